@@ -19,6 +19,7 @@ when not all dependencies are installed.
 __all__ = [
     # LLM
     'LLMClient',
+    'ResponseCache',
     # Market Data
     'TechnicalCalculator',
     'TwelveDataClient',
@@ -95,6 +96,9 @@ def __getattr__(name):
     if name == 'LLMClient':
         from .llm.client import LLMClient
         return LLMClient
+    elif name == 'ResponseCache':
+        from .llm.cache import ResponseCache
+        return ResponseCache
     # Market Data
     elif name == 'TechnicalCalculator':
         from .market_data.technical import TechnicalCalculator
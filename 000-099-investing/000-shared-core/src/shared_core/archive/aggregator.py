@@ -3,16 +3,99 @@ Monthly aggregation for daily indicators.
 
 Compresses daily data older than 90 days into monthly summaries,
 preserving key statistics while reducing storage footprint by ~30x.
+
+A month is aggregated in the database by the aggregate_monthly_indicators
+function (AGGREGATE_MONTH_SQL, one INSERT ... SELECT ... GROUP BY symbol);
+the client only calls it and reads back the row count. Where the function
+has not been installed, the month's rows are downloaded and aggregated with
+one pandas groupby (aggregate_daily_rows).
 """
 
 import logging
+import math
 import os
 from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+AGGREGATE_MONTH_RPC = "aggregate_monthly_indicators"
+
+# Run once in the Supabase SQL editor. Same statistics as aggregate_daily_rows;
+# buy/sell signals stay 0 because daily_indicators has no action column.
+AGGREGATE_MONTH_SQL = f"""\
+CREATE OR REPLACE FUNCTION {AGGREGATE_MONTH_RPC}(month_start date)
+RETURNS integer LANGUAGE sql AS $$
+    WITH daily AS (
+        SELECT symbol, date, NULLIF(close, 0)::numeric AS close, rsi::numeric AS rsi,
+               bullish_score::numeric AS bullish_score,
+               reversal_score::numeric AS reversal_score,
+               oversold_score::numeric AS oversold_score
+        FROM daily_indicators
+        WHERE date >= month_start AND date < (month_start + interval '1 month')::date
+    ), stats AS (
+        SELECT symbol,
+               (array_agg(close ORDER BY date) FILTER (WHERE close IS NOT NULL))[1] AS first_close,
+               (array_agg(close ORDER BY date DESC) FILTER (WHERE close IS NOT NULL))[1] AS last_close,
+               max(close) AS high_close,
+               min(close) AS low_close,
+               avg(rsi) AS avg_rsi,
+               min(rsi) AS min_rsi,
+               max(rsi) AS max_rsi,
+               count(*) FILTER (WHERE rsi < 30) AS days_oversold,
+               count(*) FILTER (WHERE rsi > 70) AS days_overbought,
+               avg(bullish_score) AS avg_bullish_score,
+               avg(reversal_score) AS avg_reversal_score,
+               avg(oversold_score) AS avg_oversold_score
+        FROM daily
+        GROUP BY symbol
+    ), merged AS (
+        INSERT INTO monthly_aggregates (
+            month, symbol, open_price, close_price, high_price, low_price, monthly_return,
+            avg_rsi, min_rsi, max_rsi, days_oversold, days_overbought,
+            avg_bullish_score, avg_reversal_score, avg_oversold_score,
+            buy_signals, sell_signals
+        )
+        SELECT month_start, symbol,
+               round(coalesce(first_close, 0), 4), round(coalesce(last_close, 0), 4),
+               round(coalesce(high_close, 0), 2), round(coalesce(low_close, 0), 2),
+               CASE WHEN first_close > 0
+                    THEN round((last_close - first_close) / first_close * 100, 4) END,
+               round(avg_rsi, 2), round(min_rsi, 2), round(max_rsi, 2),
+               days_oversold, days_overbought,
+               round(avg_bullish_score, 2), round(avg_reversal_score, 2),
+               round(avg_oversold_score, 2),
+               0, 0
+        FROM stats
+        ON CONFLICT (month, symbol) DO UPDATE SET
+            open_price = EXCLUDED.open_price,
+            close_price = EXCLUDED.close_price,
+            high_price = EXCLUDED.high_price,
+            low_price = EXCLUDED.low_price,
+            monthly_return = EXCLUDED.monthly_return,
+            avg_rsi = EXCLUDED.avg_rsi,
+            min_rsi = EXCLUDED.min_rsi,
+            max_rsi = EXCLUDED.max_rsi,
+            days_oversold = EXCLUDED.days_oversold,
+            days_overbought = EXCLUDED.days_overbought,
+            avg_bullish_score = EXCLUDED.avg_bullish_score,
+            avg_reversal_score = EXCLUDED.avg_reversal_score,
+            avg_oversold_score = EXCLUDED.avg_oversold_score,
+            buy_signals = EXCLUDED.buy_signals,
+            sell_signals = EXCLUDED.sell_signals
+        RETURNING 1
+    )
+    SELECT count(*)::integer FROM merged;
+$$;
+"""
+
+# daily_indicators columns the client-side fallback downloads
+_DAILY_COLUMNS = "symbol,date,close,rsi,bullish_score,reversal_score,oversold_score"
+
 
 @dataclass
 class MonthlyAggregate:
@@ -62,6 +145,104 @@ class MonthlyAggregate:
         }
 
 
+def _month_bounds(month: str) -> tuple:
+    """First day of a YYYY-MM month and of the month after it."""
+    year, mon = int(month[:4]), int(month[5:7])
+    if mon == 12:
+        return f"{month}-01", f"{year + 1}-01-01"
+    return f"{month}-01", f"{year}-{mon + 1:02d}-01"
+
+
+def _rounded(value: Any, digits: int = 2, default: Any = None) -> Any:
+    """Python-rounded float, or default for NaN."""
+    value = float(value)
+    return default if math.isnan(value) else round(value, digits)
+
+
+def aggregate_daily_rows(month: str, rows: pd.DataFrame) -> List[MonthlyAggregate]:
+    """
+    Monthly aggregates for every symbol in a month of daily rows.
+
+    One groupby over the whole month instead of per-symbol lists. Closes
+    of 0 or None are ignored; averages and RSI extremes are rounded to 2
+    decimals, prices to 4 (high/low to 2, as before), returns to 4.
+
+    Args:
+        month: Month string in YYYY-MM format
+        rows: daily_indicators rows with 'symbol', 'date', 'close' and any
+            of 'rsi', the three score columns and 'action'
+
+    Returns:
+        One MonthlyAggregate per symbol, in order of first appearance
+    """
+    # Integer sort/group keys: object-string sorts dominate otherwise
+    order = np.argsort(pd.to_datetime(rows['date']).to_numpy(), kind='stable')
+    df = rows.iloc[order].reset_index(drop=True)
+    codes, symbols = pd.factorize(df['symbol'])
+    df['symbol'] = codes
+    for column in ('rsi', 'bullish_score', 'reversal_score', 'oversold_score'):
+        df[column] = pd.to_numeric(df[column], errors='coerce') if column in df else float('nan')
+    close = pd.to_numeric(df['close'], errors='coerce')
+    df = df.assign(close=close.where(close != 0))
+
+    buy = sell = False
+    if 'action' in df:
+        # Match on the few distinct actions, then broadcast by code
+        codes, actions = pd.factorize(df['action'])
+        actions = pd.Series(actions, dtype=object).astype(str).str.upper()
+        buy = np.append(actions.str.contains('BUY').to_numpy(), False)[codes]
+        sell = np.append(actions.str.contains('SELL').to_numpy(), False)[codes]
+    df = df.assign(
+        oversold=df['rsi'] < 30,
+        overbought=df['rsi'] > 70,
+        buy=buy,
+        sell=sell,
+    )
+
+    stats = df.groupby('symbol', sort=False).agg(
+        open_price=('close', 'first'),
+        close_price=('close', 'last'),
+        high_price=('close', 'max'),
+        low_price=('close', 'min'),
+        avg_rsi=('rsi', 'mean'),
+        min_rsi=('rsi', 'min'),
+        max_rsi=('rsi', 'max'),
+        days_oversold=('oversold', 'sum'),
+        days_overbought=('overbought', 'sum'),
+        avg_bullish_score=('bullish_score', 'mean'),
+        avg_reversal_score=('reversal_score', 'mean'),
+        avg_oversold_score=('oversold_score', 'mean'),
+        buy_signals=('buy', 'sum'),
+        sell_signals=('sell', 'sum'),
+    )
+    opens, closes = stats['open_price'], stats['close_price']
+    stats['monthly_return'] = ((closes - opens) / opens * 100).where(opens > 0)
+
+    month_date = f"{month}-01"
+    return [
+        MonthlyAggregate(
+            month=month_date,
+            symbol=symbol,
+            open_price=_rounded(row.open_price, 4, default=0),
+            close_price=_rounded(row.close_price, 4, default=0),
+            high_price=_rounded(row.high_price, default=0),
+            low_price=_rounded(row.low_price, default=0),
+            monthly_return=_rounded(row.monthly_return, 4),
+            avg_rsi=_rounded(row.avg_rsi),
+            min_rsi=_rounded(row.min_rsi),
+            max_rsi=_rounded(row.max_rsi),
+            days_oversold=int(row.days_oversold),
+            days_overbought=int(row.days_overbought),
+            avg_bullish_score=_rounded(row.avg_bullish_score),
+            avg_reversal_score=_rounded(row.avg_reversal_score),
+            avg_oversold_score=_rounded(row.avg_oversold_score),
+            buy_signals=int(row.buy_signals),
+            sell_signals=int(row.sell_signals),
+        )
+        for symbol, row in zip(symbols[stats.index], stats.itertuples(index=False))
+    ]
+
+
 class MonthlyAggregator:
     """
     Aggregates daily indicators into monthly summaries.
@@ -177,6 +358,10 @@ class MonthlyAggregator:
         """
         Aggregate daily data for a specific month into monthly summaries.
 
+        Runs server-side (AGGREGATE_MONTH_SQL); falls back to downloading
+        the month and aggregating it client-side when the function is not
+        installed.
+
         Args:
             month: Month string in YYYY-MM format
 
@@ -188,20 +373,29 @@ class MonthlyAggregator:
 
         logger.info(f"Aggregating month: {month}")
 
-        # Get all daily data for this month
-        start_date = f"{month}-01"
-        # Calculate end of month
-        year, mon = int(month[:4]), int(month[5:7])
-        if mon == 12:
-            end_date = f"{year + 1}-01-01"
-        else:
-            end_date = f"{year}-{mon + 1:02d}-01"
+        try:
+            result = self.client.rpc(
+                AGGREGATE_MONTH_RPC,
+                {'month_start': f"{month}-01"}
+            ).execute()
+        except Exception as e:
+            # If RPC doesn't exist, fall back to client-side aggregation
+            logger.debug(f"RPC not available, using fallback: {e}")
+            return self._aggregate_month_fallback(month)
+
+        count = result.data if isinstance(result.data, int) else 0
+        logger.info(f"Created {count} aggregates for {month}")
+        return count
+
+    def _aggregate_month_fallback(self, month: str) -> int:
+        """Download a month's daily rows and aggregate them with pandas."""
+        start_date, end_date = _month_bounds(month)
 
         try:
             result = (
                 self.client
                 .table("daily_indicators")
-                .select("*")
+                .select(_DAILY_COLUMNS)
                 .gte("date", start_date)
                 .lt("date", end_date)
                 .order("date")
@@ -212,19 +406,7 @@ class MonthlyAggregator:
                 logger.info(f"No data found for {month}")
                 return 0
 
-            # Group by symbol
-            by_symbol: Dict[str, List[Dict]] = {}
-            for row in result.data:
-                symbol = row['symbol']
-                if symbol not in by_symbol:
-                    by_symbol[symbol] = []
-                by_symbol[symbol].append(row)
-
-            # Create aggregates
-            aggregates = []
-            for symbol, rows in by_symbol.items():
-                agg = self._create_aggregate(month, symbol, rows)
-                aggregates.append(agg)
+            aggregates = aggregate_daily_rows(month, pd.DataFrame(result.data))
 
             # Upsert to monthly_aggregates
             records = [a.to_dict() for a in aggregates]
@@ -246,69 +428,8 @@ class MonthlyAggregator:
         symbol: str,
         rows: List[Dict]
     ) -> MonthlyAggregate:
-        """Create a monthly aggregate from daily rows."""
-        # Sort by date to get first/last correctly
-        rows = sorted(rows, key=lambda r: r['date'])
-
-        # Price stats
-        closes = [r['close'] for r in rows if r.get('close')]
-
-        def safe_avg(values: List) -> Optional[float]:
-            valid = [v for v in values if v is not None]
-            return round(sum(valid) / len(valid), 2) if valid else None
-
-        def safe_min(values: List) -> Optional[float]:
-            valid = [v for v in values if v is not None]
-            return round(min(valid), 2) if valid else None
-
-        def safe_max(values: List) -> Optional[float]:
-            valid = [v for v in values if v is not None]
-            return round(max(valid), 2) if valid else None
-
-        # Extract indicator values
-        rsi_vals = [r.get('rsi') for r in rows]
-        bullish_vals = [r.get('bullish_score') for r in rows]
-        reversal_vals = [r.get('reversal_score') for r in rows]
-        oversold_vals = [r.get('oversold_score') for r in rows]
-        actions = [r.get('action') for r in rows if r.get('action')]
-
-        # Calculate RSI-based counts
-        days_oversold = sum(1 for rsi in rsi_vals if rsi is not None and rsi < 30)
-        days_overbought = sum(1 for rsi in rsi_vals if rsi is not None and rsi > 70)
-
-        # Count buy/sell signals
-        buy_signals = sum(1 for a in actions if a and 'BUY' in a.upper())
-        sell_signals = sum(1 for a in actions if a and 'SELL' in a.upper())
-
-        # Calculate monthly return
-        open_price = closes[0] if closes else 0
-        close_price = closes[-1] if closes else 0
-        monthly_return = None
-        if open_price and open_price > 0:
-            monthly_return = round(((close_price - open_price) / open_price) * 100, 4)
-
-        # Month format should be YYYY-MM-01 for the table
-        month_date = f"{month}-01"
-
-        return MonthlyAggregate(
-            month=month_date,
-            symbol=symbol,
-            open_price=round(open_price, 4) if open_price else 0,
-            close_price=round(close_price, 4) if close_price else 0,
-            high_price=round(safe_max(closes) or 0, 4),
-            low_price=round(safe_min(closes) or 0, 4),
-            monthly_return=monthly_return,
-            avg_rsi=safe_avg(rsi_vals),
-            min_rsi=safe_min(rsi_vals),
-            max_rsi=safe_max(rsi_vals),
-            days_oversold=days_oversold,
-            days_overbought=days_overbought,
-            avg_bullish_score=safe_avg(bullish_vals),
-            avg_reversal_score=safe_avg(reversal_vals),
-            avg_oversold_score=safe_avg(oversold_vals),
-            buy_signals=buy_signals,
-            sell_signals=sell_signals,
-        )
+        """Create a monthly aggregate from one symbol's daily rows."""
+        return aggregate_daily_rows(month, pd.DataFrame(rows).assign(symbol=symbol))[0]
 
     def cleanup_old_daily(self, month: str) -> int:
         """
@@ -339,12 +460,7 @@ class MonthlyAggregator:
             logger.warning(f"Cannot cleanup {month}: not yet aggregated")
             return 0
 
-        start_date = f"{month}-01"
-        year, mon = int(month[:4]), int(month[5:7])
-        if mon == 12:
-            end_date = f"{year + 1}-01-01"
-        else:
-            end_date = f"{year}-{mon + 1:02d}-01"
+        start_date, end_date = _month_bounds(month)
 
         try:
             result = (
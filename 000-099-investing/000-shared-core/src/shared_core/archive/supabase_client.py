@@ -3,17 +3,37 @@ Supabase client for archiving daily indicator snapshots.
 
 Archives computed technical indicators to Supabase for historical analysis,
 backtesting, and pattern recognition.
+
+Write paths for daily_indicators (ARCHIVE_CONFIG.MODE or the mode argument):
+- "upsert": PostgREST upsert in chunks packed by payload size, several
+  chunks in flight at once
+- "rpc": the bulk_upsert_daily_indicators function (BULK_UPSERT_FUNCTION_SQL)
+  takes whole multi-megabyte chunks as one jsonb argument
+- "copy": COPY into a temporary table and one merge INSERT over a direct
+  Postgres connection (SUPABASE_DB_URL); needs psycopg
+
+The rpc and copy paths keep existing values when a snapshot leaves a column
+empty, like the sparse upsert does.
 """
 
+import json
 import logging
 import math
 import os
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..config import ARCHIVE_CONFIG
 
 logger = logging.getLogger(__name__)
 
+ARCHIVE_SCHEMA = "investing_one"
+ARCHIVE_TABLE = "daily_indicators"
+ARCHIVE_MODES = ("upsert", "rpc", "copy")
+
 
 _sanitize_count = 0  # Track how many values were sanitized
 
@@ -165,6 +185,98 @@ class IndicatorSnapshot:
         return result
 
 
+# daily_indicators columns written by the archiver, in IndicatorSnapshot order
+ARCHIVE_COLUMNS = tuple(f.name for f in fields(IndicatorSnapshot))
+_KEY_COLUMNS = ("date", "symbol")
+
+
+def _load_table_sql(name: str) -> str:
+    """
+    Temp staging table holding only ARCHIVE_COLUMNS, for COPY.
+
+    Built from a column select rather than LIKE, so NOT NULL columns the
+    archive does not write (e.g. a defaulted created_at) are left out.
+    """
+    return (
+        f"CREATE TEMP TABLE {name} ON COMMIT DROP AS "
+        f"SELECT {', '.join(ARCHIVE_COLUMNS)} FROM {ARCHIVE_SCHEMA}.{ARCHIVE_TABLE} WITH NO DATA"
+    )
+
+
+def _merge_sql(source: str) -> str:
+    """INSERT ... ON CONFLICT from `source` that never overwrites with NULL."""
+    table = f"{ARCHIVE_SCHEMA}.{ARCHIVE_TABLE}"
+    columns = ", ".join(ARCHIVE_COLUMNS)
+    updates = ",\n        ".join(
+        f"{c} = COALESCE(EXCLUDED.{c}, {ARCHIVE_TABLE}.{c})"
+        for c in ARCHIVE_COLUMNS if c not in _KEY_COLUMNS
+    )
+    return (
+        f"INSERT INTO {table} ({columns})\n"
+        # WHERE true keeps ON CONFLICT from parsing as a join constraint (SQLite)
+        f"    SELECT {columns} FROM {source} WHERE true\n"
+        f"    ON CONFLICT ({', '.join(_KEY_COLUMNS)}) DO UPDATE SET\n        {updates}"
+    )
+
+
+# Run once in the Supabase SQL editor to enable mode="rpc"
+BULK_UPSERT_FUNCTION_SQL = f"""\
+CREATE OR REPLACE FUNCTION {ARCHIVE_SCHEMA}.{ARCHIVE_CONFIG.RPC_FUNCTION}(rows jsonb)
+RETURNS integer LANGUAGE sql AS $$
+    WITH merged AS (
+    {_merge_sql(f"jsonb_populate_recordset(NULL::{ARCHIVE_SCHEMA}.{ARCHIVE_TABLE}, rows)")}
+    RETURNING 1
+    )
+    SELECT count(*)::integer FROM merged;
+$$;
+"""
+
+
+def chunk_records(
+    records: List[Dict[str, Any]],
+    max_bytes: int,
+    max_rows: Optional[int] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Split records into chunks whose JSON payload stays under max_bytes.
+
+    Chunk sizes follow the data: sparse snapshots pack many rows per
+    request, snapshots carrying component breakdowns fewer. A single
+    record larger than max_bytes becomes its own chunk.
+
+    Args:
+        records: Row dicts to send
+        max_bytes: Serialized size budget per chunk
+        max_rows: Optional row cap per chunk
+
+    Returns:
+        Chunks in input order
+    """
+    chunks: List[List[Dict[str, Any]]] = []
+    chunk: List[Dict[str, Any]] = []
+    size = 2  # "[]"
+    for record in records:
+        record_size = len(json.dumps(record, default=str)) + 1
+        full = max_rows is not None and len(chunk) >= max_rows
+        if chunk and (full or size + record_size > max_bytes):
+            chunks.append(chunk)
+            chunk, size = [], 2
+        chunk.append(record)
+        size += record_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _copy_rows(records: Iterable[Dict[str, Any]]) -> Iterable[tuple]:
+    """Records as COPY rows in ARCHIVE_COLUMNS order (JSONB columns as text)."""
+    for record in records:
+        yield tuple(
+            json.dumps(v) if isinstance(v, (dict, list)) else v
+            for v in (record.get(c) for c in ARCHIVE_COLUMNS)
+        )
+
+
 class SupabaseArchiver:
     """
     Archives daily indicator snapshots to Supabase.
@@ -176,6 +288,9 @@ class SupabaseArchiver:
         self,
         url: Optional[str] = None,
         key: Optional[str] = None,
+        dsn: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        connect: Optional[Callable[[str], Any]] = None,
     ):
         """
         Initialize the Supabase archiver.
@@ -183,10 +298,21 @@ class SupabaseArchiver:
         Args:
             url: Supabase project URL (defaults to SUPABASE_URL env var)
             key: Supabase service role key (defaults to SUPABASE_SERVICE_KEY env var)
+            dsn: Postgres connection string for mode="copy"
+                (defaults to SUPABASE_DB_URL env var)
+            max_workers: Concurrent upsert requests
+                (default ARCHIVE_CONFIG.UPSERT_MAX_WORKERS)
+            connect: DB-API connect function for mode="copy"
+                (default psycopg.connect)
         """
         self.url = url or os.environ.get("SUPABASE_URL")
         self.key = key or os.environ.get("SUPABASE_SERVICE_KEY")
+        self.dsn = dsn or os.environ.get("SUPABASE_DB_URL")
+        self.max_workers = max_workers or ARCHIVE_CONFIG.UPSERT_MAX_WORKERS
+        self._connect = connect
         self._client = None
+        self.round_trips = 0
+        self._round_trips_lock = threading.Lock()
 
         if not self.url or not self.key:
             logger.debug(
@@ -220,24 +346,30 @@ class SupabaseArchiver:
     def archive_snapshots(
         self,
         snapshots: List[IndicatorSnapshot],
+        mode: Optional[str] = None,
     ) -> int:
         """
         Archive indicator snapshots to Supabase.
 
-        Uses upsert to handle re-runs on the same day.
+        Upserts on (date, symbol) to handle re-runs on the same day.
 
         Args:
             snapshots: List of IndicatorSnapshot objects to archive
+            mode: "upsert", "rpc" or "copy" (default ARCHIVE_CONFIG.MODE)
 
         Returns:
             Number of records upserted
         """
+        mode = mode or ARCHIVE_CONFIG.MODE
+        if mode not in ARCHIVE_MODES:
+            raise ValueError(f"Unknown archive mode '{mode}' (expected one of {ARCHIVE_MODES})")
+
         if not snapshots:
             logger.debug("No snapshots to archive")
             return 0
 
-        if not self.is_configured:
-            logger.debug("Supabase not configured, skipping archive")
+        if not self.can_archive(mode):
+            logger.debug(f"Supabase not configured for {mode}, skipping archive")
             return 0
 
         _reset_sanitize_count()  # Reset before converting
@@ -246,25 +378,105 @@ class SupabaseArchiver:
         if sanitized > 0:
             logger.debug(f"Sanitized {sanitized} inf/nan values to None")
 
+        round_trips = self.round_trips
         try:
-            # Upsert in batches of 500 to avoid payload limits
-            batch_size = 500
-            total_upserted = 0
-
-            for i in range(0, len(records), batch_size):
-                batch = records[i:i + batch_size]
-                self.client.schema("investing_one").table("daily_indicators").upsert(
-                    batch, on_conflict="date,symbol"
-                ).execute()
-                total_upserted += len(batch)
-
-            logger.info(f"Archived {total_upserted} indicator snapshots to Supabase")
+            if mode == "copy":
+                total_upserted = self._copy_records(records)
+            elif mode == "rpc":
+                total_upserted = self._send_chunks(
+                    chunk_records(records, ARCHIVE_CONFIG.RPC_MAX_BATCH_BYTES),
+                    self._rpc_chunk,
+                )
+            else:
+                total_upserted = self._send_chunks(
+                    chunk_records(
+                        records,
+                        ARCHIVE_CONFIG.UPSERT_MAX_BATCH_BYTES,
+                        ARCHIVE_CONFIG.UPSERT_MAX_BATCH_ROWS,
+                    ),
+                    self._upsert_chunk,
+                )
+
+            logger.info(
+                f"Archived {total_upserted} indicator snapshots to Supabase "
+                f"({mode}, {self.round_trips - round_trips} requests)"
+            )
             return total_upserted
 
         except Exception as e:
             logger.error(f"Failed to archive to Supabase: {e}")
             raise
 
+    def can_archive(self, mode: Optional[str] = None) -> bool:
+        """Whether the credentials a write mode needs are available."""
+        if (mode or ARCHIVE_CONFIG.MODE) == "copy":
+            return bool(self.dsn)
+        return self.is_configured
+
+    def _count_round_trips(self, n: int) -> None:
+        """Add to round_trips (chunks are sent from worker threads)."""
+        with self._round_trips_lock:
+            self.round_trips += n
+
+    def _send_chunks(
+        self,
+        chunks: List[List[Dict[str, Any]]],
+        send: Callable[[List[Dict[str, Any]]], int],
+    ) -> int:
+        """Send chunks with up to max_workers requests in flight."""
+        workers = min(self.max_workers, len(chunks))
+        if workers <= 1:
+            return sum(send(chunk) for chunk in chunks)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map re-raises the first failure when its result is consumed
+            return sum(executor.map(send, chunks))
+
+    def _upsert_chunk(self, chunk: List[Dict[str, Any]]) -> int:
+        """One PostgREST upsert request."""
+        self.client.schema(ARCHIVE_SCHEMA).table(ARCHIVE_TABLE).upsert(
+            chunk, on_conflict=",".join(_KEY_COLUMNS)
+        ).execute()
+        self._count_round_trips(1)
+        return len(chunk)
+
+    def _rpc_chunk(self, chunk: List[Dict[str, Any]]) -> int:
+        """One call of the server-side bulk upsert function."""
+        result = self.client.schema(ARCHIVE_SCHEMA).rpc(
+            ARCHIVE_CONFIG.RPC_FUNCTION, {"rows": chunk}
+        ).execute()
+        self._count_round_trips(1)
+        return result.data if isinstance(result.data, int) else len(chunk)
+
+    def _copy_records(self, records: List[Dict[str, Any]]) -> int:
+        """COPY all records into a temp table and merge them in one transaction."""
+        connect = self._connect
+        if connect is None:
+            try:
+                from psycopg import connect
+            except ImportError:
+                raise ImportError(
+                    "psycopg package not installed. Run: pip install 'psycopg[binary]'"
+                )
+
+        columns = ", ".join(ARCHIVE_COLUMNS)
+        conn = connect(self.dsn)
+        try:
+            with conn.cursor() as cur:
+                cur.execute(_load_table_sql("_archive_load"))
+                with cur.copy(f"COPY _archive_load ({columns}) FROM STDIN") as copy:
+                    for row in _copy_rows(records):
+                        copy.write_row(row)
+                cur.execute(_merge_sql("_archive_load"))
+                upserted = cur.rowcount
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        self._count_round_trips(3)
+        return upserted if upserted is not None and upserted >= 0 else len(records)
+
     def get_history(
         self,
         symbol: str,
@@ -414,6 +626,7 @@ def archive_daily_indicators(
     results: List[Dict[str, Any]],
     scan_date: Optional[date] = None,
     score_type: str = "bullish",
+    mode: Optional[str] = None,
 ) -> int:
     """
     Archive indicator data to Supabase.
@@ -441,6 +654,7 @@ def archive_daily_indicators(
         results: List of dicts with indicator data
         scan_date: Date of the scan (defaults to today)
         score_type: Type of scanner ("bullish", "reversal", "oversold")
+        mode: Write path, "upsert", "rpc" or "copy" (default ARCHIVE_CONFIG.MODE)
 
     Returns:
         Number of records archived
@@ -449,7 +663,7 @@ def archive_daily_indicators(
         return 0
 
     archiver = _get_archiver()
-    if not archiver.is_configured:
+    if not archiver.can_archive(mode):
         logger.debug("Supabase not configured, skipping archive")
         return 0
 
@@ -551,7 +765,7 @@ def archive_daily_indicators(
         )
         snapshots.append(snapshot)
 
-    return archiver.archive_snapshots(snapshots)
+    return archiver.archive_snapshots(snapshots, mode=mode)
 
 
 def get_historical_data(
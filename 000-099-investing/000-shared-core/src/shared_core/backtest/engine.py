@@ -4,15 +4,22 @@ Backtest Engine — Core backtesting logic for reversal signals.
 Scans historical data, detects signals, and calculates forward returns.
 """
 
-from dataclasses import dataclass
+import itertools
+from dataclasses import dataclass, field, replace
 from datetime import date
-from typing import Dict, List, Optional, Tuple
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
-from ..divergence.divergence import detect_combined_divergence
-from ..scoring.models import DivergenceType
+from ..divergence.divergence import (
+    combined_divergence_history,
+    detect_combined_divergence,
+    divergence_at,
+)
+from ..scoring.models import DivergenceResult, DivergenceType
 from .models import (
     HORIZON_DAYS,
     BacktestResult,
@@ -23,9 +30,29 @@ from .models import (
 )
 
 
+# Score components, in the order they are summed into the raw score
+COMPONENT_KEYS = (
+    'rsi', 'macd_crossover', 'macd_hist', 'price_sma50',
+    'price_sma200', 'volume', 'divergence',
+)
+
+DEFAULT_WEIGHTS = {
+    'rsi': 0.15,
+    'macd_crossover': 0.15,
+    'macd_hist': 0.10,
+    'price_sma50': 0.15,
+    'price_sma200': 0.20,
+    'volume': 0.15,
+    'divergence': 0.10,
+}
+
+
 @dataclass
 class ScoringConfig:
-    """Configuration for signal scoring thresholds."""
+    """Configuration for signal scoring weights and thresholds."""
+    # Component weights for the raw score (see COMPONENT_KEYS)
+    weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_WEIGHTS))
+
     # Score thresholds for conviction levels
     high_score_min: float = 8.0
     medium_score_min: float = 7.0
@@ -38,6 +65,55 @@ class ScoringConfig:
     # ADX requirements
     high_adx_max: float = 35.0
 
+    def __post_init__(self):
+        unknown = set(self.weights) - set(COMPONENT_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown score components: {sorted(unknown)}")
+
+
+def scoring_grid(base: Optional[ScoringConfig] = None, **options: Sequence[Any]) -> List[ScoringConfig]:
+    """
+    Every combination of ScoringConfig field values, for BacktestEngine.sweep.
+
+    Example:
+        >>> configs = scoring_grid(
+        ...     low_score_min=[5.5, 6.0, 6.5],
+        ...     weights=[DEFAULT_WEIGHTS, {**DEFAULT_WEIGHTS, 'divergence': 0.3}],
+        ... )
+        >>> len(configs)
+        6
+
+    Args:
+        base: Config supplying the fields not varied (default: ScoringConfig())
+        **options: Field name -> candidate values
+
+    Returns:
+        One config per combination, in itertools.product order
+    """
+    base = base or ScoringConfig()
+    names = list(options)
+    return [
+        replace(base, **dict(zip(names, values)))
+        for values in itertools.product(*(options[name] for name in names))
+    ]
+
+
+@dataclass
+class ComponentTable:
+    """
+    Config-independent scoring inputs for one ticker's scan dates.
+
+    Everything a ScoringConfig changes (weights, thresholds) is applied on
+    top of this, so one table serves any number of configs.
+    """
+    df: pd.DataFrame             # Datetime-indexed history (for forward returns)
+    rows: np.ndarray             # Scanned row positions in df
+    components: np.ndarray       # (len(rows), len(COMPONENT_KEYS)) component scores
+    volume_mult: np.ndarray
+    adx_mult: np.ndarray
+    volume_ratio: np.ndarray
+    adx: np.ndarray              # ADX with NaN replaced by 25
+
 
 class BacktestEngine:
     """
@@ -49,15 +125,26 @@ class BacktestEngine:
     3. Detect signals based on scoring logic
     4. Calculate forward returns at each horizon
     5. Aggregate metrics
+
+    By default each ticker is scanned incrementally: indicator columns, the
+    rolling volume mean and the divergence state are derived once as full
+    series and every date is scored from them. Pass ``incremental=False`` to
+    use the original rolling-window scan, which rescores a copy of the history
+    for every date.
     """
 
+    # Trailing bars used for divergence detection
+    DIVERGENCE_LOOKBACK = 20
+
     def __init__(
         self,
         scoring_config: Optional[ScoringConfig] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        incremental: bool = True,
     ):
         self.config = scoring_config or ScoringConfig()
         self.verbose = verbose
+        self.incremental = incremental
 
     def run_backtest(
         self,
@@ -83,26 +170,127 @@ class BacktestEngine:
         all_signals: List[SignalEvent] = []
 
         for ticker, df in ticker_data.items():
-            if df is None or len(df) < 250:  # Need ~1 year minimum
-                if self.verbose:
-                    print(f"  Skipping {ticker}: insufficient data ({len(df) if df is not None else 0} rows)")
-                continue
-
-            signals = self._scan_ticker(
-                ticker, df, signal_type, start_date, end_date
+            all_signals.extend(
+                self.scan(ticker, df, signal_type, start_date, end_date, conviction_filter)
             )
 
-            # Filter by conviction if specified
-            if conviction_filter:
-                conviction_order = [ConvictionLevel.HIGH, ConvictionLevel.MEDIUM, ConvictionLevel.LOW]
-                min_idx = conviction_order.index(conviction_filter)
-                signals = [s for s in signals if conviction_order.index(s.conviction) <= min_idx]
+        return self.summarize(
+            list(ticker_data.keys()), all_signals, signal_type,
+            start_date, end_date, conviction_filter,
+        )
+
+    def scan(
+        self,
+        ticker: str,
+        df: Optional[pd.DataFrame],
+        signal_type: SignalType = SignalType.UPSIDE_REVERSAL,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        conviction_filter: Optional[ConvictionLevel] = None,
+    ) -> List[SignalEvent]:
+        """
+        Detect signals for one ticker (steps 2-4 of the workflow).
 
-            all_signals.extend(signals)
+        Tickers are independent, so this is the unit of work the parallel
+        runner ships to worker processes.
 
+        Returns:
+            Signals at or above conviction_filter; empty if history is too short
+        """
+        if df is None or len(df) < 250:  # Need ~1 year minimum
             if self.verbose:
-                print(f"  {ticker}: {len(signals)} signals detected")
+                print(f"  Skipping {ticker}: insufficient data ({len(df) if df is not None else 0} rows)")
+            return []
+
+        scan = self._scan_ticker_incremental if self.incremental else self._scan_ticker
+        signals = self._filter_conviction(
+            scan(ticker, df, signal_type, start_date, end_date), conviction_filter
+        )
+
+        if self.verbose:
+            print(f"  {ticker}: {len(signals)} signals detected")
 
+        return signals
+
+    def sweep(
+        self,
+        ticker_data: Dict[str, pd.DataFrame],
+        configs: Sequence[ScoringConfig],
+        signal_type: SignalType = SignalType.UPSIDE_REVERSAL,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        conviction_filter: Optional[ConvictionLevel] = None,
+    ) -> List[BacktestResult]:
+        """
+        Backtest many scoring configs over the same data in one pass.
+
+        Indicator inputs, divergence state and per-date component scores
+        don't depend on the config, so each ticker's ComponentTable is built
+        once; each config's weights are then applied as one column of a
+        (dates x components) @ (components x configs) product, and forward
+        returns are computed once per signal date. Each result equals
+        ``BacktestEngine(config).run_backtest(...)`` for its config.
+
+        Args:
+            ticker_data: Dict mapping ticker symbols to DataFrames with OHLCV + indicators
+            configs: Scoring configs to evaluate (see scoring_grid)
+            signal_type, start_date, end_date, conviction_filter: As in run_backtest
+
+        Returns:
+            One BacktestResult per config, in the same order
+        """
+        per_config: List[List[SignalEvent]] = [[] for _ in configs]
+
+        for ticker, df in ticker_data.items():
+            if df is None or len(df) < 250:
+                continue
+            table = self._component_table(df, signal_type, start_date, end_date)
+            if table is None:
+                continue
+            found = self._signals_from_table(ticker, table, signal_type, configs)
+            for signals, config_signals in zip(per_config, found):
+                signals.extend(self._filter_conviction(config_signals, conviction_filter))
+
+        tickers = list(ticker_data.keys())
+        return [
+            self.summarize(tickers, signals, signal_type, start_date, end_date, conviction_filter)
+            for signals in per_config
+        ]
+
+    @staticmethod
+    def _filter_conviction(
+        signals: List[SignalEvent], conviction_filter: Optional[ConvictionLevel]
+    ) -> List[SignalEvent]:
+        """Keep signals at or above conviction_filter."""
+        if not conviction_filter:
+            return signals
+        conviction_order = [ConvictionLevel.HIGH, ConvictionLevel.MEDIUM, ConvictionLevel.LOW]
+        min_idx = conviction_order.index(conviction_filter)
+        return [s for s in signals if conviction_order.index(s.conviction) <= min_idx]
+
+    def summarize(
+        self,
+        tickers: List[str],
+        all_signals: List[SignalEvent],
+        signal_type: SignalType = SignalType.UPSIDE_REVERSAL,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        conviction_filter: Optional[ConvictionLevel] = None,
+    ) -> BacktestResult:
+        """
+        Aggregate scanned signals into a BacktestResult (step 5 of the workflow).
+
+        Args:
+            tickers: Tickers the backtest covered
+            all_signals: Signals from scan(), in ticker order
+            signal_type: Type of signal that was scanned
+            start_date: Requested start date (used when there are no signals)
+            end_date: Requested end date (used when there are no signals)
+            conviction_filter: Conviction filter that was applied
+
+        Returns:
+            BacktestResult with all signals and metrics
+        """
         # Determine actual date range
         if all_signals:
             actual_start = min(s.signal_date for s in all_signals)
@@ -113,7 +301,7 @@ class BacktestEngine:
 
         # Calculate aggregate metrics
         result = BacktestResult(
-            tickers=list(ticker_data.keys()),
+            tickers=tickers,
             start_date=actual_start,
             end_date=actual_end,
             signal_type=signal_type,
@@ -121,19 +309,22 @@ class BacktestEngine:
             signals=all_signals,
         )
 
+        # Signals as columns once; every metric below is a masked reduction
+        table = self._signal_table(all_signals)
+        everything = np.ones(len(all_signals), dtype=bool)
+
         # Calculate metrics for each horizon
-        result.metrics_2w = self._calculate_horizon_metrics(all_signals, '2w')
-        result.metrics_2m = self._calculate_horizon_metrics(all_signals, '2m')
-        result.metrics_6m = self._calculate_horizon_metrics(all_signals, '6m')
+        result.metrics_2w = self._horizon_metrics(table, everything, '2w')
+        result.metrics_2m = self._horizon_metrics(table, everything, '2m')
+        result.metrics_6m = self._horizon_metrics(table, everything, '6m')
 
         # Calculate metrics by conviction level
         for conv in [ConvictionLevel.HIGH, ConvictionLevel.MEDIUM, ConvictionLevel.LOW]:
-            conv_signals = [s for s in all_signals if s.conviction == conv]
-            if conv_signals:
+            mask = table['conviction'] == conv.value
+            if mask.any():
                 result.metrics_by_conviction[conv] = {
-                    '2w': self._calculate_horizon_metrics(conv_signals, '2w'),
-                    '2m': self._calculate_horizon_metrics(conv_signals, '2m'),
-                    '6m': self._calculate_horizon_metrics(conv_signals, '6m'),
+                    horizon: self._horizon_metrics(table, mask, horizon)
+                    for horizon in ('2w', '2m', '6m')
                 }
 
         return result
@@ -219,6 +410,211 @@ class BacktestEngine:
 
         return signals
 
+    def _scan_ticker_incremental(
+        self,
+        ticker: str,
+        df: pd.DataFrame,
+        signal_type: SignalType,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> List[SignalEvent]:
+        """
+        Scan a single ticker's data for signals in linear time.
+
+        Produces the same signals as ``_scan_ticker``. Every precomputed value
+        at row i depends only on rows up to i (trailing rolling windows and a
+        fixed divergence window), so there is no look-ahead bias.
+        """
+        table = self._component_table(df, signal_type, start_date, end_date)
+        if table is None:
+            return []
+        return self._signals_from_table(ticker, table, signal_type, [self.config])[0]
+
+    def _component_table(
+        self,
+        df: pd.DataFrame,
+        signal_type: SignalType,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> Optional[ComponentTable]:
+        """
+        Score components and multipliers for every scan date of one ticker.
+
+        Returns None when the history leaves no room for a scan window.
+        """
+        # Ensure datetime index
+        if 'datetime' in df.columns:
+            df = df.set_index('datetime')
+        df.index = pd.to_datetime(df.index)
+
+        scan_start_idx = 200
+        scan_end_idx = len(df) - HORIZON_DAYS['6m']
+
+        if scan_end_idx <= scan_start_idx:
+            return None
+
+        series = self._precompute_series(df)
+        dates = df.index.date
+
+        scan_idx = [
+            i for i in range(scan_start_idx, scan_end_idx)
+            if not (start_date and dates[i] < start_date)
+            and not (end_date and dates[i] > end_date)
+        ]
+        divergences = self._divergence_series(df, scan_idx)
+
+        components = np.empty((len(scan_idx), len(COMPONENT_KEYS)))
+        volume_mult = np.empty(len(scan_idx))
+        adx_mult = np.empty(len(scan_idx))
+        adx = np.empty(len(scan_idx))
+
+        for j, i in enumerate(scan_idx):
+            values, volume_mult[j], adx_mult[j], adx[j] = self._score_inputs(
+                signal_type,
+                **{name: values[i] for name, values in series.items()},
+                **{f'prev_{name}': series[name][i - 1] for name in self._PREV_FIELDS},
+                divergence=divergences[i],
+            )
+            components[j] = [values[k] for k in COMPONENT_KEYS]
+
+        rows = np.array(scan_idx, dtype=int)
+        return ComponentTable(
+            df=df,
+            rows=rows,
+            components=components,
+            volume_mult=volume_mult,
+            adx_mult=adx_mult,
+            volume_ratio=series['volume_ratio'][rows],
+            adx=adx,
+        )
+
+    def _signals_from_table(
+        self,
+        ticker: str,
+        table: ComponentTable,
+        signal_type: SignalType,
+        configs: Sequence[ScoringConfig],
+    ) -> List[List[SignalEvent]]:
+        """
+        Apply each config's weights and thresholds to a ComponentTable.
+
+        The weighted sum is accumulated component by component, in the same
+        order as ``_score_values``, so scores match the scalar path exactly.
+
+        Returns:
+            Signals per config, in the same order as configs
+        """
+        weights = np.array([
+            [config.weights.get(key, 0.0) for config in configs] for key in COMPONENT_KEYS
+        ])
+        raw_score = np.zeros((len(table.rows), len(configs)))
+        for k in range(len(COMPONENT_KEYS)):
+            raw_score += table.components[:, k, None] * weights[k]
+        final = np.minimum(
+            10.0, raw_score * table.volume_mult[:, None] * table.adx_mult[:, None]
+        )
+
+        dates = table.df.index.date
+        closes = table.df['close'].to_numpy(dtype=float)
+        forward_table: Optional[Dict[str, np.ndarray]] = None
+        forward: Dict[int, Dict[str, Optional[float]]] = {}
+
+        results = []
+        for v, config in enumerate(configs):
+            signals = []
+            # Rounding to 2 decimals can lift a score by at most 0.005
+            for j in np.flatnonzero(final[:, v] >= config.low_score_min - 0.01):
+                final_score = float(final[j, v])
+                score = round(final_score, 2)
+                # Only record if meets minimum threshold
+                if score < config.low_score_min:
+                    continue
+
+                i = int(table.rows[j])
+                price_at_signal = float(closes[i])
+                if i not in forward:
+                    if forward_table is None:
+                        forward_table = self._forward_return_table(table.df)
+                    forward[i] = {
+                        name: None if np.isnan(values[i]) else round(float(values[i]), 2)
+                        for name, values in forward_table.items()
+                    }
+
+                signals.append(SignalEvent(
+                    ticker=ticker,
+                    signal_date=dates[i],
+                    signal_type=signal_type,
+                    conviction=self._classify_conviction(
+                        final_score, table.volume_ratio[j], table.adx[j], config
+                    ),
+                    score=score,
+                    volume_ratio=round(float(table.volume_ratio[j]), 2),
+                    adx_value=round(float(table.adx[j]), 1),
+                    price_at_signal=price_at_signal,
+                    **forward[i]
+                ))
+            results.append(signals)
+
+        return results
+
+    # Fields whose previous-bar value also feeds the score
+    _PREV_FIELDS = ('macd', 'macd_signal', 'macd_hist', 'sma50', 'sma200', 'close')
+
+    def _precompute_series(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Extract every per-date scoring input as a full-length array.
+
+        Mirrors the column lookups in ``_calculate_score``: missing columns
+        become NaN (or 25 for ADX), and a zero in MACD_SIGNAL / MACD_HIST falls
+        back to the title-case column just like ``row.get(a) or row.get(b)``.
+        """
+        n = len(df)
+        missing = np.full(n, np.nan)
+
+        def column(name: str) -> np.ndarray:
+            return df[name].to_numpy(dtype=float) if name in df.columns else missing
+
+        def column_or(primary: str, fallback: str) -> np.ndarray:
+            if primary not in df.columns:
+                return column(fallback)
+            values = column(primary)
+            return np.where(values == 0, column(fallback), values)
+
+        if 'volume' in df.columns:
+            volume = df['volume']
+            avg_volume = volume.rolling(window=20).mean()
+            valid = volume.notna() & avg_volume.notna() & (avg_volume != 0)
+            volume_ratio = (volume / avg_volume).where(valid, 1.0).to_numpy(dtype=float)
+        else:
+            volume_ratio = np.ones(n)
+
+        return {
+            'rsi': column('RSI'),
+            'macd': column('MACD'),
+            'macd_signal': column_or('MACD_SIGNAL', 'MACD_Signal'),
+            'macd_hist': column_or('MACD_HIST', 'MACD_Hist'),
+            'sma50': column('SMA_50'),
+            'sma200': column('SMA_200'),
+            'adx': column('ADX') if 'ADX' in df.columns else np.full(n, 25.0),
+            'close': df['close'].to_numpy(dtype=float),
+            'volume_ratio': volume_ratio,
+        }
+
+    def _divergence_series(
+        self, df: pd.DataFrame, indices: List[int]
+    ) -> Dict[int, Optional[DivergenceResult]]:
+        """
+        Divergence state for each requested row, from its trailing window only.
+
+        Labels the whole history in one pass; row i of the history is the
+        combined divergence of the `DIVERGENCE_LOOKBACK` bars ending at i.
+        """
+        try:
+            history = combined_divergence_history(df, lookback=self.DIVERGENCE_LOOKBACK)
+        except Exception:
+            return {i: None for i in indices}
+        return {i: divergence_at(history, i) for i in indices}
+
     def _calculate_score(
         self,
         df: pd.DataFrame,
@@ -235,22 +631,6 @@ class BacktestEngine:
         current = df.iloc[-1]
         prev = df.iloc[-2]
 
-        # Get required values
-        rsi = current.get('RSI')
-        macd = current.get('MACD')
-        macd_signal = current.get('MACD_SIGNAL') or current.get('MACD_Signal')
-        macd_hist = current.get('MACD_HIST') or current.get('MACD_Hist')
-        prev_macd = prev.get('MACD')
-        prev_macd_signal = prev.get('MACD_SIGNAL') or prev.get('MACD_Signal')
-        prev_macd_hist = prev.get('MACD_HIST') or prev.get('MACD_Hist')
-        sma50 = current.get('SMA_50')
-        prev_sma50 = prev.get('SMA_50')
-        sma200 = current.get('SMA_200')
-        prev_sma200 = prev.get('SMA_200')
-        adx = current.get('ADX', 25)
-        close = current['close']
-        prev_close = prev['close']
-
         # Volume ratio (with NaN handling)
         if 'volume' in df.columns:
             current_volume = df['volume'].iloc[-1]
@@ -262,48 +642,109 @@ class BacktestEngine:
         else:
             volume_ratio = 1.0
 
+        return self._score_values(
+            signal_type,
+            rsi=current.get('RSI'),
+            macd=current.get('MACD'),
+            macd_signal=current.get('MACD_SIGNAL') or current.get('MACD_Signal'),
+            macd_hist=current.get('MACD_HIST') or current.get('MACD_Hist'),
+            prev_macd=prev.get('MACD'),
+            prev_macd_signal=prev.get('MACD_SIGNAL') or prev.get('MACD_Signal'),
+            prev_macd_hist=prev.get('MACD_HIST') or prev.get('MACD_Hist'),
+            sma50=current.get('SMA_50'),
+            prev_sma50=prev.get('SMA_50'),
+            sma200=current.get('SMA_200'),
+            prev_sma200=prev.get('SMA_200'),
+            adx=current.get('ADX', 25),
+            close=current['close'],
+            prev_close=prev['close'],
+            volume_ratio=volume_ratio,
+            divergence=self._detect_divergence(df),
+        )
+
+    def _score_values(
+        self,
+        signal_type: SignalType,
+        rsi, macd, macd_signal, macd_hist,
+        prev_macd, prev_macd_signal, prev_macd_hist,
+        sma50, prev_sma50, sma200, prev_sma200,
+        adx, close, prev_close, volume_ratio,
+        divergence: Optional[DivergenceResult],
+    ) -> Tuple[float, ConvictionLevel, float, float]:
+        """
+        Score one date from its indicator values.
+
+        Used by the rolling-window scan; the incremental scan applies the same
+        arithmetic to a ComponentTable. ``divergence`` is None when detection failed.
+        """
+        components, volume_mult, adx_mult, adx = self._score_inputs(
+            signal_type, rsi, macd, macd_signal, macd_hist,
+            prev_macd, prev_macd_signal, prev_macd_hist,
+            sma50, prev_sma50, sma200, prev_sma200,
+            adx, close, prev_close, volume_ratio, divergence,
+        )
+
+        # Calculate raw score
+        weights = self.config.weights
+        raw_score = sum(components[k] * weights.get(k, 0.0) for k in COMPONENT_KEYS)
+
+        final_score = min(10.0, raw_score * volume_mult * adx_mult)
+
+        # Determine conviction
+        conviction = self._classify_conviction(final_score, volume_ratio, adx)
+
+        return (
+            round(float(final_score), 2), conviction,
+            round(float(volume_ratio), 2), round(float(adx), 1),
+        )
+
+    def _score_inputs(
+        self,
+        signal_type: SignalType,
+        rsi, macd, macd_signal, macd_hist,
+        prev_macd, prev_macd_signal, prev_macd_hist,
+        sma50, prev_sma50, sma200, prev_sma200,
+        adx, close, prev_close, volume_ratio,
+        divergence: Optional[DivergenceResult],
+    ) -> Tuple[Dict[str, float], float, float, float]:
+        """
+        Config-independent part of a date's score.
+
+        Returns: (components, volume multiplier, ADX multiplier, ADX with NaN as 25)
+        """
         # Score components based on signal type
         if signal_type == SignalType.UPSIDE_REVERSAL:
             components = self._score_upside_components(
-                df, rsi, macd, macd_signal, macd_hist,
+                divergence, rsi, macd, macd_signal, macd_hist,
                 prev_macd, prev_macd_signal, prev_macd_hist,
                 close, sma50, prev_close, prev_sma50,
                 sma200, prev_sma200, volume_ratio
             )
         else:
             components = self._score_downside_components(
-                df, rsi, macd, macd_signal, macd_hist,
+                divergence, rsi, macd, macd_signal, macd_hist,
                 prev_macd, prev_macd_signal, prev_macd_hist,
                 close, sma50, prev_close, prev_sma50,
                 sma200, prev_sma200, volume_ratio
             )
 
-        # Calculate raw score
-        weights = {
-            'rsi': 0.15,
-            'macd_crossover': 0.15,
-            'macd_hist': 0.10,
-            'price_sma50': 0.15,
-            'price_sma200': 0.20,
-            'volume': 0.15,
-            'divergence': 0.10,
-        }
-
-        raw_score = sum(components.get(k, 1.0) * weights[k] for k in weights)
+        adx = adx if not pd.isna(adx) else 25
 
-        # Apply multipliers
+        # Multipliers
         volume_mult = self._get_volume_multiplier(volume_ratio)
-        adx_mult = self._get_adx_multiplier(adx if not pd.isna(adx) else 25)
-
-        final_score = min(10.0, raw_score * volume_mult * adx_mult)
+        adx_mult = self._get_adx_multiplier(adx)
 
-        # Determine conviction
-        conviction = self._classify_conviction(final_score, volume_ratio, adx if not pd.isna(adx) else 25)
+        return components, volume_mult, adx_mult, adx
 
-        return (round(final_score, 2), conviction, round(volume_ratio, 2), round(adx if not pd.isna(adx) else 25, 1))
+    def _detect_divergence(self, df: pd.DataFrame) -> Optional[DivergenceResult]:
+        """Combined RSI + OBV divergence over the trailing window, or None on failure."""
+        try:
+            return detect_combined_divergence(df, lookback=self.DIVERGENCE_LOOKBACK)
+        except Exception:
+            return None
 
     def _score_upside_components(
-        self, df: pd.DataFrame, rsi, macd, macd_signal, macd_hist,
+        self, divergence: Optional[DivergenceResult], rsi, macd, macd_signal, macd_hist,
         prev_macd, prev_macd_signal, prev_macd_hist,
         close, sma50, prev_close, prev_sma50,
         sma200, prev_sma200, volume_ratio
@@ -398,21 +839,17 @@ class BacktestEngine:
         else:
             components['volume'] = 1.0
 
-        # Divergence detection (using combined RSI + OBV)
-        try:
-            divergence = detect_combined_divergence(df, lookback=20)
-            if divergence.type == DivergenceType.BULLISH:
-                # Bullish divergence is good for upside reversal
-                components['divergence'] = min(10.0, 7.0 + (divergence.strength / 10.0))
-            else:
-                components['divergence'] = 1.0
-        except Exception:
+        # Divergence (combined RSI + OBV)
+        if divergence is not None and divergence.type == DivergenceType.BULLISH:
+            # Bullish divergence is good for upside reversal
+            components['divergence'] = min(10.0, 7.0 + (divergence.strength / 10.0))
+        else:
             components['divergence'] = 1.0
 
         return components
 
     def _score_downside_components(
-        self, df: pd.DataFrame, rsi, macd, macd_signal, macd_hist,
+        self, divergence: Optional[DivergenceResult], rsi, macd, macd_signal, macd_hist,
         prev_macd, prev_macd_signal, prev_macd_hist,
         close, sma50, prev_close, prev_sma50,
         sma200, prev_sma200, volume_ratio
@@ -505,15 +942,11 @@ class BacktestEngine:
         else:
             components['volume'] = 1.0
 
-        # Divergence detection (using combined RSI + OBV)
-        try:
-            divergence = detect_combined_divergence(df, lookback=20)
-            if divergence.type == DivergenceType.BEARISH:
-                # Bearish divergence is good for downside reversal
-                components['divergence'] = min(10.0, 7.0 + (divergence.strength / 10.0))
-            else:
-                components['divergence'] = 1.0
-        except Exception:
+        # Divergence (combined RSI + OBV)
+        if divergence is not None and divergence.type == DivergenceType.BEARISH:
+            # Bearish divergence is good for downside reversal
+            components['divergence'] = min(10.0, 7.0 + (divergence.strength / 10.0))
+        else:
             components['divergence'] = 1.0
 
         return components
@@ -543,14 +976,20 @@ class BacktestEngine:
             return 0.5
 
     def _classify_conviction(
-        self, final_score: float, volume_ratio: float, adx: float
+        self,
+        final_score: float,
+        volume_ratio: float,
+        adx: float,
+        config: Optional[ScoringConfig] = None,
     ) -> ConvictionLevel:
-        """Classify conviction level."""
-        if final_score >= 8.0 and volume_ratio >= 1.2 and adx < 35:
+        """Classify conviction level against config (default: this engine's)."""
+        config = config or self.config
+        if (final_score >= config.high_score_min and volume_ratio >= config.high_volume_min
+                and adx < config.high_adx_max):
             return ConvictionLevel.HIGH
-        elif final_score >= 7.0 and volume_ratio >= 1.0:
+        elif final_score >= config.medium_score_min and volume_ratio >= config.medium_volume_min:
             return ConvictionLevel.MEDIUM
-        elif final_score >= 6.0:
+        elif final_score >= config.low_score_min:
             return ConvictionLevel.LOW
         return ConvictionLevel.NONE
 
@@ -599,26 +1038,86 @@ class BacktestEngine:
 
         return result
 
+    def _forward_return_table(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Forward returns at each horizon for every row at once.
+
+        Same values as ``_calculate_forward_returns`` (before rounding) for
+        each row, computed with shifted-array divisions and sliding-window
+        max/min; NaN where the horizon runs past the end of the data.
+        """
+        close = df['close'].to_numpy(dtype=float)
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
+        n = len(close)
+
+        table = {}
+        for horizon, days in HORIZON_DAYS.items():
+            pct_return = np.full(n, np.nan)
+            max_gain = np.full(n, np.nan)
+            max_loss = np.full(n, np.nan)
+
+            rows = n - days
+            if rows > 0:
+                price = close[:rows]
+                pct_return[:rows] = ((close[days:] - price) / price) * 100
+                max_price = sliding_window_view(high, days + 1).max(axis=1)
+                min_price = sliding_window_view(low, days + 1).min(axis=1)
+                max_gain[:rows] = ((max_price - price) / price) * 100
+                max_loss[:rows] = ((min_price - price) / price) * 100
+
+            table[f'return_{horizon}'] = pct_return
+            table[f'max_gain_{horizon}'] = max_gain
+            table[f'max_loss_{horizon}'] = max_loss
+
+        return table
+
+    # Forward-return fields of SignalEvent, as _signal_table columns
+    _FORWARD_FIELDS = tuple(
+        f'{prefix}_{horizon}' for horizon in HORIZON_DAYS
+        for prefix in ('return', 'max_gain', 'max_loss')
+    )
+
+    @classmethod
+    def _signal_table(cls, signals: List[SignalEvent]) -> Dict[str, np.ndarray]:
+        """Conviction and forward-return columns of a signal list (None -> NaN)."""
+        get_fields = attrgetter(*cls._FORWARD_FIELDS)
+        values = np.array(
+            [get_fields(s) for s in signals], dtype=float
+        ).reshape(len(signals), len(cls._FORWARD_FIELDS))
+
+        table = {name: values[:, k] for k, name in enumerate(cls._FORWARD_FIELDS)}
+        table['conviction'] = np.array([s.conviction.value for s in signals], dtype=object)
+        return table
+
     def _calculate_horizon_metrics(
         self,
         signals: List[SignalEvent],
         horizon: str,
     ) -> HorizonMetrics:
         """Calculate aggregate metrics for a specific horizon."""
-        return_attr = f'return_{horizon}'
-        max_gain_attr = f'max_gain_{horizon}'
-        max_loss_attr = f'max_loss_{horizon}'
-
-        # Filter signals with valid return data
-        valid_signals = [
-            s for s in signals
-            if getattr(s, return_attr) is not None
-        ]
+        return self._horizon_metrics(
+            self._signal_table(signals), np.ones(len(signals), dtype=bool), horizon
+        )
+
+    def _horizon_metrics(
+        self,
+        table: Dict[str, np.ndarray],
+        mask: np.ndarray,
+        horizon: str,
+    ) -> HorizonMetrics:
+        """Aggregate metrics for the signals selected by mask, at one horizon."""
+        returns = table[f'return_{horizon}'][mask]
+        total_signals = len(returns)
+
+        # Keep signals with valid return data
+        valid = ~np.isnan(returns)
+        returns = returns[valid]
 
-        if not valid_signals:
+        if not len(returns):
             return HorizonMetrics(
                 horizon=horizon,
-                total_signals=len(signals),
+                total_signals=total_signals,
                 signals_with_data=0,
                 winners=0,
                 losers=0,
@@ -632,12 +1131,11 @@ class BacktestEngine:
                 expectancy=0.0,
             )
 
-        returns = [getattr(s, return_attr) for s in valid_signals]
-        max_gains = [getattr(s, max_gain_attr) or 0 for s in valid_signals]
-        max_losses = [getattr(s, max_loss_attr) or 0 for s in valid_signals]
+        max_gains = np.nan_to_num(table[f'max_gain_{horizon}'][mask][valid], nan=0.0)
+        max_losses = np.nan_to_num(table[f'max_loss_{horizon}'][mask][valid], nan=0.0)
 
-        winners = [r for r in returns if r > 0]
-        losers = [r for r in returns if r <= 0]
+        winners = returns[returns > 0]
+        losers = returns[returns <= 0]
 
         win_count = len(winners)
         loss_count = len(losers)
@@ -645,23 +1143,23 @@ class BacktestEngine:
 
         win_rate = (win_count / total * 100) if total > 0 else 0
 
-        avg_win = np.mean(winners) if winners else 0
-        avg_loss = abs(np.mean(losers)) if losers else 0
+        avg_win = np.mean(winners) if win_count else 0
+        avg_loss = abs(np.mean(losers)) if loss_count else 0
 
         # Expectancy = (Win% × Avg Win) - (Loss% × Avg Loss)
         expectancy = (win_rate / 100 * avg_win) - ((100 - win_rate) / 100 * avg_loss)
 
         return HorizonMetrics(
             horizon=horizon,
-            total_signals=len(signals),
-            signals_with_data=len(valid_signals),
+            total_signals=total_signals,
+            signals_with_data=total,
             winners=win_count,
             losers=loss_count,
             win_rate=round(win_rate, 1),
             avg_return=round(np.mean(returns), 2),
             median_return=round(np.median(returns), 2),
-            best_return=round(max(returns), 2),
-            worst_return=round(min(returns), 2),
+            best_return=round(float(returns.max()), 2),
+            worst_return=round(float(returns.min()), 2),
             avg_max_gain=round(np.mean(max_gains), 2),
             avg_max_loss=round(np.mean(max_losses), 2),
             expectancy=round(expectancy, 2),
@@ -6,22 +6,26 @@ Usage:
     python -m shared_core.backtest.runner --tickers AAPL,MSFT,GOOGL
     python -m shared_core.backtest.runner --all-sp500
     python -m shared_core.backtest.runner --tickers AAPL --detailed
+    python -m shared_core.backtest.runner --all-cached --workers 8
 """
 
 import argparse
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
 # Add parent to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from .engine import BacktestEngine
-from .models import ConvictionLevel, SignalType
+from ..cache.frame_cache import FrameCache
+from ..cache.storage import iter_cache_files, parse_cache_filename, read_cache_file
+from .engine import BacktestEngine, ScoringConfig
+from .models import BacktestResult, ConvictionLevel, SignalEvent, SignalType
 from .report import generate_backtest_report, generate_csv_report
 
 
@@ -29,7 +33,8 @@ def find_cached_files(cache_dir: str, ticker: str) -> Optional[Path]:
     """
     Find the most recent cache file for a ticker.
 
-    Handles both JSON (TICKER_DATE.json) and parquet formats.
+    Handles every cache storage format (TICKER_DATE.json/.npz/.parquet)
+    and legacy undated TICKER.parquet files.
     """
     cache_path = Path(cache_dir)
     twelve_data_dir = cache_path / "twelve_data"
@@ -37,10 +42,14 @@ def find_cached_files(cache_dir: str, ticker: str) -> Optional[Path]:
     if not twelve_data_dir.exists():
         return None
 
-    # Look for JSON files first (primary format)
-    json_files = sorted(twelve_data_dir.glob(f"{ticker.upper()}_*.json"), reverse=True)
-    if json_files:
-        return json_files[0]
+    # Dated cache files (primary format), most recent date first
+    dated_files = []
+    for f in iter_cache_files(twelve_data_dir, "*"):
+        parsed = parse_cache_filename(f)
+        if parsed and parsed[0] == ticker.upper():
+            dated_files.append((parsed[1], f))
+    if dated_files:
+        return max(dated_files)[1]
 
     # Fall back to parquet
     parquet_files = sorted(twelve_data_dir.glob(f"{ticker.upper()}.parquet"), reverse=True)
@@ -50,11 +59,18 @@ def find_cached_files(cache_dir: str, ticker: str) -> Optional[Path]:
     return None
 
 
-def load_from_cache(cache_dir: str, tickers: List[str], verbose: bool = False) -> Dict[str, pd.DataFrame]:
+def load_from_cache(
+    cache_dir: str,
+    tickers: List[str],
+    verbose: bool = False,
+    frame_cache: Optional[FrameCache] = None,
+) -> Dict[str, pd.DataFrame]:
     """
     Load ticker data directly from cache files.
 
     This is faster than going through the TwelveDataClient when we just want cached data.
+    With a frame_cache, files already parsed in this process are not read again
+    (the returned frames are then read-only views).
     """
     ticker_data = {}
     cache_path = Path(cache_dir)
@@ -74,12 +90,10 @@ def load_from_cache(cache_dir: str, tickers: List[str], verbose: bool = False) -
             continue
 
         try:
-            if cache_file.suffix == '.json':
-                df = pd.read_json(cache_file)
-            elif cache_file.suffix == '.parquet':
-                df = pd.read_parquet(cache_file)
+            if frame_cache is not None:
+                df = frame_cache.read(cache_file)
             else:
-                continue
+                df = read_cache_file(cache_file)
 
             if len(df) >= 250:
                 ticker_data[ticker] = df
@@ -106,15 +120,16 @@ def get_all_cached_tickers(cache_dir: str) -> List[str]:
 
     tickers = set()
 
-    # Find JSON files
-    for f in twelve_data_dir.glob("*_*.json"):
-        # Extract ticker from TICKER_DATE.json format
-        ticker = f.stem.rsplit('_', 1)[0]
-        tickers.add(ticker.upper())
+    # Find dated cache files (TICKER_DATE.<suffix>)
+    for f in iter_cache_files(twelve_data_dir):
+        parsed = parse_cache_filename(f)
+        if parsed:
+            tickers.add(parsed[0].upper())
 
-    # Find parquet files
+    # Find legacy undated parquet files
     for f in twelve_data_dir.glob("*.parquet"):
-        tickers.add(f.stem.upper())
+        if parse_cache_filename(f) is None:
+            tickers.add(f.stem.upper())
 
     return sorted(tickers)
 
@@ -124,11 +139,13 @@ def load_ticker_data(
     api_key: Optional[str] = None,
     cache_dir: Optional[str] = None,
     verbose: bool = False,
+    frame_cache: Optional[FrameCache] = None,
 ) -> Dict[str, pd.DataFrame]:
     """
     Load historical data for tickers.
 
     Uses cached data if available, otherwise fetches from API.
+    frame_cache is passed to load_from_cache.
     """
     from ..cache.data_cache import DataCache
     from ..market_data.twelve_data import TwelveDataClient
@@ -137,7 +154,7 @@ def load_ticker_data(
     if cache_dir:
         if verbose:
             print(f"Loading from cache: {cache_dir}")
-        ticker_data = load_from_cache(cache_dir, tickers, verbose)
+        ticker_data = load_from_cache(cache_dir, tickers, verbose, frame_cache)
 
         # Calculate indicators for cached data
         if ticker_data:
@@ -219,6 +236,115 @@ def _ensure_indicators(df: pd.DataFrame, client) -> pd.DataFrame:
     return df
 
 
+def _scan_shard(
+    cache_dir: str,
+    tickers: List[str],
+    signal_type: SignalType,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    conviction_filter: Optional[ConvictionLevel],
+    scoring_config: Optional[ScoringConfig],
+) -> Tuple[List[str], List[SignalEvent]]:
+    """
+    Worker: load one shard of tickers from cache and scan them.
+
+    Runs in a child process. Only the shard's frames are ever in memory here,
+    and only the (small) signal lists travel back to the parent.
+
+    Returns:
+        (tickers loaded from cache, their signals in ticker order)
+    """
+    from ..market_data.twelve_data import TwelveDataClient
+
+    ticker_data = load_from_cache(cache_dir, tickers)
+    client = TwelveDataClient(api_key="", output_size=1000, verbose=False)
+    engine = BacktestEngine(scoring_config=scoring_config)
+
+    loaded = list(ticker_data)
+    signals: List[SignalEvent] = []
+    for ticker in loaded:
+        # Release each frame as soon as it is scanned
+        df = _ensure_indicators(ticker_data.pop(ticker), client)
+        signals.extend(
+            engine.scan(ticker, df, signal_type, start_date, end_date, conviction_filter)
+        )
+    return loaded, signals
+
+
+def run_parallel_backtest(
+    cache_dir: str,
+    tickers: List[str],
+    signal_type: SignalType = SignalType.UPSIDE_REVERSAL,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    conviction_filter: Optional[ConvictionLevel] = None,
+    scoring_config: Optional[ScoringConfig] = None,
+    workers: Optional[int] = None,
+    shard_size: Optional[int] = None,
+    verbose: bool = False,
+) -> BacktestResult:
+    """
+    Run a backtest over cached tickers on a pool of worker processes.
+
+    Tickers are split into shards; each worker loads its shard's cache files
+    itself and streams back signals, so the parent never holds price
+    history. Metrics are computed once over the merged signals. The result
+    matches BacktestEngine.run_backtest on the same cached data.
+
+    Only cached tickers are backtested (no API fallback).
+
+    Args:
+        cache_dir: Cache directory containing twelve_data/
+        tickers: Ticker symbols to backtest
+        signal_type: Type of signal to detect
+        start_date: Start of backtest period
+        end_date: End of backtest period
+        conviction_filter: Minimum conviction level to keep
+        scoring_config: Scoring thresholds (default: ScoringConfig())
+        workers: Worker processes (default: os.cpu_count())
+        shard_size: Tickers per task (default: about 4 tasks per worker)
+        verbose: Print per-shard progress
+
+    Returns:
+        BacktestResult with all signals and metrics
+    """
+    workers = workers or os.cpu_count() or 1
+    if shard_size is None:
+        shard_size = max(1, -(-len(tickers) // (workers * 4)))
+    shards = [tickers[i:i + shard_size] for i in range(0, len(tickers), shard_size)]
+
+    results: Dict[int, Tuple[List[str], List[SignalEvent]]] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                _scan_shard, cache_dir, shard, signal_type,
+                start_date, end_date, conviction_filter, scoring_config,
+            ): i
+            for i, shard in enumerate(shards)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i] = future.result()
+            if verbose:
+                loaded, signals = results[i]
+                print(f"  Shard {len(results)}/{len(shards)}: "
+                      f"{len(loaded)} tickers, {len(signals)} signals")
+
+    # Merge in shard order so the result doesn't depend on completion order
+    loaded_tickers: List[str] = []
+    all_signals: List[SignalEvent] = []
+    for i in range(len(shards)):
+        loaded, signals = results[i]
+        loaded_tickers.extend(loaded)
+        all_signals.extend(signals)
+
+    engine = BacktestEngine(scoring_config=scoring_config)
+    return engine.summarize(
+        loaded_tickers, all_signals, signal_type,
+        start_date, end_date, conviction_filter,
+    )
+
+
 def run_backtest_cli(
     tickers: List[str],
     signal_type: SignalType = SignalType.UPSIDE_REVERSAL,
@@ -230,28 +356,52 @@ def run_backtest_cli(
     output_csv: Optional[str] = None,
     detailed: bool = False,
     verbose: bool = False,
+    workers: int = 1,
 ):
-    """Run backtest from command line."""
-    print(f"Loading data for {len(tickers)} tickers...")
-    ticker_data = load_ticker_data(
-        tickers, api_key, cache_dir, verbose
-    )
+    """
+    Run backtest from command line.
 
-    if not ticker_data:
-        print("Error: No valid ticker data loaded.")
-        return
+    With workers > 1 and a cache_dir, tickers are sharded across worker
+    processes (see run_parallel_backtest); tickers missing from the cache
+    are then skipped instead of fetched from the API.
+    """
+    if workers > 1 and cache_dir:
+        print(f"Running backtest for {len(tickers)} tickers on {workers} workers...")
+        result = run_parallel_backtest(
+            cache_dir,
+            tickers,
+            signal_type=signal_type,
+            start_date=start_date,
+            end_date=end_date,
+            conviction_filter=conviction_filter,
+            workers=workers,
+            verbose=verbose,
+        )
+        if not result.tickers:
+            print("Error: No valid ticker data loaded.")
+            return
+        print(f"Loaded {len(result.tickers)} tickers with sufficient data.")
+    else:
+        print(f"Loading data for {len(tickers)} tickers...")
+        ticker_data = load_ticker_data(
+            tickers, api_key, cache_dir, verbose
+        )
 
-    print(f"Loaded {len(ticker_data)} tickers with sufficient data.")
-    print("Running backtest...")
+        if not ticker_data:
+            print("Error: No valid ticker data loaded.")
+            return
 
-    engine = BacktestEngine(verbose=verbose)
-    result = engine.run_backtest(
-        ticker_data=ticker_data,
-        signal_type=signal_type,
-        start_date=start_date,
-        end_date=end_date,
-        conviction_filter=conviction_filter,
-    )
+        print(f"Loaded {len(ticker_data)} tickers with sufficient data.")
+        print("Running backtest...")
+
+        engine = BacktestEngine(verbose=verbose)
+        result = engine.run_backtest(
+            ticker_data=ticker_data,
+            signal_type=signal_type,
+            start_date=start_date,
+            end_date=end_date,
+            conviction_filter=conviction_filter,
+        )
 
     # Generate report
     report = generate_backtest_report(result, detailed=detailed)
@@ -334,6 +484,13 @@ def main():
         help='Verbose output'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes; >1 shards cached tickers across processes'
+    )
+
     parser.add_argument(
         '--all-cached',
         action='store_true',
@@ -394,6 +551,7 @@ def main():
         output_csv=args.output_csv,
         detailed=args.detailed,
         verbose=args.verbose,
+        workers=args.workers,
     )
 
 
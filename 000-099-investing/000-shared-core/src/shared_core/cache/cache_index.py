@@ -0,0 +1,364 @@
+"""
+Index of date-stamped cache files.
+
+Listing cached tickers, checking whether a ticker is fresh for a date and
+computing cache stats used to glob the whole cache directory (and sometimes
+parse every file). CacheIndex keeps one SQLite row per TICKER_DATE file with
+its row count, last bar timestamp and byte size, so those questions become
+indexed lookups.
+
+DataCache records every file it writes, migrates or deletes. Files added or
+removed by anything else are picked up lazily: each lookup compares the
+directory's mtime with the one seen at the last scan and, when it changed,
+rescans file names (no file is opened). The index lives in the cache
+directory's parent so its own journal files never touch that mtime.
+
+Cache structure:
+    data/
+    ├── cache_index.sqlite
+    ├── twelve_data/
+    │   └── AAPL_2025-12-19.npz
+    └── transcripts/
+        └── AAPL_2025-12-19.json
+
+Usage:
+    from shared_core.cache.cache_index import CacheIndex
+
+    index = CacheIndex(Path("data/twelve_data"))
+    tickers = index.tickers("2025-12-19")
+    entry = index.find("AAPL", "2025-12-19")
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+
+from .storage import CACHE_SUFFIXES, parse_cache_filename
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "cache_index.sqlite"
+
+# A directory scanned within this long of its last change may have changed
+# again inside the same mtime tick; such scans are repeated on next lookup.
+RACY_WINDOW_NS = 1_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_files (
+    directory TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    date TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    rows INTEGER,
+    last_bar TEXT,
+    PRIMARY KEY (directory, filename)
+);
+CREATE INDEX IF NOT EXISTS idx_cache_files_date ON cache_files(directory, date, ticker);
+CREATE INDEX IF NOT EXISTS idx_cache_files_ticker ON cache_files(directory, ticker, date);
+CREATE TABLE IF NOT EXISTS cache_dirs (
+    directory TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    scanned_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cache_reads (
+    directory TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    read_ns INTEGER NOT NULL,
+    PRIMARY KEY (directory, ticker)
+);
+"""
+
+
+@dataclass
+class CacheEntry:
+    """One indexed cache file. rows/last_bar are None for files not written by DataCache."""
+    ticker: str
+    date: str
+    filename: str
+    size_bytes: int
+    rows: Optional[int] = None
+    last_bar: Optional[str] = None
+
+
+def _last_bar(df: pd.DataFrame) -> Optional[str]:
+    """Timestamp of the latest bar, from a 'datetime' column or a DatetimeIndex."""
+    if 'datetime' in df.columns:
+        values = pd.to_datetime(df['datetime'], errors='coerce')
+    elif isinstance(df.index, pd.DatetimeIndex):
+        values = df.index
+    else:
+        return None
+    latest = values.max()
+    return None if pd.isna(latest) else pd.Timestamp(latest).isoformat()
+
+
+class CacheIndex:
+    """
+    SQLite index of the TICKER_DATE.<suffix> files in one cache directory.
+
+    Safe to share between threads; processes sharing a cache directory
+    share the index file.
+    """
+
+    def __init__(self, directory: Path, suffixes: Sequence[str] = CACHE_SUFFIXES):
+        """
+        Args:
+            directory: Cache directory to index (e.g., data/twelve_data)
+            suffixes: File suffixes that count as cache files
+        """
+        self.directory = Path(directory)
+        self.suffixes = tuple(suffixes)
+        self.db_path = self.directory.parent / INDEX_FILENAME
+        self._key = self.directory.name
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._touched: Set[str] = set()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the index database (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # =========================================================================
+    # MAINTENANCE
+    # =========================================================================
+
+    def record(self, path: Path, df: Optional[pd.DataFrame] = None) -> None:
+        """
+        Add or update the entry for a file that was just written.
+
+        Args:
+            path: Cache file path inside the indexed directory
+            df: Frame that was written (supplies row count and last bar)
+        """
+        parsed = parse_cache_filename(path)
+        if parsed is None:
+            return
+        try:
+            size = path.stat().st_size
+            with self._lock, self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self._key, path.name, parsed[0], parsed[1], size,
+                     len(df) if df is not None else None,
+                     _last_bar(df) if df is not None else None),
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Cache index update failed for {path.name}: {e}")
+
+    def remove(self, path: Path) -> None:
+        """Drop the entry for a deleted file."""
+        try:
+            with self._lock, self._connection() as conn:
+                conn.execute(
+                    "DELETE FROM cache_files WHERE directory = ? AND filename = ?",
+                    (self._key, path.name),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Cache index update failed for {path.name}: {e}")
+
+    def touch(self, ticker: str) -> None:
+        """
+        Record that a ticker's cache was read (drives LRU eviction).
+
+        Only the first read per ticker is written for each CacheIndex
+        instance, so hot read loops don't turn into database writes.
+        """
+        if ticker in self._touched:
+            return
+        try:
+            with self._lock, self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_reads VALUES (?, ?, ?)",
+                    (self._key, ticker, time.time_ns()),
+                )
+            self._touched.add(ticker)
+        except sqlite3.Error as e:
+            logger.warning(f"Cache index read tracking failed for {ticker}: {e}")
+
+    def last_reads(self) -> Dict[str, int]:
+        """Ticker -> time of the last recorded read (ns since epoch)."""
+        rows = self._query("SELECT ticker, read_ns FROM cache_reads WHERE directory = ?")
+        return dict(rows)
+
+    def clear(self) -> None:
+        """Drop every entry for this directory."""
+        with self._lock, self._connection() as conn:
+            conn.execute("DELETE FROM cache_files WHERE directory = ?", (self._key,))
+            conn.execute("DELETE FROM cache_dirs WHERE directory = ?", (self._key,))
+            conn.execute("DELETE FROM cache_reads WHERE directory = ?", (self._key,))
+        self._touched.clear()
+
+    def sync(self) -> None:
+        """
+        Reconcile the index with the directory if it changed since the last scan.
+
+        Costs one stat when nothing changed; otherwise one directory listing
+        plus a stat per previously unseen file.
+        """
+        try:
+            mtime_ns = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+
+        with self._lock, self._connection() as conn:
+            seen = conn.execute(
+                "SELECT mtime_ns, scanned_ns FROM cache_dirs WHERE directory = ?",
+                (self._key,),
+            ).fetchone()
+            if (seen is not None and seen[0] == mtime_ns
+                    and seen[1] - seen[0] >= RACY_WINDOW_NS):
+                return
+
+            on_disk: Dict[str, Tuple[str, str]] = {}
+            if mtime_ns is not None:
+                with os.scandir(self.directory) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(self.suffixes) or not entry.is_file():
+                            continue
+                        parsed = parse_cache_filename(Path(entry.name))
+                        if parsed is not None:
+                            on_disk[entry.name] = parsed
+
+            known = {
+                row[0] for row in conn.execute(
+                    "SELECT filename FROM cache_files WHERE directory = ?", (self._key,)
+                )
+            }
+            conn.executemany(
+                "DELETE FROM cache_files WHERE directory = ? AND filename = ?",
+                [(self._key, name) for name in known - on_disk.keys()],
+            )
+            added = []
+            for name in on_disk.keys() - known:
+                try:
+                    size = (self.directory / name).stat().st_size
+                except FileNotFoundError:
+                    continue
+                ticker, date = on_disk[name]
+                added.append((self._key, name, ticker, date, size, None, None))
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache_files VALUES (?, ?, ?, ?, ?, ?, ?)", added
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_dirs VALUES (?, ?, ?)",
+                (self._key, mtime_ns if mtime_ns is not None else -1, time.time_ns()),
+            )
+
+    # =========================================================================
+    # LOOKUPS
+    # =========================================================================
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[tuple]:
+        self.sync()
+        with self._lock:
+            return self._connection().execute(sql, (self._key, *params)).fetchall()
+
+    def find(
+        self,
+        ticker: str,
+        date: str,
+        preferred_suffix: Optional[str] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        Entry for a ticker's file on a date, if cached.
+
+        When files in several formats exist, the preferred suffix wins,
+        then suffix order.
+        """
+        rows = self._query(
+            "SELECT ticker, date, filename, size_bytes, rows, last_bar FROM cache_files "
+            "WHERE directory = ? AND ticker = ? AND date = ?",
+            (ticker, date),
+        )
+        if not rows:
+            return None
+        order = [preferred_suffix] if preferred_suffix else []
+        order += [s for s in self.suffixes if s != preferred_suffix]
+        rows.sort(key=lambda row: next(
+            (i for i, suffix in enumerate(order) if row[2].endswith(suffix)), len(order)
+        ))
+        return CacheEntry(*rows[0])
+
+    def latest(self, ticker: str, before: str) -> Optional[CacheEntry]:
+        """Most recent entry for a ticker dated strictly before a date."""
+        rows = self._query(
+            "SELECT date FROM cache_files WHERE directory = ? AND ticker = ? AND date < ? "
+            "ORDER BY date DESC LIMIT 1",
+            (ticker, before),
+        )
+        return self.find(ticker, rows[0][0]) if rows else None
+
+    def entries(
+        self,
+        date: Optional[str] = None,
+        before: Optional[str] = None,
+        ticker: Optional[str] = None,
+    ) -> List[CacheEntry]:
+        """
+        Indexed files, optionally limited to one date or to dates before a cutoff.
+
+        Args:
+            date: Only files for this date (YYYY-MM-DD)
+            before: Only files dated strictly before this date
+            ticker: Only files for this ticker
+        """
+        sql = "SELECT ticker, date, filename, size_bytes, rows, last_bar FROM cache_files WHERE directory = ?"
+        params: Tuple = ()
+        if ticker is not None:
+            sql += " AND ticker = ?"
+            params += (ticker,)
+        if date is not None:
+            sql += " AND date = ?"
+            params += (date,)
+        if before is not None:
+            sql += " AND date < ?"
+            params += (before,)
+        return [CacheEntry(*row) for row in self._query(sql + " ORDER BY ticker, date", params)]
+
+    def tickers(self, date: str) -> List[str]:
+        """Sorted tickers with a file for the date."""
+        rows = self._query(
+            "SELECT DISTINCT ticker FROM cache_files WHERE directory = ? AND date = ? ORDER BY ticker",
+            (date,),
+        )
+        return [row[0] for row in rows]
+
+    def dates(self) -> List[str]:
+        """Dates with at least one file, most recent first."""
+        rows = self._query(
+            "SELECT DISTINCT date FROM cache_files WHERE directory = ? ORDER BY date DESC"
+        )
+        return [row[0] for row in rows]
+
+    def summary(self, date: str) -> Dict[str, int]:
+        """
+        File counts and total size.
+
+        Returns:
+            Dict with 'files', 'files_on_date' and 'size_bytes'
+        """
+        files, size = self._query(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_files WHERE directory = ?"
+        )[0]
+        on_date = self._query(
+            "SELECT COUNT(*) FROM cache_files WHERE directory = ? AND date = ?", (date,)
+        )[0][0]
+        return {'files': files, 'files_on_date': on_date, 'size_bytes': size}
@@ -0,0 +1,391 @@
+"""
+Size- and age-bounded compaction of the time series cache.
+
+Every daily TICKER_DATE file holds almost the same history as the day
+before, so the cache grows with days x tickers x history length. Compaction
+folds a ticker's dated snapshots into one history file under
+``twelve_data/history/`` and replaces each folded snapshot with a small
+``.ptr`` pointer to its row range in that history (see PointerStorage).
+A pointer reads back exactly as the snapshot it replaced, so readers don't
+change; a snapshot that can't be reproduced that way (e.g. one from before
+a split) stays a full file.
+
+Compaction then deletes snapshots older than max_age_days and, while the
+cache is over its byte budget, evicts tickers least recently read first.
+Today's snapshots are the working set and are never folded or evicted.
+
+Cache structure after compaction:
+    data/
+    ├── cache_index.sqlite
+    └── twelve_data/
+        ├── history/
+        │   └── AAPL.npz
+        ├── AAPL_2025-12-17.ptr
+        ├── AAPL_2025-12-18.ptr
+        └── AAPL_2025-12-19.npz
+
+Usage:
+    from shared_core.cache.data_cache import DataCache
+
+    report = DataCache(Path("data")).compact(max_bytes=500 * 1024 * 1024)
+"""
+
+import datetime
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..config.constants import CACHE_CONFIG
+from .cache_index import CacheEntry, CacheIndex
+from .storage import POINTER_STORAGE, CacheStorage, read_cache_file
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DIRNAME = "history"
+
+
+@dataclass
+class CompactionReport:
+    """Outcome of one CacheCompactor.compact() run."""
+    folded: int = 0
+    expired: int = 0
+    evicted: List[str] = field(default_factory=list)
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+
+def history_bytes(directory: Path) -> int:
+    """Total size of the folded history files under a cache directory."""
+    history_dir = Path(directory) / HISTORY_DIRNAME
+    if not history_dir.exists():
+        return 0
+    return sum(path.stat().st_size for path in history_dir.iterdir() if path.is_file())
+
+
+def _frames_equal(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    return a.reset_index(drop=True).equals(b.reset_index(drop=True))
+
+
+def _compatible(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    """Same columns with the same dtypes, and a datetime column to key rows on."""
+    return (
+        'datetime' in a.columns
+        and list(a.columns) == list(b.columns)
+        and (a.dtypes == b.dtypes).all()
+    )
+
+
+def _differing_rows(df: pd.DataFrame, other: pd.DataFrame) -> np.ndarray:
+    """Positions where two aligned frames of equal length differ in any column."""
+    differs = np.zeros(len(df), dtype=bool)
+    for column in df.columns:
+        a, b = df[column].to_numpy(), other[column].to_numpy()
+        differs |= ~((a == b) | (pd.isna(a) & pd.isna(b)))
+    return np.flatnonzero(differs)
+
+
+def build_pointer(
+    df: pd.DataFrame,
+    history: pd.DataFrame,
+    history_name: str,
+    max_patch_rows: int = CACHE_CONFIG.COMPACT_MAX_PATCH_ROWS,
+) -> Optional[Dict[str, Any]]:
+    """
+    Describe a snapshot as a row range of a history frame.
+
+    Args:
+        df: Snapshot to replace
+        history: Folded history the pointer will read from
+        history_name: History path relative to the snapshot's directory
+        max_patch_rows: Most rows allowed to differ from the history
+
+    Returns:
+        Pointer document, or None if the snapshot can't be expressed
+        against this history
+    """
+    if df.empty or not _compatible(df, history):
+        return None
+
+    dates = pd.to_datetime(df['datetime'])
+    history_dates = pd.to_datetime(history['datetime'])
+    start, end = dates.iloc[0], dates.iloc[-1]
+    window = history.loc[(history_dates >= start) & (history_dates <= end)]
+    if len(window) != len(df) or not (history_dates[window.index].to_numpy() == dates.to_numpy()).all():
+        return None
+
+    rows = _differing_rows(df, window)
+    if len(rows) > max_patch_rows:
+        return None
+
+    pointer: Dict[str, Any] = {
+        'history': history_name,
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'rows': len(df),
+    }
+    if len(rows):
+        pointer['patch'] = {
+            'rows': rows.tolist(),
+            'values': {
+                column: df[column].iloc[rows].tolist()
+                for column in df.columns if column != 'datetime'
+            },
+        }
+    return pointer
+
+
+class CacheCompactor:
+    """
+    Folds, expires and evicts the dated snapshots of one cache directory.
+
+    Works through the directory's CacheIndex, which it keeps up to date.
+    """
+
+    def __init__(
+        self,
+        index: CacheIndex,
+        storage: CacheStorage,
+        today: str,
+        verbose: bool = False,
+    ):
+        """
+        Args:
+            index: Index of the cache directory to compact
+            storage: Format for history files (the cache's write format)
+            today: Current cache date; snapshots from this date on are kept as is
+            verbose: Print compaction operations
+        """
+        self.index = index
+        self.directory = index.directory
+        self.history_dir = self.directory / HISTORY_DIRNAME
+        self.storage = storage
+        self.today = today
+        self.verbose = verbose
+
+    def total_bytes(self) -> int:
+        """Bytes used by snapshots, pointers and histories."""
+        return self.index.summary(self.today)['size_bytes'] + history_bytes(self.directory)
+
+    def compact(
+        self,
+        max_bytes: Optional[int] = CACHE_CONFIG.COMPACT_MAX_BYTES,
+        max_age_days: Optional[int] = CACHE_CONFIG.COMPACT_MAX_AGE_DAYS,
+    ) -> CompactionReport:
+        """
+        Expire old snapshots, fold the rest into histories, then enforce the budget.
+
+        Args:
+            max_bytes: Byte budget (None = unbounded)
+            max_age_days: Delete snapshots older than this many days (None = keep)
+
+        Returns:
+            CompactionReport
+        """
+        report = CompactionReport(bytes_before=self.total_bytes())
+
+        if max_age_days is not None:
+            report.expired = self._expire(max_age_days)
+
+        for ticker in sorted({entry.ticker for entry in self.index.entries(before=self.today)}):
+            try:
+                report.folded += self._fold(ticker)
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Cache compaction failed for {ticker}: {e}")
+        self._remove_orphan_histories()
+
+        if max_bytes is not None:
+            report.evicted = self._evict(max_bytes)
+
+        report.bytes_after = self.total_bytes()
+        if self.verbose:
+            print(f"    🗜️  Compacted cache: {report.bytes_before / 1e6:.1f}MB -> "
+                  f"{report.bytes_after / 1e6:.1f}MB ({report.folded} folded, "
+                  f"{report.expired} expired, {len(report.evicted)} tickers evicted)")
+        return report
+
+    # =========================================================================
+    # STEPS
+    # =========================================================================
+
+    def _delete(self, entry: CacheEntry) -> None:
+        path = self.directory / entry.filename
+        path.unlink(missing_ok=True)
+        self.index.remove(path)
+
+    def _expire(self, max_age_days: int) -> int:
+        cutoff = datetime.date.fromisoformat(self.today) - datetime.timedelta(days=max_age_days)
+        expired = self.index.entries(before=cutoff.isoformat())
+        for entry in expired:
+            self._delete(entry)
+            if self.verbose:
+                print(f"    🗑️  Deleted old cache: {entry.filename}")
+        return len(expired)
+
+    def _history_path(self, ticker: str) -> Path:
+        return self.history_dir / f"{ticker}{self.storage.suffix}"
+
+    def _fold(self, ticker: str) -> int:
+        """Fold one ticker's earlier snapshots; returns the number newly turned into pointers."""
+        snapshots: Dict[str, CacheEntry] = {}
+        for entry in self.index.entries(ticker=ticker):
+            snapshots.setdefault(entry.date, self.index.find(ticker, entry.date))
+
+        frames: Dict[str, pd.DataFrame] = {}
+        for date, entry in snapshots.items():
+            try:
+                df = read_cache_file(self.directory / entry.filename)
+            except (ValueError, OSError, KeyError) as e:
+                logger.warning(f"Skipping unreadable cache file {entry.filename}: {e}")
+                continue
+            if 'datetime' in df.columns and not df.empty:
+                frames[date] = df
+
+        history = self._build_history(frames)
+        if history is None:
+            return 0
+
+        history_path = self._history_path(ticker)
+        history_name = f"{HISTORY_DIRNAME}/{history_path.name}"
+        pointers = {
+            date: build_pointer(frames[date], history, history_name)
+            for date in frames if date < self.today
+        }
+
+        # Pointers the new history can't reproduce become full files again
+        # before the history they read from is replaced
+        for date, pointer in pointers.items():
+            entry = snapshots[date]
+            if pointer is None and entry.filename.endswith(POINTER_STORAGE.suffix):
+                self._write_snapshot(ticker, date, frames[date], entry)
+
+        self.history_dir.mkdir(exist_ok=True)
+        tmp_path = history_path.with_name(f".{history_path.stem}.tmp{history_path.suffix}")
+        self.storage.write(history, tmp_path)
+        os.replace(tmp_path, history_path)
+        for path in self.history_dir.iterdir():
+            # History left in a previous storage format
+            if path.stem == ticker and path != history_path:
+                path.unlink()
+
+        folded = 0
+        for date, pointer in pointers.items():
+            if pointer is None:
+                continue
+            entry = snapshots[date]
+            was_pointer = entry.filename.endswith(POINTER_STORAGE.suffix)
+            if self._write_pointer(ticker, date, pointer, frames[date], entry) and not was_pointer:
+                folded += 1
+        return folded
+
+    def _build_history(self, frames: Dict[str, pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """
+        Newest snapshot extended backwards with older snapshots' earlier bars.
+
+        An older snapshot only contributes if it agrees with the history on
+        the bars they share (so pre-split data is never mixed in).
+        """
+        if not frames:
+            return None
+
+        dates = sorted(frames, reverse=True)
+        history = frames[dates[0]]
+        for date in dates[1:]:
+            df = frames[date]
+            if not _compatible(df, history):
+                continue
+            first = pd.to_datetime(history['datetime']).iloc[0]
+            df_dates = pd.to_datetime(df['datetime'])
+            earlier, later = df.loc[df_dates < first], df.loc[df_dates >= first]
+            if earlier.empty or (not later.empty and build_pointer(later, history, "") is None):
+                continue
+            history = pd.concat([earlier, history], ignore_index=True)
+        return history.reset_index(drop=True)
+
+    def _write_pointer(
+        self,
+        ticker: str,
+        date: str,
+        pointer: Dict[str, Any],
+        df: pd.DataFrame,
+        entry: CacheEntry,
+    ) -> bool:
+        """Write a pointer for a snapshot and drop the full file once it reads back identically."""
+        path = self.directory / f"{ticker}_{date}{POINTER_STORAGE.suffix}"
+        POINTER_STORAGE.write_pointer(path, pointer)
+        try:
+            identical = _frames_equal(POINTER_STORAGE.read(path), df)
+        except (ValueError, OSError, KeyError) as e:
+            logger.warning(f"Cache pointer check failed for {path.name}: {e}")
+            identical = False
+
+        if not identical:
+            if entry.filename != path.name:
+                path.unlink()
+            else:
+                self._write_snapshot(ticker, date, df, entry)
+            return False
+
+        self.index.record(path, df)
+        if entry.filename != path.name:
+            self._delete(entry)
+        return True
+
+    def _write_snapshot(self, ticker: str, date: str, df: pd.DataFrame, entry: CacheEntry) -> None:
+        """Materialize a snapshot as a full file in the cache's format."""
+        path = self.directory / f"{ticker}_{date}{self.storage.suffix}"
+        self.storage.write(df, path)
+        self.index.record(path, df)
+        if entry.filename != path.name:
+            self._delete(entry)
+
+    def _remove_orphan_histories(self) -> None:
+        if not self.history_dir.exists():
+            return
+        referenced = {
+            entry.ticker for entry in self.index.entries()
+            if entry.filename.endswith(POINTER_STORAGE.suffix)
+        }
+        for path in self.history_dir.iterdir():
+            if path.is_file() and path.stem not in referenced:
+                path.unlink()
+
+    def _evict(self, max_bytes: int) -> List[str]:
+        """Delete earlier snapshots of least recently read tickers until under budget."""
+        total = self.total_bytes()
+        if total <= max_bytes:
+            return []
+
+        by_ticker: Dict[str, List[CacheEntry]] = {}
+        for entry in self.index.entries(before=self.today):
+            by_ticker.setdefault(entry.ticker, []).append(entry)
+        reads = self.index.last_reads()
+
+        def recency(ticker: str):
+            return reads.get(ticker, 0), max(entry.date for entry in by_ticker[ticker])
+
+        evicted = []
+        for ticker in sorted(by_ticker, key=recency):
+            if total <= max_bytes:
+                break
+            for entry in by_ticker[ticker]:
+                self._delete(entry)
+                total -= entry.size_bytes
+            history_path = self._history_path(ticker)
+            if history_path.exists():
+                total -= history_path.stat().st_size
+                history_path.unlink()
+            evicted.append(ticker)
+            if self.verbose:
+                print(f"    🗑️  Evicted cache: {ticker}")
+
+        if total > max_bytes:
+            logger.warning(
+                f"Cache still {total} bytes after eviction (budget {max_bytes}); "
+                "today's snapshots are never evicted"
+            )
+        return evicted
@@ -1,6 +1,7 @@
 """
 Date-based caching layer for API responses.
-Stores Twelve Data time series and transcript data as JSON files.
+Stores Twelve Data time series in a pluggable format (JSON by default, or a
+binary columnar format; see storage.py) and transcript data as JSON files.
 Each file is stamped with the fetch date to enable daily refresh logic.
 """
 
@@ -8,37 +9,90 @@ import datetime
 import json
 import logging
 import os
+import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import pandas as pd
 
+from ..config.constants import CACHE_CONFIG
+from .cache_index import CacheIndex
+from .compaction import HISTORY_DIRNAME, CacheCompactor, CompactionReport, history_bytes
+from .frame_cache import FrameCache
+from .indicator_state import IndicatorStateStore
+from .indicator_store import IndicatorStore
+from .storage import (
+    CACHE_SUFFIXES,
+    POINTER_STORAGE,
+    CacheStorage,
+    find_cache_file,
+    get_storage,
+    iter_cache_files,
+    parse_cache_filename,
+    storage_for_path,
+)
+
+if TYPE_CHECKING:
+    from ..llm.cache import ResponseCache
+
 logger = logging.getLogger(__name__)
 
 
 class DataCache:
     """
-    Manages local JSON cache for API data.
+    Manages local cache for API data.
 
     Cache structure:
         data/
+        ├── cache_index.sqlite         (see cache_index.py)
         ├── twelve_data/
+        │   ├── history/               (see compact)
+        │   └── AAPL_2025-12-19.json   (or .npz / .parquet / .ptr)
+        ├── transcripts/
         │   └── AAPL_2025-12-19.json
-        └── transcripts/
-            └── AAPL_2025-12-19.json
+        ├── indicators/                (see get_indicator_store)
+        │   └── AAPL_2025-12-19_<digest>.npz
+        └── indicator_state/           (see get_indicator_state_store)
+            └── AAPL.json
+
+    Time series are read in whichever format they were written. A file in
+    another format than the cache's own is rewritten on first read, so
+    existing JSON caches migrate transparently after switching formats.
+
+    Every file written or removed here is recorded in a CacheIndex, so
+    freshness checks, ticker listings and stats never glob the directories.
+    compact() folds earlier snapshots into per-ticker histories and keeps
+    the cache within a byte budget.
+
+    With a FrameCache, get_twelve_data parses each file once per process and
+    returns read-only views (see frame_cache.py).
     """
 
-    def __init__(self, cache_dir: Path, verbose: bool = False):
+    def __init__(
+        self,
+        cache_dir: Path,
+        verbose: bool = False,
+        storage_format: Optional[str] = None,
+        frame_cache: Optional[FrameCache] = None,
+    ):
         """
         Initialize cache manager.
 
         Args:
             cache_dir: Root directory for cache (e.g., project/data/)
             verbose: Print cache operations
+            storage_format: Time series format: 'json', 'npz' or 'parquet'
+                (default: CACHE_FORMAT env var, else CACHE_CONFIG.STORAGE_FORMAT)
+            frame_cache: Optional in-memory LRU of parsed time series, e.g.
+                shared_frame_cache() to share one across the process
         """
         self.cache_dir = Path(cache_dir)
         self.verbose = verbose
         self.today = os.environ.get('CACHE_DATE') or datetime.date.today().isoformat()
+        self.storage: CacheStorage = get_storage(
+            storage_format or os.environ.get('CACHE_FORMAT') or CACHE_CONFIG.STORAGE_FORMAT
+        )
+        self.frame_cache = frame_cache
 
         # Ensure directories exist
         self.twelve_data_dir = self.cache_dir / "twelve_data"
@@ -46,10 +100,13 @@ class DataCache:
         self.twelve_data_dir.mkdir(parents=True, exist_ok=True)
         self.transcripts_dir.mkdir(parents=True, exist_ok=True)
 
+        self.twelve_data_index = CacheIndex(self.twelve_data_dir)
+        self.transcripts_index = CacheIndex(self.transcripts_dir, suffixes=(".json",))
+
     def _get_twelve_data_path(self, ticker: str, date: Optional[str] = None) -> Path:
         """Get path for a ticker's time series cache file."""
         date = date or self.today
-        return self.twelve_data_dir / f"{ticker.upper()}_{date}.json"
+        return self.twelve_data_dir / f"{ticker.upper()}_{date}{self.storage.suffix}"
 
     def _get_transcript_path(self, ticker: str, date: Optional[str] = None) -> Path:
         """Get path for a ticker's transcript cache file."""
@@ -70,17 +127,26 @@ class DataCache:
         Returns:
             DataFrame with OHLCV data if cached today, else None
         """
-        path = self._get_twelve_data_path(ticker)
+        path = find_cache_file(
+            self.twelve_data_dir, ticker.upper(), self.today, preferred=self.storage
+        )
 
-        if not path.exists():
+        if path is None:
             if self.verbose:
                 print(f"    📁 Cache miss: {ticker} (no file)")
             return None
 
         try:
-            df = pd.read_json(path)
+            storage = storage_for_path(path)
+            if self.frame_cache is not None:
+                df = self.frame_cache.read(path, storage.read)
+            else:
+                df = storage.read(path)
             if self.verbose:
                 print(f"    📁 Cache hit: {ticker} ({len(df)} bars)")
+            self.twelve_data_index.touch(ticker.upper())
+            if storage is not self.storage and storage is not POINTER_STORAGE:
+                self._migrate_file(ticker, path, df)
             return df
         except (json.JSONDecodeError, ValueError) as e:
             logger.warning(f"Cache parse error for {ticker}: {e}")
@@ -104,7 +170,13 @@ class DataCache:
         path = self._get_twelve_data_path(ticker)
 
         try:
-            df.to_json(path, date_format='iso')
+            self.storage.write(df, path)
+            self.twelve_data_index.record(path, df)
+            # A compacted snapshot for the same date is now stale
+            pointer = path.with_suffix(POINTER_STORAGE.suffix)
+            if pointer.exists():
+                pointer.unlink()
+                self.twelve_data_index.remove(pointer)
             if self.verbose:
                 print(f"    💾 Cached: {ticker} ({len(df)} bars)")
         except OSError as e:
@@ -116,6 +188,117 @@ class DataCache:
             if self.verbose:
                 print(f"    ⚠️  Cache save failed: {ticker} ({e})")
 
+    def _migrate_file(self, ticker: str, path: Path, df: pd.DataFrame) -> bool:
+        """Rewrite a cache file in this cache's format and remove the original."""
+        date = parse_cache_filename(path)
+        target = self._get_twelve_data_path(ticker, date[1] if date else None)
+
+        try:
+            self.storage.write(df, target)
+            path.unlink()
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Cache migration failed for {path.name}: {e}")
+            return False
+
+        self.twelve_data_index.remove(path)
+        self.twelve_data_index.record(target, df)
+
+        if self.verbose:
+            print(f"    🔁 Migrated cache: {path.name} -> {target.name}")
+        return True
+
+    def migrate_twelve_data(self) -> int:
+        """
+        Convert every time series file in another format to this cache's format.
+
+        Returns:
+            Number of files migrated
+        """
+        migrated = 0
+
+        for path in list(iter_cache_files(self.twelve_data_dir)):
+            storage = storage_for_path(path)
+            parsed = parse_cache_filename(path)
+            if storage in (self.storage, POINTER_STORAGE) or parsed is None:
+                continue
+            try:
+                df = storage.read(path)
+            except (ValueError, OSError) as e:
+                logger.warning(f"Skipping unreadable cache file {path.name}: {e}")
+                continue
+            if self._migrate_file(parsed[0], path, df):
+                migrated += 1
+
+        return migrated
+
+    def has_twelve_data(self, ticker: str, date: Optional[str] = None) -> bool:
+        """
+        Check for a cached time series without reading it.
+
+        Args:
+            ticker: Stock ticker symbol
+            date: Cache date (default: today)
+
+        Returns:
+            True if a file exists for the ticker and date
+        """
+        return self.twelve_data_index.find(ticker.upper(), date or self.today) is not None
+
+    def get_previous_twelve_data(self, ticker: str) -> Optional[pd.DataFrame]:
+        """
+        Load the most recent time series cached before today.
+
+        Used as the base for delta refreshes (see market_data/delta.py).
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            DataFrame from the latest earlier cache file, or None
+        """
+        entry = self.twelve_data_index.latest(ticker.upper(), self.today)
+        if entry is None:
+            return None
+
+        path = self.twelve_data_dir / entry.filename
+        try:
+            return storage_for_path(path).read(path)
+        except (ValueError, OSError) as e:
+            logger.warning(f"Previous cache read error for {ticker}: {e}")
+            return None
+
+    def get_indicator_store(self) -> IndicatorStore:
+        """
+        Indicator snapshot store kept next to this cache's time series.
+
+        Returns:
+            IndicatorStore rooted at <cache_dir>/indicators
+        """
+        return IndicatorStore(self.cache_dir / "indicators", verbose=self.verbose)
+
+    def get_indicator_state_store(self) -> IndicatorStateStore:
+        """
+        Streaming indicator state store kept next to this cache's time series.
+
+        Returns:
+            IndicatorStateStore rooted at <cache_dir>/indicator_state
+        """
+        return IndicatorStateStore(self.cache_dir / "indicator_state", verbose=self.verbose)
+
+    def get_llm_cache(self, ttl_hours: Optional[float] = None) -> "ResponseCache":
+        """
+        Persistent LLM response cache kept next to this cache's time series.
+
+        Args:
+            ttl_hours: Response lifetime (default CACHE_CONFIG.LLM_CACHE_TTL_HOURS)
+
+        Returns:
+            ResponseCache rooted at <cache_dir>/llm_responses
+        """
+        from ..llm.cache import ResponseCache
+
+        return ResponseCache(self.cache_dir / "llm_responses", ttl_hours=ttl_hours, verbose=self.verbose)
+
     # =========================================================================
     # TRANSCRIPT CACHE
     # =========================================================================
@@ -167,6 +350,7 @@ class DataCache:
         try:
             with open(path, 'w') as f:
                 json.dump(data, f, indent=2, default=str)
+            self.transcripts_index.record(path)
             if self.verbose:
                 print(f"    💾 Transcript cached: {ticker}")
         except OSError as e:
@@ -178,10 +362,25 @@ class DataCache:
             if self.verbose:
                 print(f"    ⚠️  Transcript cache save failed: {ticker} ({e})")
 
+    def has_transcript(self, ticker: str, date: Optional[str] = None) -> bool:
+        """Check for a cached transcript without reading it."""
+        return self.transcripts_index.find(ticker.upper(), date or self.today) is not None
+
     # =========================================================================
     # CACHE MANAGEMENT
     # =========================================================================
 
+    def _twelve_data_files(self) -> List[Path]:
+        """All time series cache files, in every storage format."""
+        return [
+            path for suffix in CACHE_SUFFIXES
+            for path in self.twelve_data_dir.glob(f"*{suffix}")
+        ]
+
+    def _transcript_files(self) -> List[Path]:
+        """All transcript cache files."""
+        return list(self.transcripts_dir.glob("*.json"))
+
     def list_cached_tickers(self, data_type: str = 'twelve_data') -> List[str]:
         """
         List all tickers with cache files for today.
@@ -192,23 +391,12 @@ class DataCache:
         Returns:
             List of ticker symbols
         """
-        if data_type == 'twelve_data':
-            directory = self.twelve_data_dir
-        else:
-            directory = self.transcripts_dir
-
-        suffix = f"_{self.today}.json"
-        tickers = []
-
-        for path in directory.glob(f"*{suffix}"):
-            ticker = path.stem.replace(f"_{self.today}", "")
-            tickers.append(ticker)
-
-        return sorted(tickers)
+        index = self.twelve_data_index if data_type == 'twelve_data' else self.transcripts_index
+        return index.tickers(self.today)
 
     def clear_old_cache(self, days: int = 7) -> int:
         """
-        Remove cache files older than N days.
+        Remove cache files and indicator snapshots older than N days.
 
         Args:
             days: Delete files older than this many days
@@ -216,24 +404,22 @@ class DataCache:
         Returns:
             Number of files deleted
         """
-        cutoff = datetime.date.today() - datetime.timedelta(days=days)
+        cutoff = (datetime.date.today() - datetime.timedelta(days=days)).isoformat()
         deleted = 0
 
-        for directory in [self.twelve_data_dir, self.transcripts_dir]:
-            for path in directory.glob("*.json"):
+        for index in (self.twelve_data_index, self.transcripts_index):
+            for entry in index.entries(before=cutoff):
+                path = index.directory / entry.filename
                 try:
-                    # Extract date from filename (TICKER_YYYY-MM-DD.json)
-                    date_str = path.stem.split('_')[-1]
-                    file_date = datetime.date.fromisoformat(date_str)
-
-                    if file_date < cutoff:
-                        path.unlink()
-                        deleted += 1
-                        if self.verbose:
-                            print(f"    🗑️  Deleted old cache: {path.name}")
-                except (ValueError, IndexError):
-                    # Skip files that don't match expected format
-                    continue
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                index.remove(path)
+                deleted += 1
+                if self.verbose:
+                    print(f"    🗑️  Deleted old cache: {path.name}")
+
+        deleted += self.get_indicator_store().clear_old(days)
 
         return deleted
 
@@ -246,10 +432,12 @@ class DataCache:
         """
         deleted = 0
 
-        for directory in [self.twelve_data_dir, self.transcripts_dir]:
-            for path in directory.glob("*.json"):
-                path.unlink()
-                deleted += 1
+        for path in self._twelve_data_files() + self._transcript_files():
+            path.unlink()
+            deleted += 1
+        shutil.rmtree(self.twelve_data_dir / HISTORY_DIRNAME, ignore_errors=True)
+        self.twelve_data_index.clear()
+        self.transcripts_index.clear()
 
         if self.verbose:
             print(f"    🗑️  Cleared {deleted} cache files")
@@ -263,20 +451,40 @@ class DataCache:
         Returns:
             Dict with cache statistics
         """
-        twelve_data_files = list(self.twelve_data_dir.glob("*.json"))
-        transcript_files = list(self.transcripts_dir.glob("*.json"))
-
-        today_twelve = len([f for f in twelve_data_files if self.today in f.name])
-        today_transcripts = len([f for f in transcript_files if self.today in f.name])
-
-        total_size = sum(f.stat().st_size for f in twelve_data_files + transcript_files)
+        twelve_data = self.twelve_data_index.summary(self.today)
+        transcripts = self.transcripts_index.summary(self.today)
+        total_size = (
+            twelve_data['size_bytes'] + transcripts['size_bytes']
+            + history_bytes(self.twelve_data_dir)
+        )
 
         return {
-            'twelve_data_total': len(twelve_data_files),
-            'twelve_data_today': today_twelve,
-            'transcripts_total': len(transcript_files),
-            'transcripts_today': today_transcripts,
+            'twelve_data_total': twelve_data['files'],
+            'twelve_data_today': twelve_data['files_on_date'],
+            'transcripts_total': transcripts['files'],
+            'transcripts_today': transcripts['files_on_date'],
             'total_size_mb': round(total_size / (1024 * 1024), 2),
             'cache_date': self.today,
         }
 
+    def compact(
+        self,
+        max_bytes: Optional[int] = CACHE_CONFIG.COMPACT_MAX_BYTES,
+        max_age_days: Optional[int] = CACHE_CONFIG.COMPACT_MAX_AGE_DAYS,
+    ) -> CompactionReport:
+        """
+        Fold earlier time series snapshots into per-ticker histories,
+        delete expired ones and evict least recently read tickers until
+        the cache fits its byte budget. Today's files are left as they are.
+
+        Args:
+            max_bytes: Byte budget for twelve_data/ (None = unbounded)
+            max_age_days: Delete snapshots older than this many days (None = keep)
+
+        Returns:
+            CompactionReport
+        """
+        compactor = CacheCompactor(
+            self.twelve_data_index, self.storage, self.today, verbose=self.verbose
+        )
+        return compactor.compact(max_bytes=max_bytes, max_age_days=max_age_days)
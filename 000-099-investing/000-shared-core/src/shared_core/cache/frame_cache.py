@@ -0,0 +1,151 @@
+"""
+In-process LRU of parsed cache files.
+
+One run of 007's run_all.py (or the backtest runner) reads the same ticker
+file several times: a freshness check, indicator calculation, multi-horizon
+metrics. Each read parses the file again. FrameCache keeps parsed DataFrames
+in memory, keyed by path, mtime and size, so a file rewritten on disk is
+parsed again while repeated reads of an unchanged file cost nothing.
+
+Cached frames are shared, so every read returns a shallow view whose numpy
+columns are read-only: adding or replacing columns on the view is fine, but
+writing into an existing column (``df.loc[i, 'close'] = x``) raises
+ValueError. Callers that need to mutate should ``df.copy()`` first.
+
+Usage:
+    from shared_core.cache.frame_cache import shared_frame_cache
+
+    cache = DataCache(Path("data"), frame_cache=shared_frame_cache())
+    ticker_data = load_from_cache("data", tickers, frame_cache=shared_frame_cache())
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config.constants import CACHE_CONFIG
+from .storage import read_cache_file
+
+# (path, mtime_ns, size) identifies one version of a file on disk
+FrameKey = Tuple[str, int, int]
+
+
+def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy a frame into per-column read-only numpy arrays."""
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, np.dtype):
+            values = np.array(series.to_numpy(), copy=True)
+            values.flags.writeable = False
+            columns[column] = values
+        else:
+            # Extension dtypes (tz-aware, categorical, ...) can't be flagged
+            columns[column] = series.copy().array
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+class FrameCache:
+    """
+    Memory-bounded LRU of parsed cache files.
+
+    Thread-safe; a frame is parsed outside the lock, so two threads missing
+    on the same file at once may both parse it.
+    """
+
+    def __init__(self, max_bytes: int = CACHE_CONFIG.FRAME_CACHE_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Upper bound on the summed memory of cached frames.
+                Frames larger than this on their own are never cached.
+        """
+        self.max_bytes = max_bytes
+        self._frames: "OrderedDict[FrameKey, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._keys: Dict[str, FrameKey] = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def read(
+        self,
+        path: Path,
+        loader: Callable[[Path], pd.DataFrame] = read_cache_file,
+    ) -> pd.DataFrame:
+        """
+        Read a cache file through the LRU.
+
+        Args:
+            path: Cache file to read
+            loader: Parses the file on a miss (default: read_cache_file)
+
+        Returns:
+            Read-only view of the parsed DataFrame
+
+        Raises:
+            Whatever loader raises; failed reads are not cached
+        """
+        stat = os.stat(path)
+        name = str(Path(path).resolve())
+        key = (name, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return cached[0].copy(deep=False)
+            self.misses += 1
+
+        frame = _freeze(loader(path))
+        size = int(frame.memory_usage(deep=True, index=True).sum())
+
+        with self._lock:
+            self._discard(self._keys.get(name))
+            if size <= self.max_bytes:
+                self._frames[key] = (frame, size)
+                self._keys[name] = key
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    self._discard(next(iter(self._frames)))
+        return frame.copy(deep=False)
+
+    def _discard(self, key: Optional[FrameKey]) -> None:
+        """Drop one entry (caller holds the lock)."""
+        entry = self._frames.pop(key, None) if key is not None else None
+        if entry is not None:
+            self.bytes -= entry[1]
+            if self._keys.get(key[0]) == key:
+                del self._keys[key[0]]
+
+    def clear(self) -> None:
+        """Drop every cached frame and reset counters."""
+        with self._lock:
+            self._frames.clear()
+            self._keys.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+_shared: Optional[FrameCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_frame_cache() -> FrameCache:
+    """Process-wide FrameCache, created on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = FrameCache()
+        return _shared
@@ -0,0 +1,127 @@
+"""
+Persisted streaming indicator state, one JSON file per ticker.
+
+IndicatorStore snapshots whole indicator frames; this store keeps the
+accumulators of market_data.streaming.IndicatorState instead, so the next
+run only applies the bars that arrived since the last one rather than
+recomputing the full history.
+
+A saved state is rebuilt from history when it no longer lines up with the
+OHLCV it is advanced with (its last bar is missing or its close changed,
+e.g. after a split adjustment) or when the state version or smoothing
+differs.
+
+Cache structure:
+    data/
+    ├── twelve_data/
+    │   └── AAPL_2025-12-19.json
+    └── indicator_state/
+        └── AAPL.json
+
+Usage:
+    from shared_core.cache.indicator_state import IndicatorStateStore
+
+    store = cache.get_indicator_state_store()   # or IndicatorStateStore(path)
+    state = store.advance("AAPL", ohlcv_df)
+    rsi = state.values['RSI']
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from ..market_data.fused_indicators import resolve_smoothing
+from ..market_data.streaming import IndicatorState
+from ..state.utils import safe_read_json, safe_write_json
+
+logger = logging.getLogger(__name__)
+
+
+class IndicatorStateStore:
+    """Loads, advances and saves per-ticker IndicatorState files."""
+
+    def __init__(
+        self,
+        state_dir: Path,
+        smoothing: Optional[str] = None,
+        verbose: bool = False,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            state_dir: Directory for state files (e.g., project/data/indicator_state/)
+            smoothing: RSI/ATR/ADX averaging for new states
+                (default INDICATOR_CONFIG.SMOOTHING); saved states with
+                another smoothing are rebuilt
+            verbose: Print store operations
+        """
+        self.state_dir = Path(state_dir)
+        self.smoothing = resolve_smoothing(smoothing)
+        self.verbose = verbose
+        self.rebuilds = 0
+        self.bars_applied = 0
+
+    def _get_path(self, ticker: str) -> Path:
+        """Get path for a ticker's state file."""
+        return self.state_dir / f"{ticker.upper()}.json"
+
+    def load(self, ticker: str) -> Optional[IndicatorState]:
+        """
+        Load a ticker's saved state.
+
+        Returns:
+            The state, or None when missing, unreadable, from another
+            state version or computed with another smoothing
+        """
+        data = safe_read_json(str(self._get_path(ticker)))
+        if data is None:
+            return None
+        try:
+            state = IndicatorState.from_dict(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Discarding indicator state for {ticker}: {e}")
+            return None
+        return state if state.smoothing == self.smoothing else None
+
+    def save(self, state: IndicatorState) -> None:
+        """Write a state to its ticker's file (atomic replace)."""
+        if not state.ticker:
+            raise ValueError("IndicatorState needs a ticker to be saved")
+        try:
+            safe_write_json(str(self._get_path(state.ticker)), state.to_dict())
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Indicator state write failed for {state.ticker}: {e}")
+            if self.verbose:
+                print(f"    ⚠️  Indicator state save failed: {state.ticker} ({e})")
+
+    def advance(self, ticker: str, ohlcv: pd.DataFrame) -> IndicatorState:
+        """
+        Bring a ticker's state up to the last bar of `ohlcv` and save it.
+
+        Only bars after the saved state's last bar are applied; the state
+        is rebuilt from the whole frame when there is none or it does not
+        continue `ohlcv`.
+
+        Args:
+            ticker: Stock ticker symbol
+            ohlcv: Price frame with a sorted DatetimeIndex and 'high', 'low',
+                'close' (and optionally 'volume') columns
+
+        Returns:
+            State as of the last bar of `ohlcv`
+        """
+        state = self.load(ticker)
+        if state is None or not state.continues(ohlcv):
+            self.rebuilds += 1
+            state = IndicatorState(ticker.upper(), self.smoothing)
+
+        applied = state.update_frame(ohlcv)
+        self.bars_applied += applied
+        if applied:
+            self.save(state)
+        if self.verbose:
+            print(f"    📈 Indicator state {ticker}: +{applied} bars")
+        return state
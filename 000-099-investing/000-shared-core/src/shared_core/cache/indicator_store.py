@@ -0,0 +1,227 @@
+"""
+Content-addressed store for computed indicator frames.
+
+The alerts, reversals and oversold pipelines all load the same cached OHLCV
+and compute the same indicators for the same tickers each day. The first
+pipeline to process a ticker materializes the result here, next to the
+``twelve_data/`` cache, and the others read it back instead of recomputing.
+
+Snapshots are addressed by ticker, cache date and a digest of the indicator
+config plus the OHLCV content, so a refreshed price file or a changed
+indicator definition never returns stale columns. Other per-ticker results
+use the same store under their own configs: multi-horizon records
+(MULTI_HORIZON_CONFIG) and divergence histories (divergence_history_config).
+DataCache.clear_old_cache prunes old snapshots with clear_old.
+
+Cache structure:
+    data/
+    ├── twelve_data/
+    │   └── AAPL_2025-12-19.json
+    └── indicators/
+        └── AAPL_2025-12-19_3f2a9c0d1b7e4a65.npz
+
+Usage:
+    from shared_core.cache.indicator_store import IndicatorStore
+    from shared_core.data import add_standard_indicators
+
+    store = IndicatorStore(Path("data/indicators"))
+    df = store.get_or_compute("AAPL", ohlcv_df, add_standard_indicators)
+"""
+
+import dataclasses
+import datetime
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import pandas as pd
+
+from ..config.constants import DEFAULT_PERIODS, INDICATOR_CONFIG
+from .storage import CacheStorage, get_storage
+
+logger = logging.getLogger(__name__)
+
+# Bump when the standard indicator formulas change so old snapshots are ignored
+STANDARD_INDICATORS_VERSION = 2
+
+STANDARD_INDICATORS_CONFIG: Dict[str, Any] = {
+    'indicators': 'standard',
+    'version': STANDARD_INDICATORS_VERSION,
+    'periods': dataclasses.asdict(DEFAULT_PERIODS),
+    'smoothing': INDICATOR_CONFIG.SMOOTHING,
+}
+
+DIGEST_LENGTH = 16
+
+
+class IndicatorStore:
+    """
+    Persists indicator frames keyed by ticker, cache date and indicator config.
+
+    Snapshots use the npz format by default: it round-trips float columns
+    exactly, so a loaded frame equals the freshly computed one.
+    """
+
+    def __init__(
+        self,
+        store_dir: Path,
+        verbose: bool = False,
+        storage_format: str = "npz",
+    ):
+        """
+        Initialize indicator store.
+
+        Args:
+            store_dir: Directory for snapshots (e.g., project/data/indicators/)
+            verbose: Print store operations
+            storage_format: Snapshot format: 'npz', 'parquet' or 'json'
+        """
+        self.store_dir = Path(store_dir)
+        self.verbose = verbose
+        self.today = os.environ.get('CACHE_DATE') or datetime.date.today().isoformat()
+        self.storage: CacheStorage = get_storage(storage_format)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(ohlcv: pd.DataFrame, config: Mapping[str, Any]) -> str:
+        """
+        Content digest of an OHLCV frame plus the indicator config.
+
+        Args:
+            ohlcv: Input price frame the indicators are computed from
+            config: JSON-serializable description of the computation
+
+        Returns:
+            Hex digest (DIGEST_LENGTH characters)
+        """
+        h = hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode())
+        h.update(",".join(map(str, ohlcv.columns)).encode())
+        h.update(pd.util.hash_pandas_object(ohlcv, index=True).to_numpy().tobytes())
+        return h.hexdigest()[:DIGEST_LENGTH]
+
+    def _get_path(self, ticker: str, digest: str) -> Path:
+        """Get path for a ticker's snapshot."""
+        return self.store_dir / f"{ticker.upper()}_{self.today}_{digest}{self.storage.suffix}"
+
+    def load(
+        self,
+        ticker: str,
+        ohlcv: pd.DataFrame,
+        config: Mapping[str, Any] = STANDARD_INDICATORS_CONFIG,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load the snapshot computed from this OHLCV with this config, if any.
+
+        Returns:
+            Stored indicator frame, or None on a miss or unreadable file
+        """
+        path = self._get_path(ticker, self.digest(ohlcv, config))
+        if not path.exists():
+            return None
+
+        try:
+            return self.storage.read(path)
+        except (ValueError, OSError) as e:
+            logger.warning(f"Indicator snapshot read error for {ticker}: {e}")
+            return None
+
+    def save(
+        self,
+        ticker: str,
+        ohlcv: pd.DataFrame,
+        df: pd.DataFrame,
+        config: Mapping[str, Any] = STANDARD_INDICATORS_CONFIG,
+    ) -> None:
+        """
+        Save an indicator frame computed from `ohlcv` with `config`.
+
+        Args:
+            ticker: Stock ticker symbol
+            ohlcv: Input price frame (before indicators were added)
+            df: Computed indicator frame to store
+            config: JSON-serializable description of the computation
+        """
+        self._save(ticker, self.digest(ohlcv, config), df)
+
+    def _save(self, ticker: str, digest: str, df: pd.DataFrame) -> None:
+        path = self._get_path(ticker, digest)
+        try:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            self.storage.write(df, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Indicator snapshot write failed for {ticker}: {e}")
+            if self.verbose:
+                print(f"    ⚠️  Indicator snapshot save failed: {ticker} ({e})")
+
+    def get_or_compute(
+        self,
+        ticker: str,
+        ohlcv: pd.DataFrame,
+        compute: Callable[[pd.DataFrame], pd.DataFrame],
+        config: Mapping[str, Any] = STANDARD_INDICATORS_CONFIG,
+    ) -> pd.DataFrame:
+        """
+        Return the stored indicator frame, computing and storing it on a miss.
+
+        Args:
+            ticker: Stock ticker symbol
+            ohlcv: Input price frame
+            compute: Function adding indicators to an OHLCV frame
+            config: JSON-serializable description of `compute`; callers
+                using a different computation must pass their own config
+
+        Returns:
+            Indicator frame
+        """
+        digest = self.digest(ohlcv, config)
+        path = self._get_path(ticker, digest)
+
+        if path.exists():
+            try:
+                df = self.storage.read(path)
+                self.hits += 1
+                if self.verbose:
+                    print(f"    📁 Indicator snapshot hit: {ticker}")
+                return df
+            except (ValueError, OSError) as e:
+                logger.warning(f"Indicator snapshot read error for {ticker}: {e}")
+
+        self.misses += 1
+        df = compute(ohlcv)
+        self._save(ticker, digest, df)
+        if self.verbose:
+            print(f"    💾 Indicator snapshot stored: {ticker}")
+        return df
+
+    def clear_old(self, days: int = 7) -> int:
+        """
+        Remove snapshots older than N days.
+
+        Args:
+            days: Delete snapshots older than this many days
+
+        Returns:
+            Number of files deleted
+        """
+        if not self.store_dir.exists():
+            return 0
+
+        cutoff = datetime.date.today() - datetime.timedelta(days=days)
+        deleted = 0
+
+        for path in self.store_dir.glob(f"*{self.storage.suffix}"):
+            # TICKER_YYYY-MM-DD_<digest>.<suffix>
+            parts = path.name[:-len(self.storage.suffix)].rsplit('_', 2)
+            try:
+                file_date = datetime.date.fromisoformat(parts[1])
+            except (ValueError, IndexError):
+                continue
+            if len(parts) == 3 and file_date < cutoff:
+                path.unlink()
+                deleted += 1
+
+        return deleted
@@ -0,0 +1,314 @@
+"""
+Storage formats for cached OHLCV time series.
+
+Each format reads and writes one DataFrame per file and is identified by its
+file suffix, so files written in different formats can sit side by side in
+``twelve_data/`` and be read back without knowing which format wrote them.
+
+Formats:
+    json     pandas column-oriented JSON (original format, human readable)
+    npz      uncompressed NumPy archive, one typed array per column
+    parquet  Apache Parquet (requires pyarrow or fastparquet)
+    ptr      read-only pointer into a per-ticker history file, written by
+             cache compaction (see compaction.py)
+
+Usage:
+    from shared_core.cache.storage import find_cache_file, read_cache_file
+
+    path = find_cache_file(cache_dir, "AAPL", "2025-12-19")
+    df = read_cache_file(path) if path else None
+"""
+
+import datetime
+import json
+import os
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+class CacheStorage:
+    """Base class for a cache file format."""
+
+    name: str = ""
+    suffix: str = ""
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check if the libraries this format needs are installed."""
+        return True
+
+    def read(self, path: Path) -> pd.DataFrame:
+        """
+        Load a cache file into a DataFrame.
+
+        Raises:
+            ValueError: If the file content is malformed
+            OSError: If the file cannot be read
+        """
+        raise NotImplementedError
+
+    def write(self, df: pd.DataFrame, path: Path) -> None:
+        """Write a DataFrame to a cache file, replacing it atomically."""
+        raise NotImplementedError
+
+
+class JsonStorage(CacheStorage):
+    """pandas column-oriented JSON (``df.to_json`` default orient)."""
+
+    name = "json"
+    suffix = ".json"
+
+    def read(self, path: Path) -> pd.DataFrame:
+        return pd.read_json(path)
+
+    def write(self, df: pd.DataFrame, path: Path) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        df.to_json(tmp_path, date_format='iso')
+        os.replace(tmp_path, path)
+
+
+class NpzStorage(CacheStorage):
+    """
+    Uncompressed NumPy archive with one typed array per column.
+
+    Loading is a straight array read per column with no text parsing.
+    Object columns are stored as fixed-width strings so files never
+    need pickle to load.
+    """
+
+    name = "npz"
+    suffix = ".npz"
+
+    COLUMNS_KEY = "__columns__"
+    INDEX_KEY = "__index__"
+    INDEX_NAME_KEY = "__index_name__"
+
+    @staticmethod
+    def _to_array(values: Union[pd.Series, pd.Index]) -> np.ndarray:
+        if isinstance(values.dtype, pd.DatetimeTZDtype):
+            values = values.tz_convert(None) if isinstance(values, pd.Index) else values.dt.tz_convert(None)
+        array = values.to_numpy()
+        if array.dtype == object:
+            array = array.astype(str)
+        return array
+
+    def read(self, path: Path) -> pd.DataFrame:
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                columns = archive[self.COLUMNS_KEY].tolist()
+                data = {name: archive[f"col_{i}"] for i, name in enumerate(columns)}
+                index = None
+                if self.INDEX_KEY in archive.files:
+                    index = pd.Index(archive[self.INDEX_KEY])
+                    if self.INDEX_NAME_KEY in archive.files:
+                        index.name = str(archive[self.INDEX_NAME_KEY])
+        except (KeyError, zipfile.BadZipFile) as e:
+            raise ValueError(f"Malformed npz cache file {path.name}: {e}") from e
+
+        return pd.DataFrame(data, index=index, columns=columns)
+
+    def write(self, df: pd.DataFrame, path: Path) -> None:
+        arrays: Dict[str, np.ndarray] = {
+            self.COLUMNS_KEY: np.array([str(c) for c in df.columns]),
+        }
+        for i, col in enumerate(df.columns):
+            arrays[f"col_{i}"] = self._to_array(df[col])
+
+        if not isinstance(df.index, pd.RangeIndex):
+            arrays[self.INDEX_KEY] = self._to_array(df.index)
+            if df.index.name is not None:
+                arrays[self.INDEX_NAME_KEY] = np.array(str(df.index.name))
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+
+class ParquetStorage(CacheStorage):
+    """Apache Parquet via pandas (optional dependency)."""
+
+    name = "parquet"
+    suffix = ".parquet"
+
+    @staticmethod
+    def is_available() -> bool:
+        for module in ("pyarrow", "fastparquet"):
+            try:
+                __import__(module)
+                return True
+            except ImportError:
+                continue
+        return False
+
+    def read(self, path: Path) -> pd.DataFrame:
+        return pd.read_parquet(path)
+
+    def write(self, df: pd.DataFrame, path: Path) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+
+class PointerStorage(CacheStorage):
+    """
+    Dated snapshot stored as a row range of a per-ticker history file.
+
+    The pointer is a small JSON document naming the history file (relative
+    to the pointer), the first and last bar of the snapshot, and the values
+    of any rows where the snapshot differed from the history (typically a
+    partial last bar that was later finalized). Reading it yields the
+    snapshot exactly as it was written.
+
+    Pointers are only written by cache compaction, never as a cache format.
+    """
+
+    name = "ptr"
+    suffix = ".ptr"
+
+    def read(self, path: Path) -> pd.DataFrame:
+        try:
+            with open(path, 'r') as f:
+                pointer = json.load(f)
+            history_path = path.parent / pointer['history']
+            start, end = pd.Timestamp(pointer['start']), pd.Timestamp(pointer['end'])
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"Malformed cache pointer {path.name}: {e}") from e
+
+        history = read_cache_file(history_path)
+        dates = pd.to_datetime(history['datetime'])
+        df = history.loc[(dates >= start) & (dates <= end)].reset_index(drop=True)
+        if len(df) != pointer.get('rows', len(df)):
+            raise ValueError(f"Cache pointer {path.name} no longer matches {history_path.name}")
+
+        patch = pointer.get('patch')
+        if patch:
+            for column, values in patch['values'].items():
+                df.loc[patch['rows'], column] = values
+        return df
+
+    def write(self, df: pd.DataFrame, path: Path) -> None:
+        raise ValueError("Cache pointers are written by compaction, not from frames")
+
+    @staticmethod
+    def write_pointer(path: Path, pointer: Dict) -> None:
+        """Write a pointer document, replacing it atomically."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(pointer, f)
+        os.replace(tmp_path, path)
+
+
+STORAGE_FORMATS: Dict[str, CacheStorage] = {
+    storage.name: storage
+    for storage in (JsonStorage(), NpzStorage(), ParquetStorage())
+}
+
+# Readable but never selectable as a write format
+POINTER_STORAGE = PointerStorage()
+
+# Suffixes recognised as twelve_data cache files, binary formats first
+CACHE_SUFFIXES: Tuple[str, ...] = (".npz", ".parquet", ".json", POINTER_STORAGE.suffix)
+
+
+def get_storage(name: str) -> CacheStorage:
+    """
+    Look up a storage format by name.
+
+    Raises:
+        ValueError: If the format is unknown
+        ImportError: If the format's optional dependency is missing
+    """
+    storage = STORAGE_FORMATS.get(name.lower())
+    if storage is None:
+        raise ValueError(
+            f"Unknown cache format '{name}'. Choose from: {', '.join(STORAGE_FORMATS)}"
+        )
+    if not storage.is_available():
+        raise ImportError(f"Cache format '{name}' requires pyarrow or fastparquet")
+    return storage
+
+
+def storage_for_path(path: Path) -> Optional[CacheStorage]:
+    """Return the storage format matching a file's suffix, if any."""
+    for storage in (*STORAGE_FORMATS.values(), POINTER_STORAGE):
+        if path.suffix == storage.suffix:
+            return storage
+    return None
+
+
+def read_cache_file(path: Path) -> pd.DataFrame:
+    """
+    Read a cache file in any supported format.
+
+    Raises:
+        ValueError: If the suffix is unknown or the content is malformed
+        OSError: If the file cannot be read
+    """
+    storage = storage_for_path(path)
+    if storage is None:
+        raise ValueError(f"Unrecognised cache file format: {path.name}")
+    return storage.read(path)
+
+
+def find_cache_file(
+    directory: Path,
+    ticker: str,
+    date: str,
+    preferred: Optional[CacheStorage] = None,
+) -> Optional[Path]:
+    """
+    Find a ticker's cache file for a date, whatever format it was written in.
+
+    Args:
+        directory: Directory holding TICKER_DATE.<suffix> files
+        ticker: Stock ticker symbol
+        date: Cache date (YYYY-MM-DD)
+        preferred: Format to check first (e.g. the cache's write format)
+
+    Returns:
+        Path to the first existing file, or None
+    """
+    suffixes: List[str] = list(CACHE_SUFFIXES)
+    if preferred is not None and preferred.suffix in suffixes:
+        suffixes.remove(preferred.suffix)
+        suffixes.insert(0, preferred.suffix)
+
+    for suffix in suffixes:
+        path = Path(directory) / f"{ticker}_{date}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def iter_cache_files(directory: Path, date: str = "*") -> Iterator[Path]:
+    """
+    Yield TICKER_DATE cache files in any supported format.
+
+    Args:
+        directory: Directory holding cache files
+        date: Date to match (YYYY-MM-DD), or a glob pattern such as "*"
+    """
+    for suffix in CACHE_SUFFIXES:
+        yield from Path(directory).glob(f"*_{date}{suffix}")
+
+
+def parse_cache_filename(path: Path) -> Optional[Tuple[str, str]]:
+    """
+    Split a TICKER_YYYY-MM-DD.<suffix> filename into (ticker, date).
+
+    Returns:
+        (ticker, date) tuple, or None if the name doesn't match
+    """
+    parts = path.stem.rsplit('_', 1)
+    if len(parts) != 2 or not parts[0]:
+        return None
+    try:
+        datetime.date.fromisoformat(parts[1])
+    except ValueError:
+        return None
+    return parts[0], parts[1]
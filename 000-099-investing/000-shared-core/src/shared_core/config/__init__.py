@@ -5,18 +5,24 @@ Provides centralized constants and configuration values.
 """
 
 from .constants import (
+    ARCHIVE_CONFIG,
     CACHE_CONFIG,
     DEFAULT_PERIODS,
+    INDICATOR_CONFIG,
     RATE_LIMITS,
     RSI_THRESHOLDS,
     SCORING_WEIGHTS,
     STOCHASTIC_THRESHOLDS,
     TREND_THRESHOLDS,
     VOLATILITY_THRESHOLDS,
+    # Archive
+    ArchiveConfig,
     # Cache
     CacheConfig,
     # Default periods
     DefaultPeriods,
+    # Indicators
+    IndicatorConfig,
     # Rate limiting
     RateLimits,
     # RSI
@@ -39,7 +45,9 @@ __all__ = [
     'RSIThresholds',
     'StochasticThresholds',
     'DefaultPeriods',
+    'IndicatorConfig',
     'CacheConfig',
+    'ArchiveConfig',
     'ScoringWeights',
     # Instances
     'RATE_LIMITS',
@@ -48,6 +56,8 @@ __all__ = [
     'RSI_THRESHOLDS',
     'STOCHASTIC_THRESHOLDS',
     'DEFAULT_PERIODS',
+    'INDICATOR_CONFIG',
     'CACHE_CONFIG',
+    'ARCHIVE_CONFIG',
     'SCORING_WEIGHTS',
 ]
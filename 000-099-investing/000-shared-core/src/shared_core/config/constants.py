@@ -22,6 +22,7 @@ class RateLimits:
     # Twelve Data free tier limits
     TWELVE_DATA_REQUESTS_PER_MINUTE: int = 8
     TWELVE_DATA_DEFAULT_DELAY: float = 7.5  # 60 / 8 seconds
+    TWELVE_DATA_MINUTE_BACKOFF: float = 60.0  # Key pause after a per-minute credit error
 
     # Retry configuration
     DEFAULT_RETRY_ATTEMPTS: int = 3
@@ -102,6 +103,16 @@ class DefaultPeriods:
     SMA_LONG: int = 200
 
 
+@dataclass(frozen=True)
+class IndicatorConfig:
+    """Indicator formula options."""
+
+    # Averaging for RSI, ATR and ADX (see market_data/fused_indicators.py):
+    # "wilder" (recursive, alpha = 1/period) or "simple" (rolling mean; the
+    # formulas used before Wilder smoothing was introduced)
+    SMOOTHING: str = "wilder"
+
+
 @dataclass(frozen=True)
 class CacheConfig:
     """Cache configuration."""
@@ -109,6 +120,30 @@ class CacheConfig:
     # Default data fetch size
     DEFAULT_OUTPUT_SIZE: int = 365
 
+    # Time series file format: "json", "npz" or "parquet" (see cache/storage.py)
+    STORAGE_FORMAT: str = "json"
+
+    # Delta refresh (see market_data/delta.py): fetch only bars after the last
+    # cached file when it is at most this many days old...
+    DELTA_MAX_GAP_DAYS: int = 10
+    # ...and its anchor bar's close still matches the API within this
+    # relative tolerance (a mismatch means a split or revision: full refetch)
+    DELTA_PRICE_TOLERANCE: float = 1e-6
+
+    # Compaction (see cache/compaction.py): byte budget for twelve_data/,
+    # age limit for dated snapshots, and how many rows a snapshot may differ
+    # from the folded history by and still become a pointer
+    COMPACT_MAX_BYTES: int = 1024 * 1024 * 1024
+    COMPACT_MAX_AGE_DAYS: int = 30
+    COMPACT_MAX_PATCH_ROWS: int = 5
+
+    # In-process LRU of parsed cache files (see cache/frame_cache.py)
+    FRAME_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+
+    # LLM response cache (see llm/cache.py): age after which a cached
+    # response is refetched (0 keeps responses forever)
+    LLM_CACHE_TTL_HOURS: float = 24.0
+
     # Relative paths to look for cache (from project root)
     CACHE_SUBDIRS: Tuple[str, ...] = (
         "007-ticker-analysis/data/twelve_data",
@@ -116,6 +151,26 @@ class CacheConfig:
     )
 
 
+@dataclass(frozen=True)
+class ArchiveConfig:
+    """Supabase archive write options (see archive/supabase_client.py)."""
+
+    # Write path for daily_indicators: "upsert" (PostgREST upsert, chunked and
+    # concurrent), "rpc" (server-side bulk upsert function, few large chunks)
+    # or "copy" (COPY + merge over a direct Postgres connection)
+    MODE: str = "upsert"
+
+    # Upsert chunks are packed by serialized size up to this many bytes/rows...
+    UPSERT_MAX_BATCH_BYTES: int = 512 * 1024
+    UPSERT_MAX_BATCH_ROWS: int = 1000
+    # ...and sent this many at a time
+    UPSERT_MAX_WORKERS: int = 4
+
+    # Chunk budget for the RPC path (one jsonb argument per request)
+    RPC_MAX_BATCH_BYTES: int = 8 * 1024 * 1024
+    RPC_FUNCTION: str = "bulk_upsert_daily_indicators"
+
+
 @dataclass(frozen=True)
 class ScoringWeights:
     """Weights for scoring calculations."""
@@ -144,5 +199,7 @@ VOLATILITY_THRESHOLDS = VolatilityThresholds()
 RSI_THRESHOLDS = RSIThresholds()
 STOCHASTIC_THRESHOLDS = StochasticThresholds()
 DEFAULT_PERIODS = DefaultPeriods()
+INDICATOR_CONFIG = IndicatorConfig()
 CACHE_CONFIG = CacheConfig()
+ARCHIVE_CONFIG = ArchiveConfig()
 SCORING_WEIGHTS = ScoringWeights()
@@ -8,13 +8,15 @@ from typing import Any, Dict, Optional
 
 import pandas as pd
 
-# Import TechnicalCalculator for indicator calculations
-from ..market_data.technical import TechnicalCalculator
+from ..cache.indicator_store import IndicatorStore
+from ..market_data.fused_indicators import compute_standard_indicators
 
 
 def process_ohlcv_data(
     time_series_data: Dict[str, Any],
     include_indicators: bool = True,
+    indicator_store: Optional[IndicatorStore] = None,
+    ticker: Optional[str] = None,
 ) -> Optional[pd.DataFrame]:
     """
     Convert raw Twelve Data API response to DataFrame with indicators.
@@ -22,6 +24,9 @@ def process_ohlcv_data(
     Args:
         time_series_data: API response with 'values' key containing OHLCV data
         include_indicators: If True, calculate standard technical indicators
+        indicator_store: Reuse indicators already computed today for the same
+            OHLCV (requires ticker)
+        ticker: Stock ticker symbol, used as the indicator store key
 
     Returns:
         DataFrame with datetime index and OHLCV + indicators, or None if invalid
@@ -54,7 +59,10 @@ def process_ohlcv_data(
         return None
 
     if include_indicators:
-        df = add_standard_indicators(df)
+        if indicator_store is not None and ticker:
+            df = indicator_store.get_or_compute(ticker, df, add_standard_indicators)
+        else:
+            df = add_standard_indicators(df)
 
     return df
 
@@ -70,57 +78,23 @@ def add_standard_indicators(df: pd.DataFrame) -> pd.DataFrame:
     - Volume: OBV
     - Oscillators: STOCH_K, STOCH_D, ADX, WILLIAMS_R, ROC
 
+    Shared intermediates (true range, rolling extremes, close diffs) are
+    computed once; values match the individual TechnicalCalculator methods.
+
     Args:
         df: DataFrame with OHLCV data
 
     Returns:
         DataFrame with added indicator columns
     """
-    calc = TechnicalCalculator()
-
-    # SMAs
-    df['SMA_5'] = calc.sma(df['close'], 5)
-    df['SMA_14'] = calc.sma(df['close'], 14)
-    df['SMA_20'] = calc.sma(df['close'], 20)
-    df['SMA_50'] = calc.sma(df['close'], 50)
-    df['SMA_200'] = calc.sma(df['close'], 200)
-
-    # RSI
-    df['RSI'] = calc.rsi(df['close'], 14)
-
-    # MACD
-    macd_line, signal_line, hist = calc.macd(df['close'])
-    df['MACD'] = macd_line
-    df['MACD_SIGNAL'] = signal_line
-    df['MACD_HIST'] = hist
-
-    # Bollinger Bands with width
-    bb_upper, bb_middle, bb_lower = calc.bollinger_bands(df['close'])
-    df['BB_UPPER'] = bb_upper
-    df['BB_MIDDLE'] = bb_middle
-    df['BB_LOWER'] = bb_lower
-    df['BB_WIDTH'] = ((bb_upper - bb_lower) / bb_middle) * 100
-
-    # ATR
-    df['ATR'] = calc.atr(df)
-
-    # OBV (requires volume)
-    if 'volume' in df.columns:
-        df['OBV'] = calc.obv(df)
-
-    # Stochastics
-    stoch_k, stoch_d = calc.stochastic(df)
-    df['STOCH_K'] = stoch_k
-    df['STOCH_D'] = stoch_d
-
-    # ADX
-    df['ADX'] = calc.adx_series(df)
-
-    # Williams %R
-    df['WILLIAMS_R'] = calc.williams_r(df)
-
-    # Rate of Change
-    df['ROC'] = calc.roc(df['close'])
+    columns = compute_standard_indicators(
+        df['high'],
+        df['low'],
+        df['close'],
+        df['volume'] if 'volume' in df.columns else None,
+    )
+    for name, values in columns.items():
+        df[name] = values
 
     return df
 
@@ -5,15 +5,20 @@ Provides:
 - Swing point detection (highs and lows)
 - RSI and OBV divergence detection
 - Combined divergence with confluence bonus
+- Full-history divergence labels for backtests and scanners
 """
 
 # Re-export models from scoring
 from ..scoring.models import DivergenceResult, DivergenceType
 from .divergence import (
+    combined_divergence_history,
     detect_combined_divergence,
     detect_divergence_enhanced,
     detect_obv_divergence,
     detect_rsi_divergence,
+    divergence_at,
+    divergence_history,
+    divergence_history_config,
 )
 from .swing_points import (
     find_swing_highs,
@@ -38,5 +43,10 @@ __all__ = [
     "detect_combined_divergence",
     "detect_rsi_divergence",
     "detect_obv_divergence",
+    # Full-history divergence
+    "divergence_history",
+    "combined_divergence_history",
+    "divergence_at",
+    "divergence_history_config",
 ]
 
@@ -2,13 +2,35 @@
 Divergence detection algorithms.
 
 Detects price/indicator divergences that may signal trend reversals.
+
+The ``detect_*`` functions report the state of the latest bar. The
+``*_history`` functions label every bar at once, each exactly as the
+matching ``detect_*`` call would on the trailing ``lookback`` bars ending
+there, for backtests and scanners that need the state at every date.
+Pipelines store history frames in an IndicatorStore under
+divergence_history_config(lookback).
 """
 
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
 import pandas as pd
 
 from ..scoring.models import DivergenceResult, DivergenceType
 from .swing_points import find_swing_highs, find_swing_lows
 
+# Bump when the divergence formulas change so stored histories are ignored
+DIVERGENCE_HISTORY_VERSION = 1
+
+
+def divergence_history_config(lookback: int) -> Dict[str, Any]:
+    """IndicatorStore config for combined_divergence_history(df, lookback)."""
+    return {
+        'indicators': 'combined_divergence_history',
+        'version': DIVERGENCE_HISTORY_VERSION,
+        'lookback': lookback,
+    }
+
 
 def detect_divergence_enhanced(
     df: pd.DataFrame,
@@ -197,3 +219,196 @@ def detect_obv_divergence(
         return 'bearish'
     return 'none'
 
+
+
+# ---------------------------------------------------------------------------
+# Full-history divergence
+# ---------------------------------------------------------------------------
+
+def _last_swing_pairs(
+    mask: np.ndarray, lookback: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Positions of the last two swing points inside each bar's trailing window.
+
+    A window of `lookback` bars ending at t can only confirm swing points
+    at t-lookback+2 .. t-1 (both neighbours must be in the window), so the
+    two latest full-series swing points at or before t-1 are the window's
+    pair whenever the older one is still inside that range.
+
+    Returns:
+        (valid, first, second) arrays of length len(mask); `first` and
+        `second` are only meaningful where `valid` is True
+    """
+    n = len(mask)
+    bars = np.arange(n)
+    swings = np.flatnonzero(mask)
+    if len(swings) < 2:
+        zeros = np.zeros(n, dtype=int)
+        return np.zeros(n, dtype=bool), zeros, zeros
+
+    latest = np.searchsorted(swings, bars - 1, side='right') - 1
+    second = swings[np.clip(latest, 0, None)]
+    first = swings[np.clip(latest - 1, 0, None)]
+    valid = (latest >= 1) & (bars >= lookback - 1) & (first >= bars - lookback + 2)
+    return valid, first, second
+
+
+def _descriptions(
+    types: np.ndarray, template_bull: str, template_bear: str,
+    pct: np.ndarray, strength: np.ndarray, default: str,
+) -> List[str]:
+    descriptions = [default] * len(types)
+    for i in np.flatnonzero(types != DivergenceType.NONE.value):
+        template = template_bull if types[i] == DivergenceType.BULLISH.value else template_bear
+        descriptions[i] = template.format(pct=pct[i], strength=strength[i])
+    return descriptions
+
+
+def divergence_history(
+    df: pd.DataFrame,
+    lookback: int = 14,
+    indicator: str = "RSI",
+) -> pd.DataFrame:
+    """
+    Swing-point divergence state for every bar.
+
+    Row i equals ``detect_divergence_enhanced(df.iloc[:i + 1], lookback,
+    indicator)``: swing points are found once over the whole series and
+    each bar's last two lows/highs are located with array lookups.
+
+    Args:
+        df: DataFrame with 'close' and the indicator column
+        lookback: Number of bars each window analyzes
+        indicator: Indicator column name ("RSI" or "OBV")
+
+    Returns:
+        DataFrame on df's index with 'type' (DivergenceType value),
+        'strength' and 'description' columns
+
+    Example:
+        >>> history = divergence_history(df, lookback=20, indicator="OBV")
+        >>> bullish_dates = history.index[history['type'] == 'bullish']
+    """
+    n = len(df)
+    types = np.full(n, DivergenceType.NONE.value, dtype=object)
+    strength = np.zeros(n)
+
+    if indicator not in df.columns:
+        descriptions = [f"{indicator} not available"] * n
+    else:
+        prices = df['close'].to_numpy(dtype=float)
+        values = df[indicator].to_numpy(dtype=float)
+        prev_p = np.r_[np.nan, prices[:-1]]
+        next_p = np.r_[prices[1:], np.nan]
+        pct = np.zeros(n)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Bullish: price lower low, indicator higher low
+            valid, first, second = _last_swing_pairs(
+                (prev_p > prices) & (next_p > prices), lookback
+            )
+            p1, p2 = prices[first], prices[second]
+            r1, r2 = values[first], values[second]
+            bullish = valid & (p2 < p1) & (r2 > r1)
+            strength = np.where(bullish, np.abs(r2 - r1), strength)
+            pct = np.where(bullish, np.where(p1 != 0, ((p1 - p2) / p1) * 100, 0), pct)
+
+            # Bearish (only where no bullish signal): price higher high, indicator lower high
+            valid, first, second = _last_swing_pairs(
+                (prev_p < prices) & (next_p < prices), lookback
+            )
+            p1, p2 = prices[first], prices[second]
+            r1, r2 = values[first], values[second]
+            bearish = valid & ~bullish & (p2 > p1) & (r2 < r1)
+            strength = np.where(bearish, np.abs(r1 - r2), strength)
+            pct = np.where(bearish, np.where(p1 != 0, ((p2 - p1) / p1) * 100, 0), pct)
+
+        types[bullish] = DivergenceType.BULLISH.value
+        types[bearish] = DivergenceType.BEARISH.value
+        descriptions = _descriptions(
+            types,
+            f"Bullish: Price -{{pct:.1f}}%, {indicator} +{{strength:.1f}}",
+            f"Bearish: Price +{{pct:.1f}}%, {indicator} -{{strength:.1f}}",
+            pct, strength, "No divergence detected",
+        )
+
+    # Windows shorter than lookback report insufficient data
+    for i in range(min(n, lookback - 1)):
+        descriptions[i] = "Insufficient data"
+
+    return pd.DataFrame(
+        {'type': types, 'strength': strength, 'description': descriptions},
+        index=df.index,
+    )
+
+
+def combined_divergence_history(
+    df: pd.DataFrame,
+    lookback: int = 14,
+) -> pd.DataFrame:
+    """
+    Combined RSI + OBV divergence state for every bar.
+
+    Row i equals ``detect_combined_divergence(df.iloc[:i + 1], lookback)``,
+    including the 1.5x confluence bonus when both indicators agree.
+
+    Args:
+        df: DataFrame with 'close', 'RSI' and 'OBV' columns
+        lookback: Number of bars each window analyzes
+
+    Returns:
+        DataFrame on df's index with 'type', 'strength' and 'description'
+        columns (see divergence_history and divergence_at)
+    """
+    rsi = divergence_history(df, lookback, "RSI")
+    obv = divergence_history(df, lookback, "OBV")
+
+    rsi_type = rsi['type'].to_numpy()
+    obv_type = obv['type'].to_numpy()
+    none = DivergenceType.NONE.value
+    both_bullish = (rsi_type == DivergenceType.BULLISH.value) & (obv_type == DivergenceType.BULLISH.value)
+    both_bearish = (rsi_type == DivergenceType.BEARISH.value) & (obv_type == DivergenceType.BEARISH.value)
+    confirmed = both_bullish | both_bearish
+    rsi_only = ~confirmed & (rsi_type != none)
+    obv_only = ~confirmed & ~rsi_only & (obv_type != none)
+
+    combined_strength = ((rsi['strength'] + obv['strength']) / 2).to_numpy() * 1.5
+    strength = np.select(
+        [confirmed, rsi_only, obv_only],
+        [combined_strength, rsi['strength'].to_numpy(), obv['strength'].to_numpy()],
+        0.0,
+    )
+    types = np.select([rsi_only, obv_only], [rsi_type, obv_type], none).astype(object)
+    types[both_bullish] = DivergenceType.BULLISH.value
+    types[both_bearish] = DivergenceType.BEARISH.value
+    descriptions = np.select(
+        [both_bullish, both_bearish, rsi_only, obv_only],
+        [
+            "STRONG Bullish (RSI + OBV confirmed)",
+            "STRONG Bearish (RSI + OBV confirmed)",
+            rsi['description'].to_numpy(),
+            obv['description'].to_numpy(),
+        ],
+        "No divergence",
+    )
+
+    return pd.DataFrame(
+        {'type': types, 'strength': strength, 'description': descriptions},
+        index=df.index,
+    )
+
+
+def divergence_at(history: pd.DataFrame, i: int) -> DivergenceResult:
+    """
+    DivergenceResult for row position i of a divergence history.
+
+    Args:
+        history: Output of divergence_history or combined_divergence_history
+        i: Row position (supports negative positions)
+
+    Returns:
+        DivergenceResult equal to the matching detect_* call
+    """
+    row = history.iloc[i]
+    return DivergenceResult(DivergenceType(row['type']), row['strength'], row['description'])
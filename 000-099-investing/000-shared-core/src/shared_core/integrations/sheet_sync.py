@@ -0,0 +1,209 @@
+"""
+Diff-based sync of ticker rows to a sheet tab.
+
+SheetSyncState remembers, per ticker, the sheet row it was last written to
+and a short hash of every cell written there. plan_sync compares a new batch
+of rows against it and returns only the cell ranges that changed, coalesced
+across columns and across consecutive rows, ready for a single
+Worksheet.batch_update. Rows whose cells all hash the same are not sent.
+
+The state records what was last written, not what the sheet holds now: a
+ticker whose sheet row differs from the recorded one (rows sorted, deleted
+or inserted by hand) is written in full again. It has no gspread dependency.
+
+Usage:
+    state = SheetSyncState.load(state_dir / "tech_data.json", columns)
+    plan = plan_sync(rows, existing_rows, state)
+    sheet.batch_update(plan.updates)
+    state.commit(plan)
+    state.save()
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..state.utils import safe_read_json, safe_write_json
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+
+# Unchanged cells between two changed ones that are cheaper to rewrite than
+# to split the range over
+MAX_GAP = 2
+
+
+def column_letter(col_num: int) -> str:
+    """
+    Convert 1-based column number to Excel-style letter(s).
+    e.g., 1 -> 'A', 26 -> 'Z', 27 -> 'AA', 29 -> 'AC'
+    """
+    result = ""
+    while col_num > 0:
+        col_num, remainder = divmod(col_num - 1, 26)
+        result = chr(65 + remainder) + result
+    return result
+
+
+def cell_hash(value: Any) -> str:
+    """Short stable hash of one cell value."""
+    encoded = json.dumps(value, default=str, sort_keys=True).encode()
+    return hashlib.blake2b(encoded, digest_size=6).hexdigest()
+
+
+def _runs(indexes: Sequence[int], max_gap: int) -> List[Tuple[int, int]]:
+    """Sorted column indexes -> inclusive (first, last) runs, bridging small gaps."""
+    runs: List[Tuple[int, int]] = []
+    for i in indexes:
+        if runs and i - runs[-1][1] - 1 <= max_gap:
+            runs[-1] = (runs[-1][0], i)
+        else:
+            runs.append((i, i))
+    return runs
+
+
+@dataclass
+class SyncPlan:
+    """
+    Changes needed to bring a tab in line with a batch of rows.
+
+    Attributes:
+        updates: batch_update payload ({'range', 'values'} per block)
+        appends: Rows for tickers not on the sheet yet, in input order
+        written: ticker -> (row number, cell hashes) to record once the
+            updates succeed (appended rows are recorded by commit)
+        skipped: Rows with no changed cell
+        cells: Cells sent in updates
+    """
+    updates: List[Dict[str, Any]] = field(default_factory=list)
+    appends: List[Tuple[str, List[Any]]] = field(default_factory=list)
+    written: Dict[str, Tuple[int, List[str]]] = field(default_factory=dict)
+    skipped: int = 0
+    cells: int = 0
+
+
+class SheetSyncState:
+    """Last written row position and cell hashes per ticker, for one tab."""
+
+    def __init__(self, columns: Sequence[str], path: Optional[Path] = None):
+        """
+        Args:
+            columns: Column headers of the tab (a change invalidates the state)
+            path: JSON file to persist to; None keeps the state in memory
+        """
+        self.columns = list(columns)
+        self.path = Path(path) if path else None
+        self.rows: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, path: Path, columns: Sequence[str]) -> "SheetSyncState":
+        """Read a saved state; missing, unreadable or stale files start empty."""
+        state = cls(columns, path)
+        data = safe_read_json(str(path))
+        if (
+            isinstance(data, dict)
+            and data.get('version') == STATE_VERSION
+            and data.get('columns') == state.columns
+        ):
+            state.rows = data.get('rows', {})
+        return state
+
+    def save(self) -> None:
+        """Write the state to its file (no-op for in-memory states)."""
+        if self.path is None:
+            return
+        try:
+            safe_write_json(str(self.path), {
+                'version': STATE_VERSION,
+                'columns': self.columns,
+                'rows': self.rows,
+            })
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Sheet sync state write failed for {self.path}: {e}")
+
+    def clear(self) -> None:
+        """Forget every row (e.g. after the tab was cleared)."""
+        self.rows = {}
+
+    def record(self, ticker: str, row_number: int, hashes: List[str]) -> None:
+        self.rows[ticker] = {'row': row_number, 'cells': hashes}
+
+    def commit(self, plan: SyncPlan, first_append_row: Optional[int] = None) -> None:
+        """
+        Record a plan as written.
+
+        Args:
+            plan: Plan whose updates (and appends) succeeded
+            first_append_row: Sheet row of the first appended row; appends
+                are not recorded when unknown
+        """
+        for ticker, (row_number, hashes) in plan.written.items():
+            self.record(ticker, row_number, hashes)
+        if first_append_row is not None:
+            for offset, (ticker, values) in enumerate(plan.appends):
+                self.record(ticker, first_append_row + offset, [cell_hash(v) for v in values])
+
+
+def plan_sync(
+    rows: Sequence[Tuple[str, List[Any]]],
+    existing_rows: Mapping[str, int],
+    state: SheetSyncState,
+    max_gap: int = MAX_GAP,
+) -> SyncPlan:
+    """
+    Work out which cells of a tab need writing.
+
+    Args:
+        rows: (ticker, cell values in state.columns order) per row to write
+        existing_rows: ticker -> 1-based sheet row, as read from the sheet
+        state: What was last written
+        max_gap: Unchanged cells bridged inside one range
+
+    Returns:
+        SyncPlan with coalesced updates for changed cells of existing rows
+        and the rows to append
+    """
+    plan = SyncPlan()
+    # (first column, last column) -> [(row number, cell values)]
+    blocks: Dict[Tuple[int, int], List[Tuple[int, List[Any]]]] = {}
+
+    for ticker, values in rows:
+        row_number = existing_rows.get(ticker)
+        if row_number is None:
+            plan.appends.append((ticker, values))
+            continue
+
+        hashes = [cell_hash(v) for v in values]
+        previous = state.rows.get(ticker)
+        if previous and previous.get('row') == row_number and len(previous.get('cells', ())) == len(hashes):
+            changed = [i for i, (old, new) in enumerate(zip(previous['cells'], hashes)) if old != new]
+        else:
+            changed = list(range(len(values)))
+
+        if not changed:
+            plan.skipped += 1
+            continue
+
+        plan.written[ticker] = (row_number, hashes)
+        for first, last in _runs(changed, max_gap):
+            blocks.setdefault((first, last), []).append((row_number, values[first:last + 1]))
+
+    # Stack rows with the same changed columns into rectangles
+    for (first, last), block_rows in blocks.items():
+        block_rows.sort(key=lambda r: r[0])
+        start = 0
+        for i in range(1, len(block_rows) + 1):
+            if i == len(block_rows) or block_rows[i][0] != block_rows[i - 1][0] + 1:
+                top, bottom = block_rows[start][0], block_rows[i - 1][0]
+                plan.updates.append({
+                    'range': f"{column_letter(first + 1)}{top}:{column_letter(last + 1)}{bottom}",
+                    'values': [values for _, values in block_rows[start:i]],
+                })
+                plan.cells += (last - first + 1) * (i - start)
+                start = i
+
+    return plan
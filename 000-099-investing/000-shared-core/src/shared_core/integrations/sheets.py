@@ -7,9 +7,10 @@ import csv
 import logging
 import math
 import os
+import re
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import gspread
 import numpy as np
@@ -19,17 +20,35 @@ from requests.exceptions import ReadTimeout
 from tenacity import (
     before_sleep_log,
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
+from ..scoring.multi_horizon import format_multi_horizon
+from .sheet_sync import SheetSyncState, cell_hash, column_letter, plan_sync
+
 logger = logging.getLogger(__name__)
 
+# Quota exhaustion (429) and server-side errors clear up on their own;
+# other client errors (bad range, permission) fail straight to the fallback
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, ReadTimeout):
+        return True
+    if isinstance(exc, gspread.exceptions.APIError):
+        status = getattr(exc, 'code', None) or getattr(getattr(exc, 'response', None), 'status_code', None)
+        return status is None or status in _RETRY_STATUSES
+    return False
+
+
 _sheets_retry = retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=4, max=30),
-    retry=retry_if_exception_type((gspread.exceptions.APIError, ReadTimeout)),
+    stop=stop_after_attempt(5),
+    # Truncated exponential backoff with jitter, as the Sheets quota docs advise
+    wait=wait_random_exponential(multiplier=2, min=4, max=64),
+    retry=retry_if_exception(_is_transient),
     before_sleep=before_sleep_log(logger, logging.WARNING),
     reraise=True,
 )
@@ -50,6 +69,16 @@ def _safe_cell(v: Any) -> Any:
     return v
 
 
+def _first_row(append_response: Any) -> Optional[int]:
+    """First row number of an append_rows response's updated range."""
+    try:
+        updated = append_response['updates']['updatedRange']
+    except (TypeError, KeyError):
+        return None
+    match = re.search(r'![A-Z]+(\d+)', updated)
+    return int(match.group(1)) if match else None
+
+
 class SheetManager:
     """
     Google Sheets manager with:
@@ -90,7 +119,8 @@ class SheetManager:
         'AI_Risk_Level', 'AI_Key_Levels',
     ]
 
-    def __init__(self, credentials_file: str, spreadsheet_name: str, verbose: bool = False):
+    def __init__(self, credentials_file: str, spreadsheet_name: str, verbose: bool = False,
+                 sync_state_dir: Optional[str] = None):
         """
         Initialize Sheet manager.
 
@@ -98,8 +128,13 @@ class SheetManager:
             credentials_file: Path to Google service account JSON
             spreadsheet_name: Name of the spreadsheet to open
             verbose: Print detailed progress
+            sync_state_dir: Directory for per-tab sync state (what was last
+                written), so row replacement only sends changed cells across
+                runs; None keeps it for this instance only
         """
         self.verbose = verbose
+        self.sync_state_dir = Path(sync_state_dir) if sync_state_dir else None
+        self._sync_states: Dict[str, SheetSyncState] = {}
 
         if verbose:
             print("📊 Connecting to Google Sheets...")
@@ -127,11 +162,7 @@ class SheetManager:
         Convert 1-based column number to Excel-style letter(s).
         e.g., 1 -> 'A', 26 -> 'Z', 27 -> 'AA', 29 -> 'AC'
         """
-        result = ""
-        while col_num > 0:
-            col_num, remainder = divmod(col_num - 1, 26)
-            result = chr(65 + remainder) + result
-        return result
+        return column_letter(col_num)
 
     # =========================================================================
     # RETRY + FALLBACK HELPERS
@@ -164,6 +195,17 @@ class SheetManager:
         except Exception:
             logger.error(f"Failed to save CSV fallback for {tab_name}", exc_info=True)
 
+    def _sync_state(self, tab_name: str, columns: List[str]) -> SheetSyncState:
+        """Sync state of a tab, loaded from sync_state_dir on first use."""
+        state = self._sync_states.get(tab_name)
+        if state is None or state.columns != columns:
+            if self.sync_state_dir is not None:
+                state = SheetSyncState.load(self.sync_state_dir / f"{tab_name}.json", columns)
+            else:
+                state = SheetSyncState(columns)
+            self._sync_states[tab_name] = state
+        return state
+
     # =========================================================================
     # TICKER READING
     # =========================================================================
@@ -309,16 +351,21 @@ class SheetManager:
             row = [_safe_cell(d.get(col, '')) for col in self.TECH_COLUMNS]
             rows.append(row)
 
+        state = self._sync_state(tab_name, self.TECH_COLUMNS)
         try:
             if append:
-                self._call_api(sheet.append_rows, rows)
+                response = self._call_api(sheet.append_rows, rows)
+                self._record_appended(state, data, rows, response)
                 if self.verbose:
                     print(f"   ✅ Appended {len(data)} rows to {tab_name}")
             else:
                 self._call_api(sheet.clear)
                 self._call_api(sheet.update, rows, 'A1')
+                state.clear()
+                self._record_appended(state, data, rows[1:], first_row=2)
                 if self.verbose:
                     print(f"   ✅ Wrote {len(data)} rows to {tab_name}")
+            state.save()
             return True
         except gspread.exceptions.APIError:
             self._save_csv_fallback(tab_name, self.TECH_COLUMNS, data)
@@ -329,9 +376,12 @@ class SheetManager:
         """
         Write technical data with row replacement support.
 
-        - For tickers that exist: update the specific row
+        - For tickers that exist: update only the cells that changed since
+          this manager (or its sync_state_dir) last wrote the row
         - For new tickers: append to the end
 
+        Changed cells are sent as coalesced ranges in one batch_update.
+
         Args:
             tab_name: Name of the sheet tab
             data: List of dicts with tech indicator values
@@ -349,47 +399,52 @@ class SheetManager:
             sheet = self.spreadsheet.add_worksheet(title=tab_name, rows=1000, cols=35)
             sheet.update([self.TECH_COLUMNS], 'A1')
 
-        # Separate into updates and appends
-        rows_to_update = []  # (row_number, row_data)
-        rows_to_append = []
-
-        for d in data:
-            ticker = d.get('Ticker', '').upper()
-            row_data = [_safe_cell(d.get(col, '')) for col in self.TECH_COLUMNS]
-
-            if ticker in existing_data:
-                row_num = existing_data[ticker]['row_number']
-                rows_to_update.append((row_num, row_data))
-            else:
-                rows_to_append.append(row_data)
+        rows = [
+            (d.get('Ticker', '').upper(), [_safe_cell(d.get(col, '')) for col in self.TECH_COLUMNS])
+            for d in data
+        ]
+        existing_rows = {ticker: info['row_number'] for ticker, info in existing_data.items()}
+        state = self._sync_state(tab_name, self.TECH_COLUMNS)
+        plan = plan_sync(rows, existing_rows, state)
 
         try:
-            # Perform updates for existing rows
-            if rows_to_update:
-                updates = []
-                last_col = self.col_num_to_letter(len(self.TECH_COLUMNS))
-
-                for row_num, row_data in rows_to_update:
-                    range_str = f'A{row_num}:{last_col}{row_num}'
-                    updates.append({
-                        'range': range_str,
-                        'values': [row_data]
-                    })
-
-                self._call_api(sheet.batch_update, updates)
+            # Changed cells of existing rows, one request
+            if plan.updates:
+                self._call_api(sheet.batch_update, plan.updates)
                 if self.verbose:
-                    print(f"   ✅ Updated {len(rows_to_update)} existing rows in {tab_name}")
+                    print(f"   ✅ Updated {len(plan.written)} existing rows in {tab_name} "
+                          f"({plan.cells} cells, {len(plan.updates)} ranges)")
+            if plan.skipped and self.verbose:
+                print(f"   ⏭️  {plan.skipped} rows unchanged in {tab_name}")
+            state.commit(plan)
 
             # Append new rows
-            if rows_to_append:
-                self._call_api(sheet.append_rows, rows_to_append)
+            if plan.appends:
+                append_rows = [values for _, values in plan.appends]
+                response = self._call_api(sheet.append_rows, append_rows)
+                state.commit(plan, first_append_row=_first_row(response))
                 if self.verbose:
-                    print(f"   ✅ Appended {len(rows_to_append)} new rows to {tab_name}")
+                    print(f"   ✅ Appended {len(plan.appends)} new rows to {tab_name}")
+            state.save()
             return True
         except gspread.exceptions.APIError:
+            state.save()
             self._save_csv_fallback(tab_name, self.TECH_COLUMNS, data)
             return False
 
+    @staticmethod
+    def _record_appended(state: SheetSyncState, data: List[Dict], rows: List[List[Any]],
+                         response: Any = None, first_row: Optional[int] = None) -> None:
+        """Record rows written in order from first_row (or the append response)."""
+        if first_row is None:
+            first_row = _first_row(response)
+        if first_row is None:
+            return
+        for offset, (d, values) in enumerate(zip(data, rows)):
+            ticker = d.get('Ticker', '').upper()
+            if ticker:
+                state.record(ticker, first_row + offset, [cell_hash(v) for v in values])
+
     # =========================================================================
     # MULTI-HORIZON TECH DATA WRITING (tech_analysis_clean)
     # =========================================================================
@@ -402,7 +457,8 @@ class SheetManager:
 
         Args:
             tab_name: Name of the sheet tab (e.g., 'tech_analysis_clean')
-            data: List of dicts with multi-horizon indicator values
+            data: List of dicts with multi-horizon indicator values, either
+                numeric (MultiHorizonResult.to_record()) or already formatted
 
         Returns:
             True on success, False if fell back to CSV.
@@ -423,6 +479,7 @@ class SheetManager:
         rows = [self.MULTI_HORIZON_COLUMNS]
 
         for d in data:
+            d = format_multi_horizon(d)
             row = [_safe_cell(d.get(col, '')) for col in self.MULTI_HORIZON_COLUMNS]
             rows.append(row)
 
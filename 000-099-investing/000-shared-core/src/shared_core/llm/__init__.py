@@ -1,4 +1,6 @@
 """LLM client and utilities."""
+from .cache import RequestCoalescer, ResponseCache, cache_key
 from .client import LLMClient
+from .mock import MockLLM
 
-__all__ = ["LLMClient"]
+__all__ = ["LLMClient", "MockLLM", "RequestCoalescer", "ResponseCache", "cache_key"]
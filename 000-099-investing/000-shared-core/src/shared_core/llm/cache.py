@@ -0,0 +1,197 @@
+"""
+Persistent LLM response cache and in-flight request coalescing.
+
+Responses are content-addressed: the key is a SHA-256 of the provider,
+model, prompt, system message, max_tokens and the provider settings that
+shape the output (OUTPUT_SETTINGS), so an unchanged request (re-analyzing
+an unchanged ticker, rerunning a pipeline after a partial failure) is
+answered from disk. Entries older than the TTL are treated as missing.
+
+Cache structure:
+    data/
+    └── llm_responses/
+        └── 3f/
+            └── 3fa9...e1.json
+
+Usage:
+    from shared_core.llm import LLMClient, ResponseCache
+
+    cache = ResponseCache(Path("data/llm_responses"), ttl_hours=24)
+    client = LLMClient("claude", api_key, settings, cache=cache)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from ..config.constants import CACHE_CONFIG
+from ..state.utils import safe_read_json, safe_write_json
+
+logger = logging.getLogger(__name__)
+
+# Provider settings that change the response (model and max_tokens are keyed
+# separately); anything else, e.g. MockLLM latency, is left out of the key
+OUTPUT_SETTINGS = (
+    "temperature",
+    "reasoning_effort",
+    "web_search",
+    "use_extended_thinking",
+    "thinking_budget_tokens",
+    "responses",
+)
+
+
+def cache_key(
+    provider: str,
+    model: str,
+    prompt: str,
+    system_message: Optional[str],
+    max_tokens: int,
+    settings: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Content address of one LLM request.
+
+    Args:
+        provider: Provider name
+        model: Resolved API model string
+        prompt: User prompt
+        system_message: System instruction (None and "" differ)
+        max_tokens: Output token cap
+        settings: Provider settings; only the OUTPUT_SETTINGS keys are hashed
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "prompt": prompt,
+            "system": system_message,
+            "max_tokens": max_tokens,
+            "settings": {k: v for k, v in (settings or {}).items() if k in OUTPUT_SETTINGS},
+        },
+        sort_keys=True,
+        default=str,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Response text per cache key, one JSON file each, with a TTL."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_hours: Optional[float] = None,
+        verbose: bool = False,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for response files (e.g., project/data/llm_responses/)
+            ttl_hours: Age after which a response is refetched
+                (default CACHE_CONFIG.LLM_CACHE_TTL_HOURS; 0 never expires)
+            verbose: Print cache operations
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_hours = CACHE_CONFIG.LLM_CACHE_TTL_HOURS if ttl_hours is None else ttl_hours
+        self.verbose = verbose
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def _get_path(self, key: str) -> Path:
+        """Get path for a key (sharded by its first two hex digits)."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Cached response for a key.
+
+        Returns:
+            Response text, or None when missing, unreadable or expired
+        """
+        data = safe_read_json(str(self._get_path(key)))
+        response = data.get("response") if isinstance(data, dict) else None
+        if not isinstance(response, str) or (
+            self.ttl_hours and time.time() - data.get("created", 0) > self.ttl_hours * 3600
+        ):
+            response = None
+        with self._stats_lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def put(self, key: str, response: str, **meta: Any) -> None:
+        """Store a response (atomic replace); meta is saved alongside for inspection."""
+        try:
+            safe_write_json(
+                str(self._get_path(key)),
+                {"created": time.time(), "response": response, **meta},
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"LLM cache write failed for {key[:12]}: {e}")
+            if self.verbose:
+                print(f"    ⚠️  LLM cache save failed: {key[:12]} ({e})")
+
+    def clear_expired(self) -> int:
+        """Delete expired response files. Returns the number deleted."""
+        if not self.ttl_hours or not self.cache_dir.exists():
+            return 0
+        cutoff = time.time() - self.ttl_hours * 3600
+        deleted = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            data = safe_read_json(str(path))
+            if not isinstance(data, dict) or data.get("created", 0) < cutoff:
+                path.unlink(missing_ok=True)
+                deleted += 1
+        return deleted
+
+
+class RequestCoalescer:
+    """
+    Single-flight execution: concurrent calls with the same key share one run.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight block and receive its result (or its exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.coalesced = 0
+
+    def run(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
@@ -1,7 +1,7 @@
 """Unified LLM client with retry logic and multi-provider support."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from tenacity import (
     retry,
@@ -10,6 +10,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from .cache import RequestCoalescer, ResponseCache, cache_key
+
 # Use standard logging, let consumer configure handlers
 logger = logging.getLogger(__name__)
 
@@ -17,31 +19,50 @@ logger = logging.getLogger(__name__)
 class LLMClient:
     """Unified LLM client supporting multiple providers with retry logic."""
 
-    def __init__(self, provider: str, api_key: str, provider_settings: Dict[str, Any]):
+    def __init__(
+        self,
+        provider: str,
+        api_key: str,
+        provider_settings: Dict[str, Any],
+        cache: Optional[ResponseCache] = None,
+    ):
         """Initialize LLM client for a specific provider.
 
         Args:
-            provider: Provider name (claude, openai, grok, gemini)
+            provider: Provider name (claude, openai, grok, gemini, or mock
+                      for offline use; mock needs no api_key)
             api_key: API key for the provider
             provider_settings: Provider-specific settings dictionary.
                              Should contain 'model' and optionally 'max_tokens', etc.
+            cache: Persistent response cache; identical requests are answered
+                   from it until they expire
         """
         self.provider = provider
         self.api_key = api_key
         self.provider_settings = provider_settings
+        self.cache = cache
         self.client: Any = None
         self.model_name: str = ""
         self.max_tokens: int = provider_settings.get("max_tokens", 64000)
+        self._coalescer = RequestCoalescer()
 
         self._initialize_client()
         self._sanitize_caps()
 
     def _initialize_client(self) -> None:
         """Initialize the appropriate API client."""
-        if not self.api_key:
+        if self.provider == "mock":
+            from .mock import MockLLM
+            self.client = MockLLM(
+                self.provider_settings.get("responses"),
+                latency=self.provider_settings.get("latency", 0.0),
+            )
+            self.model_name = self.provider_settings.get("model") or "mock"
+
+        elif not self.api_key:
             raise ValueError(f"API key not provided for {self.provider}")
 
-        if self.provider == "claude":
+        elif self.provider == "claude":
             from anthropic import Anthropic
             self.client = Anthropic(api_key=self.api_key)
             self.model_name = self._get_model_mapping("claude", self.provider_settings.get("model", ""))
@@ -120,20 +141,27 @@ class LLMClient:
         except (TypeError, ValueError, KeyError) as e:
             logger.warning(f"Error sanitizing caps: {e}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type((RuntimeError, Exception)),
-        reraise=True
-    )
-    def call_llm(self, prompt: str, system_message: str | None = None, max_tokens: int | None = None, stream: bool = False) -> str:
+    def call_llm(
+        self,
+        prompt: str,
+        system_message: str | None = None,
+        max_tokens: int | None = None,
+        stream: bool = False,
+        use_cache: bool = True,
+    ) -> str:
         """Call LLM with automatic retry on failure.
 
+        With a cache, a request identical to an unexpired earlier one
+        (same provider, model, prompt, system message, max_tokens and
+        output-shaping provider settings) is answered from it. Identical requests made
+        concurrently from several threads share a single provider call.
+
         Args:
             prompt: Input prompt
             system_message: Optional system instruction
             max_tokens: Maximum tokens to generate
             stream: Whether to stream the response
+            use_cache: False always calls the provider (and skips coalescing)
 
         Returns:
             LLM response text
@@ -141,6 +169,43 @@ class LLMClient:
         if max_tokens is None:
             max_tokens = self.max_tokens
 
+        if not use_cache:
+            return self._call_provider(prompt, system_message, max_tokens, stream)
+
+        key = cache_key(
+            self.provider, self.model_name, prompt, system_message, max_tokens, self.provider_settings
+        )
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit for {self.provider} model {self.model_name} ({key[:12]})")
+                return cached
+
+        return self._coalescer.run(
+            key, lambda: self._fetch(key, prompt, system_message, max_tokens, stream)
+        )
+
+    def _fetch(self, key: str, prompt: str, system_message: str | None, max_tokens: int, stream: bool) -> str:
+        """Call the provider for a cache miss and store the response."""
+        if self.cache is not None:
+            # A request that finished between the lookup and this call
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = self._call_provider(prompt, system_message, max_tokens, stream)
+        if self.cache is not None and response:
+            self.cache.put(key, response, provider=self.provider, model=self.model_name)
+        return response
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=60),
+        retry=retry_if_exception_type((RuntimeError, Exception)),
+        reraise=True
+    )
+    def _call_provider(self, prompt: str, system_message: str | None, max_tokens: int, stream: bool) -> str:
+        """Send one request to the provider, retrying on failure."""
         logger.debug(f"Calling {self.provider} model {self.model_name} with {max_tokens} max tokens")
 
         try:
@@ -152,6 +217,8 @@ class LLMClient:
                 return self._call_grok(prompt, system_message, max_tokens)
             elif self.provider == "gemini":
                 return self._call_gemini(prompt, system_message, max_tokens)
+            elif self.provider == "mock":
+                return self.client.complete(prompt, system_message, max_tokens)
             else:
                 raise ValueError(f"Unknown provider: {self.provider}")
         except Exception as e:
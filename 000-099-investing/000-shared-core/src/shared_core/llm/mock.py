@@ -0,0 +1,44 @@
+"""Offline mock provider for LLMClient (tests, dry runs, cache warm-up checks)."""
+
+import hashlib
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class MockLLM:
+    """
+    Deterministic stand-in for a provider SDK.
+
+    Returns a canned response when the prompt has one, otherwise a stable
+    text derived from the prompt, and counts every call it receives.
+
+    Usage:
+        client = LLMClient("mock", "", {"responses": {"ping": "pong"}})
+        client.call_llm("ping")   # -> "pong"
+        client.client.calls       # -> 1
+    """
+
+    def __init__(self, responses: Optional[Dict[str, str]] = None, latency: float = 0.0):
+        """
+        Args:
+            responses: prompt -> response text
+            latency: Seconds to sleep per call (simulates a slow provider)
+        """
+        self.responses = dict(responses or {})
+        self.latency = latency
+        self.calls = 0
+        self.prompts: List[Tuple[str, Optional[str], int]] = []
+        self._lock = threading.Lock()
+
+    def complete(self, prompt: str, system_message: Optional[str] = None, max_tokens: int = 0) -> str:
+        """Answer one request."""
+        with self._lock:
+            self.calls += 1
+            self.prompts.append((prompt, system_message, max_tokens))
+        if self.latency:
+            time.sleep(self.latency)
+        if prompt in self.responses:
+            return self.responses[prompt]
+        digest = hashlib.sha256(f"{system_message or ''}\n{prompt}".encode("utf-8")).hexdigest()
+        return f"mock response {digest[:12]}"
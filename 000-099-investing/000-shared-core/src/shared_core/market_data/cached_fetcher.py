@@ -3,14 +3,17 @@ CacheAwareFetcher - Unified cache-aware data fetcher for Twelve Data.
 
 This module provides a centralized fetcher that:
 1. Checks the shared cache (008-ticker-analysis/data/twelve_data/) for today's data
-2. Falls back to Twelve Data API if cache miss
-3. Handles the column-oriented DataFrame JSON format from the cache
+2. Falls back to Twelve Data API if cache miss, fetching only the bars
+   since the most recent earlier cache file when there is one
+3. Handles the column-oriented DataFrame JSON format from the cache, plus the
+   binary formats from shared_core.cache.storage
 
 Usage:
     from shared_core.market_data.cached_fetcher import CacheAwareFetcher
 
     fetcher = CacheAwareFetcher(api_key="...", cache_dir=Path("../008-ticker-analysis/data/twelve_data"))
     data = fetcher.fetch("AAPL")  # Returns API-format dict with 'values'
+    df = fetcher.get_cached_dataframe("AAPL")  # Typed DataFrame, no row parsing
 """
 
 import datetime
@@ -18,14 +21,31 @@ import json
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import pandas as pd
 import requests
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
-
+from tenacity import (
+    RetryError,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from shared_core.cache.cache_index import CacheIndex
+from shared_core.cache.storage import find_cache_file, storage_for_path
 from shared_core.config.constants import CACHE_CONFIG, RATE_LIMITS
-from shared_core.market_data.twelve_data import ApiCreditExhausted, _build_key_pool
+from shared_core.market_data.delta import delta_start_date, merge_delta
+from shared_core.market_data.rate_limiter import KeyScheduler
+from shared_core.market_data.twelve_data import (
+    ApiCreditExhausted,
+    ApiRateLimited,
+    _build_key_pool,
+    parse_time_series,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +56,10 @@ class CacheAwareFetcher:
 
     Checks shared cache first, falls back to API on cache miss.
     Handles pandas DataFrame column-oriented JSON format from cache.
+
+    On a miss with an earlier cache file for the symbol, only the bars since
+    that file are requested and merged onto it (source 'delta'); a split or
+    gap detected by the merge falls back to a full fetch.
     """
 
     def __init__(
@@ -45,6 +69,8 @@ class CacheAwareFetcher:
         rate_limit_delay: float = RATE_LIMITS.TWELVE_DATA_DEFAULT_DELAY,
         output_size: int = CACHE_CONFIG.DEFAULT_OUTPUT_SIZE,
         api_keys: Optional[List[str]] = None,
+        requests_per_minute: Optional[float] = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the cache-aware fetcher.
@@ -52,16 +78,29 @@ class CacheAwareFetcher:
         Args:
             api_key: Twelve Data API key (primary)
             cache_dir: Path to cache directory (default: auto-detect from project structure)
-            rate_limit_delay: Delay between API calls in seconds
+            rate_limit_delay: Minimum spacing between API calls per key, in seconds.
+                Only used to derive requests_per_minute when that is not given.
             output_size: Number of data points to fetch from API
             api_keys: Optional list of API keys for rotation on credit exhaustion
+            requests_per_minute: Credit budget per API key for batch fetches
+                (default: 60 / rate_limit_delay)
+            max_workers: Concurrent batch requests (default: combined per-minute
+                budget of all keys, capped at 32)
         """
         self._key_pool = _build_key_pool(api_key, api_keys)
         self._key_index = 0
         self.api_key = self._key_pool[0]
         self.base_url = "https://api.twelvedata.com"
         self.rate_limit_delay = rate_limit_delay
+        self.rate_limit_backoff = RATE_LIMITS.TWELVE_DATA_MINUTE_BACKOFF
         self.output_size = output_size
+        if requests_per_minute is None and rate_limit_delay > 0:
+            requests_per_minute = 60.0 / rate_limit_delay
+        self.requests_per_minute = requests_per_minute
+        if max_workers is None:
+            per_key = int(requests_per_minute) if requests_per_minute else 32
+            max_workers = min(32, max(1, per_key * len(self._key_pool)))
+        self.max_workers = max_workers
         self.today = os.environ.get('CACHE_DATE') or datetime.date.today().isoformat()
 
         # Auto-detect cache directory if not provided
@@ -78,6 +117,7 @@ class CacheAwareFetcher:
                     break
 
         self.cache_dir = cache_dir
+        self._cache_index: Optional[CacheIndex] = None
         if self.cache_dir and self.cache_dir.exists():
             logger.debug(f"Cache directory: {self.cache_dir}")
         else:
@@ -129,35 +169,143 @@ class CacheAwareFetcher:
             "meta": {"symbol": symbol, "source": "cache"}
         }
 
-    def get_cached_data(self, symbol: str) -> Optional[Dict[str, Any]]:
+    def _dataframe_to_api_format(self, df: pd.DataFrame, symbol: str) -> Optional[Dict[str, Any]]:
         """
-        Check shared cache for today's data.
+        Convert a typed cache DataFrame into the same API-like format as
+        _parse_cached_json, column by column.
+        """
+        if "datetime" not in df.columns or "close" not in df.columns:
+            return None
+
+        columns = {"datetime": pd.to_datetime(df["datetime"]).dt.strftime("%Y-%m-%d")}
+        for col in ("open", "high", "low", "close"):
+            columns[col] = df[col].astype(str) if col in df.columns else ""
+        if "volume" in df.columns:
+            volume = pd.to_numeric(df["volume"], errors="coerce").fillna(0)
+            columns["volume"] = volume.astype("int64").astype(str)
+        else:
+            columns["volume"] = "0"
+
+        return {
+            "values": pd.DataFrame(columns, index=df.index).to_dict("records"),
+            "status": "ok",
+            "meta": {"symbol": symbol, "source": "cache"}
+        }
+
+    def _index(self) -> CacheIndex:
+        """Index of the cache directory (opened on first use)."""
+        if self._cache_index is None:
+            self._cache_index = CacheIndex(self.cache_dir)
+        return self._cache_index
+
+    def _find_cache_file(self, symbol: str) -> Optional[Path]:
+        """Locate today's cache file for a symbol in any storage format."""
+        if not self.cache_dir or not self.cache_dir.exists():
+            return None
+        return find_cache_file(self.cache_dir, symbol, self.today)
+
+    def get_cached_dataframe(self, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Load today's cached data as a typed DataFrame.
+
+        Skips the API-format round trip: binary cache files load straight
+        into typed columns, JSON files via a single pd.read_json.
 
         Args:
             symbol: Ticker symbol (e.g., "AAPL")
 
         Returns:
-            API-format dict with 'values' if cached, None otherwise
+            DataFrame with datetime + OHLCV columns if cached, None otherwise
         """
+        cache_file = self._find_cache_file(symbol)
+        if cache_file is None:
+            return None
+
+        try:
+            df = storage_for_path(cache_file).read(cache_file)
+        except (ValueError, OSError) as e:
+            logger.warning(f"Cache read error for {symbol}: {e}")
+            return None
+
+        if "close" not in df.columns or df.empty:
+            return None
+        self._index().touch(symbol)
+        return df
+
+    def _delta_base(self, symbol: str) -> Optional[Tuple[pd.DataFrame, str]]:
+        """Most recent earlier cached history and the date to fetch from, if usable."""
         if not self.cache_dir or not self.cache_dir.exists():
             return None
 
-        cache_file = self.cache_dir / f"{symbol}_{self.today}.json"
+        entry = self._index().latest(symbol, self.today)
+        if entry is None:
+            return None
+
+        path = self.cache_dir / entry.filename
+        try:
+            previous = storage_for_path(path).read(path)
+        except (ValueError, OSError) as e:
+            logger.warning(f"Previous cache read error for {symbol}: {e}")
+            return None
+
+        start_date = delta_start_date(previous, self.today)
+        return (previous, start_date) if start_date else None
+
+    def _merge_delta_response(
+        self, symbol: str, previous: pd.DataFrame, data: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Merge a delta API response onto the cached history, None if it doesn't line up."""
+        if not data or not data.get("values"):
+            return None
+        try:
+            delta = parse_time_series(data["values"])
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Delta parse error for {symbol}: {e}")
+            return None
+
+        merged = merge_delta(previous, delta, max_bars=self.output_size)
+        if merged is None:
+            logger.info(f"🔁 Cached history for {symbol} no longer matches, refetching in full")
+            return None
+
+        result = self._dataframe_to_api_format(merged, symbol)
+        result["meta"]["source"] = "delta"
+        logger.info(f"🌐 Fetched delta from API: {symbol} ({len(delta)} new rows)")
+        return result
+
+    def get_cached_data(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Check shared cache for today's data.
+
+        Args:
+            symbol: Ticker symbol (e.g., "AAPL")
+
+        Returns:
+            API-format dict with 'values' if cached, None otherwise
+        """
+        cache_file = self._find_cache_file(symbol)
 
-        if not cache_file.exists():
+        if cache_file is None:
             return None
 
         try:
-            with open(cache_file, 'r') as f:
-                raw_data = json.load(f)
+            if cache_file.suffix == ".json":
+                with open(cache_file, 'r') as f:
+                    raw_data = json.load(f)
+                result = self._parse_cached_json(raw_data, symbol)
+            else:
+                df = storage_for_path(cache_file).read(cache_file)
+                result = self._dataframe_to_api_format(df, symbol)
 
-            result = self._parse_cached_json(raw_data, symbol)
             if result and result.get("values"):
+                self._index().touch(symbol)
                 logger.info(f"📁 Using cached data for {symbol} ({len(result['values'])} rows)")
                 return result
 
         except json.JSONDecodeError as e:
             logger.warning(f"Cache JSON parse error for {symbol}: {e}")
+        except ValueError as e:
+            logger.warning(f"Cache parse error for {symbol}: {e}")
         except OSError as e:
             logger.warning(f"Cache file read error for {symbol}: {e}")
         except (KeyError, TypeError) as e:
@@ -174,18 +322,36 @@ class CacheAwareFetcher:
         logger.info(f"🔄 Rotating to API key {self._key_index + 1}/{len(self._key_pool)}")
         return True
 
-    def _fetch_from_api_once(self, symbol: str) -> Optional[Dict[str, Any]]:
+    def _fetch_from_api_once(
+        self,
+        symbol: str,
+        key_index: Optional[int] = None,
+        start_date: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
-        Single API fetch attempt. Raises ApiCreditExhausted on credit errors.
+        Single API fetch attempt. Raises ApiRateLimited when the key's
+        per-minute credits are spent and ApiCreditExhausted on other
+        (daily) credit errors.
         Raises RequestException on network errors (for tenacity to retry).
+
+        Uses the current rotation key unless key_index picks one from the pool.
+        start_date limits the request to bars from that date on.
         """
+        if key_index is None:
+            key_index = self._key_index
+            api_key = self.api_key
+        else:
+            api_key = self._key_pool[key_index]
+
         url = f"{self.base_url}/time_series"
         params = {
             "symbol": symbol,
             "interval": "1day",
             "outputsize": self.output_size,
-            "apikey": self.api_key,
+            "apikey": api_key,
         }
+        if start_date:
+            params["start_date"] = start_date
 
         response = requests.get(url, params=params, timeout=30)
         response.raise_for_status()
@@ -194,7 +360,9 @@ class CacheAwareFetcher:
         if "status" in data and data["status"] == "error":
             msg = data.get("message", "Unknown")
             if "credit" in msg.lower():
-                raise ApiCreditExhausted(self._key_index)
+                if "minute" in msg.lower():
+                    raise ApiRateLimited(key_index)
+                raise ApiCreditExhausted(key_index)
             logger.error(f"API error for {symbol}: {msg}")
             return None
 
@@ -214,9 +382,14 @@ class CacheAwareFetcher:
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type(requests.exceptions.RequestException),
     )
-    def _fetch_with_retry(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Retries on network errors only. ApiCreditExhausted passes through."""
-        return self._fetch_from_api_once(symbol)
+    def _fetch_with_retry(
+        self,
+        symbol: str,
+        key_index: Optional[int] = None,
+        start_date: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Retries on network errors only. Credit errors pass through."""
+        return self._fetch_from_api_once(symbol, key_index, start_date)
 
     def fetch(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -233,76 +406,149 @@ class CacheAwareFetcher:
         if cached:
             return cached
 
-        # Fall back to API with key rotation
+        # Fall back to API with key rotation, fetching only new bars if possible
+        base = self._delta_base(symbol)
         while True:
             try:
+                if base is not None:
+                    merged = self._merge_delta_response(
+                        symbol, base[0], self._fetch_with_retry(symbol, start_date=base[1])
+                    )
+                    if merged is not None:
+                        return merged
+                    base = None
                 return self._fetch_with_retry(symbol)
+            except ApiRateLimited:
+                logger.info(f"⏳ API key {self._key_index + 1} at its per-minute limit, waiting")
+                time.sleep(self.rate_limit_backoff)
             except ApiCreditExhausted:
                 if not self._rotate_key():
                     logger.error(f"All API keys exhausted fetching {symbol}")
                     return None
 
-    def fetch_batch(self, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    def _fetch_scheduled(
+        self, symbol: str, scheduler: KeyScheduler
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one symbol using whichever key the scheduler hands out,
+        failing over to another key on credit exhaustion. A key at its
+        per-minute limit is paused and the symbol requeued on the next key
+        with credit.
+
+        A delta request that doesn't line up with the cache is followed by
+        a full fetch, which borrows a key (and credit) of its own.
+        """
+        base = self._delta_base(symbol)
+        while True:
+            key_index = scheduler.acquire()
+            if key_index is None:
+                return None
+
+            try:
+                if base is not None:
+                    result = self._merge_delta_response(
+                        symbol, base[0], self._fetch_with_retry(symbol, key_index, base[1])
+                    )
+                    if result is None:
+                        base = None
+                        scheduler.release(key_index)
+                        continue
+                else:
+                    result = self._fetch_with_retry(symbol, key_index)
+            except ApiRateLimited:
+                scheduler.back_off(key_index, self.rate_limit_backoff)
+                logger.info(f"⏳ API key {key_index + 1} at its per-minute limit, requeueing {symbol}")
+                continue
+            except ApiCreditExhausted:
+                scheduler.mark_exhausted(key_index)
+                remaining = len(scheduler.live_keys())
+                if remaining:
+                    logger.info(f"🔄 API key {key_index + 1} exhausted, {remaining} key(s) left")
+                else:
+                    logger.error("All API keys exhausted in batch fetch")
+                continue
+            except RetryError as e:
+                scheduler.abandon(key_index)
+                logger.error(f"Network error fetching {symbol}: {e}")
+                return None
+
+            scheduler.release(key_index)
+            return result
+
+    def iter_batch(
+        self, symbols: List[str]
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
         """
-        Fetch data for multiple tickers with rate limiting.
+        Fetch multiple tickers, yielding (symbol, data) as each one completes.
 
-        Only applies rate limiting for API calls (not cached data).
+        Cache hits are yielded first. Cache misses are fetched concurrently:
+        each API key spends requests_per_minute credits at an even pace,
+        so throughput follows the combined credit limit of the key pool
+        instead of a fixed sleep between calls.
 
         Args:
             symbols: List of ticker symbols
 
-        Returns:
-            Dict mapping symbol -> data dict (or None if failed)
+        Yields:
+            (symbol, data dict or None if failed)
         """
-        results = {}
         total = len(symbols)
-        api_calls = 0
-        cache_hits = 0
-        all_keys_exhausted = False
-
-        for i, symbol in enumerate(symbols):
-            if all_keys_exhausted:
-                results[symbol] = None
-                continue
-
-            logger.info(f"Fetching {symbol} ({i+1}/{total})...")
+        misses = []
 
-            # Check cache first (no rate limit needed)
+        for symbol in symbols:
             cached = self.get_cached_data(symbol)
             if cached:
-                results[symbol] = cached
-                cache_hits += 1
-                continue
+                yield symbol, cached
+            else:
+                misses.append(symbol)
 
-            # API call with rotation loop (handles any number of keys)
-            fetched = False
-            while True:
-                try:
-                    results[symbol] = self._fetch_with_retry(symbol)
-                    api_calls += 1
-                    fetched = True
-                    break
-                except ApiCreditExhausted:
-                    if not self._rotate_key():
-                        logger.error("All API keys exhausted in batch fetch")
-                        results[symbol] = None
-                        all_keys_exhausted = True
-                        break
-
-            if not fetched:
-                continue
+        cache_hits = total - len(misses)
+        api_calls = 0
 
-            # Rate limit for API calls (skip for last ticker)
-            if i < total - 1:
-                time.sleep(self.rate_limit_delay)
+        if misses:
+            scheduler = KeyScheduler(len(self._key_pool), self.requests_per_minute)
+            workers = min(self.max_workers, len(misses))
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._fetch_scheduled, symbol, scheduler): symbol
+                    for symbol in misses
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    symbol = futures[future]
+                    data = future.result()
+                    if data is not None:
+                        api_calls += 1
+                    logger.info(f"Fetched {symbol} ({cache_hits + done}/{total})")
+                    yield symbol, data
+
+            self._sync_key_rotation(scheduler)
 
         logger.info(f"Completed: {cache_hits} from cache, {api_calls} from API")
-        return results
+
+    def _sync_key_rotation(self, scheduler: KeyScheduler) -> None:
+        """Point single fetches at the first key a batch left with credits."""
+        live = scheduler.live_keys()
+        self._key_index = live[0] if live else len(self._key_pool)
+        if live:
+            self.api_key = self._key_pool[self._key_index]
+
+    def fetch_batch(self, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch data for multiple tickers with per-key credit budgeting.
+
+        Cached tickers cost nothing; API calls run concurrently (see iter_batch).
+
+        Args:
+            symbols: List of ticker symbols
+
+        Returns:
+            Dict mapping symbol -> data dict (or None if failed), in input order
+        """
+        results = dict(self.iter_batch(symbols))
+        return {symbol: results.get(symbol) for symbol in symbols}
 
     def is_cached(self, symbol: str) -> bool:
         """Check if ticker has today's cache without loading data."""
-        if not self.cache_dir or not self.cache_dir.exists():
-            return False
-        cache_file = self.cache_dir / f"{symbol}_{self.today}.json"
-        return cache_file.exists()
+        return self._find_cache_file(symbol) is not None
 
@@ -0,0 +1,105 @@
+"""
+Delta refresh of cached daily time series.
+
+A daily refresh used to download the full `output_size` history for every
+ticker just to pick up one new bar. When yesterday's (or last week's) file is
+still on disk, only the bars from the last complete cached bar onward are
+requested and appended to the cached history instead.
+
+The first requested bar is one the cache already holds (the second-to-last
+cached bar; the last one may have been a partial intraday bar). It anchors
+the merge: if the API no longer returns it, or returns it with a different
+close, a split or data revision has rewritten history and the caller falls
+back to a full fetch. Histories older than DELTA_MAX_GAP_DAYS are refetched
+in full as well.
+
+Usage:
+    from shared_core.market_data.delta import delta_start_date, merge_delta
+
+    start = delta_start_date(previous_df, today)
+    if start:
+        delta = client.fetch_raw(ticker, start_date=start)
+        df = merge_delta(previous_df, delta, max_bars=1000)  # None -> full fetch
+"""
+
+import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..config.constants import CACHE_CONFIG
+
+
+def delta_start_date(
+    cached: Optional[pd.DataFrame],
+    today: str,
+    max_gap_days: int = CACHE_CONFIG.DELTA_MAX_GAP_DAYS,
+) -> Optional[str]:
+    """
+    Date to request a delta from, or None if a full fetch is needed.
+
+    Args:
+        cached: Most recent cached history (datetime + OHLCV columns)
+        today: Current cache date (YYYY-MM-DD)
+        max_gap_days: Longest gap since the last cached bar to bridge
+
+    Returns:
+        Date of the anchor bar (YYYY-MM-DD), or None
+    """
+    if cached is None or len(cached) < 2 or not {'datetime', 'close'} <= set(cached.columns):
+        return None
+
+    dates = pd.to_datetime(cached['datetime'], errors='coerce')
+    if dates.isna().any():
+        return None
+
+    gap = (datetime.date.fromisoformat(today) - dates.iloc[-1].date()).days
+    if gap < 0 or gap > max_gap_days:
+        return None
+    return dates.iloc[-2].strftime('%Y-%m-%d')
+
+
+def merge_delta(
+    cached: pd.DataFrame,
+    delta: Optional[pd.DataFrame],
+    max_bars: Optional[int] = None,
+    tolerance: float = CACHE_CONFIG.DELTA_PRICE_TOLERANCE,
+) -> Optional[pd.DataFrame]:
+    """
+    Append freshly fetched bars to a cached history.
+
+    Bars from the anchor onward are taken from the delta, so a partial last
+    cached bar is replaced by its final values.
+
+    Args:
+        cached: Cached history, sorted by datetime
+        delta: Bars fetched from delta_start_date(cached, ...) onward
+        max_bars: Keep only this many most recent bars (e.g. output_size)
+        tolerance: Relative tolerance for the anchor close
+
+    Returns:
+        Merged history, or None when the anchor is missing or changed
+        (split, revision or gap: refetch the full history)
+    """
+    if delta is None or delta.empty or 'datetime' not in delta.columns:
+        return None
+
+    cached_dates = pd.to_datetime(cached['datetime'])
+    delta_dates = pd.to_datetime(delta['datetime'])
+    anchor = cached_dates.iloc[-2]
+
+    match = delta.loc[delta_dates == anchor, 'close']
+    if match.empty or not np.isclose(
+        match.iloc[0], cached['close'].iloc[-2], rtol=tolerance, atol=0
+    ):
+        return None
+
+    head = cached.loc[cached_dates < anchor]
+    tail = delta.loc[delta_dates >= anchor].reindex(columns=cached.columns)
+    merged = pd.concat([head, tail], ignore_index=True)
+    merged['datetime'] = pd.to_datetime(merged['datetime'])
+
+    if max_bars is not None and len(merged) > max_bars:
+        merged = merged.iloc[-max_bars:].reset_index(drop=True)
+    return merged
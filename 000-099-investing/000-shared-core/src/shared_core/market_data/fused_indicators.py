@@ -0,0 +1,301 @@
+"""
+Fused computation of the standard indicator set.
+
+Computing the standard columns one TechnicalCalculator method at a time
+repeats work: true range is built for both ATR and ADX, the 14-bar rolling
+high/low for both Stochastic and Williams %R, the 20-bar mean for both
+SMA_20 and the Bollinger middle band, and close diffs for RSI and OBV.
+Here every shared intermediate is computed once, and rolling means that
+share a window run as a single multi-column rolling call.
+
+For Series input the results are identical to the per-indicator
+TechnicalCalculator methods: the same pandas kernels run on the same inputs,
+only without the repeats.
+
+RSI, ATR and ADX average through smooth(), the one shared kernel for
+Wilder's recursive average (the default) and the simple rolling mean the
+formulas used before; INDICATOR_CONFIG.SMOOTHING picks the default and every
+entry point takes a ``smoothing`` override.
+
+Inputs may be Series (one ticker) or wide DataFrames (dates x tickers);
+each output then has the same shape as the inputs. Wide frames take a
+NumPy sliding-window path that reduces all tickers at once and agrees with
+the per-ticker values to floating-point rounding. See
+TechnicalCalculator.panel_indicators for the multi-ticker entry point.
+
+Usage:
+    from shared_core.market_data.fused_indicators import compute_standard_indicators
+
+    columns = compute_standard_indicators(df['high'], df['low'], df['close'], df['volume'])
+    df = df.assign(**columns)
+"""
+
+from typing import Dict, List, Optional, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from shared_core.config.constants import DEFAULT_PERIODS, INDICATOR_CONFIG
+
+Frame = TypeVar("Frame", pd.Series, pd.DataFrame)
+
+# Simple moving average windows added by add_standard_indicators
+STANDARD_SMA_PERIODS = (5, 14, 20, 50, 200)
+
+MeanKey = Tuple[str, int]
+
+SMOOTHING_METHODS = ('wilder', 'simple')
+
+
+def _rolling(data: Frame, window: int, stat: str) -> Frame:
+    """
+    Trailing rolling statistic ('mean', 'std', 'min' or 'max').
+
+    Series go through pandas so single-ticker results stay identical to
+    TechnicalCalculator. Wide frames are reduced in one NumPy call over a
+    sliding-window view of the whole date x ticker matrix; pandas would
+    loop over the columns. A window holding any NaN yields NaN, as with
+    pandas' default min_periods.
+    """
+    if isinstance(data, pd.Series):
+        rolling = data.rolling(window=window)
+        return getattr(rolling, stat)()
+
+    values = data.to_numpy(dtype=float)
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        windows = sliding_window_view(values, window, axis=0)
+        if stat == 'std':
+            out[window - 1:] = windows.std(axis=-1, ddof=1)
+        else:
+            out[window - 1:] = getattr(windows, stat)(axis=-1)
+    return pd.DataFrame(out, index=data.index, columns=data.columns)
+
+
+def _rolling_means(parts: Dict[MeanKey, Frame]) -> Dict[MeanKey, Frame]:
+    """
+    Rolling means keyed by (input name, window).
+
+    Series inputs sharing a window are stacked and rolled in a single
+    pandas call, so the whole indicator set costs one rolling pass per
+    distinct window.
+    """
+    by_window: Dict[int, List[MeanKey]] = {}
+    for key in parts:
+        by_window.setdefault(key[1], []).append(key)
+
+    means: Dict[MeanKey, Frame] = {}
+    for window, keys in by_window.items():
+        if not isinstance(parts[keys[0]], pd.Series):
+            for key in keys:
+                means[key] = _rolling(parts[key], window, 'mean')
+            continue
+        names = [name for name, _ in keys]
+        stacked = pd.concat([parts[key] for key in keys], axis=1, keys=names)
+        rolled = stacked.rolling(window=window).mean()
+        for key, name in zip(keys, names):
+            means[key] = rolled[name]
+    return means
+
+
+def resolve_smoothing(smoothing: Optional[str] = None) -> str:
+    """
+    Validate a smoothing method name.
+
+    Args:
+        smoothing: 'wilder', 'simple', or None for INDICATOR_CONFIG.SMOOTHING
+
+    Returns:
+        The method name
+
+    Raises:
+        ValueError: For an unknown method
+    """
+    method = INDICATOR_CONFIG.SMOOTHING if smoothing is None else smoothing
+    if method not in SMOOTHING_METHODS:
+        raise ValueError(
+            f"Unknown smoothing {method!r}; expected one of {SMOOTHING_METHODS}"
+        )
+    return method
+
+
+def smooth(
+    data: Frame,
+    period: int,
+    smoothing: Optional[str] = None,
+    mean: Optional[Frame] = None,
+) -> Frame:
+    """
+    Average used by RSI, ATR and ADX.
+
+    'simple' is the trailing rolling mean. 'wilder' seeds with that mean on
+    the first full window and then recurses
+    ``avg[t] = avg[t-1] + (x[t] - avg[t-1]) / period``, i.e. an EMA with
+    alpha = 1/period run from the seed. Both agree on the seed bar; after
+    it, Wilder's average keeps a decaying memory of the whole history
+    instead of dropping bars that leave the window. Missing bars after the
+    seed are skipped rather than restarting the average.
+
+    Args:
+        data: Series or wide DataFrame to average
+        period: Averaging period
+        smoothing: 'wilder', 'simple', or None for INDICATOR_CONFIG.SMOOTHING
+        mean: Precomputed rolling mean of data over period, if already at hand
+
+    Returns:
+        Averaged values, shaped like data
+    """
+    method = resolve_smoothing(smoothing)
+    if mean is None:
+        mean = _rolling(data, period, 'mean')
+    if method == 'simple':
+        return mean
+
+    # Per column: NaN before the first full window, the window mean on it,
+    # raw values after it
+    seen = mean.notna().cumsum()
+    seeded = data.where(seen > 1).mask(seen == 1, mean)
+    return seeded.ewm(alpha=1 / period, adjust=False, ignore_na=True).mean()
+
+
+def true_range(high: Frame, low: Frame, close: Frame) -> Frame:
+    """True range: max(high - low, |high - prev close|, |low - prev close|)."""
+    prev_close = close.shift()
+    # fmax skips NaN like pd.concat(...).max(axis=1) does on the first bar
+    return np.fmax(high - low, np.fmax(abs(high - prev_close), abs(low - prev_close)))
+
+
+def compute_standard_indicators(
+    high: Frame,
+    low: Frame,
+    close: Frame,
+    volume: Optional[Frame] = None,
+    rsi_period: int = DEFAULT_PERIODS.RSI,
+    atr_period: int = DEFAULT_PERIODS.ATR,
+    adx_period: int = DEFAULT_PERIODS.ADX,
+    stoch_period: int = DEFAULT_PERIODS.STOCH_K,
+    bb_period: int = DEFAULT_PERIODS.BOLLINGER,
+    roc_period: int = DEFAULT_PERIODS.ROC,
+    smoothing: Optional[str] = None,
+) -> Dict[str, Frame]:
+    """
+    Compute the add_standard_indicators column set in one pass.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volume (OBV is skipped when None)
+        rsi_period: RSI period
+        atr_period: ATR period
+        adx_period: ADX period
+        stoch_period: Stochastic %K and Williams %R lookback
+        bb_period: Bollinger Band period
+        roc_period: Rate of Change period
+        smoothing: RSI/ATR/ADX averaging, 'wilder' or 'simple'
+            (default INDICATOR_CONFIG.SMOOTHING)
+
+    Returns:
+        Dict of column name -> values, in add_standard_indicators order:
+        SMA_5..SMA_200, RSI, MACD, MACD_SIGNAL, MACD_HIST, BB_UPPER,
+        BB_MIDDLE, BB_LOWER, BB_WIDTH, ATR, OBV, STOCH_K, STOCH_D, ADX,
+        WILLIAMS_R, ROC
+    """
+    smoothing = resolve_smoothing(smoothing)
+
+    # Shared intermediates
+    delta = close.diff()
+    # As TechnicalCalculator.rsi: a bar without a close (or after one)
+    # counts as no gain/loss
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    if isinstance(close, pd.DataFrame):
+        # Rows before a ticker's first close are alignment padding, not
+        # history: keep them out so the column matches the ticker's own series
+        listed = close.notna().cummax()
+        gain, loss = gain.where(listed), loss.where(listed)
+    tr = true_range(high, low, close)
+
+    plus_dm = high.diff()
+    minus_dm = -low.diff()
+    plus_dm = plus_dm.mask(plus_dm < 0, 0)
+    minus_dm = minus_dm.mask(minus_dm < 0, 0)
+
+    mean_inputs: Dict[MeanKey, Frame] = {
+        ('close', period): close for period in STANDARD_SMA_PERIODS
+    }
+    mean_inputs.update({
+        ('close', bb_period): close,
+        ('gain', rsi_period): gain,
+        ('loss', rsi_period): loss,
+        ('tr', atr_period): tr,
+        ('tr', adx_period): tr,
+        ('plus_dm', adx_period): plus_dm,
+        ('minus_dm', adx_period): minus_dm,
+    })
+    means = _rolling_means(mean_inputs)
+    # RSI/ATR/ADX inputs go through the configured average, seeded from the
+    # rolling means above (ATR and ADX share the true range average)
+    for key in means:
+        if key[0] != 'close':
+            means[key] = smooth(mean_inputs[key], key[1], smoothing, means[key])
+
+    columns: Dict[str, Frame] = {}
+
+    # SMAs
+    for period in STANDARD_SMA_PERIODS:
+        columns[f'SMA_{period}'] = means[('close', period)]
+
+    # RSI
+    rs = means[('gain', rsi_period)] / means[('loss', rsi_period)].replace(0, np.nan)
+    columns['RSI'] = 100 - (100 / (1 + rs))
+
+    # MACD
+    ema_fast = close.ewm(span=DEFAULT_PERIODS.MACD_FAST, adjust=False).mean()
+    ema_slow = close.ewm(span=DEFAULT_PERIODS.MACD_SLOW, adjust=False).mean()
+    macd_line = ema_fast - ema_slow
+    signal_line = macd_line.ewm(span=DEFAULT_PERIODS.MACD_SIGNAL, adjust=False).mean()
+    columns['MACD'] = macd_line
+    columns['MACD_SIGNAL'] = signal_line
+    columns['MACD_HIST'] = macd_line - signal_line
+
+    # Bollinger Bands with width (middle band is the shared SMA)
+    bb_middle = means[('close', bb_period)]
+    std = _rolling(close, bb_period, 'std')
+    bb_upper = bb_middle + (std * 2.0)
+    bb_lower = bb_middle - (std * 2.0)
+    columns['BB_UPPER'] = bb_upper
+    columns['BB_MIDDLE'] = bb_middle
+    columns['BB_LOWER'] = bb_lower
+    columns['BB_WIDTH'] = ((bb_upper - bb_lower) / bb_middle) * 100
+
+    # ATR
+    columns['ATR'] = means[('tr', atr_period)]
+
+    # OBV
+    if volume is not None:
+        columns['OBV'] = (volume * np.where(delta > 0, 1, -1)).cumsum()
+
+    # Stochastics and Williams %R share the rolling extremes
+    low_min = _rolling(low, stoch_period, 'min')
+    high_max = _rolling(high, stoch_period, 'max')
+    stoch_k = 100 * ((close - low_min) / (high_max - low_min))
+    columns['STOCH_K'] = stoch_k
+    columns['STOCH_D'] = _rolling(stoch_k, DEFAULT_PERIODS.STOCH_D, 'mean')
+
+    # ADX (reuses the true range average)
+    atr = means[('tr', adx_period)]
+    plus_di = 100 * (means[('plus_dm', adx_period)] / atr)
+    minus_di = 100 * (means[('minus_dm', adx_period)] / atr)
+    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+    columns['ADX'] = smooth(dx, adx_period, smoothing)
+
+    # Williams %R
+    columns['WILLIAMS_R'] = -100 * ((high_max - close) / (high_max - low_min))
+
+    # Rate of Change
+    prev = close.shift(roc_period)
+    columns['ROC'] = ((close - prev) / prev) * 100
+
+    return columns
@@ -0,0 +1,165 @@
+"""
+Per-key credit budgeting for concurrent Twelve Data requests.
+
+Twelve Data meters each API key in credits per minute. Rather than sleeping a
+fixed delay between calls, each key gets a token bucket that refills at its
+per-minute rate, and concurrent workers borrow a key only when its bucket has
+a credit to spend. Throughput then tracks the combined credit limit of all
+keys. Buckets bank a single credit, so a key never bursts past its per-minute
+limit, and a key that hits the limit anyway is paused rather than dropped.
+
+Usage:
+    from shared_core.market_data.rate_limiter import KeyScheduler
+
+    scheduler = KeyScheduler(num_keys=2, requests_per_minute=8)
+    index = scheduler.acquire()       # blocks until a key has credit
+    ...                               # call the API with key `index`
+    scheduler.release(index)          # or back_off(index, 60) / mark_exhausted(index)
+"""
+
+import math
+import threading
+import time
+from typing import Callable, List, Optional
+
+
+class TokenBucket:
+    """
+    Token bucket holding up to `capacity` tokens, refilled at `rate` per second.
+
+    Not thread-safe on its own; KeyScheduler guards access with its lock.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        rate: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take `tokens` if available.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds until they will be
+        """
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+
+class KeyScheduler:
+    """
+    Hands out API key indices to concurrent workers within each key's budget.
+
+    A key serves a single request until one succeeds, so a key that is
+    already out of credits costs one failed call rather than a burst of them.
+    Keys backed off are skipped until their pause ends; keys marked exhausted
+    are never handed out again.
+    """
+
+    def __init__(
+        self,
+        num_keys: int,
+        requests_per_minute: Optional[float],
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            num_keys: Number of API keys in the pool
+            requests_per_minute: Credit limit per key (None or <= 0 = unlimited)
+            clock: Monotonic time source (injectable for tests)
+        """
+        # Capacity 1: requests are spaced at the refill rate from the start
+        self._buckets: List[Optional[TokenBucket]] = [
+            TokenBucket(1.0, requests_per_minute / 60.0, clock)
+            if requests_per_minute and requests_per_minute > 0 else None
+            for _ in range(num_keys)
+        ]
+        self._clock = clock
+        self._resume_at = [-math.inf] * num_keys
+        self._in_flight = [0] * num_keys
+        self._verified = [False] * num_keys
+        self._exhausted = [False] * num_keys
+        self._cond = threading.Condition()
+
+    @property
+    def all_exhausted(self) -> bool:
+        with self._cond:
+            return all(self._exhausted)
+
+    def live_keys(self) -> List[int]:
+        """Indices of keys that have not been marked exhausted."""
+        with self._cond:
+            return [i for i, done in enumerate(self._exhausted) if not done]
+
+    def acquire(self) -> Optional[int]:
+        """
+        Block until some key can spend a credit, then reserve it.
+
+        Returns:
+            Key index, or None once every key is exhausted
+        """
+        with self._cond:
+            while True:
+                wait = math.inf
+                live = False
+                now = self._clock()
+                for i, bucket in enumerate(self._buckets):
+                    if self._exhausted[i]:
+                        continue
+                    live = True
+                    if not self._verified[i] and self._in_flight[i] > 0:
+                        continue
+                    if now < self._resume_at[i]:
+                        wait = min(wait, self._resume_at[i] - now)
+                        continue
+                    delay = bucket.try_acquire() if bucket else 0.0
+                    if delay == 0.0:
+                        self._in_flight[i] += 1
+                        return i
+                    wait = min(wait, delay)
+
+                if not live:
+                    return None
+                self._cond.wait(None if wait == math.inf else wait)
+
+    def release(self, index: int) -> None:
+        """Return a key after a request that the API answered normally."""
+        with self._cond:
+            self._in_flight[index] -= 1
+            self._verified[index] = True
+            self._cond.notify_all()
+
+    def back_off(self, index: int, seconds: float) -> None:
+        """Return a key that hit its per-minute limit; it is skipped for `seconds`."""
+        with self._cond:
+            self._in_flight[index] -= 1
+            self._resume_at[index] = self._clock() + seconds
+            self._cond.notify_all()
+
+    def mark_exhausted(self, index: int) -> None:
+        """Return a key whose daily credits ran out; it will not be handed out again."""
+        with self._cond:
+            self._in_flight[index] -= 1
+            self._exhausted[index] = True
+            self._cond.notify_all()
+
+    def abandon(self, index: int) -> None:
+        """Return a key after a request failed before the API answered."""
+        with self._cond:
+            self._in_flight[index] -= 1
+            self._cond.notify_all()
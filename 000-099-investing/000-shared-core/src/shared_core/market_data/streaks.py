@@ -0,0 +1,119 @@
+"""
+Run-length (streak) utilities for boolean conditions.
+
+A streak is a run of consecutive bars where a condition holds: up closes,
+close above SMA200, RSI < 30. streak_lengths computes, in one cumulative
+pass, how long the run ending at every bar is; the current streak, the
+longest streak and the list of past runs all derive from it.
+
+Every function takes a boolean Series (one ticker) or a wide boolean
+DataFrame (dates x tickers, e.g. a panel_indicators column); DataFrames
+are reduced per column in the same NumPy pass. NaN/NA counts as False, so
+``rsi < 30`` on a warm-up bar breaks a streak rather than extending it.
+
+Usage:
+    from shared_core.market_data.streaks import current_streak, streak_lengths
+
+    down_days = current_streak(df['close'].diff() < 0)
+    above = streak_lengths(panel['SMA_200'].lt(closes))   # per ticker, per bar
+"""
+
+from typing import TypeVar, Union
+
+import numpy as np
+import pandas as pd
+
+Frame = TypeVar("Frame", pd.Series, pd.DataFrame)
+
+
+def _as_bool(condition: Union[pd.Series, pd.DataFrame]) -> np.ndarray:
+    """Condition values as a bool array, NaN/NA as False."""
+    return condition.eq(True).to_numpy(dtype=bool, na_value=False)
+
+
+def _run_lengths(held: np.ndarray) -> np.ndarray:
+    """Length of the True run ending at each row, along axis 0."""
+    counts = np.cumsum(held, axis=0)
+    # Cumulative count at the most recent False row; the run since is the difference
+    last_break = np.maximum.accumulate(np.where(held, 0, counts), axis=0)
+    return counts - last_break
+
+
+def streak_lengths(condition: Frame) -> Frame:
+    """
+    Length of the streak ending at each bar.
+
+    Args:
+        condition: Boolean Series or wide DataFrame
+
+    Returns:
+        Integers shaped like condition: 0 where the condition is False,
+        otherwise the number of consecutive True bars up to and including
+        this one
+
+    Example:
+        >>> streak_lengths(pd.Series([True, True, False, True])).tolist()
+        [1, 2, 0, 1]
+    """
+    runs = _run_lengths(_as_bool(condition))
+    if isinstance(condition, pd.DataFrame):
+        return pd.DataFrame(runs, index=condition.index, columns=condition.columns)
+    return pd.Series(runs, index=condition.index, name=condition.name)
+
+
+def current_streak(condition: Union[pd.Series, pd.DataFrame]) -> Union[int, pd.Series]:
+    """
+    Length of the streak ending at the last bar.
+
+    Args:
+        condition: Boolean Series or wide DataFrame
+
+    Returns:
+        int for a Series (0 when empty or the last bar is False); for a
+        DataFrame, a Series of ints per column
+    """
+    if isinstance(condition, pd.DataFrame):
+        if condition.empty:
+            return pd.Series(0, index=condition.columns)
+        return streak_lengths(condition).iloc[-1]
+    if len(condition) == 0:
+        return 0
+    held = _as_bool(condition)
+    # Only the tail matters: count back to the last False
+    breaks = np.flatnonzero(~held)
+    return int(len(held) - 1 - breaks[-1]) if len(breaks) else len(held)
+
+
+def longest_streak(condition: Union[pd.Series, pd.DataFrame]) -> Union[int, pd.Series]:
+    """
+    Length of the longest streak anywhere in the history.
+
+    Returns:
+        int for a Series; for a DataFrame, a Series of ints per column
+    """
+    if len(condition) == 0:
+        return pd.Series(0, index=condition.columns) if isinstance(condition, pd.DataFrame) else 0
+    lengths = streak_lengths(condition)
+    return lengths.max() if isinstance(condition, pd.DataFrame) else int(lengths.max())
+
+
+def streak_runs(condition: pd.Series) -> pd.DataFrame:
+    """
+    Every completed or ongoing streak of a single series.
+
+    Args:
+        condition: Boolean Series
+
+    Returns:
+        DataFrame with one row per run: 'start' and 'end' (index labels of
+        the first and last bar) and 'length', oldest first
+    """
+    held = _as_bool(condition)
+    edges = np.diff(np.concatenate(([False], held, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return pd.DataFrame({
+        'start': condition.index[starts],
+        'end': condition.index[ends],
+        'length': ends - starts + 1,
+    })
@@ -0,0 +1,541 @@
+"""
+Incremental (streaming) standard indicators for one ticker.
+
+compute_standard_indicators recomputes every column from the full history.
+When only one bar has arrived since the last run, IndicatorState updates
+the same indicators from its accumulators instead: EMA and Wilder averages,
+rolling-window sums, rolling extremes, the OBV running total and the most
+recent swing points. Each update costs a fixed amount of work, however long
+the history is.
+
+Values agree with the last row of compute_standard_indicators (same names,
+same smoothing) to floating-point rounding. The state serializes to plain
+JSON via to_dict/from_dict; see cache.indicator_state.IndicatorStateStore
+for persisting it next to the cache.
+
+Usage:
+    from shared_core.market_data.streaming import IndicatorState
+
+    state = IndicatorState.from_frame("AAPL", df)      # warm up once
+    values = state.update(high, low, close, volume, date=ts)
+    if values['RSI'] < 30: ...
+"""
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import pandas as pd
+
+from shared_core.config.constants import DEFAULT_PERIODS
+from shared_core.market_data.fused_indicators import STANDARD_SMA_PERIODS, resolve_smoothing
+
+# Bump when the accumulator layout or formulas change; older saved states
+# are rebuilt from history
+STATE_VERSION = 1
+
+# Window for the volume average and rolling high used by alert flags
+ALERT_WINDOW = DEFAULT_PERIODS.SMA_SHORT
+
+# Swing highs/lows kept per side
+SWING_POINTS_KEPT = 4
+
+NAN = float('nan')
+
+
+def _div(numerator: float, denominator: float) -> float:
+    """Division that yields NaN instead of raising on a zero denominator."""
+    if denominator == 0 or math.isnan(denominator):
+        return NAN
+    return numerator / denominator
+
+
+def _encode(value: float) -> Optional[float]:
+    return None if value is None or math.isnan(value) else value
+
+
+def _decode(value: Optional[float]) -> float:
+    return NAN if value is None else float(value)
+
+
+class _Window:
+    """
+    Trailing window of floats with running sum and sum of squares.
+
+    NaN values are tracked by count: any NaN in the window makes its mean
+    NaN, as with pandas' rolling defaults. Sums are recomputed from the
+    buffer once per window length to keep rounding drift bounded.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: Deque[float] = deque()
+        self.total = 0.0
+        self.squares = 0.0
+        self.nans = 0
+        self.pushes = 0
+
+    def push(self, value: float) -> None:
+        if len(self.values) == self.size:
+            old = self.values.popleft()
+            if math.isnan(old):
+                self.nans -= 1
+            else:
+                self.total -= old
+                self.squares -= old * old
+        self.values.append(value)
+        if math.isnan(value):
+            self.nans += 1
+        else:
+            self.total += value
+            self.squares += value * value
+
+        self.pushes += 1
+        if self.pushes % self.size == 0:
+            finite = [v for v in self.values if not math.isnan(v)]
+            self.total = math.fsum(finite)
+            self.squares = math.fsum(v * v for v in finite)
+
+    @property
+    def ready(self) -> bool:
+        return len(self.values) == self.size and self.nans == 0
+
+    def mean(self) -> float:
+        return self.total / self.size if self.ready else NAN
+
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)."""
+        if not self.ready or self.size < 2:
+            return NAN
+        variance = (self.squares - self.total * self.total / self.size) / (self.size - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'values': [_encode(v) for v in self.values], 'pushes': self.pushes}
+
+    @classmethod
+    def from_dict(cls, size: int, data: Dict[str, Any]) -> "_Window":
+        window = cls(size)
+        for value in data['values']:
+            window.push(_decode(value))
+        window.pushes = data['pushes']
+        return window
+
+
+class _Extreme:
+    """Rolling max (or min) over a trailing window via a monotonic deque."""
+
+    def __init__(self, size: int, largest: bool):
+        self.size = size
+        self.largest = largest
+        self.entries: Deque[List[float]] = deque()  # [bar index, value]
+        self.count = 0
+
+    def push(self, value: float) -> None:
+        index = self.count
+        self.count += 1
+        while self.entries and (
+            self.entries[-1][1] <= value if self.largest else self.entries[-1][1] >= value
+        ):
+            self.entries.pop()
+        self.entries.append([index, value])
+        while self.entries[0][0] <= index - self.size:
+            self.entries.popleft()
+
+    def value(self) -> float:
+        return self.entries[0][1] if self.count >= self.size else NAN
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'entries': list(self.entries), 'count': self.count}
+
+    @classmethod
+    def from_dict(cls, size: int, largest: bool, data: Dict[str, Any]) -> "_Extreme":
+        extreme = cls(size, largest)
+        extreme.entries = deque([int(i), float(v)] for i, v in data['entries'])
+        extreme.count = data['count']
+        return extreme
+
+
+class _Ema:
+    """pandas ewm(adjust=False) mean, started at the first value."""
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.value = NAN
+
+    def push(self, value: float) -> float:
+        if math.isnan(self.value):
+            self.value = value
+        elif not math.isnan(value):
+            self.value = (1 - self.alpha) * self.value + self.alpha * value
+        return self.value
+
+
+class _Average:
+    """
+    Streaming counterpart of fused_indicators.smooth().
+
+    'simple' is the trailing window mean. 'wilder' seeds with the first
+    NaN-free window mean and then recurses with alpha = 1/period, skipping
+    NaN inputs.
+    """
+
+    def __init__(self, period: int, smoothing: str):
+        self.period = period
+        self.smoothing = smoothing
+        self.window = _Window(period)
+        self.value = NAN
+
+    def push(self, value: float) -> float:
+        if self.smoothing == 'simple':
+            self.window.push(value)
+            self.value = self.window.mean()
+        elif math.isnan(self.value):
+            self.window.push(value)
+            self.value = self.window.mean()
+            if not math.isnan(self.value):
+                self.window = _Window(self.period)  # seed done, buffer unused
+        elif not math.isnan(value):
+            self.value += (value - self.value) / self.period
+        return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'value': _encode(self.value), 'window': self.window.to_dict()}
+
+    @classmethod
+    def from_dict(cls, period: int, smoothing: str, data: Dict[str, Any]) -> "_Average":
+        average = cls(period, smoothing)
+        average.value = _decode(data['value'])
+        average.window = _Window.from_dict(period, data['window'])
+        return average
+
+
+class IndicatorState:
+    """
+    Incremental standard indicators for one ticker.
+
+    Feed bars oldest first with update(); ``values`` then holds the
+    compute_standard_indicators columns for the latest bar (plus
+    VOLUME_SMA_20 and HIGH_20), ``previous`` those of the bar before, and
+    ``swing_lows``/``swing_highs`` the most recent confirmed close swings.
+    """
+
+    def __init__(self, ticker: Optional[str] = None, smoothing: Optional[str] = None):
+        """
+        Initialize an empty state.
+
+        Args:
+            ticker: Stock ticker symbol (informational, used by the store)
+            smoothing: RSI/ATR/ADX averaging, 'wilder' or 'simple'
+                (default INDICATOR_CONFIG.SMOOTHING)
+        """
+        p = DEFAULT_PERIODS
+        self.ticker = ticker
+        self.smoothing = resolve_smoothing(smoothing)
+        self.bars = 0
+        self.last_date: Optional[pd.Timestamp] = None
+        self.last_close = NAN
+        self.last_high = NAN
+        self.last_low = NAN
+        self.last_volume = NAN
+        self.obv = 0.0
+
+        self.sma = {period: _Window(period) for period in STANDARD_SMA_PERIODS}
+        self.bollinger = _Window(p.BOLLINGER)
+        self.gain = _Average(p.RSI, self.smoothing)
+        self.loss = _Average(p.RSI, self.smoothing)
+        self.ema_fast = _Ema(2 / (p.MACD_FAST + 1))
+        self.ema_slow = _Ema(2 / (p.MACD_SLOW + 1))
+        self.macd_signal = _Ema(2 / (p.MACD_SIGNAL + 1))
+        self.atr = _Average(p.ATR, self.smoothing)
+        self.adx_tr = _Average(p.ADX, self.smoothing)
+        self.plus_dm = _Average(p.ADX, self.smoothing)
+        self.minus_dm = _Average(p.ADX, self.smoothing)
+        self.adx = _Average(p.ADX, self.smoothing)
+        self.stoch_high = _Extreme(p.STOCH_K, largest=True)
+        self.stoch_low = _Extreme(p.STOCH_K, largest=False)
+        self.stoch_d = _Window(p.STOCH_D)
+        self.volume_avg = _Window(ALERT_WINDOW)
+        self.high_max = _Extreme(ALERT_WINDOW, largest=True)
+        self.closes: Deque[float] = deque(maxlen=p.ROC + 1)
+
+        # (date, close, RSI) of the last three bars, for swing detection
+        self.recent: Deque[List[Any]] = deque(maxlen=3)
+        self.swing_lows: Deque[Dict[str, Any]] = deque(maxlen=SWING_POINTS_KEPT)
+        self.swing_highs: Deque[Dict[str, Any]] = deque(maxlen=SWING_POINTS_KEPT)
+
+        self.values: Dict[str, float] = {}
+        self.previous: Dict[str, float] = {}
+
+    def update(
+        self,
+        high: float,
+        low: float,
+        close: float,
+        volume: float = 0.0,
+        date: Optional[Any] = None,
+    ) -> Dict[str, float]:
+        """
+        Advance the state by one bar.
+
+        Args:
+            high: Bar high
+            low: Bar low
+            close: Bar close
+            volume: Bar volume
+            date: Bar timestamp; must be later than the previous bar's
+
+        Returns:
+            Indicator values for this bar (also stored in ``values``)
+
+        Raises:
+            ValueError: If date is not after the last bar's date
+        """
+        if date is not None:
+            date = pd.Timestamp(date)
+            if self.last_date is not None and date <= self.last_date:
+                raise ValueError(
+                    f"Bar {date} for {self.ticker} is not after {self.last_date}"
+                )
+        high, low, close, volume = float(high), float(low), float(close), float(volume)
+        p = DEFAULT_PERIODS
+        first = self.bars == 0
+        prev_close = self.last_close
+
+        # Close diffs: the first bar has no change (gain = loss = 0, OBV -1)
+        delta = NAN if first else close - prev_close
+        self.gain.push(delta if delta > 0 else 0.0)
+        self.loss.push(-delta if delta < 0 else 0.0)
+        self.obv += volume if delta > 0 else -volume
+
+        for window in self.sma.values():
+            window.push(close)
+        self.bollinger.push(close)
+        self.closes.append(close)
+
+        fast = self.ema_fast.push(close)
+        slow = self.ema_slow.push(close)
+        macd = fast - slow
+        signal = self.macd_signal.push(macd)
+
+        if first:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        atr = self.atr.push(tr)
+        adx_atr = self.adx_tr.push(tr)
+
+        if not first:
+            up = high - self.last_high
+            down = self.last_low - low
+            self.plus_dm.push(max(up, 0.0))
+            self.minus_dm.push(max(down, 0.0))
+        plus_di = 100 * _div(self.plus_dm.value, adx_atr)
+        minus_di = 100 * _div(self.minus_dm.value, adx_atr)
+        dx = 100 * _div(abs(plus_di - minus_di), plus_di + minus_di)
+        # Leading NaN DX bars (before the DI averages exist) are not averaged
+        if not math.isnan(dx) or self.adx.window.values or not math.isnan(self.adx.value):
+            self.adx.push(dx)
+
+        self.stoch_high.push(high)
+        self.stoch_low.push(low)
+        high_max, low_min = self.stoch_high.value(), self.stoch_low.value()
+        stoch_k = 100 * _div(close - low_min, high_max - low_min)
+        if not math.isnan(stoch_k) or self.stoch_d.values:
+            self.stoch_d.push(stoch_k)
+
+        self.volume_avg.push(volume)
+        self.high_max.push(high)
+
+        rsi = 100 - 100 / (1 + _div(self.gain.value, self.loss.value))
+        bb_middle = self.bollinger.mean()
+        bb_std = self.bollinger.std()
+        bb_upper = bb_middle + bb_std * 2.0
+        bb_lower = bb_middle - bb_std * 2.0
+        roc_base = self.closes[0] if len(self.closes) > p.ROC else NAN
+
+        values: Dict[str, float] = {
+            f'SMA_{period}': window.mean() for period, window in self.sma.items()
+        }
+        values.update({
+            'RSI': rsi,
+            'MACD': macd,
+            'MACD_SIGNAL': signal,
+            'MACD_HIST': macd - signal,
+            'BB_UPPER': bb_upper,
+            'BB_MIDDLE': bb_middle,
+            'BB_LOWER': bb_lower,
+            'BB_WIDTH': _div(bb_upper - bb_lower, bb_middle) * 100,
+            'ATR': atr,
+            'OBV': self.obv,
+            'STOCH_K': stoch_k,
+            'STOCH_D': self.stoch_d.mean(),
+            'ADX': self.adx.value,
+            'WILLIAMS_R': -100 * _div(high_max - close, high_max - low_min),
+            'ROC': _div(close - roc_base, roc_base) * 100,
+            f'VOLUME_SMA_{ALERT_WINDOW}': self.volume_avg.mean(),
+            f'HIGH_{ALERT_WINDOW}': self.high_max.value(),
+        })
+
+        self._track_swings(date, close, rsi)
+        self.previous = self.values
+        self.values = values
+        self.bars += 1
+        self.last_date = date if date is not None else self.last_date
+        self.last_close, self.last_high, self.last_low = close, high, low
+        self.last_volume = volume
+        return values
+
+    def _track_swings(self, date: Optional[pd.Timestamp], close: float, rsi: float) -> None:
+        """Record the middle of the last three bars if it is a close swing point."""
+        self.recent.append([date, close, rsi])
+        if len(self.recent) < 3:
+            return
+        (_, before, _), (middle_date, middle, middle_rsi), (_, after, _) = self.recent
+        point = {
+            'date': middle_date.isoformat() if middle_date is not None else None,
+            'bar': self.bars - 1,
+            'close': middle,
+            'rsi': _encode(middle_rsi),
+        }
+        if before > middle < after:
+            self.swing_lows.append(point)
+        elif before < middle > after:
+            self.swing_highs.append(point)
+
+    def update_frame(self, df: pd.DataFrame) -> int:
+        """
+        Feed the rows of an OHLCV frame that are newer than the last bar.
+
+        Args:
+            df: DataFrame with a sorted DatetimeIndex and 'high', 'low',
+                'close' (and optionally 'volume') columns
+
+        Returns:
+            Number of bars applied
+        """
+        if self.last_date is not None:
+            df = df.iloc[df.index.searchsorted(self.last_date, side='right'):]
+        volume = df['volume'] if 'volume' in df.columns else pd.Series(0.0, index=df.index)
+        rows = zip(df.index, df['high'], df['low'], df['close'], volume)
+        for date, high, low, close, vol in rows:
+            self.update(high, low, close, vol, date=date)
+        return len(df)
+
+    @classmethod
+    def from_frame(
+        cls,
+        ticker: Optional[str],
+        df: pd.DataFrame,
+        smoothing: Optional[str] = None,
+    ) -> "IndicatorState":
+        """Build a state by replaying an OHLCV history (see update_frame)."""
+        state = cls(ticker, smoothing)
+        state.update_frame(df)
+        return state
+
+    def continues(self, df: pd.DataFrame) -> bool:
+        """
+        Whether df extends the history this state was built from.
+
+        False when the last bar is missing from df or its close differs
+        (e.g. history re-adjusted for a split), so the state needs a rebuild.
+        """
+        if self.last_date is None or self.last_date not in df.index:
+            return self.bars == 0
+        close = float(df.at[self.last_date, 'close'])
+        return math.isclose(close, self.last_close, rel_tol=1e-9)
+
+    def close_ago(self, bars: int) -> float:
+        """Close ``bars`` bars before the latest (up to the ROC period), else NaN."""
+        if bars >= len(self.closes):
+            return NAN
+        return self.closes[-1 - bars]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to JSON-compatible types (NaN becomes None)."""
+        def encode_values(values: Dict[str, float]) -> Dict[str, Optional[float]]:
+            return {name: _encode(value) for name, value in values.items()}
+
+        return {
+            'version': STATE_VERSION,
+            'ticker': self.ticker,
+            'smoothing': self.smoothing,
+            'bars': self.bars,
+            'last_date': self.last_date.isoformat() if self.last_date is not None else None,
+            'last': [
+                _encode(v) for v in
+                (self.last_close, self.last_high, self.last_low, self.last_volume)
+            ],
+            'obv': self.obv,
+            'sma': {str(period): window.to_dict() for period, window in self.sma.items()},
+            'bollinger': self.bollinger.to_dict(),
+            'averages': {
+                name: getattr(self, name).to_dict()
+                for name in ('gain', 'loss', 'atr', 'adx_tr', 'plus_dm', 'minus_dm', 'adx')
+            },
+            'ema': {
+                name: _encode(getattr(self, name).value)
+                for name in ('ema_fast', 'ema_slow', 'macd_signal')
+            },
+            'extremes': {
+                name: getattr(self, name).to_dict()
+                for name in ('stoch_high', 'stoch_low', 'high_max')
+            },
+            'stoch_d': self.stoch_d.to_dict(),
+            'volume_avg': self.volume_avg.to_dict(),
+            'closes': list(self.closes),
+            'recent': [
+                [d.isoformat() if d is not None else None, c, _encode(r)]
+                for d, c, r in self.recent
+            ],
+            'swing_lows': list(self.swing_lows),
+            'swing_highs': list(self.swing_highs),
+            'values': encode_values(self.values),
+            'previous': encode_values(self.previous),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndicatorState":
+        """
+        Restore a state saved with to_dict.
+
+        Raises:
+            ValueError: If the data was written by another STATE_VERSION
+        """
+        if data.get('version') != STATE_VERSION:
+            raise ValueError(
+                f"Indicator state version {data.get('version')} != {STATE_VERSION}"
+            )
+        p = DEFAULT_PERIODS
+        state = cls(data['ticker'], data['smoothing'])
+        state.bars = data['bars']
+        state.last_date = pd.Timestamp(data['last_date']) if data['last_date'] else None
+        (state.last_close, state.last_high, state.last_low,
+         state.last_volume) = (_decode(v) for v in data['last'])
+        state.obv = data['obv']
+        state.sma = {
+            period: _Window.from_dict(period, data['sma'][str(period)])
+            for period in STANDARD_SMA_PERIODS
+        }
+        state.bollinger = _Window.from_dict(p.BOLLINGER, data['bollinger'])
+        for name, saved in data['averages'].items():
+            setattr(state, name, _Average.from_dict(
+                getattr(state, name).period, state.smoothing, saved,
+            ))
+        for name, value in data['ema'].items():
+            getattr(state, name).value = _decode(value)
+        for name, saved in data['extremes'].items():
+            extreme = getattr(state, name)
+            setattr(state, name, _Extreme.from_dict(extreme.size, extreme.largest, saved))
+        state.stoch_d = _Window.from_dict(p.STOCH_D, data['stoch_d'])
+        state.volume_avg = _Window.from_dict(ALERT_WINDOW, data['volume_avg'])
+        state.closes.extend(data['closes'])
+        state.recent.extend(
+            [pd.Timestamp(d) if d else None, c, _decode(r)] for d, c, r in data['recent']
+        )
+        state.swing_lows.extend(data['swing_lows'])
+        state.swing_highs.extend(data['swing_highs'])
+        state.values = {name: _decode(v) for name, v in data['values'].items()}
+        state.previous = {name: _decode(v) for name, v in data['previous'].items()}
+        return state
@@ -5,7 +5,7 @@ Pure math functions operating on pandas DataFrames/Series.
 Unified calculator for all investing projects in 000-099-investing.
 """
 
-from typing import Tuple
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -16,6 +16,15 @@ from shared_core.config.constants import (
     TREND_THRESHOLDS,
     VOLATILITY_THRESHOLDS,
 )
+from shared_core.market_data.fused_indicators import (
+    compute_standard_indicators,
+    resolve_smoothing,
+    smooth,
+    true_range,
+)
+from shared_core.market_data.streaks import current_streak
+
+PANEL_FIELDS = ('open', 'high', 'low', 'close', 'volume')
 
 
 class TechnicalCalculator:
@@ -35,20 +44,22 @@ class TechnicalCalculator:
         return data.ewm(span=period, adjust=False).mean()
 
     @staticmethod
-    def rsi(close_prices: pd.Series, period: int = 14) -> pd.Series:
+    def rsi(close_prices: pd.Series, period: int = 14,
+            smoothing: Optional[str] = None) -> pd.Series:
         """
         Relative Strength Index.
 
         Args:
             close_prices: Series of closing prices
             period: RSI period (default 14)
+            smoothing: 'wilder' or 'simple' (default INDICATOR_CONFIG.SMOOTHING)
 
         Returns:
             Series of RSI values (0-100)
         """
         delta = close_prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        gain = smooth(delta.where(delta > 0, 0), period, smoothing)
+        loss = smooth(-delta.where(delta < 0, 0), period, smoothing)
         rs = gain / loss.replace(0, np.nan)
         rsi = 100 - (100 / (1 + rs))
         return rsi
@@ -85,20 +96,18 @@ class TechnicalCalculator:
         return upper, sma, lower
 
     @staticmethod
-    def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
+    def atr(df: pd.DataFrame, period: int = 14,
+            smoothing: Optional[str] = None) -> pd.Series:
         """
         Average True Range.
 
         Args:
             df: DataFrame with 'high', 'low', 'close' columns
             period: ATR period (default 14)
+            smoothing: 'wilder' or 'simple' (default INDICATOR_CONFIG.SMOOTHING)
         """
-        high, low, close = df['high'], df['low'], df['close']
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        return tr.rolling(window=period).mean()
+        tr = true_range(df['high'], df['low'], df['close'])
+        return smooth(tr, period, smoothing)
 
     @staticmethod
     def stochastic(df: pd.DataFrame, k_period: int = 14,
@@ -116,65 +125,49 @@ class TechnicalCalculator:
         return k, d
 
     @staticmethod
-    def adx(df: pd.DataFrame, period: int = 14) -> float:
+    def adx(df: pd.DataFrame, period: int = 14,
+            smoothing: Optional[str] = None) -> float:
         """
         Average Directional Index.
 
         Args:
             df: DataFrame with 'high', 'low', 'close' columns
             period: ADX period (default 14)
+            smoothing: 'wilder' or 'simple' (default INDICATOR_CONFIG.SMOOTHING)
 
         Returns:
-            Current ADX value (float)
+            Current ADX value (float), 20.0 when there is too little history
         """
-        high, low, close = df['high'], df['low'], df['close']
-        plus_dm = high.diff()
-        minus_dm = -low.diff()
-        plus_dm[plus_dm < 0] = 0
-        minus_dm[minus_dm < 0] = 0
-
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        atr = tr.rolling(window=period).mean()
-        plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
-        minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
-
-        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(window=period).mean()
-        return float(adx.iloc[-1]) if not pd.isna(adx.iloc[-1]) else 20.0
+        adx = TechnicalCalculator.adx_series(df, period, smoothing)
+        return float(adx.iloc[-1]) if len(adx) and not pd.isna(adx.iloc[-1]) else 20.0
 
     @staticmethod
-    def adx_series(df: pd.DataFrame, period: int = 14) -> pd.Series:
+    def adx_series(df: pd.DataFrame, period: int = 14,
+                   smoothing: Optional[str] = None) -> pd.Series:
         """
         Average Directional Index as a full Series.
 
         Args:
             df: DataFrame with 'high', 'low', 'close' columns
             period: ADX period (default 14)
+            smoothing: 'wilder' or 'simple' (default INDICATOR_CONFIG.SMOOTHING)
 
         Returns:
             Series of ADX values
         """
-        high, low, close = df['high'], df['low'], df['close']
+        smoothing = resolve_smoothing(smoothing)
+        high, low = df['high'], df['low']
         plus_dm = high.diff()
         minus_dm = -low.diff()
-        plus_dm[plus_dm < 0] = 0
-        minus_dm[minus_dm < 0] = 0
+        plus_dm = plus_dm.mask(plus_dm < 0, 0)
+        minus_dm = minus_dm.mask(minus_dm < 0, 0)
 
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        atr = tr.rolling(window=period).mean()
-        plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
-        minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
+        atr = smooth(true_range(high, low, df['close']), period, smoothing)
+        plus_di = 100 * (smooth(plus_dm, period, smoothing) / atr)
+        minus_di = 100 * (smooth(minus_dm, period, smoothing) / atr)
 
         dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-        return dx.rolling(window=period).mean()
+        return smooth(dx, period, smoothing)
 
     @staticmethod
     def obv(df: pd.DataFrame) -> pd.Series:
@@ -330,33 +323,18 @@ class TechnicalCalculator:
         """
         Counts consecutive up/down days.
 
+        A flat close ends both streaks; at most lookback - 1 changes count.
+
         Returns: {'consecutive_down': int, 'consecutive_up': int}
         """
         if len(df) < 2:
             return {'consecutive_down': 0, 'consecutive_up': 0}
 
-        recent = df.iloc[-lookback:]
-        changes = recent['close'].diff().dropna()
-
-        # Count consecutive from end
-        consecutive_down = 0
-        consecutive_up = 0
-
-        for change in reversed(changes.values):
-            if change < 0:
-                if consecutive_up == 0:
-                    consecutive_down += 1
-                else:
-                    break
-            elif change > 0:
-                if consecutive_down == 0:
-                    consecutive_up += 1
-                else:
-                    break
-            else:
-                break
-
-        return {'consecutive_down': consecutive_down, 'consecutive_up': consecutive_up}
+        changes = df['close'].iloc[-lookback:].diff()
+        return {
+            'consecutive_down': current_streak(changes < 0),
+            'consecutive_up': current_streak(changes > 0),
+        }
 
     @staticmethod
     def classify_volatility(atr_series: pd.Series, lookback: int = 90) -> str:
@@ -419,3 +397,123 @@ class TechnicalCalculator:
             'strongest_resistance': float(strong_resistance)
         }
 
+    # =========================================================================
+    # Panel (multi-ticker) indicators
+    # =========================================================================
+
+    @staticmethod
+    def panel_fields(
+        ohlcv: Union[pd.DataFrame, Mapping[str, pd.DataFrame]],
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Split multi-ticker OHLCV into one wide date x ticker frame per field.
+
+        Accepted layouts:
+            - Mapping of ticker -> per-ticker OHLCV DataFrame, each with a
+              DatetimeIndex or a 'datetime' column (as cached frames have)
+            - Wide frame with (field, ticker) or (ticker, field) MultiIndex columns
+            - Long frame with a (date, ticker) MultiIndex and OHLCV columns
+
+        Tickers are aligned on the union of their dates.
+
+        Returns:
+            Dict of field name -> DataFrame (index dates, columns tickers)
+
+        Raises:
+            ValueError: If the layout is not recognised, 'close' is missing,
+                or a mapped frame has no dates
+        """
+        if isinstance(ohlcv, Mapping):
+            # Align by date, not row position: histories differ in length
+            ohlcv = pd.concat(
+                {ticker: TechnicalCalculator._date_indexed(ticker, df) for ticker, df in ohlcv.items()},
+                axis=1,
+            )
+
+        if isinstance(ohlcv.index, pd.MultiIndex):
+            names = list(ohlcv.index.names)
+            ticker_level = next(
+                (n for n in ('ticker', 'symbol') if n in names),
+                ohlcv.index.nlevels - 1,
+            )
+            ohlcv = ohlcv.unstack(ticker_level)
+
+        if not isinstance(ohlcv.columns, pd.MultiIndex) or ohlcv.columns.nlevels != 2:
+            raise ValueError(
+                "Panel OHLCV needs (field, ticker) columns, a (date, ticker) index, "
+                "or a mapping of ticker -> DataFrame"
+            )
+
+        field_level = 0 if 'close' in ohlcv.columns.get_level_values(0) else 1
+        if 'close' not in ohlcv.columns.get_level_values(field_level):
+            raise ValueError("Panel OHLCV has no 'close' field")
+
+        ohlcv = ohlcv.sort_index()
+        return {
+            field: ohlcv.xs(field, axis=1, level=field_level).astype(float)
+            for field in PANEL_FIELDS
+            if field in ohlcv.columns.get_level_values(field_level)
+        }
+
+    @staticmethod
+    def _date_indexed(ticker: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Per-ticker frame indexed by its dates."""
+        if isinstance(df.index, pd.DatetimeIndex):
+            return df
+        if 'datetime' in df.columns:
+            return df.set_index(pd.DatetimeIndex(pd.to_datetime(df['datetime']), name=None)).drop(columns='datetime')
+        raise ValueError(
+            f"Panel OHLCV for {ticker} needs a DatetimeIndex or a 'datetime' column"
+        )
+
+    @staticmethod
+    def panel_indicators(
+        ohlcv: Union[pd.DataFrame, Mapping[str, pd.DataFrame]],
+        ema_periods: Sequence[int] = (DEFAULT_PERIODS.SMA_SHORT, DEFAULT_PERIODS.SMA_MEDIUM),
+    ) -> pd.DataFrame:
+        """
+        Standard indicators for a whole watchlist in one vectorized pass.
+
+        Each rolling/ewm kernel runs once over the date x ticker matrix
+        instead of once per ticker, so the cost is a handful of 2-D array
+        operations regardless of how many tickers there are. Per ticker,
+        values match the single-ticker methods (and add_standard_indicators)
+        for that ticker's own history; a ticker missing a date inside its
+        history gets NaN for rolling windows spanning the gap, RSI counts
+        the gap as no change (as rsi does for a NaN close), and the Wilder
+        averages behind ATR/ADX step over it.
+
+        Args:
+            ohlcv: Multi-ticker OHLCV in any layout accepted by panel_fields
+            ema_periods: EMA spans to add as EMA_<period> columns
+
+        Returns:
+            DataFrame indexed by date with (indicator, ticker) MultiIndex
+            columns: SMA_5..SMA_200, EMA_*, RSI, MACD, MACD_SIGNAL, MACD_HIST,
+            BB_*, ATR, OBV (when volume is present), STOCH_K, STOCH_D, ADX,
+            WILLIAMS_R, ROC. Use ``.iloc[-1].unstack(0)`` for a ticker x
+            indicator snapshot of the latest bar.
+
+        Example:
+            >>> frames = {t: cache.get_twelve_data(t) for t in watchlist}
+            >>> panel = TechnicalCalculator.panel_indicators(frames)
+            >>> oversold = panel['RSI'].iloc[-1] < 30
+        """
+        fields = TechnicalCalculator.panel_fields(ohlcv)
+        close = fields['close']
+        if 'high' not in fields or 'low' not in fields:
+            raise ValueError("Panel OHLCV needs 'high' and 'low' fields")
+
+        columns = compute_standard_indicators(
+            fields['high'], fields['low'], close, fields.get('volume'),
+        )
+        for period in ema_periods:
+            columns[f'EMA_{period}'] = close.ewm(span=period, adjust=False).mean()
+
+        # Bars where a ticker has no close are not reported
+        has_close = close.notna()
+        return pd.concat(
+            {name: values.where(has_close) for name, values in columns.items()},
+            axis=1,
+            names=['indicator', 'ticker'],
+        )
@@ -222,8 +222,7 @@ class TranscriptClient:
         needs_refresh = []
 
         for ticker in tickers:
-            cached = self.cache.get_transcript(ticker)
-            if cached is None:
+            if not self.cache.has_transcript(ticker):
                 needs_refresh.append(ticker)
 
         if self.verbose and needs_refresh:
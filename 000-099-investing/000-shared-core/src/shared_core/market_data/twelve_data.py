@@ -12,6 +12,7 @@ import pandas as pd
 import requests
 
 from ..cache.data_cache import DataCache
+from .delta import delta_start_date, merge_delta
 from .technical import TechnicalCalculator
 
 
@@ -23,6 +24,14 @@ class ApiCreditExhausted(Exception):
         self.key_index = key_index
 
 
+class ApiRateLimited(Exception):
+    """Raised when a Twelve Data API key has spent its credits for the current minute."""
+
+    def __init__(self, key_index: int = 0):
+        super().__init__(f"Twelve Data per-minute credit limit reached (key {key_index + 1})")
+        self.key_index = key_index
+
+
 def _build_key_pool(api_key: str, api_keys: Optional[List[str]]) -> List[str]:
     """Build a deduplicated, non-empty list of API keys."""
     if api_keys:
@@ -36,10 +45,28 @@ def _build_key_pool(api_key: str, api_keys: Optional[List[str]]) -> List[str]:
     return [api_key]
 
 
+def parse_time_series(values: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Convert Twelve Data time_series 'values' into a typed DataFrame.
+
+    Returns:
+        DataFrame with datetime, open, high, low, close, volume columns,
+        oldest bar first, rows without a close dropped
+    """
+    df = pd.DataFrame(values)
+    df['datetime'] = pd.to_datetime(df['datetime'])
+    for col in ['open', 'high', 'low', 'close']:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df['volume'] = pd.to_numeric(df['volume'], errors='coerce').fillna(0).astype(int)
+    df = df.sort_values('datetime').reset_index(drop=True)
+    return df.dropna(subset=['close'])
+
+
 class TwelveDataClient:
     """
     Twelve Data API client with:
     - Daily caching: if data exists for today, use it; otherwise fetch fresh
+    - Delta refresh: with an earlier cache file, fetch only the new bars
     - Full technical indicator calculation
     """
 
@@ -83,6 +110,7 @@ class TwelveDataClient:
         Determine which tickers need fresh API data.
 
         Simple logic: if no cache exists for today, ticker needs refresh.
+        Answered from the cache index, so no cached file is opened.
 
         Args:
             tickers: List of all tickers to evaluate
@@ -97,8 +125,7 @@ class TwelveDataClient:
         cached_count = 0
 
         for ticker in tickers:
-            cached = self.cache.get_twelve_data(ticker)
-            if cached is None:
+            if not self.cache.has_twelve_data(ticker):
                 needs_refresh.append(ticker)
             else:
                 cached_count += 1
@@ -115,16 +142,22 @@ class TwelveDataClient:
     # RAW DATA FETCH
     # =========================================================================
 
-    def fetch_raw(self, ticker: str) -> Optional[pd.DataFrame]:
+    def fetch_raw(self, ticker: str, start_date: Optional[str] = None) -> Optional[pd.DataFrame]:
         """
         Fetch raw OHLCV data from Twelve Data API.
 
+        Args:
+            ticker: Stock ticker symbol
+            start_date: Only fetch bars from this date on (YYYY-MM-DD); the
+                minimum history length check is skipped for such deltas
+
         Returns:
             DataFrame with datetime, open, high, low, close, volume columns
             or None on error
         """
         if self.verbose:
-            print(f"    📊 Fetching {ticker} from Twelve Data API...")
+            since = f" since {start_date}" if start_date else ""
+            print(f"    📊 Fetching {ticker}{since} from Twelve Data API...")
 
         try:
             url = f"{self.base_url}/time_series"
@@ -134,6 +167,8 @@ class TwelveDataClient:
                 'outputsize': self.output_size,
                 'apikey': self.api_key
             }
+            if start_date:
+                params['start_date'] = start_date
 
             response = requests.get(url, params=params, timeout=30)
             data = response.json()
@@ -156,16 +191,9 @@ class TwelveDataClient:
                     print("    ❌ No data returned")
                 return None
 
-            # Convert to DataFrame
-            df = pd.DataFrame(data['values'])
-            df['datetime'] = pd.to_datetime(df['datetime'])
-            for col in ['open', 'high', 'low', 'close']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-            df['volume'] = pd.to_numeric(df['volume'], errors='coerce').fillna(0).astype(int)
-            df = df.sort_values('datetime').reset_index(drop=True)
-            df = df.dropna(subset=['close'])
+            df = parse_time_series(data['values'])
 
-            if len(df) < 50:
+            if start_date is None and len(df) < 50:
                 if self.verbose:
                     print(f"    ❌ Insufficient data: {len(df)} bars")
                 return None
@@ -286,22 +314,11 @@ class TwelveDataClient:
                     print(f"    ✅ Using cached data for {ticker}")
                 return self._calculate_indicators(ticker, cached_df)
 
-        # Fetch from API, rotating keys on credit exhaustion
-        while True:
-            try:
-                df = self.fetch_raw(ticker)
-                break
-            except ApiCreditExhausted:
-                if not self._rotate_key():
-                    raise  # all keys exhausted, let caller decide
+        df = self._fetch_fresh(ticker, use_delta=not force_refresh)
 
         if df is None:
             return {'Ticker': ticker, 'Status': 'ERROR: Failed to fetch data'}
 
-        # Save to cache
-        if self.cache is not None:
-            self.cache.save_twelve_data(ticker, df)
-
         # Calculate and return indicators
         result = self._calculate_indicators(ticker, df)
 
@@ -331,14 +348,46 @@ class TwelveDataClient:
                     print(f"    ✅ Using cached data for {ticker}")
                 return cached_df
 
-        # Fetch from API, rotating keys on credit exhaustion
+        return self._fetch_fresh(ticker, use_delta=not force_refresh)
+
+    def _fetch_with_rotation(self, ticker: str,
+                             start_date: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """fetch_raw, rotating keys on credit exhaustion (raises once all are spent)."""
         while True:
             try:
-                df = self.fetch_raw(ticker)
-                break
+                return self.fetch_raw(ticker, start_date=start_date)
             except ApiCreditExhausted:
                 if not self._rotate_key():
-                    raise
+                    raise  # all keys exhausted, let caller decide
+
+    def fetch_delta(self, ticker: str) -> Optional[pd.DataFrame]:
+        """
+        Extend the most recent earlier cache file with the bars since.
+
+        Returns:
+            Merged history (at most output_size bars), or None when there is
+            no usable earlier file or the anchor bar shows a split or gap
+        """
+        if self.cache is None:
+            return None
+
+        previous = self.cache.get_previous_twelve_data(ticker)
+        start_date = delta_start_date(previous, self.cache.today)
+        if start_date is None:
+            return None
+
+        merged = merge_delta(
+            previous, self._fetch_with_rotation(ticker, start_date), max_bars=self.output_size
+        )
+        if merged is None and self.verbose:
+            print(f"    ⚠️  {ticker}: cached history no longer matches, refetching in full")
+        return merged
+
+    def _fetch_fresh(self, ticker: str, use_delta: bool = True) -> Optional[pd.DataFrame]:
+        """Fetch from the API (delta first if allowed) and save to the cache."""
+        df = self.fetch_delta(ticker) if use_delta else None
+        if df is None:
+            df = self._fetch_with_rotation(ticker)
 
         if df is not None and self.cache is not None:
             self.cache.save_twelve_data(ticker, df)
@@ -9,6 +9,7 @@ from typing import Optional
 
 import pandas as pd
 
+from ..market_data.streaks import current_streak
 from .models import DivergenceResult, DivergenceType
 
 # =============================================================================
@@ -460,24 +461,9 @@ def score_consecutive_days(df: pd.DataFrame, direction: str = "red") -> float:
     if df is None or len(df) < 5:
         return 2.0
 
-    count = 0
-    closes = df['close'].values
-
-    for i in range(-1, -min(10, len(df)), -1):
-        prev_close = closes[i - 1] if abs(i - 1) <= len(df) else None
-        if prev_close is None:
-            break
-
-        if direction == "red":
-            if closes[i] < prev_close:
-                count += 1
-            else:
-                break
-        else:
-            if closes[i] > prev_close:
-                count += 1
-            else:
-                break
+    # Up to the last 9 day-over-day changes
+    changes = df['close'].iloc[-10:].diff()
+    count = current_streak(changes < 0 if direction == "red" else changes > 0)
 
     if count >= 5:
         return 10.0
@@ -502,14 +488,7 @@ def score_consecutive_red(df: pd.DataFrame) -> float:
     if df is None or len(df) < 2:
         return 0.0
 
-    count = 0
-    closes = df["close"].values
-
-    for i in range(len(closes) - 1, 0, -1):
-        if closes[i] < closes[i - 1]:
-            count += 1
-        else:
-            break
+    count = current_streak(df["close"].diff() < 0)
 
     # Tightened thresholds - 3 days is noise, need 5+ for signal
     thresholds = [
@@ -7,14 +7,24 @@ Calculates technical indicators across three time horizons:
 - Long-term (3-12 months): 60-250 trading days
 
 Each horizon uses appropriate indicator periods for meaningful signals.
+
+Results are numeric (MultiHorizonResult); display strings such as "+3.21%"
+or "1.4x" are produced only by format_multi_horizon / calculate_all. With an
+IndicatorStore, each ticker's record is stored under MULTI_HORIZON_CONFIG and
+read back by later runs on the same data.
 """
 
-from dataclasses import dataclass
+import dataclasses
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from ..cache.indicator_store import IndicatorStore
+from ..market_data.fused_indicators import smooth
+from ..market_data.streaks import current_streak
 from ..market_data.technical import TechnicalCalculator
 
 
@@ -89,6 +99,235 @@ HORIZON_CONFIGS = {
 }
 
 
+# Bump when the multi-horizon formulas change so stored records are ignored
+MULTI_HORIZON_VERSION = 1
+
+MULTI_HORIZON_CONFIG: Dict[str, Any] = {
+    'indicators': 'multi_horizon',
+    'version': MULTI_HORIZON_VERSION,
+    'horizons': {h.value: dataclasses.asdict(cfg) for h, cfg in HORIZON_CONFIGS.items()},
+}
+
+
+def format_trend_duration(months: float) -> str:
+    """Bucket a trend duration in months into a display label."""
+    if months < 1:
+        return "< 1 month"
+    elif months < 3:
+        return f"~{int(months)} months"
+    elif months < 6:
+        return "3-6 months"
+    elif months < 12:
+        return "6-12 months"
+    else:
+        return "> 12 months"
+
+
+def _format_signed_pct(value: float) -> str:
+    return f"{value:+.2f}%"
+
+
+# Display formatters for numeric multi-horizon columns
+MULTI_HORIZON_FORMATS: Dict[str, Callable[[float], str]] = {
+    'Change%': _format_signed_pct,
+    'ST_Price_vs_EMA10': _format_signed_pct,
+    'ST_Vol_Ratio_5d': lambda v: f"{v:.1f}x",
+    'MT_Price_vs_SMA50': _format_signed_pct,
+    'LT_Price_vs_SMA200': _format_signed_pct,
+    'LT_52W_Position': lambda v: f"{v:.0f}%",
+    'LT_Months_in_Trend': format_trend_duration,
+}
+
+
+def format_multi_horizon(record: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Apply display formatting to a numeric multi-horizon record.
+
+    Values that are already strings are left alone, so formatted and
+    numeric records can both be passed through.
+
+    Args:
+        record: Column name -> value (e.g. MultiHorizonResult.to_record())
+
+    Returns:
+        New dict with percentage/ratio/duration columns as display strings
+    """
+    formatted = dict(record)
+    for column, fmt in MULTI_HORIZON_FORMATS.items():
+        value = formatted.get(column)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            formatted[column] = fmt(value)
+    return formatted
+
+
+@dataclass
+class MultiHorizonResult:
+    """
+    Numeric multi-horizon indicators for one ticker.
+
+    Percentages are plain floats (3.21 for +3.21%), ratios are floats
+    (1.4 for 1.4x) and the trend duration is in months. Defaults are the
+    neutral values reported when there is not enough data.
+    """
+    price: float = 0.0
+    change_pct: float = 0.0
+    # Short-term
+    st_rsi: float = 50.0
+    st_stoch_k: float = 50.0
+    st_macd_hist: float = 0.0
+    st_price_vs_ema: float = 0.0
+    st_vol_ratio: float = 1.0
+    # Mid-term
+    mt_rsi: float = 50.0
+    mt_stoch_k: float = 50.0
+    mt_macd_hist: float = 0.0
+    mt_price_vs_sma50: float = 0.0
+    mt_adx: float = 20.0
+    mt_divergence: str = 'NONE'
+    mt_vol_trend: str = 'NEUTRAL'
+    mt_reversal_score: float = 5.0
+    mt_entry_score: float = 5.0
+    mt_conviction: str = 'NONE'
+    # Long-term
+    lt_rsi: float = 50.0
+    lt_macd_hist: float = 0.0
+    lt_price_vs_sma200: float = 0.0
+    lt_ma_cross: str = 'NEUTRAL'
+    lt_adx: float = 20.0
+    lt_obv_trend: str = 'NEUTRAL'
+    lt_52w_position: float = 50.0
+    lt_trend: str = 'UNDEFINED'
+    lt_months_in_trend: float = 0.0
+    lt_score: float = 5.0
+
+    def to_record(self) -> Dict[str, Any]:
+        """Numeric values keyed by sheet column name (see RESULT_COLUMNS)."""
+        return {RESULT_COLUMNS[f.name]: getattr(self, f.name) for f in fields(self)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Display values keyed by sheet column name (percent/ratio strings)."""
+        return format_multi_horizon(self.to_record())
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> 'MultiHorizonResult':
+        """Inverse of to_record (values coerced to the field types)."""
+        return cls(**{
+            f.name: type(f.default)(record[RESULT_COLUMNS[f.name]]) for f in fields(cls)
+        })
+
+
+# MultiHorizonResult attribute -> sheet column name
+RESULT_COLUMNS: Dict[str, str] = {
+    'price': 'Price',
+    'change_pct': 'Change%',
+    'st_rsi': 'ST_RSI_7',
+    'st_stoch_k': 'ST_Stoch_K',
+    'st_macd_hist': 'ST_MACD_Hist',
+    'st_price_vs_ema': 'ST_Price_vs_EMA10',
+    'st_vol_ratio': 'ST_Vol_Ratio_5d',
+    'mt_rsi': 'MT_RSI_14',
+    'mt_stoch_k': 'MT_Stoch_14',
+    'mt_macd_hist': 'MT_MACD_Hist',
+    'mt_price_vs_sma50': 'MT_Price_vs_SMA50',
+    'mt_adx': 'MT_ADX',
+    'mt_divergence': 'MT_Divergence',
+    'mt_vol_trend': 'MT_Vol_Trend_20d',
+    'mt_reversal_score': 'MT_Reversal_Score',
+    'mt_entry_score': 'MT_Entry_Score',
+    'mt_conviction': 'MT_Conviction',
+    'lt_rsi': 'LT_RSI_21',
+    'lt_macd_hist': 'LT_MACD_Hist',
+    'lt_price_vs_sma200': 'LT_Price_vs_SMA200',
+    'lt_ma_cross': 'LT_SMA50_vs_SMA200',
+    'lt_adx': 'LT_ADX_21',
+    'lt_obv_trend': 'LT_OBV_Trend_50d',
+    'lt_52w_position': 'LT_52W_Position',
+    'lt_trend': 'LT_Trend',
+    'lt_months_in_trend': 'LT_Months_in_Trend',
+    'lt_score': 'LT_Score',
+}
+
+
+class _SharedSeries:
+    """
+    Base series for one OHLCV frame, built once and shared by every horizon.
+
+    Price diffs, gains/losses and OBV are computed on first use; derived
+    indicators are memoized by period, so a period used by two horizons
+    (e.g. RSI 14, SMA 50) is computed once. Formulas match the
+    TechnicalCalculator methods exactly (ADX is TechnicalCalculator.adx).
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.close = df['close']
+        self._memo: Dict[Tuple[Any, ...], Any] = {}
+
+    def _get(self, key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+        if key not in self._memo:
+            self._memo[key] = build()
+        return self._memo[key]
+
+    def _gain_loss(self) -> Tuple[pd.Series, pd.Series]:
+        def build():
+            delta = self.close.diff()
+            return delta.where(delta > 0, 0), -delta.where(delta < 0, 0)
+        return self._get(('gain_loss',), build)
+
+    def rsi(self, period: int) -> pd.Series:
+        def build():
+            gain, loss = self._gain_loss()
+            rs = smooth(gain, period) / smooth(loss, period).replace(0, np.nan)
+            return 100 - (100 / (1 + rs))
+        return self._get(('rsi', period), build)
+
+    def ema(self, span: int) -> pd.Series:
+        return self._get(('ema', span), lambda: self.close.ewm(span=span, adjust=False).mean())
+
+    def sma(self, period: int) -> pd.Series:
+        return self._get(('sma', period), lambda: self.close.rolling(window=period).mean())
+
+    def macd_hist(self, fast: int, slow: int, signal: int) -> pd.Series:
+        def build():
+            macd_line = self.ema(fast) - self.ema(slow)
+            return macd_line - macd_line.ewm(span=signal, adjust=False).mean()
+        return self._get(('macd_hist', fast, slow, signal), build)
+
+    def stoch_k(self, period: int) -> pd.Series:
+        def build():
+            low_min = self.df['low'].rolling(window=period).min()
+            high_max = self.df['high'].rolling(window=period).max()
+            return 100 * ((self.close - low_min) / (high_max - low_min))
+        return self._get(('stoch_k', period), build)
+
+    def obv(self) -> pd.Series:
+        return self._get(
+            ('obv',),
+            lambda: (self.df['volume'] * np.where(self.close.diff() > 0, 1, -1)).cumsum(),
+        )
+
+    def adx(self, period: int) -> float:
+        """Current ADX value (20.0 when undefined)."""
+        return self._get(('adx', period), lambda: TechnicalCalculator.adx(self.df, period))
+
+
+def multi_horizon_frame(results: Mapping[str, MultiHorizonResult]) -> pd.DataFrame:
+    """
+    Columnar view of results for many tickers: one numeric row per ticker.
+
+    Args:
+        results: Ticker -> MultiHorizonResult (from calculate)
+
+    Returns:
+        DataFrame indexed by ticker with sheet column names
+    """
+    return pd.DataFrame.from_dict(
+        {ticker: result.to_record() for ticker, result in results.items()},
+        orient='index',
+        columns=list(RESULT_COLUMNS.values()),
+    )
+
+
 class MultiHorizonCalculator:
     """
     Calculates technical indicators across all three time horizons.
@@ -97,65 +336,98 @@ class MultiHorizonCalculator:
     for short-term, mid-term, and long-term investors.
     """
 
-    def __init__(self):
+    def __init__(self, indicator_store: Optional[IndicatorStore] = None):
+        """
+        Args:
+            indicator_store: Reuse results already computed today for the
+                same ticker and data (see calculate)
+        """
         self.calc = TechnicalCalculator()
+        self.indicator_store = indicator_store
 
-    def calculate_all(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def calculate(self, df: pd.DataFrame, ticker: str = '') -> MultiHorizonResult:
         """
-        Calculate all indicators for all three time horizons.
+        Calculate all indicators for all three time horizons as numbers.
 
         Args:
             df: DataFrame with OHLCV data (datetime, open, high, low, close, volume)
+            ticker: With an indicator store, read/store the result under this ticker
 
         Returns:
-            Dict with all indicator values organized by horizon prefix
+            MultiHorizonResult (neutral defaults if fewer than 50 bars)
         """
+        if self.indicator_store is not None and ticker and df is not None:
+            record = self.indicator_store.get_or_compute(
+                ticker, df,
+                lambda d: pd.DataFrame([self._calculate(d).to_record()]),
+                MULTI_HORIZON_CONFIG,
+            )
+            return MultiHorizonResult.from_record(record.iloc[0])
+        return self._calculate(df)
+
+    def _calculate(self, df: pd.DataFrame) -> MultiHorizonResult:
+        """calculate without the indicator store."""
         if df is None or len(df) < 50:
-            return self._empty_result()
+            return MultiHorizonResult()
 
-        result = {}
-
-        # Base data
         current_price = float(df['close'].iloc[-1])
-        result['Price'] = round(current_price, 2)
-        result['Change%'] = self._calculate_change_pct(df)
+        values: Dict[str, Any] = {
+            'price': round(current_price, 2),
+            'change_pct': self._calculate_change_pct(df),
+        }
+
+        # Calculate each horizon from one set of base series
+        series = _SharedSeries(df)
+        values.update(self._calculate_short_term(df, current_price, series))
+        values.update(self._calculate_mid_term(df, current_price, series))
+        values.update(self._calculate_long_term(df, current_price, series))
+
+        return MultiHorizonResult(**values)
+
+    def calculate_all(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Calculate all indicators for all three time horizons for display.
 
-        # Calculate each horizon
-        result.update(self._calculate_short_term(df, current_price))
-        result.update(self._calculate_mid_term(df, current_price))
-        result.update(self._calculate_long_term(df, current_price))
+        Args:
+            df: DataFrame with OHLCV data (datetime, open, high, low, close, volume)
 
-        return result
+        Returns:
+            Dict with all indicator values organized by horizon prefix, with
+            percentages/ratios formatted as strings (e.g. "+3.21%", "1.4x").
+            Use calculate() for numeric values.
+        """
+        return self.calculate(df).to_dict()
 
-    def _calculate_change_pct(self, df: pd.DataFrame) -> str:
+    def _calculate_change_pct(self, df: pd.DataFrame) -> float:
         """Calculate daily change percentage."""
         if len(df) < 2:
-            return "+0.00%"
+            return 0.0
         current = float(df['close'].iloc[-1])
         previous = float(df['close'].iloc[-2])
         change = ((current - previous) / previous) * 100 if previous > 0 else 0
-        return f"{change:+.2f}%"
+        return round(change, 2)
 
-    def _calculate_short_term(self, df: pd.DataFrame, current_price: float) -> Dict[str, Any]:
+    def _calculate_short_term(
+        self, df: pd.DataFrame, current_price: float, series: Optional[_SharedSeries] = None
+    ) -> Dict[str, Any]:
         """Calculate short-term (1-2 week) indicators."""
         cfg = HORIZON_CONFIGS[TimeHorizon.SHORT_TERM]
+        series = series or _SharedSeries(df)
 
         # RSI
-        rsi_series = self.calc.rsi(df['close'], cfg.rsi_period)
+        rsi_series = series.rsi(cfg.rsi_period)
         st_rsi = self._safe_float(rsi_series.iloc[-1], 50.0)
 
         # Stochastic
-        stoch_k, stoch_d = self.calc.stochastic(df, cfg.stoch_k, cfg.stoch_d)
+        stoch_k = series.stoch_k(cfg.stoch_k)
         st_stoch_k = self._safe_float(stoch_k.iloc[-1], 50.0)
 
         # MACD
-        macd_line, signal_line, histogram = self.calc.macd(
-            df['close'], cfg.macd_fast, cfg.macd_slow, cfg.macd_signal
-        )
+        histogram = series.macd_hist(cfg.macd_fast, cfg.macd_slow, cfg.macd_signal)
         st_macd_hist = self._safe_float(histogram.iloc[-1], 0.0)
 
         # Price vs EMA
-        ema = self.calc.ema(df['close'], cfg.ema_period)
+        ema = series.ema(cfg.ema_period)
         ema_val = self._safe_float(ema.iloc[-1], current_price)
         st_price_vs_ema = round(((current_price - ema_val) / ema_val) * 100, 2) if ema_val > 0 else 0.0
 
@@ -165,48 +437,49 @@ class MultiHorizonCalculator:
         st_vol_ratio = round(current_vol / avg_vol, 2) if avg_vol > 0 else 1.0
 
         return {
-            'ST_RSI_7': round(st_rsi, 1),
-            'ST_Stoch_K': round(st_stoch_k, 1),
-            'ST_MACD_Hist': round(st_macd_hist, 4),
-            'ST_Price_vs_EMA10': f"{st_price_vs_ema:+.2f}%",
-            'ST_Vol_Ratio_5d': f"{st_vol_ratio:.1f}x",
+            'st_rsi': round(st_rsi, 1),
+            'st_stoch_k': round(st_stoch_k, 1),
+            'st_macd_hist': round(st_macd_hist, 4),
+            'st_price_vs_ema': st_price_vs_ema,
+            'st_vol_ratio': float(st_vol_ratio),
         }
 
-    def _calculate_mid_term(self, df: pd.DataFrame, current_price: float) -> Dict[str, Any]:
+    def _calculate_mid_term(
+        self, df: pd.DataFrame, current_price: float, series: Optional[_SharedSeries] = None
+    ) -> Dict[str, Any]:
         """Calculate mid-term (1-3 month) indicators."""
         cfg = HORIZON_CONFIGS[TimeHorizon.MID_TERM]
+        series = series or _SharedSeries(df)
 
         # RSI
-        rsi_series = self.calc.rsi(df['close'], cfg.rsi_period)
+        rsi_series = series.rsi(cfg.rsi_period)
         mt_rsi = self._safe_float(rsi_series.iloc[-1], 50.0)
 
         # Stochastic (added for completeness)
-        stoch_k, stoch_d = self.calc.stochastic(df, cfg.stoch_k, cfg.stoch_d)
+        stoch_k = series.stoch_k(cfg.stoch_k)
         mt_stoch_k = self._safe_float(stoch_k.iloc[-1], 50.0)
 
         # MACD
-        macd_line, signal_line, histogram = self.calc.macd(
-            df['close'], cfg.macd_fast, cfg.macd_slow, cfg.macd_signal
-        )
+        histogram = series.macd_hist(cfg.macd_fast, cfg.macd_slow, cfg.macd_signal)
         mt_macd_hist = self._safe_float(histogram.iloc[-1], 0.0)
 
         # Price vs SMA50
-        sma50 = self.calc.sma(df['close'], cfg.sma_period)
+        sma50 = series.sma(cfg.sma_period)
         sma50_val = self._safe_float(sma50.iloc[-1], current_price)
         mt_price_vs_sma50 = round(((current_price - sma50_val) / sma50_val) * 100, 2) if sma50_val > 0 else 0.0
 
         # ADX
-        mt_adx = self.calc.adx(df, cfg.adx_period)
+        mt_adx = series.adx(cfg.adx_period)
 
         # Divergence (RSI + OBV combined) - uses swing low detection
-        mt_divergence = self._detect_swing_divergence(df, cfg.divergence_lookback)
+        mt_divergence = self._detect_swing_divergence(df, cfg.divergence_lookback, series)
 
         # Volume trend (OBV slope)
-        obv = self.calc.obv(df)
+        obv = series.obv()
         mt_vol_trend = self._classify_obv_trend(obv, cfg.obv_trend_period)
 
         # Reversal score (from reversal_scoring_v2 logic)
-        mt_reversal_score, mt_conviction = self._calculate_reversal_score(df)
+        mt_reversal_score, mt_conviction = self._calculate_reversal_score(df, series)
 
         # Entry score (broader metric)
         mt_entry_score = self._calculate_entry_score(
@@ -215,47 +488,48 @@ class MultiHorizonCalculator:
         )
 
         return {
-            'MT_RSI_14': round(mt_rsi, 1),
-            'MT_Stoch_14': round(mt_stoch_k, 1),
-            'MT_MACD_Hist': round(mt_macd_hist, 4),
-            'MT_Price_vs_SMA50': f"{mt_price_vs_sma50:+.2f}%",
-            'MT_ADX': round(mt_adx, 1),
-            'MT_Divergence': mt_divergence,
-            'MT_Vol_Trend_20d': mt_vol_trend,
-            'MT_Reversal_Score': round(mt_reversal_score, 1),
-            'MT_Entry_Score': round(mt_entry_score, 1),
-            'MT_Conviction': mt_conviction,
+            'mt_rsi': round(mt_rsi, 1),
+            'mt_stoch_k': round(mt_stoch_k, 1),
+            'mt_macd_hist': round(mt_macd_hist, 4),
+            'mt_price_vs_sma50': mt_price_vs_sma50,
+            'mt_adx': round(mt_adx, 1),
+            'mt_divergence': mt_divergence,
+            'mt_vol_trend': mt_vol_trend,
+            'mt_reversal_score': round(mt_reversal_score, 1),
+            'mt_entry_score': round(mt_entry_score, 1),
+            'mt_conviction': mt_conviction,
         }
 
-    def _calculate_long_term(self, df: pd.DataFrame, current_price: float) -> Dict[str, Any]:
+    def _calculate_long_term(
+        self, df: pd.DataFrame, current_price: float, series: Optional[_SharedSeries] = None
+    ) -> Dict[str, Any]:
         """Calculate long-term (3-12 month) indicators."""
         cfg = HORIZON_CONFIGS[TimeHorizon.LONG_TERM]
+        series = series or _SharedSeries(df)
 
         # RSI
-        rsi_series = self.calc.rsi(df['close'], cfg.rsi_period)
+        rsi_series = series.rsi(cfg.rsi_period)
         lt_rsi = self._safe_float(rsi_series.iloc[-1], 50.0)
 
         # MACD
-        macd_line, signal_line, histogram = self.calc.macd(
-            df['close'], cfg.macd_fast, cfg.macd_slow, cfg.macd_signal
-        )
+        histogram = series.macd_hist(cfg.macd_fast, cfg.macd_slow, cfg.macd_signal)
         lt_macd_hist = self._safe_float(histogram.iloc[-1], 0.0)
 
         # Price vs SMA200
-        sma200 = self.calc.sma(df['close'], min(200, len(df)))
+        sma200 = series.sma(min(200, len(df)))
         sma200_val = self._safe_float(sma200.iloc[-1], current_price)
         lt_price_vs_sma200 = round(((current_price - sma200_val) / sma200_val) * 100, 2) if sma200_val > 0 else 0.0
 
         # SMA50 vs SMA200 (Golden/Death cross)
-        sma50 = self.calc.sma(df['close'], 50)
+        sma50 = series.sma(50)
         sma50_val = self._safe_float(sma50.iloc[-1], current_price)
         lt_cross_status = self._classify_ma_cross(sma50, sma200)
 
         # ADX
-        lt_adx = self.calc.adx(df, cfg.adx_period)
+        lt_adx = series.adx(cfg.adx_period)
 
         # OBV trend
-        obv = self.calc.obv(df)
+        obv = series.obv()
         lt_obv_trend = self._classify_obv_trend(obv, cfg.obv_trend_period)
 
         # 52-week position
@@ -267,7 +541,7 @@ class MultiHorizonCalculator:
         lt_trend = self._classify_long_term_trend(current_price, sma50_val, sma200_val, lt_adx)
 
         # Months in trend
-        lt_months_in_trend = self._estimate_trend_duration(df, sma200)
+        lt_months_in_trend = self._trend_days(df, sma200) / 21  # ~21 trading days per month
 
         # Long-term score
         lt_score = self._calculate_long_term_score(
@@ -276,34 +550,37 @@ class MultiHorizonCalculator:
         )
 
         return {
-            'LT_RSI_21': round(lt_rsi, 1),
-            'LT_MACD_Hist': round(lt_macd_hist, 4),
-            'LT_Price_vs_SMA200': f"{lt_price_vs_sma200:+.2f}%",
-            'LT_SMA50_vs_SMA200': lt_cross_status,
-            'LT_ADX_21': round(lt_adx, 1),
-            'LT_OBV_Trend_50d': lt_obv_trend,
-            'LT_52W_Position': f"{lt_52w_position:.0f}%",
-            'LT_Trend': lt_trend,
-            'LT_Months_in_Trend': lt_months_in_trend,
-            'LT_Score': round(lt_score, 1),
+            'lt_rsi': round(lt_rsi, 1),
+            'lt_macd_hist': round(lt_macd_hist, 4),
+            'lt_price_vs_sma200': lt_price_vs_sma200,
+            'lt_ma_cross': lt_cross_status,
+            'lt_adx': round(lt_adx, 1),
+            'lt_obv_trend': lt_obv_trend,
+            'lt_52w_position': lt_52w_position,
+            'lt_trend': lt_trend,
+            'lt_months_in_trend': lt_months_in_trend,
+            'lt_score': round(lt_score, 1),
         }
 
-    def _detect_combined_divergence(self, df: pd.DataFrame, lookback: int) -> str:
+    def _detect_combined_divergence(
+        self, df: pd.DataFrame, lookback: int, series: Optional[_SharedSeries] = None
+    ) -> str:
         """Detect combined RSI + OBV divergence (simple start-to-end comparison)."""
         if len(df) < lookback + 5:
             return "NONE"
+        series = series or _SharedSeries(df)
 
         recent = df.iloc[-lookback:]
         price_start = float(recent['close'].iloc[0])
         price_end = float(recent['close'].iloc[-1])
 
         # RSI divergence
-        rsi = self.calc.rsi(df['close'], 14)
+        rsi = series.rsi(14)
         rsi_start = self._safe_float(rsi.iloc[-lookback], 50)
         rsi_end = self._safe_float(rsi.iloc[-1], 50)
 
         # OBV divergence
-        obv = self.calc.obv(df)
+        obv = series.obv()
         obv_start = float(obv.iloc[-lookback])
         obv_end = float(obv.iloc[-1])
 
@@ -325,7 +602,9 @@ class MultiHorizonCalculator:
             return "BEARISH"
         return "NONE"
 
-    def _detect_swing_divergence(self, df: pd.DataFrame, lookback: int) -> str:
+    def _detect_swing_divergence(
+        self, df: pd.DataFrame, lookback: int, series: Optional[_SharedSeries] = None
+    ) -> str:
         """
         Detect divergence using swing lows/highs instead of start-to-end.
 
@@ -335,9 +614,10 @@ class MultiHorizonCalculator:
         if len(df) < lookback + 5:
             return "NONE"
 
+        series = series or _SharedSeries(df)
         recent = df.iloc[-lookback:]
-        rsi = self.calc.rsi(df['close'], 14)
-        obv = self.calc.obv(df)
+        rsi = series.rsi(14)
+        obv = series.obv()
 
         # Simple swing detection: find the lowest low in first half vs second half
         half = lookback // 2
@@ -396,7 +676,7 @@ class MultiHorizonCalculator:
             return "BEARISH"
 
         # Fall back to simple detection for edge cases
-        return self._detect_combined_divergence(df, lookback)
+        return self._detect_combined_divergence(df, lookback, series)
 
     def _classify_obv_trend(self, obv: pd.Series, period: int) -> str:
         """Classify OBV trend over period."""
@@ -470,46 +750,29 @@ class MultiHorizonCalculator:
         else:
             return "SIDEWAYS"
 
-    def _estimate_trend_duration(self, df: pd.DataFrame, sma200: pd.Series) -> str:
-        """Estimate how long the current trend has persisted."""
+    def _trend_days(self, df: pd.DataFrame, sma200: pd.Series) -> int:
+        """Count consecutive days price has stayed on the same side of SMA200."""
         if len(df) < 60:
-            return "< 1 month"
+            return 0
 
         current_price = float(df['close'].iloc[-1])
         sma200_now = self._safe_float(sma200.iloc[-1], current_price)
         above_now = current_price > sma200_now
 
-        # Count consecutive days in same position
-        days_in_trend = 0
-        for i in range(1, min(len(df), 252)):  # Max 1 year
-            idx = -i - 1
-            if idx < -len(df):
-                break
-
-            past_price = float(df['close'].iloc[idx])
-            past_sma = self._safe_float(sma200.iloc[idx], past_price)
-            past_above = past_price > past_sma
-
-            if past_above == above_now:
-                days_in_trend += 1
-            else:
-                break
-
-        # Convert to months
-        months = days_in_trend / 21  # ~21 trading days per month
-
-        if months < 1:
-            return "< 1 month"
-        elif months < 3:
-            return f"~{int(months)} months"
-        elif months < 6:
-            return "3-6 months"
-        elif months < 12:
-            return "6-12 months"
-        else:
-            return "> 12 months"
+        # Count consecutive days in the same position, walking back up to a
+        # year. A missing SMA counts as "not above", as the price itself would.
+        window = min(len(df), 252)
+        close = df['close'].to_numpy(dtype=float)[-window:-1]
+        sma = sma200.to_numpy(dtype=float)[-window:-1]
+        return current_streak(pd.Series((close > sma) == above_now))
 
-    def _calculate_reversal_score(self, df: pd.DataFrame) -> Tuple[float, str]:
+    def _estimate_trend_duration(self, df: pd.DataFrame, sma200: pd.Series) -> str:
+        """Estimate how long the current trend has persisted (display label)."""
+        return format_trend_duration(self._trend_days(df, sma200) / 21)
+
+    def _calculate_reversal_score(
+        self, df: pd.DataFrame, series: Optional[_SharedSeries] = None
+    ) -> Tuple[float, str]:
         """
         Calculate reversal score using v3 logic from reversal_scoring_v2.
 
@@ -523,11 +786,13 @@ class MultiHorizonCalculator:
             return result.total_score, result.conviction.value
         except ImportError:
             # Fallback to simple calculation
-            return self._simple_reversal_score(df)
+            return self._simple_reversal_score(df, series)
 
-    def _simple_reversal_score(self, df: pd.DataFrame) -> Tuple[float, str]:
+    def _simple_reversal_score(
+        self, df: pd.DataFrame, series: Optional[_SharedSeries] = None
+    ) -> Tuple[float, str]:
         """Simple fallback reversal scoring."""
-        rsi = self.calc.rsi(df['close'], 14)
+        rsi = (series or _SharedSeries(df)).rsi(14)
         rsi_val = self._safe_float(rsi.iloc[-1], 50)
 
         # Simple scoring based on RSI
@@ -684,35 +949,4 @@ class MultiHorizonCalculator:
 
     def _empty_result(self) -> Dict[str, Any]:
         """Return empty result structure for insufficient data."""
-        return {
-            'Price': 0.0,
-            'Change%': '+0.00%',
-            # Short-term
-            'ST_RSI_7': 50.0,
-            'ST_Stoch_K': 50.0,
-            'ST_MACD_Hist': 0.0,
-            'ST_Price_vs_EMA10': '+0.00%',
-            'ST_Vol_Ratio_5d': '1.0x',
-            # Mid-term
-            'MT_RSI_14': 50.0,
-            'MT_Stoch_14': 50.0,
-            'MT_MACD_Hist': 0.0,
-            'MT_Price_vs_SMA50': '+0.00%',
-            'MT_ADX': 20.0,
-            'MT_Divergence': 'NONE',
-            'MT_Vol_Trend_20d': 'NEUTRAL',
-            'MT_Reversal_Score': 5.0,
-            'MT_Entry_Score': 5.0,
-            'MT_Conviction': 'NONE',
-            # Long-term
-            'LT_RSI_21': 50.0,
-            'LT_MACD_Hist': 0.0,
-            'LT_Price_vs_SMA200': '+0.00%',
-            'LT_SMA50_vs_SMA200': 'NEUTRAL',
-            'LT_ADX_21': 20.0,
-            'LT_OBV_Trend_50d': 'NEUTRAL',
-            'LT_52W_Position': '50%',
-            'LT_Trend': 'UNDEFINED',
-            'LT_Months_in_Trend': '< 1 month',
-            'LT_Score': 5.0,
-        }
+        return MultiHorizonResult().to_dict()
@@ -0,0 +1,443 @@
+"""
+Compiled trigger predicates evaluated over many symbols at once.
+
+A trigger config dict (see TriggerEngine) is compiled once into a
+CompiledTrigger: its type is resolved to a predicate that compares whole
+columns of a TriggerFrame (one row per symbol, current and previous bar).
+Evaluating a trigger list over a watchlist is then one array comparison
+per trigger; Python-level work only happens for symbols that fire, to
+format their detail message. A single symbol is evaluated through
+SymbolFrame, which reads its two bars straight from the DataFrame.
+
+Semantics match the per-symbol rules TriggerEngine has always applied: a
+NaN value or a missing column never fires.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Window of the volume average volume_spike compares against
+VOLUME_SPIKE_WINDOW = 50
+VOLUME_MA_COLUMN = f"VOLUME_MA_{VOLUME_SPIKE_WINDOW}"
+
+
+@dataclass
+class TriggerFrame:
+    """
+    Latest two bars of every symbol, column-aligned.
+
+    Attributes:
+        curr: Latest bar per symbol (index: symbols, columns: close, RSI, ...)
+        prev: Bar before it, same index
+        scores: Bullish score per symbol, as passed in (kept for messages)
+        matrix: Optional matrix flags per symbol (index: symbols)
+    """
+    curr: pd.DataFrame
+    prev: pd.DataFrame
+    scores: pd.Series
+    matrix: Optional[pd.DataFrame] = None
+    _columns: Dict[Tuple[str, bool], np.ndarray] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_frames(
+        cls,
+        frames: Mapping[str, pd.DataFrame],
+        scores: Mapping[str, float],
+        matrices: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    ) -> "TriggerFrame":
+        """
+        Build from per-symbol OHLCV + indicator frames.
+
+        Symbols whose frame is None or shorter than two bars are left out.
+        A VOLUME_MA_50 column (trailing 50-bar volume mean) is added for
+        volume_spike unless the frames already carry one.
+
+        Args:
+            frames: symbol -> DataFrame with OHLCV and indicator columns
+            scores: symbol -> bullish score
+            matrices: symbol -> matrix flags, for requires_matrix gates
+        """
+        tails: Dict[str, pd.DataFrame] = {}
+        volume_ma: Dict[str, float] = {}
+        for symbol, df in frames.items():
+            if df is None or len(df) < 2:
+                continue
+            tails[symbol] = df.iloc[-2:]
+            if VOLUME_MA_COLUMN not in df.columns and 'volume' in df.columns:
+                tail = df['volume'].to_numpy(dtype=float)[-VOLUME_SPIKE_WINDOW:]
+                volume_ma[symbol] = tail.mean() if len(tail) == VOLUME_SPIKE_WINDOW else np.nan
+
+        symbols = list(tails)
+        if not symbols:
+            empty = pd.DataFrame()
+            return cls(curr=empty, prev=empty, scores=pd.Series(dtype=object))
+
+        # Every tail has exactly two rows: even rows are prev, odd rows curr
+        stacked = pd.concat(list(tails.values()), ignore_index=True, sort=False)
+        prev = stacked.iloc[0::2].set_axis(symbols)
+        curr = stacked.iloc[1::2].set_axis(symbols)
+        if volume_ma:
+            curr = curr.assign(**{VOLUME_MA_COLUMN: pd.Series(volume_ma, dtype=float)})
+
+        matrix = None
+        if matrices:
+            matrix = pd.DataFrame.from_dict(
+                {s: dict(matrices[s]) for s in symbols if matrices.get(s)}, orient='index',
+            ).reindex(symbols)
+        return cls(
+            curr=curr,
+            prev=prev,
+            scores=pd.Series([scores.get(s) for s in symbols], index=symbols, dtype=object),
+            matrix=matrix,
+        )
+
+    @property
+    def symbols(self) -> pd.Index:
+        return self.curr.index
+
+    def __len__(self) -> int:
+        return len(self.curr)
+
+    def has(self, name: str) -> bool:
+        return name in self.curr.columns
+
+    def column(self, name: str, prev: bool = False) -> np.ndarray:
+        """Float values of a column (NaN for a missing column or value)."""
+        key = (name, prev)
+        if key not in self._columns:
+            source = self.prev if prev else self.curr
+            if name in source.columns:
+                values = pd.to_numeric(source[name], errors='coerce').to_numpy(dtype=float)
+            else:
+                values = np.full(len(self), np.nan)
+            self._columns[key] = values
+        return self._columns[key]
+
+    def score_values(self) -> np.ndarray:
+        return self.column_from(self.scores, 'score')
+
+    def score(self, row: int) -> Any:
+        """Score as passed in, for messages."""
+        return self.scores.iloc[row]
+
+    def matrix_column(self, key: str) -> Optional[List[Any]]:
+        """Matrix flag per symbol, or None without a matrix or that flag."""
+        if self.matrix is None or key not in self.matrix.columns:
+            return None
+        return self.matrix[key].tolist()
+
+    def column_from(self, series: pd.Series, name: str) -> np.ndarray:
+        key = (name, False)
+        if key not in self._columns:
+            self._columns[key] = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+        return self._columns[key]
+
+    def value(self, name: str, row: int, prev: bool = False) -> Any:
+        """Original (unconverted) value at one row, for messages."""
+        return (self.prev if prev else self.curr)[name].iat[row]
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class SymbolFrame:
+    """
+    One symbol's latest two bars, read straight from its DataFrame.
+
+    Same interface as a one-row TriggerFrame, without the concat and
+    column conversion a TriggerFrame costs; TriggerEngine.evaluate uses it.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        score: Any,
+        matrix: Optional[Mapping[str, Any]] = None,
+    ):
+        self.symbols = [symbol]
+        self.df = df
+        self._score = score
+        self._matrix = matrix
+        self._columns: Dict[Tuple[str, bool], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return 1
+
+    def has(self, name: str) -> bool:
+        return name in self.df.columns
+
+    def column(self, name: str, prev: bool = False) -> np.ndarray:
+        key = (name, prev)
+        if key not in self._columns:
+            if name in self.df.columns:
+                value = _as_float(self.df[name].iat[-2 if prev else -1])
+            elif name == VOLUME_MA_COLUMN and 'volume' in self.df.columns and not prev:
+                tail = self.df['volume'].to_numpy(dtype=float)[-VOLUME_SPIKE_WINDOW:]
+                value = tail.mean() if len(tail) == VOLUME_SPIKE_WINDOW else np.nan
+            else:
+                value = np.nan
+            self._columns[key] = np.array([value])
+        return self._columns[key]
+
+    def score_values(self) -> np.ndarray:
+        return np.array([_as_float(self._score)])
+
+    def score(self, row: int) -> Any:
+        return self._score
+
+    def matrix_column(self, key: str) -> Optional[List[Any]]:
+        if not self._matrix or key not in self._matrix:
+            return None
+        return [self._matrix[key]]
+
+    def value(self, name: str, row: int, prev: bool = False) -> Any:
+        return self.df[name].iat[-2 if prev else -1]
+
+
+Frame = Union[TriggerFrame, SymbolFrame]
+Predicate = Callable[[Frame], np.ndarray]
+Describe = Callable[[Frame, int], str]
+Compiler = Callable[[Mapping[str, Any]], Tuple[Predicate, Describe]]
+
+
+def _number(trigger: Mapping[str, Any], key: str, default: Any = None) -> float:
+    """Numeric trigger parameter; KeyError when required and absent."""
+    value = trigger[key] if default is None else trigger.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float, np.number)):
+        raise TypeError(f"{key} must be a number, got {value!r}")
+    return value
+
+
+def _column_name(trigger: Mapping[str, Any], key: str) -> str:
+    name = trigger[key]
+    if not isinstance(name, str):
+        raise TypeError(f"{key} must be a column name, got {name!r}")
+    return name
+
+
+def _score_threshold(above: bool) -> Callable[[Mapping[str, Any]], Tuple[Predicate, Describe]]:
+    def compile_(trigger):
+        value = _number(trigger, 'value')
+        op = '>=' if above else '<='
+
+        def predicate(frame):
+            score = frame.score_values()
+            return score >= value if above else score <= value
+
+        def describe(frame, row):
+            return f"Score {frame.score(row)} {op} {value}"
+        return predicate, describe
+    return compile_
+
+
+def _price_threshold(above: bool) -> Callable[[Mapping[str, Any]], Tuple[Predicate, Describe]]:
+    def compile_(trigger):
+        value = _number(trigger, 'value')
+        op = '>' if above else '<'
+
+        def predicate(frame):
+            close = frame.column('close')
+            return close > value if above else close < value
+
+        def describe(frame, row):
+            return f"Price ${round(frame.value('close', row), 2)} {op} ${value}"
+        return predicate, describe
+    return compile_
+
+
+def _price_crosses_ma(above: bool) -> Callable[[Mapping[str, Any]], Tuple[Predicate, Describe]]:
+    def compile_(trigger):
+        ma = _column_name(trigger, 'ma')
+        message = f"Price crossed {'above' if above else 'below'} {ma}"
+
+        def predicate(frame):
+            prev_close, prev_ma = frame.column('close', prev=True), frame.column(ma, prev=True)
+            close, curr_ma = frame.column('close'), frame.column(ma)
+            if above:
+                return (prev_close <= prev_ma) & (close > curr_ma)
+            return (prev_close >= prev_ma) & (close < curr_ma)
+        return predicate, lambda frame, row: message
+    return compile_
+
+
+def _price_vs_ma(above: bool) -> Callable[[Mapping[str, Any]], Tuple[Predicate, Describe]]:
+    def compile_(trigger):
+        ma = _column_name(trigger, 'ma')
+        message = f"Price {'>' if above else '<'} {ma}"
+
+        def predicate(frame):
+            close, curr_ma = frame.column('close'), frame.column(ma)
+            return close > curr_ma if above else close < curr_ma
+        return predicate, lambda frame, row: message
+    return compile_
+
+
+def _ma_cross(trigger: Mapping[str, Any]) -> Tuple[Predicate, Describe]:
+    fast = _column_name(trigger, 'fast')
+    slow = _column_name(trigger, 'slow')
+    bullish = trigger.get('direction', 'bullish') == 'bullish'
+    message = f"Golden Cross ({fast} > {slow})" if bullish else f"Death Cross ({fast} < {slow})"
+
+    def predicate(frame):
+        prev_fast, prev_slow = frame.column(fast, prev=True), frame.column(slow, prev=True)
+        curr_fast, curr_slow = frame.column(fast), frame.column(slow)
+        if bullish:
+            return (prev_fast <= prev_slow) & (curr_fast > curr_slow)
+        return (prev_fast >= prev_slow) & (curr_fast < curr_slow)
+    return predicate, lambda frame, row: message
+
+
+def _oscillator(column: str, label: str, above: bool, default: float,
+                min_score: Optional[float] = None) -> Callable[[Mapping[str, Any]], Tuple[Predicate, Describe]]:
+    def compile_(trigger):
+        threshold = _number(trigger, 'threshold', default)
+        op = '>' if above else '<'
+
+        def predicate(frame):
+            values = frame.column(column)
+            mask = values > threshold if above else values < threshold
+            if min_score is not None:
+                mask &= frame.score_values() >= min_score
+            return mask
+
+        def describe(frame, row):
+            return f"{label} {round(frame.value(column, row), 1)} {op} {threshold}"
+        return predicate, describe
+    return compile_
+
+
+def _volume_spike(trigger: Mapping[str, Any]) -> Tuple[Predicate, Describe]:
+    multiplier = _number(trigger, 'multiplier', 2.0)
+
+    def predicate(frame):
+        volume_ma = frame.column(VOLUME_MA_COLUMN)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(volume_ma > 0, frame.column('volume') / volume_ma, np.nan)
+        return ratio >= multiplier
+
+    def describe(frame, row):
+        ratio = frame.value('volume', row) / frame.column(VOLUME_MA_COLUMN)[row]
+        return f"Volume {round(ratio, 1)}x avg"
+    return predicate, describe
+
+
+def _within_pct_of_ma(trigger: Mapping[str, Any]) -> Tuple[Predicate, Describe]:
+    ma = _column_name(trigger, 'ma')
+    pct = _number(trigger, 'pct', 2)
+
+    def predicate(frame):
+        curr_ma = frame.column(ma)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distance = np.where(curr_ma > 0, np.abs(frame.column('close') - curr_ma) / curr_ma * 100, np.nan)
+        return distance <= pct
+
+    def describe(frame, row):
+        curr_ma = frame.value(ma, row)
+        distance = abs(frame.value('close', row) - curr_ma) / curr_ma * 100
+        return f"Price within {round(distance, 1)}% of {ma}"
+    return predicate, describe
+
+
+# Trigger type -> compiler producing (predicate, describe)
+TRIGGER_COMPILERS: Dict[str, Compiler] = {
+    'score_above': _score_threshold(above=True),
+    'score_below': _score_threshold(above=False),
+    'price_above': _price_threshold(above=True),
+    'price_below': _price_threshold(above=False),
+    'price_crosses_above_ma': _price_crosses_ma(above=True),
+    'price_crosses_below_ma': _price_crosses_ma(above=False),
+    'price_above_ma': _price_vs_ma(above=True),
+    'price_below_ma': _price_vs_ma(above=False),
+    'ma_cross': _ma_cross,
+    'stoch_oversold': _oscillator('STOCH_K', 'Stoch_K', above=False, default=20, min_score=5),
+    'stoch_overbought': _oscillator('STOCH_K', 'Stoch_K', above=True, default=80),
+    'rsi_oversold': _oscillator('RSI', 'RSI', above=False, default=30),
+    'rsi_overbought': _oscillator('RSI', 'RSI', above=True, default=70),
+    'volume_spike': _volume_spike,
+    'price_within_pct_of_ma': _within_pct_of_ma,
+}
+
+
+@dataclass(frozen=True)
+class CompiledTrigger:
+    """One trigger config resolved to a vectorized predicate."""
+    trigger: Mapping[str, Any]
+    type: str
+    action: str
+    note: str
+    cooldown_days: int
+    requires_matrix: Mapping[str, Any]
+    predicate: Predicate
+    describe: Describe
+
+    def mask(self, frame: Frame) -> np.ndarray:
+        """Boolean array: which symbols of the frame fire this trigger."""
+        mask = np.asarray(self.predicate(frame), dtype=bool)
+        for key, expected in self.requires_matrix.items():
+            values = frame.matrix_column(key)
+            if values is None:
+                return np.zeros(len(frame), dtype=bool)
+            mask = mask & np.array([v == expected for v in values], dtype=bool)
+        return mask
+
+
+def compile_trigger(
+    trigger: Mapping[str, Any],
+    compilers: Optional[Mapping[str, Compiler]] = None,
+) -> Optional[CompiledTrigger]:
+    """
+    Compile one trigger config.
+
+    Args:
+        trigger: Trigger config dict
+        compilers: Type -> compiler registry (default TRIGGER_COMPILERS)
+
+    Returns:
+        CompiledTrigger, or None (with a warning) for an unknown type or a
+        missing/invalid parameter
+    """
+    t_type = trigger.get('type')
+    compiler = (TRIGGER_COMPILERS if compilers is None else compilers).get(t_type)
+    if compiler is None:
+        logger.warning(f"Unknown trigger type: {t_type}")
+        return None
+    try:
+        predicate, describe = compiler(trigger)
+        cooldown_days = int(trigger.get("cooldown_days", 0) or 0)
+    except KeyError as e:
+        logger.warning(f"Missing required field in trigger {t_type}: {e}")
+        return None
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Invalid value in trigger {t_type}: {e}")
+        return None
+
+    return CompiledTrigger(
+        trigger=trigger,
+        type=t_type,
+        action=trigger.get('action', 'WATCH'),
+        note=trigger.get('note', ''),
+        cooldown_days=cooldown_days,
+        requires_matrix=trigger.get("requires_matrix") or {},
+        predicate=predicate,
+        describe=describe,
+    )
+
+
+def compile_triggers(
+    triggers: Sequence[Mapping[str, Any]],
+    compilers: Optional[Mapping[str, Compiler]] = None,
+) -> List[CompiledTrigger]:
+    """Compile a trigger list, dropping (and warning about) invalid entries."""
+    compiled = (compile_trigger(trigger, compilers) for trigger in triggers)
+    return [trigger for trigger in compiled if trigger is not None]
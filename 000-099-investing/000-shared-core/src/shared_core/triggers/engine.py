@@ -1,14 +1,28 @@
 """
 Config-driven trigger evaluation engine.
 
-Evaluates triggers defined in JSON config against market data.
+Evaluates triggers defined in JSON config against market data. Trigger
+lists are compiled once (see compiled.py) and evaluated as column masks
+over a whole watchlist (evaluate_batch), or read straight from one
+symbol's frame (evaluate).
 """
 
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .compiled import (
+    TRIGGER_COMPILERS,
+    CompiledTrigger,
+    Compiler,
+    SymbolFrame,
+    TriggerFrame,
+    compile_triggers,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,14 +37,44 @@ class TriggerEngine:
         default_triggers: List of default triggers applied to all tickers
     """
 
-    def __init__(self, default_triggers: Optional[List[Dict]] = None):
+    def __init__(
+        self,
+        default_triggers: Optional[List[Dict]] = None,
+        compilers: Optional[Mapping[str, Compiler]] = None,
+    ):
         """
         Initialize with optional default triggers.
 
         Args:
             default_triggers: Default triggers that apply to all tickers
+            compilers: Extra trigger types (type -> compiler, see
+                compiled.TRIGGER_COMPILERS), e.g. project-specific signals
         """
         self.default_triggers = default_triggers or []
+        self.compilers = {**TRIGGER_COMPILERS, **(compilers or {})}
+        self._compiled: Dict[str, List[CompiledTrigger]] = {}
+        # id(list) -> (list, compiled): skips re-serializing config lists
+        # that are passed again as the same object (the usual case)
+        self._compiled_by_id: Dict[int, Tuple[List[Dict], List[CompiledTrigger]]] = {}
+
+    def compiled(self, triggers: Optional[List[Dict]] = None) -> List[CompiledTrigger]:
+        """
+        Compiled form of a trigger list (the defaults when None/empty).
+
+        Each distinct list is compiled once per engine; invalid or unknown
+        triggers are dropped with a warning at that point. Config lists are
+        treated as immutable once passed in.
+        """
+        triggers = triggers or self.default_triggers
+        cached = self._compiled_by_id.get(id(triggers))
+        if cached is not None and cached[0] is triggers:
+            return cached[1]
+
+        key = json.dumps(triggers, sort_keys=True, default=str)
+        if key not in self._compiled:
+            self._compiled[key] = compile_triggers(triggers, self.compilers)
+        self._compiled_by_id[id(triggers)] = (triggers, self._compiled[key])
+        return self._compiled[key]
 
     def evaluate(
         self,
@@ -56,21 +100,80 @@ class TriggerEngine:
         if df is None or len(df) < 2:
             return []
 
-        triggers_to_eval = ticker_triggers if ticker_triggers else self.default_triggers
-        if not triggers_to_eval:
-            return []
+        frame = SymbolFrame(symbol, df, score, matrix)
+        return [
+            self._result(symbol, trigger, trigger.describe(frame, 0))
+            for trigger in self.compiled(ticker_triggers)
+            if trigger.mask(frame)[0]
+        ]
+
+    def evaluate_batch(
+        self,
+        frames: Mapping[str, pd.DataFrame],
+        scores: Mapping[str, float],
+        ticker_triggers: Optional[Mapping[str, Optional[List[Dict]]]] = None,
+        matrices: Optional[Mapping[str, Optional[Dict[str, Any]]]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Evaluate triggers for a whole watchlist.
 
-        results = []
-        curr = df.iloc[-1]
-        prev = df.iloc[-2]
+        Symbols sharing a trigger list (usually the defaults) are evaluated
+        together: each trigger is one vectorized comparison over their
+        latest two bars instead of a Python call per symbol.
 
-        for trigger in triggers_to_eval:
-            evaluated = self._evaluate_trigger(symbol, trigger, curr, prev, df, score, matrix=matrix)
-            if evaluated:
-                results.append(evaluated)
+        Args:
+            frames: symbol -> DataFrame with OHLCV and indicators
+            scores: symbol -> bullish score (0-10)
+            ticker_triggers: symbol -> custom triggers (overrides defaults)
+            matrices: symbol -> matrix flags for conditional triggers
+
+        Returns:
+            symbol -> triggered dicts (same shape and order as evaluate);
+            symbols with nothing triggered (or under two bars) map to []
+        """
+        ticker_triggers = ticker_triggers or {}
+        results: Dict[str, List[Dict[str, Any]]] = {symbol: [] for symbol in frames}
+
+        groups: Dict[int, List[str]] = {}
+        compiled_by_group: Dict[int, List[CompiledTrigger]] = {}
+        for symbol in frames:
+            compiled = self.compiled(ticker_triggers.get(symbol))
+            if compiled:
+                groups.setdefault(id(compiled), []).append(symbol)
+                compiled_by_group[id(compiled)] = compiled
+
+        for group_id, symbols in groups.items():
+            frame = TriggerFrame.from_frames(
+                {s: frames[s] for s in symbols}, scores, matrices,
+            )
+            if not len(frame):
+                continue
+            fired: Dict[str, List[Dict[str, Any]]] = {}
+            for trigger in compiled_by_group[group_id]:
+                for row in np.flatnonzero(trigger.mask(frame)):
+                    symbol = frame.symbols[row]
+                    fired.setdefault(symbol, []).append(
+                        self._result(symbol, trigger, trigger.describe(frame, row))
+                    )
+            results.update(fired)
 
         return results
 
+    def _result(self, symbol: str, trigger: CompiledTrigger, detail: str) -> Dict[str, Any]:
+        """Triggered dict for one symbol."""
+        action, note = trigger.action, trigger.note
+        message = f"{action}: {note} ({detail})" if note else f"{action}: {detail}"
+        return {
+            "symbol": symbol,
+            "action": action,
+            "type": trigger.type,
+            "note": note,
+            "detail": detail,
+            "message": message,
+            "trigger_key": self._trigger_key(symbol, trigger.trigger),
+            "cooldown_days": trigger.cooldown_days,
+        }
+
     def _trigger_key(self, symbol: str, trigger: Dict[str, Any]) -> str:
         """Generate stable identifier for dedupe/suppression."""
         t_type = trigger.get("type", "unknown")
@@ -98,172 +201,3 @@ class TriggerEngine:
             if p:
                 safe.append(p)
         return "_".join(safe)
-
-    def _evaluate_trigger(
-        self,
-        symbol: str,
-        trigger: Dict,
-        curr: pd.Series,
-        prev: pd.Series,
-        df: pd.DataFrame,
-        score: float,
-        matrix: Optional[Dict[str, Any]] = None,
-    ) -> Optional[Dict[str, Any]]:
-        """Evaluate a single trigger configuration."""
-        t_type = trigger.get('type')
-        action = trigger.get('action', 'WATCH')
-        note = trigger.get('note', '')
-        cooldown_days = int(trigger.get("cooldown_days", 0) or 0)
-
-        # Optional matrix gate
-        requires_matrix = trigger.get("requires_matrix") or {}
-        if requires_matrix:
-            if not matrix:
-                return None
-            for k, expected in requires_matrix.items():
-                if matrix.get(k) != expected:
-                    return None
-
-        triggered = False
-        detail = ""
-
-        try:
-            if t_type == 'score_above':
-                value = trigger['value']
-                if score >= value:
-                    triggered = True
-                    detail = f"Score {score} >= {value}"
-
-            elif t_type == 'score_below':
-                value = trigger['value']
-                if score <= value:
-                    triggered = True
-                    detail = f"Score {score} <= {value}"
-
-            elif t_type == 'price_above':
-                value = trigger['value']
-                if curr['close'] > value:
-                    triggered = True
-                    detail = f"Price ${round(curr['close'], 2)} > ${value}"
-
-            elif t_type == 'price_below':
-                value = trigger['value']
-                if curr['close'] < value:
-                    triggered = True
-                    detail = f"Price ${round(curr['close'], 2)} < ${value}"
-
-            elif t_type == 'price_crosses_above_ma':
-                ma = trigger['ma']
-                if ma in curr.index and ma in prev.index:
-                    if prev['close'] <= prev[ma] and curr['close'] > curr[ma]:
-                        triggered = True
-                        detail = f"Price crossed above {ma}"
-
-            elif t_type == 'price_crosses_below_ma':
-                ma = trigger['ma']
-                if ma in curr.index and ma in prev.index:
-                    if prev['close'] >= prev[ma] and curr['close'] < curr[ma]:
-                        triggered = True
-                        detail = f"Price crossed below {ma}"
-
-            elif t_type == 'price_above_ma':
-                ma = trigger['ma']
-                if ma in curr.index:
-                    if curr['close'] > curr[ma]:
-                        triggered = True
-                        detail = f"Price > {ma}"
-
-            elif t_type == 'price_below_ma':
-                ma = trigger['ma']
-                if ma in curr.index:
-                    if curr['close'] < curr[ma]:
-                        triggered = True
-                        detail = f"Price < {ma}"
-
-            elif t_type == 'ma_cross':
-                fast = trigger['fast']
-                slow = trigger['slow']
-                direction = trigger.get('direction', 'bullish')
-
-                if all(col in curr.index for col in [fast, slow]):
-                    if direction == 'bullish':
-                        if prev[fast] <= prev[slow] and curr[fast] > curr[slow]:
-                            triggered = True
-                            detail = f"Golden Cross ({fast} > {slow})"
-                    else:
-                        if prev[fast] >= prev[slow] and curr[fast] < curr[slow]:
-                            triggered = True
-                            detail = f"Death Cross ({fast} < {slow})"
-
-            elif t_type == 'stoch_oversold':
-                threshold = trigger.get('threshold', 20)
-                if 'STOCH_K' in curr.index:
-                    if curr['STOCH_K'] < threshold and score >= 5:
-                        triggered = True
-                        detail = f"Stoch_K {round(curr['STOCH_K'], 1)} < {threshold}"
-
-            elif t_type == 'stoch_overbought':
-                threshold = trigger.get('threshold', 80)
-                if 'STOCH_K' in curr.index:
-                    if curr['STOCH_K'] > threshold:
-                        triggered = True
-                        detail = f"Stoch_K {round(curr['STOCH_K'], 1)} > {threshold}"
-
-            elif t_type == 'rsi_oversold':
-                threshold = trigger.get('threshold', 30)
-                if 'RSI' in curr.index:
-                    if curr['RSI'] < threshold:
-                        triggered = True
-                        detail = f"RSI {round(curr['RSI'], 1)} < {threshold}"
-
-            elif t_type == 'rsi_overbought':
-                threshold = trigger.get('threshold', 70)
-                if 'RSI' in curr.index:
-                    if curr['RSI'] > threshold:
-                        triggered = True
-                        detail = f"RSI {round(curr['RSI'], 1)} > {threshold}"
-
-            elif t_type == 'volume_spike':
-                multiplier = trigger.get('multiplier', 2.0)
-                vol_ma = df['volume'].rolling(50).mean().iloc[-1]
-                if vol_ma > 0:
-                    vol_ratio = curr['volume'] / vol_ma
-                    if vol_ratio >= multiplier:
-                        triggered = True
-                        detail = f"Volume {round(vol_ratio, 1)}x avg"
-
-            elif t_type == 'price_within_pct_of_ma':
-                ma = trigger['ma']
-                pct = trigger.get('pct', 2)
-                if ma in curr.index and curr[ma] > 0:
-                    distance = abs(curr['close'] - curr[ma]) / curr[ma] * 100
-                    if distance <= pct:
-                        triggered = True
-                        detail = f"Price within {round(distance, 1)}% of {ma}"
-
-            else:
-                logger.warning(f"Unknown trigger type: {t_type}")
-                return None
-
-        except KeyError as e:
-            logger.warning(f"Missing required field in trigger {t_type}: {e}")
-            return None
-        except (TypeError, ValueError) as e:
-            logger.warning(f"Invalid value in trigger {t_type}: {e}")
-            return None
-
-        if triggered:
-            message = f"{action}: {note} ({detail})" if note else f"{action}: {detail}"
-            return {
-                "symbol": symbol,
-                "action": action,
-                "type": t_type,
-                "note": note,
-                "detail": detail,
-                "message": message,
-                "trigger_key": self._trigger_key(symbol, trigger),
-                "cooldown_days": cooldown_days,
-            }
-
-        return None
-
@@ -1,7 +1,8 @@
 """
 Cache ticker utilities.
 
-Extracts ticker symbols from cached data files.
+Extracts ticker symbols from cached data files via the cache index
+(see cache/cache_index.py), so repeated lookups don't glob the directory.
 Used by 008-alerts, 009-reversals, and 010-oversold to discover
 which tickers have cached data from 007-ticker-analysis.
 """
@@ -11,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Union
 
+from ..cache.cache_index import CacheIndex
+
 
 def get_cached_tickers(
     cache_dir: Union[str, Path],
@@ -19,7 +22,8 @@ def get_cached_tickers(
     """
     Get ticker symbols from cached data files.
 
-    Looks for files matching the pattern: TICKER_YYYY-MM-DD.json
+    Looks for files matching the pattern: TICKER_YYYY-MM-DD.<suffix>, where
+    the suffix is any cache storage format (.json, .npz, .parquet).
 
     Args:
         cache_dir: Path to the cache directory (e.g., 007-ticker-analysis/data/twelve_data)
@@ -37,19 +41,15 @@ def get_cached_tickers(
         date = os.environ.get('CACHE_DATE') or datetime.now().strftime('%Y-%m-%d')
 
     cache_path = Path(cache_dir) if isinstance(cache_dir, str) else cache_dir
-    tickers: List[str] = []
 
     if not cache_path.exists():
         return []
 
-    # Look for files matching pattern: *_{date}.json
-    for f in cache_path.glob(f"*_{date}.json"):
-        # Extract ticker from filename like "NVDA_2024-12-21.json"
-        ticker = f.stem.replace(f"_{date}", "")
-        if ticker:
-            tickers.append(ticker)
-
-    return sorted(set(tickers))
+    index = CacheIndex(cache_path)
+    try:
+        return index.tickers(date)
+    finally:
+        index.close()
 
 
 def get_latest_cached_tickers(
@@ -103,19 +103,9 @@ def get_cache_dates(cache_dir: Union[str, Path]) -> List[str]:
     if not cache_path.exists():
         return []
 
-    dates: set = set()
-
-    for f in cache_path.glob("*.json"):
-        # Extract date from filename like "NVDA_2024-12-21.json"
-        parts = f.stem.rsplit('_', 1)
-        if len(parts) == 2:
-            date_str = parts[1]
-            # Validate it's a date
-            try:
-                datetime.strptime(date_str, '%Y-%m-%d')
-                dates.add(date_str)
-            except ValueError:
-                continue
-
-    return sorted(dates, reverse=True)
+    index = CacheIndex(cache_path)
+    try:
+        return index.dates()
+    finally:
+        index.close()
 
@@ -1,18 +1,26 @@
 """Tests for the archive module (Supabase archival)."""
 
+import json
+import sqlite3
+import threading
+import time
+
 import pytest
 from datetime import date
 from unittest.mock import MagicMock, patch
 
 from shared_core.archive.supabase_client import (
+    ARCHIVE_COLUMNS,
     IndicatorSnapshot,
     SupabaseArchiver,
     archive_daily_indicators,
+    chunk_records,
     get_historical_data,
 )
 from shared_core.archive.aggregator import (
     MonthlyAggregate,
     MonthlyAggregator,
+    aggregate_daily_rows,
     run_monthly_aggregation,
 )
 
@@ -136,6 +144,225 @@ class TestSupabaseArchiver:
         assert not archiver.is_configured
 
 
+class _SqliteCursor:
+    """Cursor of the local Postgres stand-in: COPY becomes executemany."""
+
+    def __init__(self, conn, executed):
+        self._cur = conn.cursor()
+        self._executed = executed
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cur.close()
+
+    def execute(self, sql):
+        self._executed.append(sql)
+        if sql.startswith("CREATE TEMP TABLE"):
+            sql = sql.replace(" ON COMMIT DROP", "").replace(" WITH NO DATA", " WHERE 0")
+        self._cur.execute(sql)
+        self.rowcount = self._cur.rowcount
+
+    def copy(self, sql):
+        cur = self._cur
+        placeholders = ", ".join("?" for _ in ARCHIVE_COLUMNS)
+
+        class _Copy:
+            def __enter__(self):
+                self.rows = []
+                return self
+
+            def write_row(self, row):
+                self.rows.append(row)
+
+            def __exit__(self, *exc):
+                cur.executemany(f"INSERT INTO _archive_load VALUES ({placeholders})", self.rows)
+
+        return _Copy()
+
+
+class _SqliteConnection:
+    """Stands in for a psycopg connection to the archive database."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.closed = False
+        self.executed = []
+
+    def cursor(self):
+        return _SqliteCursor(self.conn, self.executed)
+
+    def commit(self):
+        # ON COMMIT DROP
+        self.conn.execute("DROP TABLE IF EXISTS temp._archive_load")
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def archive_db():
+    """In-memory database with an investing_one.daily_indicators table."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("ATTACH ':memory:' AS investing_one")
+    conn.execute(
+        f"CREATE TABLE investing_one.daily_indicators ({', '.join(ARCHIVE_COLUMNS)}, "
+        "PRIMARY KEY (date, symbol))"
+    )
+    yield conn
+    conn.close()
+
+
+class TestArchiveWritePaths:
+    """Tests for chunked, concurrent, RPC and COPY archive writes."""
+
+    @staticmethod
+    def _snapshots(n, **values):
+        return [
+            IndicatorSnapshot(date="2024-01-15", symbol=f"T{i:04d}", close=100.0 + i, **values)
+            for i in range(n)
+        ]
+
+    def test_chunk_records_respects_byte_budget(self):
+        """Chunks stay under the byte budget and keep every record in order."""
+        records = [s.to_dict() for s in self._snapshots(200, rsi=45.0)]
+        record_size = len(json.dumps(records[0]))
+
+        chunks = chunk_records(records, max_bytes=record_size * 10)
+
+        assert [r for chunk in chunks for r in chunk] == records
+        assert all(len(json.dumps(chunk)) <= record_size * 10 + 20 for chunk in chunks)
+        assert len(chunks) > 10
+
+    def test_chunk_records_row_cap_and_oversized_record(self):
+        """max_rows caps a chunk; a record over budget travels alone."""
+        records = [{"symbol": "A" * 100}, {"symbol": "B"}, {"symbol": "C"}, {"symbol": "D"}]
+
+        assert [len(c) for c in chunk_records(records, max_bytes=50)] == [1, 3]
+        assert [len(c) for c in chunk_records(records, max_bytes=10_000, max_rows=2)] == [2, 2]
+
+    @patch("shared_core.archive.supabase_client.ARCHIVE_CONFIG")
+    def test_upsert_sends_chunks_concurrently(self, config):
+        """Upsert chunks run with bounded parallelism and all rows are counted."""
+        config.MODE = "upsert"
+        config.UPSERT_MAX_BATCH_BYTES = 10_000
+        config.UPSERT_MAX_BATCH_ROWS = 1000
+        in_flight, peak, lock = [0], [0], threading.Lock()
+
+        def execute():
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+
+        client = MagicMock()
+        client.schema.return_value.table.return_value.upsert.return_value.execute.side_effect = execute
+        archiver = SupabaseArchiver(url="https://test.supabase.co", key="test-key", max_workers=3)
+        archiver._client = client
+
+        count = archiver.archive_snapshots(self._snapshots(500, rsi=45.0))
+
+        upsert = client.schema.return_value.table.return_value.upsert
+        sent = [r for call in upsert.call_args_list for r in call.args[0]]
+        assert count == 500
+        assert sorted(r["symbol"] for r in sent) == [f"T{i:04d}" for i in range(500)]
+        assert archiver.round_trips == upsert.call_count > 1
+        assert 1 < peak[0] <= 3
+        client.schema.assert_called_with("investing_one")
+
+    def test_upsert_failure_raises(self):
+        """A failed chunk is raised to the caller."""
+        client = MagicMock()
+        client.schema.return_value.table.return_value.upsert.return_value.execute.side_effect = (
+            RuntimeError("boom")
+        )
+        archiver = SupabaseArchiver(url="https://test.supabase.co", key="test-key")
+        archiver._client = client
+
+        with pytest.raises(RuntimeError):
+            archiver.archive_snapshots(self._snapshots(3))
+
+    def test_rpc_mode_sends_one_call(self):
+        """mode='rpc' sends a full universe as one function call."""
+        client = MagicMock()
+        client.schema.return_value.rpc.return_value.execute.return_value.data = 800
+        archiver = SupabaseArchiver(url="https://test.supabase.co", key="test-key")
+        archiver._client = client
+
+        count = archiver.archive_snapshots(self._snapshots(800, rsi=45.0), mode="rpc")
+
+        assert count == 800
+        assert archiver.round_trips == 1
+        name, params = client.schema.return_value.rpc.call_args.args
+        assert name == "bulk_upsert_daily_indicators"
+        assert len(params["rows"]) == 800
+
+    def test_copy_mode_merges_without_overwriting(self, archive_db):
+        """mode='copy' upserts through the stand-in and keeps other scanners' columns."""
+        archiver = SupabaseArchiver(
+            url=None, key=None, dsn="postgresql://local/test",
+            connect=lambda dsn: _SqliteConnection(archive_db),
+        )
+        bullish = self._snapshots(50, rsi=45.0, bullish_score=7.5,
+                                  bullish_components={"trend": 3.0})
+        oversold = self._snapshots(50, oversold_score=4.0)
+
+        assert archiver.archive_snapshots(bullish, mode="copy") == 50
+        assert archiver.archive_snapshots(oversold, mode="copy") == 50
+
+        rows = archive_db.execute(
+            "SELECT COUNT(*), MIN(bullish_score), MIN(oversold_score), MIN(rsi), "
+            "MIN(bullish_components) FROM investing_one.daily_indicators"
+        ).fetchone()
+        assert rows == (50, 7.5, 4.0, 45.0, '{"trend": 3.0}')
+        assert archiver.round_trips == 6
+
+    def test_copy_staging_table_skips_unwritten_columns(self, archive_db):
+        """The staging table holds ARCHIVE_COLUMNS only, not the target's other NOT NULLs."""
+        archive_db.execute(
+            "ALTER TABLE investing_one.daily_indicators "
+            "ADD COLUMN created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP"
+        )
+        conn = _SqliteConnection(archive_db)
+        archiver = SupabaseArchiver(
+            url=None, key=None, dsn="postgresql://local/test", connect=lambda dsn: conn,
+        )
+
+        assert archiver.archive_snapshots(self._snapshots(5, rsi=45.0), mode="copy") == 5
+
+        ddl = conn.executed[0]
+        assert ddl == (
+            f"CREATE TEMP TABLE _archive_load ON COMMIT DROP AS SELECT {', '.join(ARCHIVE_COLUMNS)} "
+            "FROM investing_one.daily_indicators WITH NO DATA"
+        )
+        assert "LIKE" not in ddl and "created_at" not in ddl
+        assert archive_db.execute(
+            "SELECT COUNT(*) FROM investing_one.daily_indicators WHERE created_at IS NOT NULL"
+        ).fetchone() == (5,)
+
+    def test_copy_mode_requires_dsn(self):
+        """Without a DSN the copy path is skipped like an unconfigured upsert."""
+        archiver = SupabaseArchiver(url="https://test.supabase.co", key="test-key", dsn=None)
+        archiver.dsn = None
+
+        assert not archiver.can_archive("copy")
+        assert archiver.archive_snapshots(self._snapshots(2), mode="copy") == 0
+
+    def test_unknown_mode(self):
+        """Unknown write modes are rejected."""
+        archiver = SupabaseArchiver(url="https://test.supabase.co", key="test-key")
+        with pytest.raises(ValueError):
+            archiver.archive_snapshots(self._snapshots(1), mode="bulk")
+
+
 class TestArchiveDailyIndicators:
     """Tests for the archive_daily_indicators convenience function."""
 
@@ -317,6 +544,74 @@ class TestMonthlyAggregator:
         assert MonthlyAggregator.RETENTION_DAYS == 90
 
 
+class TestServerSideAggregation:
+    """Tests for aggregate_month's server-side and fallback paths."""
+
+    @staticmethod
+    def _aggregator(client):
+        aggregator = MonthlyAggregator(url="https://test.supabase.co", key="test-key")
+        aggregator._client = client
+        return aggregator
+
+    def test_aggregate_month_uses_rpc(self):
+        """The month is aggregated by the database; no daily rows are downloaded."""
+        client = MagicMock()
+        client.rpc.return_value.execute.return_value.data = 503
+
+        count = self._aggregator(client).aggregate_month("2024-01")
+
+        assert count == 503
+        client.rpc.assert_called_once_with(
+            "aggregate_monthly_indicators", {"month_start": "2024-01-01"}
+        )
+        client.table.assert_not_called()
+
+    def test_aggregate_month_falls_back_without_rpc(self):
+        """Without the function, rows are fetched and aggregated client-side."""
+        client = MagicMock()
+        client.rpc.side_effect = Exception("function does not exist")
+        query = client.table.return_value.select.return_value.gte.return_value.lt.return_value
+        query.order.return_value.execute.return_value.data = [
+            {"symbol": "AAPL", "date": "2024-01-02", "close": 100.0, "rsi": 25.0},
+            {"symbol": "MSFT", "date": "2024-01-02", "close": 300.0, "rsi": 50.0},
+            {"symbol": "AAPL", "date": "2024-01-03", "close": 110.0, "rsi": 35.0},
+        ]
+
+        count = self._aggregator(client).aggregate_month("2024-12")
+
+        assert count == 2
+        select = client.table.return_value.select
+        assert "*" not in select.call_args.args[0]
+        select.return_value.gte.assert_called_with("date", "2024-12-01")
+        select.return_value.gte.return_value.lt.assert_called_with("date", "2025-01-01")
+        records = client.table.return_value.upsert.call_args.args[0]
+        assert [(r["symbol"], r["monthly_return"]) for r in records] == [
+            ("AAPL", 10.0), ("MSFT", 0.0),
+        ]
+
+    def test_aggregate_daily_rows_groups_symbols(self):
+        """aggregate_daily_rows orders by date within each symbol."""
+        import pandas as pd
+
+        rows = pd.DataFrame([
+            {"symbol": "AAPL", "date": "2024-01-03", "close": 150.0, "rsi": 75.0},
+            {"symbol": "MSFT", "date": "2024-01-02", "close": 0.0, "rsi": None},
+            {"symbol": "AAPL", "date": "2024-01-02", "close": 140.0, "rsi": 25.0},
+            {"symbol": "MSFT", "date": "2024-01-03", "close": 310.0, "rsi": 60.0},
+        ])
+
+        aggregates = {a.symbol: a for a in aggregate_daily_rows("2024-01", rows)}
+        aapl, msft = aggregates["AAPL"], aggregates["MSFT"]
+
+        assert len(aggregates) == 2
+        assert (aapl.symbol, aapl.open_price, aapl.close_price) == ("AAPL", 140.0, 150.0)
+        assert (aapl.days_oversold, aapl.days_overbought) == (1, 1)
+        assert aapl.monthly_return == 7.1429
+        assert (msft.symbol, msft.open_price, msft.low_price) == ("MSFT", 310.0, 310.0)
+        assert msft.avg_rsi == 60.0
+        assert msft.avg_bullish_score is None
+
+
 class TestRunMonthlyAggregation:
     """Tests for the run_monthly_aggregation convenience function."""
 
@@ -186,6 +186,52 @@ class TestBacktestEngine:
         # May or may not have signals depending on random data
         assert isinstance(result.signals, list)
 
+    @pytest.mark.parametrize("signal_type", [
+        SignalType.UPSIDE_REVERSAL, SignalType.DOWNSIDE_REVERSAL,
+    ])
+    def test_incremental_scan_matches_rolling_scan(self, signal_type):
+        """Incremental scan must reproduce the rolling-window scan exactly."""
+        df = create_mock_dataframe(600)
+        df['OBV'] = (np.sign(df['close'].diff()).fillna(0) * df['volume']).cumsum()
+        # Zero MACD_SIGNAL exercises the MACD_Signal fallback lookup
+        df.loc[300:305, 'MACD_SIGNAL'] = 0.0
+
+        rolling = BacktestEngine(incremental=False)._scan_ticker(
+            'AAPL', df.copy(), signal_type, None, None
+        )
+        incremental = BacktestEngine()._scan_ticker_incremental(
+            'AAPL', df.copy(), signal_type, None, None
+        )
+
+        assert len(rolling) > 0
+        assert incremental == rolling
+
+    def test_incremental_scan_has_no_lookahead(self):
+        """Changing future bars must not change signals dated before them."""
+        df = create_mock_dataframe(600)
+        cutoff = 400
+        altered = df.copy()
+        altered.loc[cutoff:, ['close', 'high', 'low', 'RSI', 'MACD']] *= 1.5
+
+        engine = BacktestEngine()
+        original = engine._scan_ticker_incremental(
+            'AAPL', df, SignalType.UPSIDE_REVERSAL, None, None
+        )
+        changed = engine._scan_ticker_incremental(
+            'AAPL', altered, SignalType.UPSIDE_REVERSAL, None, None
+        )
+
+        cutoff_date = df['datetime'].iloc[cutoff].date()
+        last_forward_date = df['datetime'].iloc[cutoff - HORIZON_DAYS['6m']].date()
+        before = lambda signals: [
+            (s.signal_date, s.score, s.conviction) for s in signals
+            if s.signal_date < cutoff_date
+        ]
+        assert before(original) == before(changed)
+        # Forward returns only look ahead, so signals well before the change are untouched
+        assert [s for s in original if s.signal_date < last_forward_date] == \
+            [s for s in changed if s.signal_date < last_forward_date]
+
     def test_forward_return_calculation(self):
         """Test forward return calculation."""
         engine = BacktestEngine()
@@ -204,6 +250,81 @@ class TestBacktestEngine:
         assert 'max_gain_2w' in returns
         assert 'max_loss_2w' in returns
 
+    def test_forward_return_table_matches_per_signal(self):
+        """Vectorized forward returns equal the per-signal lookup at every row."""
+        engine = BacktestEngine()
+        df = create_mock_dataframe(400).set_index('datetime')
+
+        table = engine._forward_return_table(df)
+
+        for i in range(len(df)):
+            expected = engine._calculate_forward_returns(df, i, float(df['close'].iloc[i]))
+            for name, value in expected.items():
+                got = table[name][i]
+                assert (value is None) == np.isnan(got)
+                if value is not None:
+                    assert round(float(got), 2) == value
+
+
+class TestParameterSweep:
+    """Tests for sweeping many ScoringConfigs over shared precomputation."""
+
+    def test_sweep_matches_individual_backtests(self):
+        from shared_core.backtest.engine import DEFAULT_WEIGHTS, scoring_grid
+
+        ticker_data = {'AAPL': create_mock_dataframe(600), 'MSFT': create_mock_dataframe(450)}
+        configs = scoring_grid(
+            low_score_min=[4.0, 5.0],
+            high_adx_max=[30.0, 35.0],
+            weights=[DEFAULT_WEIGHTS, {**DEFAULT_WEIGHTS, 'rsi': 0.4, 'volume': 0.0}],
+        )
+
+        results = BacktestEngine().sweep(ticker_data, configs, SignalType.UPSIDE_REVERSAL)
+
+        assert len(results) == len(configs) == 8
+        for config, result in zip(configs, results):
+            expected = BacktestEngine(config).run_backtest(ticker_data, SignalType.UPSIDE_REVERSAL)
+            assert result.signals == expected.signals
+            assert result.metrics_2m == expected.metrics_2m
+        assert len({len(r.signals) for r in results}) > 1
+
+        # Non-default weights and thresholds through the original scalar scan
+        rolling = BacktestEngine(configs[-1], incremental=False).run_backtest(
+            {t: df.copy() for t, df in ticker_data.items()}, SignalType.UPSIDE_REVERSAL
+        )
+        assert results[-1].signals == rolling.signals
+
+    def test_unknown_weight_rejected(self):
+        with pytest.raises(ValueError, match="Unknown score components"):
+            ScoringConfig(weights={'rsi': 1.0, 'momentum': 0.5})
+
+
+class TestParallelRunner:
+    """Tests for the sharded multi-process runner."""
+
+    def test_matches_serial_backtest(self, tmp_path):
+        from shared_core.backtest.runner import load_from_cache, run_parallel_backtest
+        from shared_core.cache.data_cache import DataCache
+
+        cache = DataCache(tmp_path, storage_format='npz')
+        tickers = ['AAPL', 'MSFT', 'NVDA', 'SHORT', 'MISSING']
+        for days, ticker in zip((500, 550, 600, 200), tickers):
+            cache.save_twelve_data(ticker, create_mock_dataframe(days))
+
+        serial = BacktestEngine().run_backtest(
+            load_from_cache(str(tmp_path), tickers), SignalType.UPSIDE_REVERSAL
+        )
+        parallel = run_parallel_backtest(
+            str(tmp_path), tickers, SignalType.UPSIDE_REVERSAL,
+            workers=2, shard_size=2,
+        )
+
+        assert parallel.tickers == serial.tickers == ['AAPL', 'MSFT', 'NVDA']
+        assert len(parallel.signals) > 0
+        assert parallel.signals == serial.signals
+        assert parallel.metrics_6m == serial.metrics_6m
+        assert parallel.metrics_by_conviction == serial.metrics_by_conviction
+
 
 class TestHorizonMetrics:
     """Tests for HorizonMetrics calculation."""
@@ -261,6 +382,35 @@ class TestHorizonMetrics:
         assert metrics.best_return == 10.0
         assert metrics.worst_return == -5.0
 
+    def test_metrics_by_conviction_and_missing_data(self):
+        """Grouped metrics skip signals without forward data."""
+        def signal(conviction, return_2w):
+            return SignalEvent(
+                ticker="AAPL", signal_date=date(2024, 1, 1),
+                signal_type=SignalType.UPSIDE_REVERSAL, conviction=conviction,
+                score=7.0, volume_ratio=1.0, adx_value=25.0, price_at_signal=100.0,
+                return_2w=return_2w, max_gain_2w=None if return_2w is None else 4.0,
+                max_loss_2w=None if return_2w is None else -2.0,
+            )
+
+        signals = [
+            signal(ConvictionLevel.HIGH, 6.0),
+            signal(ConvictionLevel.HIGH, None),
+            signal(ConvictionLevel.MEDIUM, -2.0),
+            signal(ConvictionLevel.MEDIUM, 0.0),
+            signal(ConvictionLevel.MEDIUM, 4.0),
+        ]
+
+        result = BacktestEngine().summarize(['AAPL'], signals)
+
+        high = result.metrics_by_conviction[ConvictionLevel.HIGH]['2w']
+        medium = result.metrics_by_conviction[ConvictionLevel.MEDIUM]['2w']
+        assert (high.total_signals, high.signals_with_data, high.win_rate) == (2, 1, 100.0)
+        assert (medium.winners, medium.losers, medium.median_return) == (1, 2, 0.0)
+        assert result.metrics_2w.avg_max_loss == -2.0
+        assert result.metrics_6m.signals_with_data == 0
+        assert ConvictionLevel.LOW not in result.metrics_by_conviction
+
 
 class TestReportGeneration:
     """Tests for report generation."""
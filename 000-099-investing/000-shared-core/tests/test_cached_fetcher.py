@@ -301,6 +301,57 @@ class TestCacheFormatConversion:
             mock_get.assert_called_once()
 
 
+class TestBinaryCacheFormats:
+    """Tests for reading binary (npz) cache files."""
+
+    def _write_npz(self, temp_cache_dir, symbol, sample_cache_data):
+        import pandas as pd
+        from shared_core.cache.storage import get_storage
+
+        df = pd.DataFrame(sample_cache_data)
+        df["datetime"] = pd.to_datetime(df["datetime"])
+        today = datetime.date.today().isoformat()
+        get_storage("npz").write(df, temp_cache_dir / f"{symbol}_{today}.npz")
+        return df
+
+    def test_npz_matches_json_api_format(self, fetcher, temp_cache_dir, sample_cache_data):
+        """Binary cache files produce the same API-format rows as JSON ones."""
+        today = datetime.date.today().isoformat()
+        with open(temp_cache_dir / f"JSON_{today}.json", 'w') as f:
+            json.dump(sample_cache_data, f)
+        self._write_npz(temp_cache_dir, "BIN", sample_cache_data)
+
+        from_json = fetcher.get_cached_data("JSON")
+        from_npz = fetcher.get_cached_data("BIN")
+
+        assert from_npz["values"] == from_json["values"]
+        assert from_npz["meta"]["source"] == "cache"
+        assert fetcher.is_cached("BIN")
+
+    def test_get_cached_dataframe_is_typed(self, fetcher, temp_cache_dir, sample_cache_data):
+        """get_cached_dataframe returns numeric columns without string parsing."""
+        expected = self._write_npz(temp_cache_dir, "AAPL", sample_cache_data)
+
+        df = fetcher.get_cached_dataframe("AAPL")
+
+        assert df is not None
+        assert df["close"].dtype == float
+        assert df["close"].tolist() == expected["close"].tolist()
+
+    def test_get_cached_dataframe_reads_json(self, fetcher, temp_cache_dir, sample_cache_data):
+        today = datetime.date.today().isoformat()
+        with open(temp_cache_dir / f"AAPL_{today}.json", 'w') as f:
+            json.dump(sample_cache_data, f)
+
+        df = fetcher.get_cached_dataframe("AAPL")
+
+        assert df is not None
+        assert len(df) == 5
+
+    def test_get_cached_dataframe_miss(self, fetcher):
+        assert fetcher.get_cached_dataframe("MISSING") is None
+
+
 class TestBatchFetching:
     """Tests for batch fetching with cache support."""
     
@@ -461,3 +512,275 @@ class TestKeyRotation:
         # Should only call API once (not 3 * 3 = 9 times)
         assert mock_get.call_count == 1
 
+
+
+class TestTokenBucket:
+    """Tests for the per-key credit bucket."""
+
+    def test_burst_then_refill(self):
+        from shared_core.market_data.rate_limiter import TokenBucket
+
+        now = [0.0]
+        bucket = TokenBucket(capacity=2, rate=1.0, clock=lambda: now[0])
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(1.0)
+
+        now[0] = 0.5
+        assert bucket.try_acquire() == pytest.approx(0.5)
+        now[0] = 1.0
+        assert bucket.try_acquire() == 0.0
+
+    def test_refill_capped_at_capacity(self):
+        from shared_core.market_data.rate_limiter import TokenBucket
+
+        now = [0.0]
+        bucket = TokenBucket(capacity=2, rate=1.0, clock=lambda: now[0])
+        now[0] = 100.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() > 0.0
+
+
+class TestKeyScheduler:
+    """Tests for handing out keys within their credit budgets."""
+
+    def test_fails_over_to_next_key(self):
+        from shared_core.market_data.rate_limiter import KeyScheduler
+
+        scheduler = KeyScheduler(num_keys=2, requests_per_minute=None)
+        first = scheduler.acquire()
+        scheduler.mark_exhausted(first)
+
+        second = scheduler.acquire()
+        assert second != first
+        scheduler.release(second)
+        assert scheduler.live_keys() == [second]
+
+        scheduler.mark_exhausted(scheduler.acquire())
+        assert scheduler.acquire() is None
+        assert scheduler.all_exhausted
+
+    def test_unverified_key_serves_one_request(self):
+        from shared_core.market_data.rate_limiter import KeyScheduler
+
+        scheduler = KeyScheduler(num_keys=2, requests_per_minute=None)
+        assert scheduler.acquire() == 0
+        # Key 0 has a request in flight and no success yet, so key 1 is used
+        assert scheduler.acquire() == 1
+
+        scheduler.release(0)
+        assert scheduler.acquire() == 0
+        assert scheduler.acquire() == 0
+
+
+    @staticmethod
+    def _fake_clock(scheduler):
+        """Make the scheduler's waits advance a fake clock instead of sleeping."""
+        now = [0.0]
+        scheduler._clock = lambda: now[0]
+        for bucket in scheduler._buckets:
+            if bucket:
+                bucket._clock = scheduler._clock
+                bucket._updated = 0.0
+
+        def wait(timeout=None):
+            now[0] += timeout
+            return False
+
+        scheduler._cond.wait = wait
+        return now
+
+    def test_first_minute_stays_within_budget(self):
+        """A fresh key sends at most requests_per_minute calls in its first 60 s."""
+        from shared_core.market_data.rate_limiter import KeyScheduler
+
+        scheduler = KeyScheduler(num_keys=1, requests_per_minute=8)
+        now = self._fake_clock(scheduler)
+
+        sent = []
+        while True:
+            index = scheduler.acquire()
+            if now[0] >= 60:
+                break
+            sent.append(now[0])
+            scheduler.release(index)
+
+        assert len(sent) == 8
+        assert sent == pytest.approx([7.5 * n for n in range(8)])
+
+    def test_back_off_pauses_key_without_dropping_it(self):
+        from shared_core.market_data.rate_limiter import KeyScheduler
+
+        scheduler = KeyScheduler(num_keys=1, requests_per_minute=None)
+        now = self._fake_clock(scheduler)
+
+        scheduler.back_off(scheduler.acquire(), 60)
+
+        assert scheduler.acquire() == 0
+        assert now[0] == pytest.approx(60)
+        assert scheduler.live_keys() == [0]
+
+
+class TestConcurrentBatch:
+    """Tests for concurrent, credit-budgeted batch fetching."""
+
+    @staticmethod
+    def _response(payload):
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json.return_value = payload
+        return response
+
+    def test_batch_is_not_paced_by_sleep_delay(self, temp_cache_dir):
+        """Fetching within the credit budget should not wait rate_limit_delay."""
+        import time
+
+        f = CacheAwareFetcher(
+            api_key="key1", cache_dir=temp_cache_dir,
+            rate_limit_delay=30.0, requests_per_minute=600,
+        )
+        good = self._response({
+            "values": [{"datetime": "2025-12-01", "close": "100.0"}],
+            "status": "ok",
+        })
+
+        with patch('shared_core.market_data.cached_fetcher.requests.get') as mock_get:
+            mock_get.return_value = good
+            start = time.monotonic()
+            results = f.fetch_batch(["AAPL", "NVDA", "TSLA", "MSFT"])
+            elapsed = time.monotonic() - start
+
+        assert list(results) == ["AAPL", "NVDA", "TSLA", "MSFT"]
+        assert all(r["meta"]["source"] == "api" for r in results.values())
+        assert elapsed < 5
+
+    def test_batch_fails_over_between_keys(self, temp_cache_dir):
+        """Tickers hitting an exhausted key are retried on the other key."""
+        f = CacheAwareFetcher(
+            api_key="key1", api_keys=["key1", "key2"], cache_dir=temp_cache_dir,
+            requests_per_minute=600,
+        )
+        exhausted = self._response({"status": "error", "message": "out of credits"})
+
+        def fake_get(url, params, timeout):
+            if params["apikey"] == "key1":
+                return exhausted
+            return self._response({
+                "values": [{"datetime": "2025-12-01", "close": "100.0"}],
+                "status": "ok",
+            })
+
+        with patch('shared_core.market_data.cached_fetcher.requests.get', side_effect=fake_get) as mock_get:
+            results = f.fetch_batch(["AAPL", "NVDA", "TSLA"])
+
+        assert all(results[s] is not None for s in ["AAPL", "NVDA", "TSLA"])
+        key1_calls = [c for c in mock_get.call_args_list if c.kwargs["params"]["apikey"] == "key1"]
+        assert len(key1_calls) == 1
+        assert f.api_key == "key2"
+
+    def test_per_minute_limit_requeues_instead_of_exhausting(self, temp_cache_dir):
+        """A per-minute credit error pauses the only key; no symbol is dropped."""
+        f = CacheAwareFetcher(
+            api_key="key1", cache_dir=temp_cache_dir, requests_per_minute=600,
+        )
+        f.rate_limit_backoff = 0.05
+        limited = self._response({
+            "status": "error", "code": 429,
+            "message": "You have run out of API credits for the current minute.",
+        })
+        good = self._response({
+            "values": [{"datetime": "2025-12-01", "close": "100.0"}],
+            "status": "ok",
+        })
+
+        with patch('shared_core.market_data.cached_fetcher.requests.get',
+                   side_effect=[limited, good, good, good]) as mock_get:
+            results = f.fetch_batch(["AAPL", "NVDA", "TSLA"])
+
+        assert all(results[s] is not None for s in ["AAPL", "NVDA", "TSLA"])
+        assert mock_get.call_count == 4
+        assert f.api_key == "key1"
+
+    def test_iter_batch_streams_cache_hits_first(self, fetcher, temp_cache_dir, sample_cache_data):
+        today = datetime.date.today().isoformat()
+        with open(temp_cache_dir / f"MSFT_{today}.json", 'w') as f:
+            json.dump(sample_cache_data, f)
+
+        with patch('shared_core.market_data.cached_fetcher.requests.get') as mock_get:
+            mock_get.return_value = self._response({
+                "values": [{"datetime": "2025-12-01", "close": "100.0"}],
+                "status": "ok",
+            })
+            streamed = list(fetcher.iter_batch(["AAPL", "MSFT"]))
+
+        assert streamed[0][0] == "MSFT"
+        assert streamed[0][1]["meta"]["source"] == "cache"
+        assert streamed[1][0] == "AAPL"
+
+
+class TestDeltaRefresh:
+    """Tests for fetching only the bars since an earlier cache file."""
+
+    @staticmethod
+    def _response(rows):
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json.return_value = {"values": [
+            {"datetime": d, "open": str(c), "high": str(c), "low": str(c),
+             "close": str(c), "volume": "1000"}
+            for d, c in reversed(rows)
+        ], "status": "ok"}
+        return response
+
+    @pytest.fixture
+    def yesterday_file(self, temp_cache_dir):
+        import pandas as pd
+
+        today = datetime.date.today()
+        dates = [today - datetime.timedelta(days=n) for n in range(5, 0, -1)]
+        df = pd.DataFrame({
+            "datetime": pd.to_datetime(dates),
+            "open": [100.0, 101.0, 102.0, 103.0, 104.0],
+            "high": [101.0, 102.0, 103.0, 104.0, 105.0],
+            "low": [99.0, 100.0, 101.0, 102.0, 103.0],
+            "close": [100.5, 101.5, 102.5, 103.5, 104.5],
+            "volume": [1000] * 5,
+        })
+        df.to_json(temp_cache_dir / f"AAPL_{dates[-1].isoformat()}.json", date_format="iso")
+        return dates
+
+    def test_fetch_merges_delta(self, fetcher, yesterday_file):
+        anchor, last = yesterday_file[-2].isoformat(), yesterday_file[-1].isoformat()
+        today = datetime.date.today().isoformat()
+
+        with patch('shared_core.market_data.cached_fetcher.requests.get') as mock_get:
+            mock_get.return_value = self._response(
+                [(anchor, 103.5), (last, 104.0), (today, 106.0)]
+            )
+            result = fetcher.fetch("AAPL")
+
+        assert mock_get.call_args.kwargs["params"]["start_date"] == anchor
+        assert result["meta"]["source"] == "delta"
+        assert [v["close"] for v in result["values"]] == [
+            "100.5", "101.5", "102.5", "103.5", "104.0", "106.0"
+        ]
+        assert result["values"][-1]["datetime"] == today
+
+    def test_batch_refetches_on_split(self, fetcher, yesterday_file):
+        anchor = yesterday_file[-2].isoformat()
+        full = MagicMock()
+        full.raise_for_status = MagicMock()
+        full.json.return_value = {
+            "values": [{"datetime": "2025-12-01", "close": "50.0"}],
+            "status": "ok",
+        }
+
+        with patch('shared_core.market_data.cached_fetcher.requests.get') as mock_get:
+            mock_get.side_effect = [self._response([(anchor, 51.75)]), full]
+            results = fetcher.fetch_batch(["AAPL"])
+
+        assert mock_get.call_count == 2
+        assert "start_date" not in mock_get.call_args.kwargs["params"]
+        assert results["AAPL"]["meta"]["source"] == "api"
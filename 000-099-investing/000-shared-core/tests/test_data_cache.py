@@ -172,3 +172,472 @@ class TestCacheVerbose:
         captured = capsys.readouterr()
         assert "Cached" in captured.out or "hit" in captured.out
 
+
+
+class TestStorageFormats:
+    """Tests for pluggable time series storage formats."""
+
+    def test_npz_round_trip_preserves_types(self, temp_cache_dir, sample_df):
+        cache = DataCache(temp_cache_dir, storage_format='npz')
+        cache.save_twelve_data("AAPL", sample_df)
+
+        assert cache._get_twelve_data_path("AAPL").suffix == ".npz"
+        result = cache.get_twelve_data("AAPL")
+
+        pd.testing.assert_frame_equal(result, sample_df)
+        assert pd.api.types.is_datetime64_any_dtype(result['datetime'])
+
+    def test_npz_preserves_datetime_index(self, temp_cache_dir, sample_df):
+        cache = DataCache(temp_cache_dir, storage_format='npz')
+        indexed = sample_df.set_index('datetime')
+        cache.save_twelve_data("AAPL", indexed)
+
+        result = cache.get_twelve_data("AAPL")
+        pd.testing.assert_frame_equal(result, indexed, check_freq=False)
+
+    def test_format_from_environment(self, temp_cache_dir, monkeypatch):
+        monkeypatch.setenv('CACHE_FORMAT', 'npz')
+        cache = DataCache(temp_cache_dir)
+        assert cache.storage.name == 'npz'
+
+    def test_unknown_format_raises(self, temp_cache_dir):
+        with pytest.raises(ValueError, match="Unknown cache format"):
+            DataCache(temp_cache_dir, storage_format='csv')
+
+    def test_json_file_migrates_on_read(self, temp_cache_dir, sample_df):
+        DataCache(temp_cache_dir).save_twelve_data("AAPL", sample_df)
+        json_path = temp_cache_dir / "twelve_data" / f"AAPL_{datetime.date.today().isoformat()}.json"
+        assert json_path.exists()
+
+        cache = DataCache(temp_cache_dir, storage_format='npz')
+        result = cache.get_twelve_data("AAPL")
+
+        assert result is not None
+        assert len(result) == len(sample_df)
+        assert not json_path.exists()
+        assert cache._get_twelve_data_path("AAPL").exists()
+        pd.testing.assert_frame_equal(cache.get_twelve_data("AAPL"), result)
+
+    def test_migrate_twelve_data(self, temp_cache_dir, sample_df):
+        json_cache = DataCache(temp_cache_dir)
+        json_cache.save_twelve_data("AAPL", sample_df)
+        json_cache.save_twelve_data("NVDA", sample_df)
+        old_date = (datetime.date.today() - datetime.timedelta(days=3)).isoformat()
+        sample_df.to_json(temp_cache_dir / "twelve_data" / f"MSFT_{old_date}.json")
+
+        cache = DataCache(temp_cache_dir, storage_format='npz')
+        assert cache.migrate_twelve_data() == 3
+
+        files = sorted(p.name for p in (temp_cache_dir / "twelve_data").iterdir())
+        assert all(name.endswith(".npz") for name in files)
+        assert f"MSFT_{old_date}.npz" in files
+
+    def test_listing_and_stats_cover_all_formats(self, temp_cache_dir, sample_df):
+        DataCache(temp_cache_dir).save_twelve_data("AAPL", sample_df)
+        cache = DataCache(temp_cache_dir, storage_format='npz')
+        cache.save_twelve_data("NVDA", sample_df)
+
+        assert cache.list_cached_tickers('twelve_data') == ['AAPL', 'NVDA']
+        assert cache.get_cache_stats()['twelve_data_today'] == 2
+        assert cache.clear_all_cache() == 2
+
+    def test_interrupted_json_write_keeps_previous_file(self, temp_cache_dir, sample_df, monkeypatch):
+        """JSON writes go through a temp file, so a failed write never truncates."""
+        from shared_core.cache.storage import get_storage
+
+        storage = get_storage("json")
+        path = temp_cache_dir / "AAPL_2025-12-19.json"
+        storage.write(sample_df, path)
+        before = path.read_bytes()
+
+        def interrupted(self, target, **kwargs):
+            Path(target).write_text('{"datetime": {"0"')
+            raise OSError("disk full")
+
+        monkeypatch.setattr(pd.DataFrame, "to_json", interrupted)
+        with pytest.raises(OSError):
+            storage.write(sample_df, path)
+
+        assert path.read_bytes() == before
+
+    def test_corrupted_npz_returns_none(self, temp_cache_dir):
+        cache = DataCache(temp_cache_dir, storage_format='npz')
+        cache._get_twelve_data_path("BAD").write_bytes(b"not an archive")
+        assert cache.get_twelve_data("BAD") is None
+
+
+class TestCacheIndex:
+    """Tests for the cache file index."""
+
+    def test_save_records_metadata(self, cache, sample_df):
+        cache.save_twelve_data("AAPL", sample_df)
+
+        entry = cache.twelve_data_index.find("AAPL", cache.today)
+        path = cache.twelve_data_dir / entry.filename
+        assert entry.rows == 100
+        assert entry.size_bytes == path.stat().st_size
+        assert pd.Timestamp(entry.last_bar) == sample_df['datetime'].max()
+        assert cache.has_twelve_data("aapl")
+        assert not cache.has_twelve_data("AAPL", "2000-01-01")
+
+    def test_external_files_are_picked_up(self, cache, sample_df):
+        cache.save_twelve_data("AAPL", sample_df)
+        assert cache.list_cached_tickers() == ['AAPL']
+
+        sample_df.to_json(cache.twelve_data_dir / f"MSFT_{cache.today}.json")
+        (cache.twelve_data_dir / f"AAPL_{cache.today}{cache.storage.suffix}").unlink()
+
+        assert cache.list_cached_tickers() == ['MSFT']
+        entry = cache.twelve_data_index.find("MSFT", cache.today)
+        assert entry.rows is None
+        assert entry.size_bytes > 0
+
+    def test_index_shared_between_instances(self, temp_cache_dir, sample_df):
+        DataCache(temp_cache_dir).save_twelve_data("AAPL", sample_df)
+        DataCache(temp_cache_dir).save_transcript("AAPL", {'Period': 'Q1'})
+
+        cache = DataCache(temp_cache_dir)
+        assert cache.has_twelve_data("AAPL")
+        assert cache.has_transcript("AAPL")
+        assert cache.list_cached_tickers('transcripts') == ['AAPL']
+        assert (temp_cache_dir / "cache_index.sqlite").exists()
+
+    def test_stats_match_directory(self, cache, sample_df):
+        for ticker in ("AAPL", "NVDA"):
+            cache.save_twelve_data(ticker, sample_df)
+        cache.save_transcript("AAPL", {'Period': 'Q1'})
+
+        files = list(cache.twelve_data_dir.iterdir()) + list(cache.transcripts_dir.iterdir())
+        total_mb = round(sum(f.stat().st_size for f in files) / (1024 * 1024), 2)
+        assert cache.get_cache_stats()['total_size_mb'] == total_mb
+
+
+class TestCompaction:
+    """Tests for folding dated snapshots into per-ticker histories."""
+
+    @staticmethod
+    def _save_days(cache, ticker, days, bars=300):
+        """Save one delta-style snapshot per day ending today; returns {date: df}."""
+        import numpy as np
+
+        today = datetime.date.fromisoformat(cache.today)
+        rng = np.random.default_rng(len(ticker))
+        dates = pd.date_range(end=today, periods=bars + days - 1, freq='D')
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.01, len(dates)))
+        full = pd.DataFrame({
+            'datetime': dates, 'open': close, 'high': close * 1.01,
+            'low': close * 0.99, 'close': close,
+            'volume': rng.integers(1_000, 10_000, len(dates)),
+        })
+
+        saved = {}
+        for k in range(days):
+            snapshot = full.iloc[k:k + bars].reset_index(drop=True)
+            # Last bar fetched intraday, finalized by the next day's snapshot
+            snapshot.loc[bars - 1, 'close'] += 0.5
+            date = snapshot['datetime'].iloc[-1].date().isoformat()
+            cache.today, real_today = date, cache.today
+            cache.save_twelve_data(ticker, snapshot)
+            cache.today = real_today
+            saved[date] = snapshot
+        return saved
+
+    @staticmethod
+    def _read(cache, ticker, date):
+        from shared_core.cache.storage import find_cache_file, read_cache_file
+        return read_cache_file(find_cache_file(cache.twelve_data_dir, ticker, date))
+
+    @pytest.mark.parametrize("fmt", ["json", "npz"])
+    def test_pointers_read_back_exactly(self, temp_cache_dir, fmt):
+        cache = DataCache(temp_cache_dir, storage_format=fmt)
+        saved = self._save_days(cache, "AAPL", days=6)
+        before = {date: self._read(cache, "AAPL", date) for date in saved}
+
+        report = cache.compact(max_bytes=None, max_age_days=None)
+
+        assert report.folded == 5
+        assert report.bytes_after < report.bytes_before / 2
+        assert len(list(cache.twelve_data_dir.glob("AAPL_*.ptr"))) == 5
+        assert (cache.twelve_data_dir / f"AAPL_{cache.today}.{fmt}").exists()
+        for date, df in before.items():
+            pd.testing.assert_frame_equal(self._read(cache, "AAPL", date), df)
+
+    def test_recompaction_absorbs_new_days(self, temp_cache_dir):
+        cache = DataCache(temp_cache_dir, storage_format="npz")
+        saved = self._save_days(cache, "AAPL", days=5)
+        last = max(saved)
+        (cache.twelve_data_dir / f"AAPL_{last}.npz").unlink()
+        cache.today, today = sorted(saved)[-2], cache.today
+        cache.compact(max_bytes=None, max_age_days=None)
+
+        cache.today = today
+        cache.save_twelve_data("AAPL", saved[last])
+        report = cache.compact(max_bytes=None, max_age_days=None)
+
+        assert report.folded == 1
+        assert len(list((cache.twelve_data_dir / "history").iterdir())) == 1
+        for date, df in saved.items():
+            pd.testing.assert_frame_equal(self._read(cache, "AAPL", date), df)
+        assert cache.get_previous_twelve_data("AAPL") is not None
+
+    def test_resave_replaces_pointer(self, temp_cache_dir):
+        cache = DataCache(temp_cache_dir, storage_format="npz")
+        saved = self._save_days(cache, "AAPL", days=3)
+        cache.compact(max_bytes=None, max_age_days=None)
+        first = min(saved)
+        revised = saved[first].assign(close=saved[first]['close'] + 1)
+
+        cache.today, today = first, cache.today
+        cache.save_twelve_data("AAPL", revised)
+        cache.today = today
+
+        assert not (cache.twelve_data_dir / f"AAPL_{first}.ptr").exists()
+        pd.testing.assert_frame_equal(self._read(cache, "AAPL", first), revised)
+
+    def test_split_snapshot_stays_full(self, temp_cache_dir):
+        cache = DataCache(temp_cache_dir, storage_format="npz")
+        saved = self._save_days(cache, "AAPL", days=3)
+        first = min(saved)
+        pre_split = saved[first].assign(close=saved[first]['close'] * 4)
+        cache.today, today = first, cache.today
+        cache.save_twelve_data("AAPL", pre_split)
+        cache.today = today
+
+        report = cache.compact(max_bytes=None, max_age_days=None)
+
+        assert report.folded == 1
+        assert (cache.twelve_data_dir / f"AAPL_{first}.npz").exists()
+        pd.testing.assert_frame_equal(self._read(cache, "AAPL", first), pre_split)
+
+    def test_age_limit(self, temp_cache_dir):
+        cache = DataCache(temp_cache_dir, storage_format="npz")
+        saved = self._save_days(cache, "AAPL", days=6)
+
+        report = cache.compact(max_bytes=None, max_age_days=2)
+
+        assert report.expired == 3
+        assert cache.twelve_data_index.dates() == sorted(saved, reverse=True)[:3]
+
+    def test_evicts_least_recently_read(self, temp_cache_dir):
+        cache = DataCache(temp_cache_dir, storage_format="npz")
+        for ticker in ("AAPL", "MSFT", "NVDA"):
+            self._save_days(cache, ticker, days=3)
+        cache.get_twelve_data("NVDA")
+        cache.get_twelve_data("AAPL")
+        compacted = cache.compact(max_bytes=None, max_age_days=None).bytes_after
+
+        assert cache.compact(max_bytes=compacted - 1, max_age_days=None).evicted == ["MSFT"]
+        report = cache.compact(max_bytes=compacted // 2, max_age_days=None)
+
+        assert report.evicted == ["NVDA", "AAPL"]
+        assert not list(cache.twelve_data_dir.glob("*.ptr"))
+        assert cache.has_twelve_data("NVDA")
+        assert cache.list_cached_tickers() == ["AAPL", "MSFT", "NVDA"]
+
+
+class TestFrameCache:
+    """Tests for the in-process LRU of parsed cache files."""
+
+    @pytest.fixture
+    def frames(self):
+        from shared_core.cache.frame_cache import FrameCache
+        return FrameCache()
+
+    def test_repeated_reads_parse_once(self, temp_cache_dir, sample_df, frames):
+        cache = DataCache(temp_cache_dir, frame_cache=frames)
+        cache.save_twelve_data("AAPL", sample_df)
+
+        first = cache.get_twelve_data("AAPL")
+        second = cache.get_twelve_data("AAPL")
+
+        assert (frames.misses, frames.hits) == (1, 1)
+        pd.testing.assert_frame_equal(first, second)
+        pd.testing.assert_frame_equal(first, DataCache(temp_cache_dir).get_twelve_data("AAPL"))
+
+    def test_views_are_read_only(self, temp_cache_dir, sample_df, frames):
+        cache = DataCache(temp_cache_dir, frame_cache=frames)
+        cache.save_twelve_data("AAPL", sample_df)
+        df = cache.get_twelve_data("AAPL")
+
+        with pytest.raises(ValueError):
+            df.loc[0, 'close'] = -1.0
+        df['close'] = df['close'] * 2
+        df['RSI'] = 50.0
+
+        again = cache.get_twelve_data("AAPL")
+        assert 'RSI' not in again.columns
+        assert again['close'].iloc[0] == sample_df['close'].iloc[0]
+
+    def test_rewritten_file_is_reparsed(self, temp_cache_dir, sample_df, frames):
+        import os
+
+        cache = DataCache(temp_cache_dir, storage_format="npz", frame_cache=frames)
+        cache.save_twelve_data("AAPL", sample_df)
+        cache.get_twelve_data("AAPL")
+        path = cache.twelve_data_dir / f"AAPL_{cache.today}.npz"
+        mtime = path.stat().st_mtime_ns
+
+        cache.save_twelve_data("AAPL", sample_df.assign(close=1.0))
+        os.utime(path, ns=(mtime + 1, mtime + 1))
+
+        assert (cache.get_twelve_data("AAPL")['close'] == 1.0).all()
+        assert len(frames) == 1
+
+    def test_memory_bound_evicts_least_recent(self, temp_cache_dir, sample_df):
+        from shared_core.cache.frame_cache import FrameCache
+
+        frames = FrameCache()
+        cache = DataCache(temp_cache_dir, frame_cache=frames)
+        for ticker in ("AAPL", "MSFT", "NVDA"):
+            cache.save_twelve_data(ticker, sample_df)
+        cache.get_twelve_data("AAPL")
+        frames.max_bytes = 2 * frames.bytes
+
+        cache.get_twelve_data("MSFT")
+        cache.get_twelve_data("AAPL")
+        cache.get_twelve_data("NVDA")
+        cache.get_twelve_data("AAPL")
+
+        assert len(frames) == 2
+        assert frames.bytes <= frames.max_bytes
+        assert (frames.misses, frames.hits) == (3, 2)
+
+    def test_load_from_cache_shares_frames(self, temp_cache_dir, frames):
+        from shared_core.backtest.runner import load_from_cache
+
+        dates = pd.date_range(end=datetime.date.today(), periods=300, freq='D')
+        df = pd.DataFrame({'datetime': dates, 'open': 1.0, 'high': 1.0,
+                           'low': 1.0, 'close': 1.0, 'volume': 100})
+        DataCache(temp_cache_dir).save_twelve_data("AAPL", df)
+
+        load_from_cache(str(temp_cache_dir), ["AAPL"], frame_cache=frames)
+        loaded = load_from_cache(str(temp_cache_dir), ["AAPL"], frame_cache=frames)
+
+        assert (frames.misses, frames.hits) == (1, 1)
+        assert len(loaded["AAPL"]) == 300
+
+
+class TestIndicatorStore:
+    """Tests for the indicator snapshot store."""
+
+    @pytest.fixture
+    def ohlcv(self, sample_df):
+        return sample_df.set_index('datetime')
+
+    @pytest.fixture
+    def store(self, cache):
+        return cache.get_indicator_store()
+
+    def test_second_call_reads_snapshot(self, store, ohlcv):
+        from shared_core.data import add_standard_indicators
+
+        calls = []
+
+        def compute(df):
+            calls.append(1)
+            return add_standard_indicators(df)
+
+        first = store.get_or_compute("AAPL", ohlcv.copy(), compute)
+        second = store.get_or_compute("AAPL", ohlcv.copy(), compute)
+
+        assert len(calls) == 1
+        assert (store.hits, store.misses) == (1, 1)
+        pd.testing.assert_frame_equal(second, first, check_freq=False)
+        assert list(store.store_dir.glob("AAPL_*.npz"))
+
+    def test_changed_ohlcv_misses(self, store, ohlcv):
+        store.get_or_compute("AAPL", ohlcv.copy(), lambda df: df)
+        changed = ohlcv.copy()
+        changed.iloc[-1, changed.columns.get_loc('close')] += 1.0
+
+        assert store.load("AAPL", changed) is None
+        assert store.load("AAPL", ohlcv) is not None
+
+    def test_config_is_part_of_key(self, store, ohlcv):
+        store.get_or_compute("AAPL", ohlcv, lambda df: df, config={'rsi': 14})
+        assert store.load("AAPL", ohlcv, config={'rsi': 14}) is not None
+        assert store.load("AAPL", ohlcv, config={'rsi': 21}) is None
+
+    def test_process_ohlcv_data_uses_store(self, store, ohlcv):
+        from shared_core.data import process_ohlcv_data
+
+        raw = {'values': [
+            {'datetime': str(ts.date()), 'open': r.open, 'high': r.high,
+             'low': r.low, 'close': r.close, 'volume': r.volume}
+            for ts, r in ohlcv.iterrows()
+        ]}
+        first = process_ohlcv_data(raw, indicator_store=store, ticker="AAPL")
+        second = process_ohlcv_data(raw, indicator_store=store, ticker="AAPL")
+
+        assert store.hits == 1
+        pd.testing.assert_frame_equal(second, first, check_freq=False)
+        pd.testing.assert_frame_equal(first, process_ohlcv_data(raw), check_freq=False)
+
+    def test_clear_old(self, store, ohlcv):
+        store.get_or_compute("BRK.B", ohlcv, lambda df: df)
+        old = store.store_dir / "BRK.B_2000-01-01_0123456789abcdef.npz"
+        old.write_bytes(b"")
+
+        assert store.clear_old(days=7) == 1
+        assert not old.exists()
+        assert len(list(store.store_dir.glob("*.npz"))) == 1
+
+    def test_clear_old_cache_prunes_snapshots(self, cache, store, ohlcv):
+        store.get_or_compute("AAPL", ohlcv, lambda df: df)
+        old = store.store_dir / "AAPL_2000-01-01_0123456789abcdef.npz"
+        old.write_bytes(b"")
+
+        assert cache.clear_old_cache(days=7) == 1
+        assert not old.exists()
+        assert store.load("AAPL", ohlcv) is not None
+
+
+class TestIndicatorStateStore:
+    """Tests for persisted streaming indicator state."""
+
+    @pytest.fixture
+    def ohlcv(self, sample_df):
+        return sample_df.set_index('datetime')
+
+    @pytest.fixture
+    def store(self, temp_cache_dir):
+        from shared_core.cache.indicator_state import IndicatorStateStore
+
+        return IndicatorStateStore(temp_cache_dir / "indicator_state")
+
+    def test_advance_applies_only_new_bars(self, store, ohlcv):
+        from shared_core.market_data.streaming import IndicatorState
+
+        store.advance("AAPL", ohlcv.iloc[:90])
+        state = store.advance("aapl", ohlcv.iloc[5:])
+
+        assert (store.rebuilds, store.bars_applied) == (1, 100)
+        assert (store.state_dir / "AAPL.json").exists()
+        full = IndicatorState.from_frame("AAPL", ohlcv)
+        assert state.values['MACD'] == pytest.approx(full.values['MACD'])
+        assert state.values['SMA_50'] == pytest.approx(full.values['SMA_50'])
+
+    def test_rewritten_history_rebuilds(self, store, ohlcv):
+        store.advance("AAPL", ohlcv.iloc[:90])
+        adjusted = ohlcv / 2
+        state = store.advance("AAPL", adjusted)
+
+        assert store.rebuilds == 2
+        assert state.bars == 100
+        assert state.last_close == adjusted['close'].iloc[-1]
+
+    def test_smoothing_mismatch_rebuilds(self, store, ohlcv):
+        from shared_core.cache.indicator_state import IndicatorStateStore
+
+        store.advance("AAPL", ohlcv)
+        simple = IndicatorStateStore(store.state_dir, smoothing='simple')
+
+        assert simple.load("AAPL") is None
+        assert simple.advance("AAPL", ohlcv).smoothing == 'simple'
+
+    def test_unreadable_state_is_ignored(self, store, ohlcv):
+        store.state_dir.mkdir(parents=True)
+        (store.state_dir / "AAPL.json").write_text('{"version": 0}')
+
+        assert store.load("AAPL") is None
+        assert store.advance("AAPL", ohlcv).bars == 100
@@ -164,6 +164,114 @@ class TestAddStandardIndicators:
         for col in original_cols:
             assert col in result.columns
 
+    def test_matches_per_indicator_methods(self, sample_ohlcv_df):
+        """Fused columns equal the individual TechnicalCalculator methods."""
+        from shared_core.market_data.technical import TechnicalCalculator
+
+        df = sample_ohlcv_df.copy()
+        result = add_standard_indicators(df.copy())
+        calc = TechnicalCalculator()
+
+        macd_line, signal_line, hist = calc.macd(df['close'])
+        bb_upper, bb_middle, bb_lower = calc.bollinger_bands(df['close'])
+        stoch_k, stoch_d = calc.stochastic(df)
+        expected = {
+            'SMA_5': calc.sma(df['close'], 5),
+            'SMA_14': calc.sma(df['close'], 14),
+            'SMA_20': calc.sma(df['close'], 20),
+            'SMA_50': calc.sma(df['close'], 50),
+            'SMA_200': calc.sma(df['close'], 200),
+            'RSI': calc.rsi(df['close'], 14),
+            'MACD': macd_line,
+            'MACD_SIGNAL': signal_line,
+            'MACD_HIST': hist,
+            'BB_UPPER': bb_upper,
+            'BB_MIDDLE': bb_middle,
+            'BB_LOWER': bb_lower,
+            'BB_WIDTH': ((bb_upper - bb_lower) / bb_middle) * 100,
+            'ATR': calc.atr(df),
+            'OBV': calc.obv(df),
+            'STOCH_K': stoch_k,
+            'STOCH_D': stoch_d,
+            'ADX': calc.adx_series(df),
+            'WILLIAMS_R': calc.williams_r(df),
+            'ROC': calc.roc(df['close']),
+        }
+
+        assert list(result.columns[len(df.columns):]) == list(expected)
+        for name, series in expected.items():
+            pd.testing.assert_series_equal(
+                result[name], pd.Series(series, index=df.index),
+                check_names=False, check_exact=True, obj=name,
+            )
+
+    def test_skips_obv_without_volume(self, sample_ohlcv_df):
+        """OBV is only added when a volume column exists."""
+        result = add_standard_indicators(sample_ohlcv_df.drop(columns=['volume']))
+        assert 'OBV' not in result.columns
+        assert 'ADX' in result.columns
+
+    def test_wide_frames_match_single_ticker(self, sample_ohlcv_df):
+        """Wide (date x ticker) inputs give the same values per column."""
+        from shared_core.market_data.fused_indicators import compute_standard_indicators
+
+        df = sample_ohlcv_df
+        scaled = df * 1.5
+        wide = {
+            col: pd.DataFrame({'AAA': df[col], 'BBB': scaled[col]})
+            for col in ('high', 'low', 'close', 'volume')
+        }
+        panel = compute_standard_indicators(wide['high'], wide['low'], wide['close'], wide['volume'])
+        single = compute_standard_indicators(scaled['high'], scaled['low'], scaled['close'], scaled['volume'])
+
+        for name, values in single.items():
+            assert list(panel[name].columns) == ['AAA', 'BBB']
+            pd.testing.assert_series_equal(
+                panel[name]['BBB'], values, check_names=False, obj=name,
+            )
+
+
+    def test_rsi_with_missing_close_matches_reference(self, sample_ohlcv_df):
+        """A NaN close inside the history gives the same RSI as TechnicalCalculator.rsi."""
+        from shared_core.market_data.fused_indicators import compute_standard_indicators
+        from shared_core.market_data.technical import TechnicalCalculator
+
+        df = sample_ohlcv_df.copy()
+        df.iloc[120, df.columns.get_loc('close')] = np.nan
+        expected = TechnicalCalculator.rsi(df['close'])
+
+        single = compute_standard_indicators(df['high'], df['low'], df['close'])
+        wide = {col: pd.DataFrame({'AAA': df[col], 'BBB': df[col].iloc[40:]}) for col in ('high', 'low', 'close')}
+        panel = compute_standard_indicators(wide['high'], wide['low'], wide['close'])
+
+        pd.testing.assert_series_equal(single['RSI'], expected, check_names=False, check_exact=True)
+        pd.testing.assert_series_equal(panel['RSI']['AAA'], expected, check_names=False)
+        pd.testing.assert_series_equal(
+            panel['RSI']['BBB'].iloc[40:], TechnicalCalculator.rsi(df['close'].iloc[40:]),
+            check_names=False,
+        )
+
+    def test_simple_smoothing_matches_per_indicator_methods(self, sample_ohlcv_df):
+        """The 'simple' switch applies to RSI, ATR and ADX alike."""
+        from shared_core.market_data.fused_indicators import compute_standard_indicators
+        from shared_core.market_data.technical import TechnicalCalculator
+
+        df = sample_ohlcv_df
+        calc = TechnicalCalculator()
+        columns = compute_standard_indicators(
+            df['high'], df['low'], df['close'], df['volume'], smoothing='simple',
+        )
+        expected = {
+            'RSI': calc.rsi(df['close'], 14, smoothing='simple'),
+            'ATR': calc.atr(df, smoothing='simple'),
+            'ADX': calc.adx_series(df, smoothing='simple'),
+        }
+        for name, series in expected.items():
+            pd.testing.assert_series_equal(
+                columns[name], series, check_names=False, check_exact=True, obj=name,
+            )
+        assert not columns['ADX'].equals(calc.adx_series(df, smoothing='wilder'))
+
 
 class TestBollingerBandsWithWidth:
     """Tests for bollinger_bands_with_width function."""
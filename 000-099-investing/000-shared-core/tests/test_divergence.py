@@ -19,9 +19,14 @@ from shared_core.divergence import (
     detect_combined_divergence,
     detect_rsi_divergence,
     detect_obv_divergence,
+    divergence_history,
+    combined_divergence_history,
+    divergence_at,
+    divergence_history_config,
     DivergenceType,
     DivergenceResult,
 )
+from shared_core.cache.indicator_store import IndicatorStore
 from shared_core.data import add_standard_indicators
 
 
@@ -175,6 +180,53 @@ class TestDetectObvDivergence:
         assert isinstance(result, str)
 
 
+class TestDivergenceHistory:
+    """Tests for full-history divergence labelling."""
+
+    @pytest.mark.parametrize("indicator", ["RSI", "OBV"])
+    @pytest.mark.parametrize("lookback", [5, 14, 20])
+    def test_matches_detection_at_every_bar(self, sample_ohlcv_df_with_indicators, indicator, lookback):
+        """Each row equals detect_divergence_enhanced on the history up to it."""
+        df = sample_ohlcv_df_with_indicators
+        history = divergence_history(df, lookback, indicator)
+
+        assert history.index.equals(df.index)
+        for i in range(len(df)):
+            expected = detect_divergence_enhanced(df.iloc[:i + 1], lookback, indicator)
+            assert divergence_at(history, i) == expected
+
+    def test_combined_matches_detection_at_every_bar(self, sample_ohlcv_df_with_indicators):
+        """Each row equals detect_combined_divergence, confluence bonus included."""
+        df = sample_ohlcv_df_with_indicators
+        history = combined_divergence_history(df, lookback=20)
+
+        assert (history['type'] != 'none').any()
+        for i in range(len(df)):
+            assert divergence_at(history, i) == detect_combined_divergence(df.iloc[:i + 1], 20)
+
+    def test_stored_history_round_trips(self, sample_ohlcv_df_with_indicators, tmp_path):
+        """A history read back from an IndicatorStore labels bars identically."""
+        df = sample_ohlcv_df_with_indicators
+        store = IndicatorStore(tmp_path / "indicators")
+
+        def compute(d):
+            return combined_divergence_history(d, lookback=20)
+
+        computed = store.get_or_compute("AAA", df, compute, divergence_history_config(20))
+        stored = store.get_or_compute("AAA", df, compute, divergence_history_config(20))
+
+        assert (store.hits, store.misses) == (1, 1)
+        assert store.load("AAA", df, divergence_history_config(14)) is None
+        for i in range(len(df)):
+            assert divergence_at(stored, i) == divergence_at(computed, i)
+
+    def test_missing_indicator(self, sample_ohlcv_df):
+        """Missing indicator column yields no divergence anywhere."""
+        history = divergence_history(sample_ohlcv_df, indicator='RSI')
+        assert (history['type'] == 'none').all()
+        assert divergence_at(history, -1) == detect_divergence_enhanced(sample_ohlcv_df, indicator='RSI')
+
+
 class TestDivergenceEdgeCases:
     """Edge case tests for divergence detection."""
     
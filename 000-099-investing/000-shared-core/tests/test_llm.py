@@ -1,6 +1,11 @@
 
+import json
+import threading
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch
+from shared_core.llm import MockLLM, RequestCoalescer, ResponseCache, cache_key
 from shared_core.llm.client import LLMClient
 
 @pytest.fixture
@@ -60,3 +65,155 @@ def test_call_with_system_message(mock_anthropic):
     call_args = mock_instance.messages.create.call_args[1]
     assert call_args["system"] == "System"
     assert call_args["messages"][0]["content"] == "Prompt"
+
+
+# =============================================================================
+# Response cache and coalescing (offline, mock provider)
+# =============================================================================
+
+
+def _mock_client(tmp_path, ttl_hours=None, **settings):
+    cache = ResponseCache(tmp_path / "llm_responses", ttl_hours=ttl_hours)
+    return LLMClient("mock", "", {"max_tokens": 1024, **settings}, cache=cache)
+
+
+class TestMockProvider:
+    """Tests for the offline mock provider."""
+
+    def test_no_api_key_needed(self):
+        client = LLMClient("mock", "", {"responses": {"ping": "pong"}})
+
+        assert client.call_llm("ping") == "pong"
+        assert client.call_llm("other") == MockLLM().complete("other")
+        assert client.client.calls == 2
+
+    def test_real_provider_still_needs_key(self):
+        with pytest.raises(ValueError, match="API key"):
+            LLMClient("claude", "", {})
+
+
+class TestResponseCache:
+    """Tests for the persistent response cache."""
+
+    def test_rerun_hits_cache(self, tmp_path):
+        """A second run of the same prompts makes no provider calls."""
+        prompts = [f"Analyze {t}" for t in ("AAPL", "MSFT", "NVDA")]
+        first = _mock_client(tmp_path)
+        answers = [first.call_llm(p, system_message="analyst") for p in prompts]
+
+        rerun = _mock_client(tmp_path)
+        assert [rerun.call_llm(p, system_message="analyst") for p in prompts] == answers
+        assert rerun.client.calls == 0
+        assert rerun.cache.hits == 3
+
+    def test_key_covers_request_parameters(self, tmp_path):
+        """Prompt, system message, max_tokens and settings each change the key."""
+        base = cache_key("claude", "m", "p", None, 100, {"temperature": 0.2})
+        variants = [
+            cache_key("openai", "m", "p", None, 100, {"temperature": 0.2}),
+            cache_key("claude", "m2", "p", None, 100, {"temperature": 0.2}),
+            cache_key("claude", "m", "p2", None, 100, {"temperature": 0.2}),
+            cache_key("claude", "m", "p", "", 100, {"temperature": 0.2}),
+            cache_key("claude", "m", "p", None, 200, {"temperature": 0.2}),
+            cache_key("claude", "m", "p", None, 100, {"temperature": 0.7}),
+        ]
+        assert base not in variants
+        assert len(set(variants)) == len(variants)
+
+        client = _mock_client(tmp_path)
+        client.call_llm("p")
+        client.call_llm("p", max_tokens=50)
+        client.call_llm("p", system_message="s")
+        assert client.client.calls == 3
+
+    def test_key_ignores_settings_that_do_not_shape_output(self):
+        """Settings outside OUTPUT_SETTINGS (e.g. mock latency) share a key."""
+        base = cache_key("mock", "m", "p", None, 100, {"temperature": 0.2})
+
+        assert cache_key("mock", "m", "p", None, 100, {"temperature": 0.2, "latency": 1.5}) == base
+        assert cache_key("mock", "m", "p", None, 100, {"temperature": 0.2, "max_tokens": 100}) == base
+        assert cache_key("mock", "m", "p", None, 100, {"temperature": 0.2, "web_search": {"enabled": True}}) != base
+
+    def test_concurrent_lookups_count_every_hit(self, tmp_path):
+        """hits/misses stay exact when many threads read the cache at once."""
+        cache = ResponseCache(tmp_path)
+        cache.put("k", "v")
+        threads = [
+            threading.Thread(target=lambda: [cache.get(key) for key in ("k", "missing") * 200])
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert (cache.hits, cache.misses) == (1600, 1600)
+
+    def test_ttl_expiry(self, tmp_path):
+        """Responses older than the TTL are fetched again."""
+        client = _mock_client(tmp_path, ttl_hours=1)
+        client.call_llm("p")
+        path = next((tmp_path / "llm_responses").glob("*/*.json"))
+        data = json.loads(path.read_text())
+        data["created"] = time.time() - 7200
+        path.write_text(json.dumps(data))
+
+        client.call_llm("p")
+
+        assert client.client.calls == 2
+        assert client.cache.clear_expired() == 0
+
+    def test_use_cache_false_and_empty_responses(self, tmp_path):
+        """Bypassed calls always hit the provider; empty answers are not stored."""
+        client = _mock_client(tmp_path, responses={"blank": ""})
+        client.call_llm("p")
+        client.call_llm("p", use_cache=False)
+        client.call_llm("blank")
+        client.call_llm("blank")
+
+        assert client.client.calls == 4
+
+
+class TestRequestCoalescing:
+    """Tests for single-flight coalescing of concurrent identical requests."""
+
+    def test_concurrent_identical_requests_share_one_call(self, tmp_path):
+        client = _mock_client(tmp_path, latency=0.2)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.call_llm("Analyze AAPL")))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert client.client.calls == 1
+        assert len(set(results)) == 1 and len(results) == 8
+
+    def test_errors_propagate_to_waiters(self):
+        coalescer = RequestCoalescer()
+        started = threading.Event()
+        errors = []
+
+        def failing():
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError("boom")
+
+        def call(fn):
+            try:
+                coalescer.run("k", fn)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        leader = threading.Thread(target=call, args=(failing,))
+        leader.start()
+        started.wait()
+        call(lambda: "unused")
+        leader.join()
+
+        assert errors == ["boom", "boom"]
+        assert coalescer.coalesced == 1
+        assert coalescer.run("k", lambda: "ok") == "ok"
@@ -9,9 +9,13 @@ from datetime import datetime, timedelta
 
 from shared_core.scoring.multi_horizon import (
     MultiHorizonCalculator,
+    MultiHorizonResult,
     TimeHorizon,
     HORIZON_CONFIGS,
+    format_multi_horizon,
+    multi_horizon_frame,
 )
+from shared_core.cache.indicator_store import IndicatorStore
 
 
 @pytest.fixture
@@ -262,6 +266,80 @@ class TestEntryScore:
         assert 1.0 <= result['MT_Reversal_Score'] <= 10.0
 
 
+class TestNumericResult:
+    """Test the typed numeric result and display formatting."""
+
+    def test_calculate_returns_numbers(self, sample_df):
+        result = MultiHorizonCalculator().calculate(sample_df)
+
+        assert isinstance(result, MultiHorizonResult)
+        for value in (result.change_pct, result.st_price_vs_ema, result.st_vol_ratio,
+                      result.mt_price_vs_sma50, result.lt_price_vs_sma200,
+                      result.lt_52w_position, result.lt_months_in_trend):
+            assert isinstance(value, float)
+
+    def test_calculate_all_is_formatted_result(self, sample_df):
+        calc = MultiHorizonCalculator()
+        numeric = calc.calculate(sample_df)
+        display = calc.calculate_all(sample_df)
+
+        assert display == numeric.to_dict()
+        assert display['LT_Price_vs_SMA200'] == f"{numeric.lt_price_vs_sma200:+.2f}%"
+        assert display['ST_Vol_Ratio_5d'] == f"{numeric.st_vol_ratio:.1f}x"
+        assert display['LT_52W_Position'] == f"{numeric.lt_52w_position:.0f}%"
+        assert set(display) == set(numeric.to_record())
+
+    def test_format_is_idempotent(self, sample_df):
+        record = MultiHorizonCalculator().calculate(sample_df).to_record()
+        once = format_multi_horizon(record)
+        assert format_multi_horizon(once) == once
+
+    def test_trend_duration_labels(self):
+        record = MultiHorizonResult(lt_months_in_trend=2.5).to_record()
+        assert format_multi_horizon(record)['LT_Months_in_Trend'] == "~2 months"
+        assert MultiHorizonResult().to_dict()['LT_Months_in_Trend'] == "< 1 month"
+
+
+class TestResultFrame:
+    """Test the columnar view of results for many tickers."""
+
+    def test_frame_has_row_per_ticker(self, sample_df, uptrend_df):
+        calc = MultiHorizonCalculator()
+        results = {'AAA': calc.calculate(sample_df), 'CCC': calc.calculate(uptrend_df)}
+        frame = multi_horizon_frame(results)
+
+        assert list(frame.index) == ['AAA', 'CCC']
+        assert frame.loc['AAA', 'MT_RSI_14'] == results['AAA'].mt_rsi
+
+    def test_indicator_store_round_trip(self, sample_df, tmp_path):
+        """A stored record reads back as the result calculate would return."""
+        store = IndicatorStore(tmp_path / "indicators")
+        calc = MultiHorizonCalculator(indicator_store=store)
+
+        first = calc.calculate(sample_df, 'AAA')
+        second = calc.calculate(sample_df, 'AAA')
+
+        assert (store.hits, store.misses) == (1, 1)
+        assert second == first == MultiHorizonCalculator().calculate(sample_df)
+        assert isinstance(second.mt_divergence, str) and isinstance(second.price, float)
+
+    def test_trend_days_matches_backward_walk(self, sample_df):
+        calc = MultiHorizonCalculator()
+        close = sample_df['close']
+        sma200 = close.rolling(200).mean()
+
+        for end in (60, 150, 220, 300):
+            df = sample_df.iloc[:end]
+            sma = sma200.iloc[:end]
+            above_now = close.iloc[end - 1] > sma.iloc[end - 1]
+            expected = 0
+            for i in range(end - 2, max(end - 253, -1), -1):
+                if (close.iloc[i] > sma.iloc[i]) != above_now:
+                    break
+                expected += 1
+            assert calc._trend_days(df, sma) == expected
+
+
 class TestInsufficientData:
     """Test handling of insufficient data."""
 
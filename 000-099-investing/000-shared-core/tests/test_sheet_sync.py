@@ -0,0 +1,131 @@
+"""
+Unit tests for shared_core.integrations.sheet_sync (diff-based sheet writes).
+"""
+
+from shared_core.integrations.sheet_sync import (
+    SheetSyncState,
+    cell_hash,
+    column_letter,
+    plan_sync,
+)
+
+COLUMNS = ['Ticker', 'Price', 'RSI', 'MACD', 'Trend', 'Updated']
+
+
+def _row(ticker, price=100.0, rsi=50.0, macd=1.0, trend='UP', updated='2025-01-02'):
+    return ticker, [ticker, price, rsi, macd, trend, updated]
+
+
+def _written_state(rows, existing_rows):
+    state = SheetSyncState(COLUMNS)
+    state.commit(plan_sync(rows, existing_rows, state))
+    return state
+
+
+class TestColumnLetter:
+    """Tests for column_letter."""
+
+    def test_letters(self):
+        assert [column_letter(n) for n in (1, 26, 27, 29, 52)] == ['A', 'Z', 'AA', 'AC', 'AZ']
+
+
+class TestPlanSync:
+    """Tests for plan_sync diffing and range coalescing."""
+
+    def test_unknown_rows_written_in_full(self):
+        """Without state every existing row is sent whole, stacked into one block."""
+        rows = [_row('AAPL'), _row('MSFT')]
+        plan = plan_sync(rows, {'AAPL': 2, 'MSFT': 3}, SheetSyncState(COLUMNS))
+
+        assert plan.updates == [{'range': 'A2:F3', 'values': [rows[0][1], rows[1][1]]}]
+        assert plan.cells == 12
+        assert plan.appends == []
+
+    def test_unchanged_rows_skipped(self):
+        """Rows identical to what was last written are not sent."""
+        rows = [_row('AAPL'), _row('MSFT')]
+        existing = {'AAPL': 2, 'MSFT': 3}
+        state = _written_state(rows, existing)
+
+        plan = plan_sync(rows, existing, state)
+
+        assert plan.updates == []
+        assert plan.skipped == 2
+
+    def test_only_changed_cells_sent(self):
+        """Changed cells become ranges; same-column changes stack across rows."""
+        existing = {'AAPL': 2, 'MSFT': 3, 'NVDA': 4}
+        state = _written_state([_row('AAPL'), _row('MSFT'), _row('NVDA')], existing)
+
+        plan = plan_sync(
+            [_row('AAPL', price=101.0), _row('MSFT', price=99.0), _row('NVDA', trend='DOWN')],
+            existing, state,
+        )
+
+        assert plan.updates == [
+            {'range': 'B2:B3', 'values': [[101.0], [99.0]]},
+            {'range': 'E4:E4', 'values': [['DOWN']]},
+        ]
+        assert plan.cells == 3
+
+    def test_small_gaps_bridged(self):
+        """Changes separated by a couple of unchanged cells share one range."""
+        existing = {'AAPL': 2}
+        state = _written_state([_row('AAPL')], existing)
+
+        plan = plan_sync([_row('AAPL', price=101.0, trend='DOWN')], existing, state)
+        split = plan_sync([_row('AAPL', price=101.0, trend='DOWN')], existing, state, max_gap=1)
+
+        assert [u['range'] for u in plan.updates] == ['B2:E2']
+        assert [u['range'] for u in split.updates] == ['B2:B2', 'E2:E2']
+
+    def test_moved_row_rewritten(self):
+        """A ticker whose sheet row changed is written in full at its new row."""
+        state = _written_state([_row('AAPL')], {'AAPL': 2})
+
+        plan = plan_sync([_row('AAPL')], {'AAPL': 5}, state)
+
+        assert [u['range'] for u in plan.updates] == ['A5:F5']
+
+    def test_new_tickers_appended(self):
+        """Tickers missing from the sheet are returned as appends, in order."""
+        plan = plan_sync([_row('TSLA'), _row('AAPL')], {}, SheetSyncState(COLUMNS))
+
+        assert [ticker for ticker, _ in plan.appends] == ['TSLA', 'AAPL']
+        assert plan.updates == []
+
+
+class TestSheetSyncState:
+    """Tests for SheetSyncState persistence."""
+
+    def test_commit_records_appends(self):
+        """Appended rows are recorded at the row the sheet placed them."""
+        state = SheetSyncState(COLUMNS)
+        plan = plan_sync([_row('TSLA')], {}, state)
+
+        state.commit(plan, first_append_row=7)
+
+        assert state.rows['TSLA']['row'] == 7
+        assert plan_sync([_row('TSLA')], {'TSLA': 7}, state).skipped == 1
+
+    def test_save_and_load(self, tmp_path):
+        """State round-trips through its file."""
+        path = tmp_path / 'sheet_sync' / 'tech_data.json'
+        state = SheetSyncState(COLUMNS, path)
+        state.record('AAPL', 2, [cell_hash(v) for v in _row('AAPL')[1]])
+        state.save()
+
+        loaded = SheetSyncState.load(path, COLUMNS)
+
+        assert loaded.rows == state.rows
+        assert plan_sync([_row('AAPL')], {'AAPL': 2}, loaded).skipped == 1
+
+    def test_column_change_discards_state(self, tmp_path):
+        """A state saved for other columns is ignored."""
+        path = tmp_path / 'tech_data.json'
+        state = SheetSyncState(COLUMNS, path)
+        state.record('AAPL', 2, ['x'] * len(COLUMNS))
+        state.save()
+
+        assert SheetSyncState.load(path, COLUMNS + ['Extra']).rows == {}
+        assert SheetSyncState.load(tmp_path / 'missing.json', COLUMNS).rows == {}
@@ -106,6 +106,35 @@ class TestRSI:
         result = calc.rsi(prices, 14)
         assert result.iloc[-1] < 30
 
+    def test_rsi_wilder_recursion(self, sample_ohlcv_df, calc):
+        close = sample_ohlcv_df['close']
+        delta = close.diff()
+        gain = delta.where(delta > 0, 0).to_numpy()
+        loss = (-delta.where(delta < 0, 0)).to_numpy()
+        avg_gain, avg_loss = gain[:14].mean(), loss[:14].mean()
+        expected = [100 - 100 / (1 + avg_gain / avg_loss)]
+        for g, l in zip(gain[14:], loss[14:]):
+            avg_gain = (avg_gain * 13 + g) / 14
+            avg_loss = (avg_loss * 13 + l) / 14
+            expected.append(100 - 100 / (1 + avg_gain / avg_loss))
+
+        result = calc.rsi(close, 14, smoothing='wilder')
+        assert result.iloc[:13].isna().all()
+        np.testing.assert_allclose(result.iloc[13:], expected, rtol=1e-10)
+
+    def test_rsi_simple_smoothing_keeps_rolling_mean(self, sample_ohlcv_df, calc):
+        close = sample_ohlcv_df['close']
+        delta = close.diff()
+        gain = delta.where(delta > 0, 0).rolling(14).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+        expected = 100 - 100 / (1 + gain / loss)
+        result = calc.rsi(close, 14, smoothing='simple')
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_rsi_unknown_smoothing(self, sample_ohlcv_df, calc):
+        with pytest.raises(ValueError, match="Unknown smoothing"):
+            calc.rsi(sample_ohlcv_df['close'], 14, smoothing='ema')
+
 
 class TestMACD:
     """Tests for MACD calculation."""
@@ -154,6 +183,24 @@ class TestATR:
         valid = result.dropna()
         assert all(valid >= 0)
 
+    def test_atr_wilder_recursion(self, sample_ohlcv_df, calc):
+        high, low, close = (sample_ohlcv_df[c] for c in ('high', 'low', 'close'))
+        prev = close.shift()
+        tr = pd.concat([high - low, abs(high - prev), abs(low - prev)], axis=1).max(axis=1)
+        expected = [tr.iloc[:14].mean()]
+        for value in tr.iloc[14:]:
+            expected.append((expected[-1] * 13 + value) / 14)
+
+        result = calc.atr(sample_ohlcv_df, 14, smoothing='wilder')
+        np.testing.assert_allclose(result.iloc[13:], expected, rtol=1e-10)
+
+    def test_atr_simple_smoothing(self, sample_ohlcv_df, calc):
+        wilder = calc.atr(sample_ohlcv_df, 14, smoothing='wilder')
+        simple = calc.atr(sample_ohlcv_df, 14, smoothing='simple')
+        # Both start from the same window mean, then diverge
+        assert wilder.iloc[13] == pytest.approx(simple.iloc[13])
+        assert not np.allclose(wilder.iloc[20:], simple.iloc[20:])
+
 
 class TestStochastic:
     """Tests for Stochastic Oscillator calculation."""
@@ -186,6 +233,16 @@ class TestADX:
         result = calc.adx(sample_ohlcv_df)
         assert result >= 0
 
+    @pytest.mark.parametrize("smoothing", ['wilder', 'simple'])
+    def test_adx_is_last_series_value(self, sample_ohlcv_df, calc, smoothing):
+        series = calc.adx_series(sample_ohlcv_df, smoothing=smoothing)
+        assert series.iloc[:27].isna().all()
+        assert series.iloc[27:].notna().all()
+        assert calc.adx(sample_ohlcv_df, smoothing=smoothing) == series.iloc[-1]
+
+    def test_adx_short_history_default(self, sample_ohlcv_df, calc):
+        assert calc.adx(sample_ohlcv_df.iloc[:20]) == 20.0
+
 
 class TestOBV:
     """Tests for OBV calculation."""
@@ -253,3 +310,191 @@ class TestSupportResistance:
         # Support should be lower than resistance
         assert result['key_support'] <= result['strongest_resistance']
 
+
+
+class TestPanelIndicators:
+    """Tests for multi-ticker panel indicators."""
+
+    @pytest.fixture
+    def frames(self, sample_ohlcv_df):
+        """Three tickers, one with a shorter history."""
+        return {
+            'AAA': sample_ohlcv_df,
+            'BBB': sample_ohlcv_df * 0.5,
+            'CCC': sample_ohlcv_df.iloc[30:] * 2.0,
+        }
+
+    def test_matches_single_ticker(self, frames, calc):
+        panel = calc.panel_indicators(frames)
+
+        for ticker, df in frames.items():
+            expected = {
+                'SMA_20': calc.sma(df['close'], 20),
+                'EMA_20': calc.ema(df['close'], 20),
+                'RSI': calc.rsi(df['close']),
+                'MACD_HIST': calc.macd(df['close'])[2],
+                'ATR': calc.atr(df),
+                'ADX': calc.adx_series(df),
+                'OBV': calc.obv(df),
+            }
+            for name, series in expected.items():
+                actual = panel[name][ticker].dropna()
+                series = series.dropna().astype(float)
+                assert actual.index.equals(series.index), (name, ticker)
+                np.testing.assert_allclose(actual.values, series.values, rtol=1e-9)
+
+    def test_accepts_wide_and_long_layouts(self, frames, calc):
+        from_dict = calc.panel_indicators(frames)
+
+        wide = pd.concat(frames, axis=1).swaplevel(axis=1)
+        long = pd.concat(frames, names=['ticker', 'date']).swaplevel().sort_index()
+
+        pd.testing.assert_frame_equal(calc.panel_indicators(wide), from_dict)
+        pd.testing.assert_frame_equal(
+            calc.panel_indicators(long), from_dict, check_names=False, check_freq=False,
+        )
+
+    def test_missing_bars_are_not_reported(self, frames, calc):
+        panel = calc.panel_indicators(frames)
+        assert panel['OBV']['CCC'].iloc[:30].isna().all()
+        assert panel['EMA_50']['CCC'].iloc[:30].isna().all()
+
+    def test_aligns_cached_frames_by_date(self, sample_ohlcv_df, calc):
+        """RangeIndex frames with a 'datetime' column line up by date, not row."""
+        cached = sample_ohlcv_df.rename_axis('datetime').reset_index()
+        cached['datetime'] = cached['datetime'].dt.strftime('%Y-%m-%d')
+        frames = {'A': cached, 'B': cached.iloc[30:].reset_index(drop=True)}
+
+        latest = calc.panel_indicators(frames).iloc[-1].unstack(0)
+
+        for ticker, df in frames.items():
+            dated = df.set_index(pd.to_datetime(df['datetime']))
+            assert latest.loc[ticker, 'RSI'] == pytest.approx(calc.rsi(dated['close']).iloc[-1])
+            assert latest.loc[ticker, 'SMA_20'] == pytest.approx(calc.sma(dated['close'], 20).iloc[-1])
+            assert latest.loc[ticker, 'ADX'] == pytest.approx(calc.adx_series(dated).iloc[-1])
+
+    def test_rejects_frames_without_dates(self, sample_ohlcv_df, calc):
+        with pytest.raises(ValueError, match='datetime'):
+            calc.panel_indicators({'A': sample_ohlcv_df.reset_index(drop=True)})
+
+    def test_rejects_single_ticker_frame(self, sample_ohlcv_df, calc):
+        with pytest.raises(ValueError):
+            calc.panel_indicators(sample_ohlcv_df)
+
+
+class TestIndicatorState:
+    """Tests for the streaming indicator state."""
+
+    @staticmethod
+    def _stream(df, smoothing):
+        from shared_core.market_data.streaming import IndicatorState
+
+        state = IndicatorState("TEST", smoothing)
+        rows = [
+            dict(state.update(r.high, r.low, r.close, r.volume, date=ts))
+            for ts, r in df.iterrows()
+        ]
+        return state, pd.DataFrame(rows, index=df.index)
+
+    @pytest.mark.parametrize("smoothing", ['wilder', 'simple'])
+    def test_matches_batch_indicators(self, sample_ohlcv_df, smoothing):
+        from shared_core.market_data.fused_indicators import compute_standard_indicators
+
+        df = pd.concat([sample_ohlcv_df] * 3, ignore_index=True)
+        df.index = pd.date_range('2024-01-01', periods=len(df), freq='D')
+        _, streamed = self._stream(df, smoothing)
+        batch = compute_standard_indicators(
+            df['high'], df['low'], df['close'], df['volume'], smoothing=smoothing,
+        )
+
+        for name, series in batch.items():
+            np.testing.assert_allclose(
+                streamed[name], series, rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=name,
+            )
+        np.testing.assert_allclose(streamed['VOLUME_SMA_20'], df['volume'].rolling(20).mean())
+        np.testing.assert_allclose(streamed['HIGH_20'], df['high'].rolling(20).max())
+
+    def test_restored_state_continues(self, sample_ohlcv_df):
+        import json
+        from shared_core.market_data.streaming import IndicatorState
+
+        state = IndicatorState.from_frame("TEST", sample_ohlcv_df.iloc[:60])
+        restored = IndicatorState.from_dict(json.loads(json.dumps(state.to_dict())))
+
+        assert restored.update_frame(sample_ohlcv_df) == 40
+        full = IndicatorState.from_frame("TEST", sample_ohlcv_df)
+        assert restored.bars == full.bars == 100
+        for name, value in full.values.items():
+            assert restored.values[name] == pytest.approx(value, rel=1e-9, nan_ok=True), name
+        assert restored.previous['RSI'] == pytest.approx(full.previous['RSI'])
+
+    def test_rejects_out_of_order_bars(self, sample_ohlcv_df):
+        from shared_core.market_data.streaming import IndicatorState
+
+        state = IndicatorState.from_frame("TEST", sample_ohlcv_df)
+        with pytest.raises(ValueError):
+            state.update(101, 99, 100, 1000, date=sample_ohlcv_df.index[-1])
+
+    def test_swing_points_match_batch(self, sample_ohlcv_df):
+        from shared_core.divergence.swing_points import find_swing_highs, find_swing_lows
+
+        state, streamed = self._stream(sample_ohlcv_df, 'wilder')
+        lows = find_swing_lows(sample_ohlcv_df['close']).iloc[-4:]
+        highs = find_swing_highs(sample_ohlcv_df['close']).iloc[-4:]
+
+        assert [p['close'] for p in state.swing_lows] == list(lows)
+        assert [p['close'] for p in state.swing_highs] == list(highs)
+        last_low = state.swing_lows[-1]
+        assert pd.Timestamp(last_low['date']) == lows.index[-1]
+        assert last_low['rsi'] == pytest.approx(streamed['RSI'].loc[lows.index[-1]])
+
+
+class TestStreaks:
+    """Tests for the run-length utilities."""
+
+    def test_streak_lengths(self):
+        from shared_core.market_data.streaks import streak_lengths
+
+        condition = pd.Series([True, True, False, True, True, True, np.nan, True])
+        assert streak_lengths(condition).tolist() == [1, 2, 0, 1, 2, 3, 0, 1]
+
+    def test_current_and_longest(self):
+        from shared_core.market_data.streaks import current_streak, longest_streak
+
+        condition = pd.Series([False, True, True, True, False, True, True])
+        assert current_streak(condition) == 2
+        assert longest_streak(condition) == 3
+        assert current_streak(condition.iloc[:5]) == 0
+        assert current_streak(pd.Series([], dtype=bool)) == 0
+        assert current_streak(pd.Series([True] * 4)) == 4
+
+    def test_streak_runs(self):
+        from shared_core.market_data.streaks import streak_runs
+
+        dates = pd.date_range('2024-01-01', periods=7)
+        runs = streak_runs(pd.Series([True, True, False, False, True, False, True], index=dates))
+        assert runs['length'].tolist() == [2, 1, 1]
+        assert runs['start'].tolist() == [dates[0], dates[4], dates[6]]
+        assert runs['end'].tolist() == [dates[1], dates[4], dates[6]]
+
+    def test_panel_matches_per_column(self, sample_ohlcv_df):
+        from shared_core.market_data.streaks import current_streak, longest_streak, streak_lengths
+
+        closes = pd.DataFrame({
+            'AAA': sample_ohlcv_df['close'],
+            'BBB': sample_ohlcv_df['close'][::-1].to_numpy(),
+        }, index=sample_ohlcv_df.index)
+        down = closes.diff() < 0
+        lengths = streak_lengths(down)
+
+        for ticker in closes:
+            assert lengths[ticker].tolist() == streak_lengths(down[ticker]).tolist()
+            assert current_streak(down)[ticker] == current_streak(down[ticker])
+            assert longest_streak(down)[ticker] == longest_streak(down[ticker])
+
+    def test_consecutive_direction(self, calc):
+        df = pd.DataFrame({'close': [10.0, 11, 12, 11, 10, 9, 8]})
+        assert calc.count_consecutive_direction(df) == {'consecutive_down': 4, 'consecutive_up': 0}
+        assert calc.count_consecutive_direction(df, lookback=3) == {'consecutive_down': 2, 'consecutive_up': 0}
+        flat = pd.DataFrame({'close': [10.0, 11, 11]})
+        assert calc.count_consecutive_direction(flat) == {'consecutive_down': 0, 'consecutive_up': 0}
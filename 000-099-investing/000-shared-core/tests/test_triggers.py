@@ -309,6 +309,139 @@ class TestTriggerEngine:
             assert keys1 == keys2
 
 
+class TestCompiledTriggers:
+    """Tests for compiled (vectorized) trigger evaluation."""
+
+    @staticmethod
+    def _frame(closes, sma, volume=None):
+        return pd.DataFrame({
+            'close': closes,
+            'SMA_20': sma,
+            'RSI': np.linspace(20, 40, len(closes)),
+            'volume': volume if volume is not None else [1000.0] * len(closes),
+        })
+
+    def test_batch_matches_per_symbol(self):
+        """evaluate_batch returns what evaluate returns for each symbol."""
+        engine = TriggerEngine([
+            {'type': 'price_crosses_above_ma', 'ma': 'SMA_20', 'action': 'BUY'},
+            {'type': 'rsi_oversold', 'threshold': 45, 'action': 'WATCH', 'note': 'dip'},
+            {'type': 'score_above', 'value': 7, 'action': 'BUY'},
+        ])
+        frames = {
+            'AAPL': self._frame([99.0, 101.0], [100.0, 100.0]),
+            'MSFT': self._frame([101.0, 99.0], [100.0, 100.0]),
+            'TINY': self._frame([100.0], [100.0]),
+        }
+        scores = {'AAPL': 8.0, 'MSFT': 5.0, 'TINY': 9.0}
+
+        batch = engine.evaluate_batch(frames, scores)
+
+        assert set(batch) == {'AAPL', 'MSFT', 'TINY'}
+        assert batch['TINY'] == []
+        for symbol, df in frames.items():
+            assert batch[symbol] == engine.evaluate(symbol, df, scores[symbol])
+        assert [r['type'] for r in batch['AAPL']] == [
+            'price_crosses_above_ma', 'rsi_oversold', 'score_above',
+        ]
+        assert batch['AAPL'][1]['message'] == 'WATCH: dip (RSI 40.0 < 45)'
+        assert [r['type'] for r in batch['MSFT']] == ['rsi_oversold']
+
+    def test_ticker_triggers_override_defaults(self):
+        """Symbols with custom triggers are evaluated against their own list."""
+        engine = TriggerEngine([{'type': 'score_above', 'value': 7, 'action': 'BUY'}])
+        frames = {
+            'AAPL': self._frame([99.0, 101.0], [100.0, 100.0]),
+            'MSFT': self._frame([99.0, 101.0], [100.0, 100.0]),
+        }
+
+        batch = engine.evaluate_batch(
+            frames, {'AAPL': 8.0, 'MSFT': 8.0},
+            ticker_triggers={'MSFT': [{'type': 'price_above', 'value': 100, 'action': 'TRIM'}]},
+        )
+
+        assert [r['action'] for r in batch['AAPL']] == ['BUY']
+        assert [r['detail'] for r in batch['MSFT']] == ['Price $101.0 > $100']
+
+    def test_matrix_gate(self):
+        """requires_matrix only fires for symbols whose matrix matches."""
+        engine = TriggerEngine([
+            {'type': 'score_above', 'value': 5, 'action': 'BUY', 'requires_matrix': {'bull': True}},
+        ])
+        frames = {s: self._frame([100.0, 101.0], [100.0, 100.0]) for s in ('A', 'B', 'C')}
+
+        batch = engine.evaluate_batch(
+            frames, {'A': 8.0, 'B': 8.0, 'C': 8.0},
+            matrices={'A': {'bull': True}, 'B': {'bull': False}},
+        )
+
+        assert len(batch['A']) == 1
+        assert batch['B'] == []
+        assert batch['C'] == []
+        for symbol, matrix in (('A', {'bull': True}), ('B', {'bull': False}), ('C', None)):
+            assert engine.evaluate(symbol, frames[symbol], 8.0, matrix=matrix) == batch[symbol]
+
+    def test_volume_spike_uses_50_bar_average(self):
+        """volume_spike compares against the trailing 50-bar volume mean."""
+        engine = TriggerEngine([{'type': 'volume_spike', 'multiplier': 2.0, 'action': 'WATCH'}])
+        volume = [100.0] * 49 + [400.0]
+        closes = [100.0] * 50
+
+        results = engine.evaluate('AAPL', self._frame(closes, closes, volume), 5.0)
+        short = engine.evaluate('AAPL', self._frame(closes[:49], closes[:49], volume[-49:]), 5.0)
+
+        assert [r['detail'] for r in results] == ['Volume 3.8x avg']
+        assert short == []
+
+    def test_nan_indicator_never_fires(self):
+        """A NaN indicator value does not trigger."""
+        engine = TriggerEngine([{'type': 'price_above_ma', 'ma': 'SMA_20', 'action': 'BUY'}])
+        df = self._frame([100.0, 101.0], [100.0, np.nan])
+
+        assert engine.evaluate('AAPL', df, 5.0) == []
+
+    def test_invalid_triggers_dropped_at_compile(self):
+        """Unknown types and missing fields are skipped, valid triggers kept."""
+        engine = TriggerEngine([
+            {'type': 'no_such_trigger', 'action': 'BUY'},
+            {'type': 'price_above', 'action': 'BUY'},
+            {'type': 'score_above', 'value': 'high', 'action': 'BUY'},
+            {'type': 'score_above', 'value': 5, 'action': 'BUY'},
+        ])
+
+        assert [t.type for t in engine.compiled()] == ['score_above']
+        assert engine.compiled() is engine.compiled()
+
+    def test_equal_trigger_lists_share_compiled_form(self):
+        """Equal lists passed as different objects compile once."""
+        engine = TriggerEngine()
+        triggers = [{'type': 'price_above', 'value': 100, 'action': 'BUY'}]
+
+        assert engine.compiled(triggers) is engine.compiled([dict(t) for t in triggers])
+
+    def test_extra_compilers(self):
+        """Project-specific trigger types plug in through compilers."""
+        def close_up(trigger):
+            def predicate(frame):
+                return frame.column('close') > frame.column('close', prev=True)
+            return predicate, lambda frame, row: 'Close up'
+
+        engine = TriggerEngine(
+            [{'type': 'close_up', 'action': 'WATCH'}], compilers={'close_up': close_up},
+        )
+        frames = {
+            'UP': self._frame([100.0, 101.0], [100.0, 100.0]),
+            'DOWN': self._frame([101.0, 100.0], [100.0, 100.0]),
+        }
+
+        batch = engine.evaluate_batch(frames, {'UP': 5.0, 'DOWN': 5.0})
+
+        assert [r['message'] for r in batch['UP']] == ['WATCH: Close up']
+        assert batch['DOWN'] == []
+        assert engine.evaluate('UP', frames['UP'], 5.0) == batch['UP']
+        assert TriggerEngine([{'type': 'close_up'}]).compiled() == []
+
+
 class TestTriggerEdgeCases:
     """Edge case tests for triggers."""
     
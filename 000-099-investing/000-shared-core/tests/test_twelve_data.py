@@ -244,6 +244,84 @@ class TestGetDataframe:
         assert result is not None
 
 
+class TestDeltaRefresh:
+    """Tests for appending new bars to an earlier cache file."""
+
+    @pytest.fixture
+    def previous(self, cache, sample_df):
+        """Yesterday's cache file, last bar dated yesterday."""
+        df = sample_df.copy()
+        df['datetime'] = df['datetime'].dt.normalize() - pd.Timedelta(days=1)
+        today = cache.today
+        cache.today = (datetime.fromisoformat(today) - timedelta(days=1)).date().isoformat()
+        cache.save_twelve_data("AAPL", df)
+        cache.today = today
+        return df
+
+    @staticmethod
+    def _response(rows):
+        return {'values': [
+            {'datetime': str(ts.date()), 'open': str(c), 'high': str(c), 'low': str(c),
+             'close': str(c), 'volume': '1000'}
+            for ts, c in reversed(rows)
+        ], 'status': 'ok'}
+
+    @patch('shared_core.market_data.twelve_data.requests.get')
+    def test_appends_new_bars(self, mock_get, client, cache, previous):
+        anchor, last = previous['datetime'].iloc[-2], previous['datetime'].iloc[-1]
+        mock_get.return_value.json.return_value = self._response([
+            (anchor, previous['close'].iloc[-2]),
+            (last, 123.0),
+            (last + timedelta(days=1), 124.0),
+        ])
+
+        result = client.get_dataframe("AAPL")
+
+        assert mock_get.call_args.kwargs['params']['start_date'] == str(anchor.date())
+        assert len(result) == 101
+        assert result['close'].iloc[-2:].tolist() == [123.0, 124.0]
+        pd.testing.assert_series_equal(result['close'].iloc[:98], previous['close'].iloc[:98])
+        assert cache.has_twelve_data("AAPL")
+
+    @patch('shared_core.market_data.twelve_data.requests.get')
+    def test_trims_to_output_size(self, mock_get, cache, previous):
+        client = TwelveDataClient(api_key="test_api_key", cache=cache, output_size=100)
+        anchor, last = previous['datetime'].iloc[-2], previous['datetime'].iloc[-1]
+        mock_get.return_value.json.return_value = self._response([
+            (anchor, previous['close'].iloc[-2]),
+            (last, 123.0),
+            (last + timedelta(days=1), 124.0),
+        ])
+
+        result = client.get_dataframe("AAPL")
+
+        assert len(result) == 100
+        assert result['datetime'].iloc[0] == previous['datetime'].iloc[1]
+
+    @patch('shared_core.market_data.twelve_data.requests.get')
+    def test_split_triggers_full_refetch(self, mock_get, client, previous, mock_api_response):
+        anchor = previous['datetime'].iloc[-2]
+        split = Mock()
+        split.json.return_value = self._response([(anchor, previous['close'].iloc[-2] / 4)])
+        full = Mock()
+        full.json.return_value = mock_api_response
+        mock_get.side_effect = [split, full]
+
+        result = client.get_dataframe("AAPL")
+
+        assert mock_get.call_count == 2
+        assert 'start_date' not in mock_get.call_args.kwargs['params']
+        assert len(result) == 100
+
+    @patch('shared_core.market_data.twelve_data.requests.get')
+    def test_force_refresh_skips_delta(self, mock_get, client, previous, mock_api_response):
+        mock_get.return_value.json.return_value = mock_api_response
+
+        client.get_dataframe("AAPL", force_refresh=True)
+
+        assert 'start_date' not in mock_get.call_args.kwargs['params']
+
+
 class TestIndicatorCalculation:
     """Tests for indicator calculation accuracy."""
     
@@ -23,6 +23,7 @@ import pandas as pd
 import numpy as np
 
 from core import load_config, SheetManager
+from shared_core.cache.storage import iter_cache_files, parse_cache_filename, read_cache_file
 
 
 def parse_args():
@@ -56,18 +57,14 @@ def find_latest_cache_files(cache_dir: Path) -> dict:
     """
     ticker_files = defaultdict(list)
     
-    for f in cache_dir.glob('*.json'):
-        # Parse filename: TICKER_YYYY-MM-DD.json
-        parts = f.stem.rsplit('_', 1)
-        if len(parts) != 2:
+    for f in iter_cache_files(cache_dir):
+        # Parse filename: TICKER_YYYY-MM-DD.<json|npz|parquet>
+        parsed = parse_cache_filename(f)
+        if parsed is None:
             continue
         
-        ticker, date_str = parts
-        try:
-            file_date = dt.date.fromisoformat(date_str)
-            ticker_files[ticker].append((file_date, f))
-        except ValueError:
-            continue
+        ticker, date_str = parsed
+        ticker_files[ticker].append((dt.date.fromisoformat(date_str), f))
     
     # Keep only the most recent file per ticker
     latest = {}
@@ -90,7 +87,7 @@ def load_price_data(cache_files: dict, min_days: int, verbose: bool) -> pd.DataF
     
     for ticker, filepath in sorted(cache_files.items()):
         try:
-            df = pd.read_json(filepath)
+            df = read_cache_file(filepath)
             
             # Ensure we have required columns
             if 'close' not in df.columns:
@@ -29,6 +29,7 @@ from core import (
     GrokAnalyzer,
     SheetManager,
 )
+from shared_core.cache.frame_cache import shared_frame_cache
 
 # Multi-horizon analysis
 try:
@@ -97,7 +98,8 @@ def main():
     
     # Initialize components
     data_dir = script_dir / 'data'
-    cache = DataCache(data_dir, verbose=config.verbose)
+    # Each ticker file is read several times per run; parse it once
+    cache = DataCache(data_dir, verbose=config.verbose, frame_cache=shared_frame_cache())
     
     if args.clear_cache:
         deleted = cache.clear_old_cache(days=7)
@@ -127,6 +129,7 @@ def main():
         credentials_file=str(script_dir / config.google_sheets.credentials_file),
         spreadsheet_name=config.google_sheets.spreadsheet_name,
         verbose=config.verbose,
+        sync_state_dir=str(data_dir / 'sheet_sync'),
     )
     
     # Get tickers from main sheet
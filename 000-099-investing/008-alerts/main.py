@@ -24,10 +24,11 @@ from shared_core import (
     safe_write_json,
     archive_daily_indicators,
 )
+from shared_core.cache.indicator_state import IndicatorStateStore
 from shared_core.triggers.conditions import update_cooldowns
 
-from src.fetch_prices import PriceFetcher
-from src.compute_flags import process_ticker_data, compute_flags
+from src.fetch_prices import PriceFetcher, SHARED_STATE_DIR
+from src.compute_flags import advance_ticker_state, compute_flags_from_state, state_row
 from src.evaluate_triggers import evaluate_ticker
 from src.send_email import EmailSender, format_main_email, format_reminder_email
 from src.handle_action import handle_action
@@ -136,6 +137,8 @@ def main():
     # Fetch price data
     fetcher = PriceFetcher(td_api_key, api_keys=td_api_keys)
     raw_data = fetcher.fetch_all_tickers(all_tickers)
+    # Saved per-ticker indicator state: only bars since the last run are applied
+    state_store = IndicatorStateStore(SHARED_STATE_DIR)
 
     # Process each ticker
     all_signals = []
@@ -149,9 +152,9 @@ def main():
             logger.warning(f"No data for {ticker}")
             continue
 
-        # Process data
-        df = process_ticker_data(data)
-        if df is None:
+        # Advance indicator state with the new bars
+        state = advance_ticker_state(data, ticker, state_store)
+        if state is None:
             logger.warning(f"Could not process data for {ticker}")
             continue
 
@@ -159,11 +162,11 @@ def main():
         prev_state = last_run.get('flags', {}).get(ticker)
 
         # Compute flags
-        flags = compute_flags(df, prev_state)
+        flags = compute_flags_from_state(state, prev_state)
         new_state[ticker] = flags
 
         # Collect full indicator data for archiving
-        curr = df.iloc[-1]
+        curr = state_row(state)
         archive_data.append({
             'symbol': ticker,
             'close': float(curr['close']),
@@ -207,6 +210,11 @@ def main():
         else:
             no_signal_tickers.append(ticker)
 
+    logger.info(
+        f"Indicator state: {state_store.bars_applied} bars applied, "
+        f"{state_store.rebuilds} tickers rebuilt from history"
+    )
+
     # Update cooldowns
     cooldowns = update_cooldowns(cooldowns, all_signals)
     save_json(state_dir / "cooldowns.json", cooldowns)
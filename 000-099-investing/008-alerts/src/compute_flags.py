@@ -16,21 +16,14 @@ Continuous Values:
 import logging
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
-
-logger = logging.getLogger(__name__)
-
-
-def compute_sma(series: pd.Series, period: int) -> pd.Series:
-    return series.rolling(window=period).mean()
+from typing import Dict, Any, Mapping, Optional
 
+from shared_core.cache.indicator_state import IndicatorStateStore
+from shared_core.cache.indicator_store import IndicatorStore
+from shared_core.data import process_ohlcv_data
+from shared_core.market_data.streaming import ALERT_WINDOW, IndicatorState
 
-def compute_rsi(close: pd.Series, period: int = 14) -> pd.Series:
-    delta = close.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss.replace(0, np.nan)
-    return 100 - (100 / (1 + rs))
+logger = logging.getLogger(__name__)
 
 
 def compute_score(df: pd.DataFrame) -> float:
@@ -40,10 +33,16 @@ def compute_score(df: pd.DataFrame) -> float:
     """
     if len(df) < 50:
         return 0.0
-    
-    curr = df.iloc[-1]
-    prev = df.iloc[-2]
-    
+
+    close_5d = df.iloc[-5]['close'] if len(df) >= 5 else None
+    return score_row(df.iloc[-1], df.iloc[-2], close_5d)
+
+
+def score_row(curr: Mapping[str, Any], prev: Mapping[str, Any], close_5d: Optional[float]) -> float:
+    """
+    Bullish score (0-10) from the latest row, the row before it and the
+    close 4 bars before the latest (None when unavailable).
+    """
     score = 0.0
     
     # Trend: Price vs SMAs (30%)
@@ -77,8 +76,8 @@ def compute_score(df: pd.DataFrame) -> float:
         score += 0.75
     
     # Price momentum (10%)
-    if len(df) >= 5:
-        pct_5d = (curr['close'] - df.iloc[-5]['close']) / df.iloc[-5]['close'] * 100
+    if close_5d is not None:
+        pct_5d = (curr['close'] - close_5d) / close_5d * 100
         if pct_5d > 3:
             score += 1.0
         elif pct_5d > 0:
@@ -87,46 +86,42 @@ def compute_score(df: pd.DataFrame) -> float:
     return round(min(10, score), 1)
 
 
-def process_ticker_data(raw_data: Dict[str, Any]) -> Optional[pd.DataFrame]:
+def process_ticker_data(
+    raw_data: Dict[str, Any],
+    ticker: Optional[str] = None,
+    indicator_store: Optional[IndicatorStore] = None,
+) -> Optional[pd.DataFrame]:
     """
     Process raw Twelve Data response into DataFrame with indicators.
+
+    Standard indicators come from shared_core (read from the indicator store
+    when another pipeline already computed them today); the alert-specific
+    column names are aliases of those columns.
     """
-    if not raw_data or "values" not in raw_data:
+    if not raw_data:
         return None
-    
-    df = pd.DataFrame(raw_data["values"])
-    df['datetime'] = pd.to_datetime(df['datetime'])
-    df = df.set_index('datetime').sort_index()
-    
-    # Convert numeric columns
-    for col in ['open', 'high', 'low', 'close', 'volume']:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-    
-    df = df.dropna(subset=['close'])
-    
-    if len(df) < 20:
+
+    df = process_ohlcv_data(raw_data, indicator_store=indicator_store, ticker=ticker)
+    if df is None:
         return None
-    
-    # Compute indicators
-    df['sma200'] = compute_sma(df['close'], 200)
-    df['sma50'] = compute_sma(df['close'], 50)
-    df['sma20'] = compute_sma(df['close'], 20)
-    df['rsi'] = compute_rsi(df['close'], 14)
-    
+
+    df['sma200'] = df['SMA_200']
+    df['sma50'] = df['SMA_50']
+    df['sma20'] = df['SMA_20']
+    df['rsi'] = df['RSI']
+
     # Volume average
     df['avg_volume_20d'] = df['volume'].rolling(20).mean()
     df['volume_ratio'] = df['volume'] / df['avg_volume_20d']
-    
+
     # 20-day high
     df['high_20d'] = df['high'].rolling(20).max()
-    
+
     # MACD
-    ema12 = df['close'].ewm(span=12, adjust=False).mean()
-    ema26 = df['close'].ewm(span=26, adjust=False).mean()
-    df['macd'] = ema12 - ema26
-    df['macd_signal'] = df['macd'].ewm(span=9, adjust=False).mean()
-    df['macd_hist'] = df['macd'] - df['macd_signal']
-    
+    df['macd'] = df['MACD']
+    df['macd_signal'] = df['MACD_SIGNAL']
+    df['macd_hist'] = df['MACD_HIST']
+
     return df
 
 
@@ -143,8 +138,16 @@ def compute_flags(df: pd.DataFrame, previous_state: Optional[Dict[str, Any]] = N
     """
     if df is None or len(df) < 2:
         return {}
-    
-    curr = df.iloc[-1]
+
+    return _flags_from_row(df.iloc[-1], compute_score(df), previous_state)
+
+
+def _flags_from_row(
+    curr: Mapping[str, Any],
+    score: float,
+    previous_state: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Flags for the latest row (alert column names) and its bullish score."""
     close = curr['close']
     sma200 = curr.get('sma200') or 0
     sma50 = curr.get('sma50') or 0
@@ -153,9 +156,6 @@ def compute_flags(df: pd.DataFrame, previous_state: Optional[Dict[str, Any]] = N
     volume = curr.get('volume') or 0
     avg_volume = curr.get('avg_volume_20d') or volume
     
-    # Compute score
-    score = compute_score(df)
-    
     # State flags - convert numpy types to native Python types for JSON
     flags = {
         'above_SMA200': bool(close > sma200) if sma200 else False,
@@ -192,6 +192,78 @@ def compute_flags(df: pd.DataFrame, previous_state: Optional[Dict[str, Any]] = N
     return flags
 
 
+def state_row(state: IndicatorState) -> Dict[str, Any]:
+    """
+    Latest bar of a streaming IndicatorState under the alert column names
+    process_ticker_data produces (close, sma50, rsi, macd_hist, ...).
+    """
+    return _alert_row(state.values, state.last_close, state.last_volume)
+
+
+def _alert_row(values: Mapping[str, float], close: float, volume: float) -> Dict[str, Any]:
+    avg_volume = values.get(f'VOLUME_SMA_{ALERT_WINDOW}', np.nan)
+    return {
+        'close': close,
+        'volume': volume,
+        'sma200': values.get('SMA_200'),
+        'sma50': values.get('SMA_50'),
+        'sma20': values.get('SMA_20'),
+        'rsi': values.get('RSI'),
+        'avg_volume_20d': avg_volume,
+        'volume_ratio': volume / avg_volume if avg_volume else np.nan,
+        'high_20d': values.get(f'HIGH_{ALERT_WINDOW}'),
+        'macd': values.get('MACD'),
+        'macd_signal': values.get('MACD_SIGNAL'),
+        'macd_hist': values.get('MACD_HIST'),
+    }
+
+
+def advance_ticker_state(
+    raw_data: Dict[str, Any],
+    ticker: str,
+    state_store: IndicatorStateStore,
+) -> Optional[IndicatorState]:
+    """
+    Apply the bars of a raw Twelve Data response that are newer than the
+    ticker's saved IndicatorState (rebuilding it when needed).
+
+    Only OHLCV is parsed; no indicator is recomputed over the history.
+    """
+    if not raw_data:
+        return None
+
+    df = process_ohlcv_data(raw_data, include_indicators=False)
+    if df is None:
+        return None
+    return state_store.advance(ticker, df)
+
+
+def compute_flags_from_state(
+    state: IndicatorState,
+    previous_state: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Same flags as compute_flags, read from a streaming IndicatorState.
+
+    Args:
+        state: State advanced to the latest bar (see advance_ticker_state)
+        previous_state: Previous day's flags (for event detection)
+
+    Returns:
+        Dict with all flags and values
+    """
+    if state is None or state.bars < 2:
+        return {}
+
+    curr = state_row(state)
+    score = 0.0
+    if state.bars >= 50:
+        prev = _alert_row(state.previous, state.close_ago(1), np.nan)
+        close_5d = state.close_ago(4)
+        score = score_row(curr, prev, close_5d)
+    return _flags_from_row(curr, score, previous_state)
+
+
 if __name__ == "__main__":
     # Test
     print("compute_flags module loaded successfully")
@@ -17,6 +17,12 @@ logger = logging.getLogger(__name__)
 # Shared cache location (relative to this file's directory)
 SHARED_CACHE_DIR = Path(__file__).parent.parent.parent / "007-ticker-analysis" / "data" / "twelve_data"
 
+# Indicator snapshots shared with the other pipelines reading the same cache
+SHARED_INDICATOR_DIR = SHARED_CACHE_DIR.parent / "indicators"
+
+# Streaming indicator state (one file per ticker), advanced bar by bar
+SHARED_STATE_DIR = SHARED_CACHE_DIR.parent / "indicator_state"
+
 
 class PriceFetcher:
     """
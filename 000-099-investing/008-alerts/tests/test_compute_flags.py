@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from shared_core.cache.indicator_state import IndicatorStateStore
+from src.compute_flags import (
+    advance_ticker_state,
+    compute_flags,
+    compute_flags_from_state,
+    process_ticker_data,
+)
+
+
+def to_raw(df):
+    """Twelve Data response (newest first) for an OHLCV frame."""
+    return {'values': [
+        {'datetime': str(ts.date()), 'open': r.open, 'high': r.high,
+         'low': r.low, 'close': r.close, 'volume': int(r.volume)}
+        for ts, r in df.iloc[::-1].iterrows()
+    ]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return IndicatorStateStore(tmp_path / "indicator_state")
+
+
+class TestComputeFlagsFromState:
+
+    def test_matches_frame_flags(self, sample_market_data, store):
+        raw = to_raw(sample_market_data)
+        prev = {'above_SMA200': False, 'below_SMA200': True, 'rsi': 25.0}
+
+        state = advance_ticker_state(raw, "TEST", store)
+        expected = compute_flags(process_ticker_data(raw), prev)
+
+        flags = compute_flags_from_state(state, prev)
+        assert flags.keys() == expected.keys()
+        for name, value in expected.items():
+            # sma200 is NaN with only 100 bars
+            assert flags[name] == value or (pd.isna(flags[name]) and pd.isna(value)), name
+
+    def test_next_run_applies_new_bar_only(self, sample_market_data, store):
+        advance_ticker_state(to_raw(sample_market_data.iloc[:-1]), "TEST", store)
+        raw = to_raw(sample_market_data.iloc[1:])
+        state = advance_ticker_state(raw, "TEST", store)
+
+        assert store.rebuilds == 1
+        assert store.bars_applied == len(sample_market_data)
+        flags = compute_flags_from_state(state)
+        assert flags['close'] == round(sample_market_data['close'].iloc[-1], 2)
+        assert flags['new_20day_high'] == compute_flags(process_ticker_data(raw))['new_20day_high']
+
+    def test_empty_response(self, store):
+        assert advance_ticker_state({}, "TEST", store) is None
+        assert compute_flags_from_state(None) == {}
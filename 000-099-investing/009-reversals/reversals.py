@@ -14,8 +14,9 @@ from shared_core import (
     Digest,
     archive_daily_indicators,
 )
+from shared_core.cache.indicator_store import IndicatorStore
 
-from src.fetcher import TwelveDataFetcher
+from src.fetcher import TwelveDataFetcher, SHARED_INDICATOR_DIR
 from src.calculator import TechnicalCalculator
 from src.reversal_calculator import ReversalCalculator
 from src.triggers import TriggerEngine
@@ -161,8 +162,9 @@ def main():
         if extra:
             td_api_keys.append(extra)
     fetcher = TwelveDataFetcher(td_api_key, api_keys=td_api_keys)
-    calculator = TechnicalCalculator()
-    reversal_calc = ReversalCalculator()
+    indicator_store = IndicatorStore(SHARED_INDICATOR_DIR)
+    calculator = TechnicalCalculator(indicator_store=indicator_store)
+    reversal_calc = ReversalCalculator(indicator_store=indicator_store)
     trigger_engine = TriggerEngine(default_triggers)
     notifier = Notifier(resend_api_key, email_from, email_to)
 
@@ -180,6 +182,7 @@ def main():
     all_matrix_data = []  # Matrix for ALL tickers
     triggered_items_for_state = []
     trigger_keys_fired_today = []
+    scanned = {}  # symbol -> per-ticker scan results, in watchlist order
     
     # Process each ticker
     for ticker_conf in tickers:
@@ -195,7 +198,7 @@ def main():
             continue
             
         # Calculate indicators and score
-        df = calculator.process_data(data_ts)
+        df = calculator.process_data(data_ts, symbol=symbol)
         if df is None or df.empty:
             logger.warning(f"Could not process data for {symbol}")
             continue
@@ -248,8 +251,32 @@ def main():
         matrix['downside_conviction'] = downside_conviction
         matrix['reversal_signal'] = reversal_analysis['signal']
 
-        # Evaluate config-based Triggers
-        triggers = trigger_engine.evaluate(symbol, df, score, ticker_triggers, matrix=matrix)
+        scanned[symbol] = {
+            'theme': theme,
+            'ticker_triggers': ticker_triggers,
+            'df': df,
+            'score': score,
+            'price': price,
+            'matrix': matrix,
+            'upside_conviction': upside_conviction,
+            'downside_conviction': downside_conviction,
+            'reversal_triggers': reversal_triggers_raw,
+        }
+
+    # Evaluate config-based triggers for the whole watchlist at once
+    fired = trigger_engine.evaluate_batch(
+        {symbol: item['df'] for symbol, item in scanned.items()},
+        {symbol: item['score'] for symbol, item in scanned.items()},
+        ticker_triggers={symbol: item['ticker_triggers'] for symbol, item in scanned.items()},
+        matrices={symbol: item['matrix'] for symbol, item in scanned.items()},
+    )
+
+    for symbol, item in scanned.items():
+        theme, score, price = item['theme'], item['score'], item['price']
+        upside_conviction = item['upside_conviction']
+        downside_conviction = item['downside_conviction']
+        reversal_triggers_raw = item['reversal_triggers']
+        triggers = fired[symbol]
 
         # Convert reversal_triggers to standard trigger format and merge
         # IMPORTANT: Only include HIGH conviction signals for actionable alerts
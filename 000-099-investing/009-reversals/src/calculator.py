@@ -4,11 +4,15 @@ Technical indicator calculations for reversal signals.
 Extends shared_core.TechnicalCalculator with reversal-specific methods.
 """
 
+from typing import Optional
+
 import pandas as pd
 import numpy as np
 
 # Import base calculator from shared_core
 from shared_core import TechnicalCalculator as BaseCalculator
+from shared_core.cache.indicator_store import IndicatorStore
+from shared_core.data import add_standard_indicators
 
 
 class TechnicalCalculator(BaseCalculator):
@@ -23,8 +27,13 @@ class TechnicalCalculator(BaseCalculator):
     - count_consecutive_direction, calculate_support_resistance
     """
     
-    def __init__(self):
-        pass
+    def __init__(self, indicator_store: Optional[IndicatorStore] = None):
+        """
+        Args:
+            indicator_store: Reuse indicators other pipelines already
+                computed today from the same cached OHLCV
+        """
+        self.indicator_store = indicator_store
     
     @staticmethod
     def bollinger_bands_with_width(close: pd.Series, period: int = 20, std_dev: int = 2) -> tuple:
@@ -36,10 +45,13 @@ class TechnicalCalculator(BaseCalculator):
         bandwidth = ((upper - lower) / middle) * 100
         return upper, middle, lower, bandwidth
 
-    def process_data(self, time_series_data):
+    def process_data(self, time_series_data, symbol: Optional[str] = None):
         """
         Takes raw Twelve Data time series (list of dicts) and returns a DataFrame
         with calculated indicators.
+
+        Indicators are the shared_core standard set; with an indicator store
+        and a symbol they are read back when already computed today.
         """
         if "values" not in time_series_data or not time_series_data["values"]:
             return None
@@ -56,51 +68,9 @@ class TechnicalCalculator(BaseCalculator):
         # Drop rows with missing core data
         df = df.dropna(subset=['close'])
         
-        # Reset index for methods that expect 'close' as column not index
-        df_reset = df.reset_index()
-        
-        # Calculate Indicators using inherited static methods
-        # Trend
-        df['SMA_20'] = self.sma(df['close'], 20)
-        df['SMA_50'] = self.sma(df['close'], 50)
-        df['SMA_200'] = self.sma(df['close'], 200)
-        
-        # Momentum
-        df['RSI'] = self.rsi(df['close'], 14)
-        
-        macd_line, signal_line, hist = self.macd(df['close'])
-        df['MACD'] = macd_line
-        df['MACD_SIGNAL'] = signal_line
-        df['MACD_HIST'] = hist
-        
-        # ADX - use adx_series for full series
-        df['ADX'] = self.adx_series(df)
-        
-        # OBV
-        df['OBV'] = self.obv(df)
-        
-        # Stochastics
-        stoch_k, stoch_d = self.stochastic(df)
-        df['STOCH_K'] = stoch_k
-        df['STOCH_D'] = stoch_d
-        
-        # Bollinger Bands with bandwidth
-        bb_upper, bb_middle, bb_lower, bb_width = self.bollinger_bands_with_width(df['close'])
-        df['BB_UPPER'] = bb_upper
-        df['BB_MIDDLE'] = bb_middle
-        df['BB_LOWER'] = bb_lower
-        df['BB_WIDTH'] = bb_width
-        
-        # ATR
-        df['ATR'] = self.atr(df)
-        
-        # Williams %R
-        df['WILLIAMS_R'] = self.williams_r(df)
-        
-        # Rate of Change
-        df['ROC'] = self.roc(df['close'])
-        
-        return df
+        if self.indicator_store is not None and symbol:
+            return self.indicator_store.get_or_compute(symbol, df, add_standard_indicators)
+        return add_standard_indicators(df)
 
     def calculate_bullish_score(self, df):
         """
@@ -5,12 +5,18 @@ Mid-term reversal detection for portfolio management.
 Uses v2 scoring with volume gate, ADX regime, and enhanced divergence.
 """
 
+from typing import Optional
+
 import pandas as pd
+from shared_core.cache.indicator_store import IndicatorStore
+from shared_core.divergence import combined_divergence_history, divergence_history_config
 from .calculator import TechnicalCalculator
 from .reversal_scoring_v2 import (
+    DIVERGENCE_LOOKBACK,
     calculate_upside_reversal_score_v2,
     calculate_downside_reversal_score_v2,
     detect_combined_divergence,
+    DivergenceResult,
     DivergenceType,
     ConvictionLevel,
     format_score_report,
@@ -23,10 +29,36 @@ class ReversalCalculator:
     Uses v2 scoring with volume gate, ADX regime multiplier, and enhanced divergence.
     """
     
-    def __init__(self):
+    def __init__(self, indicator_store: Optional[IndicatorStore] = None):
+        """
+        Args:
+            indicator_store: Reuse divergence histories already computed
+                today for the same ticker and data
+        """
         self.calc = TechnicalCalculator()
-    
-    def calculate_upside_reversal_score(self, df: pd.DataFrame) -> tuple:
+        self.indicator_store = indicator_store
+
+    def stored_divergence(self, df: pd.DataFrame, symbol: str) -> Optional[DivergenceResult]:
+        """
+        Latest combined divergence, read from (or added to) the indicator store.
+
+        Returns:
+            DivergenceResult equal to detect_combined_divergence(df,
+            DIVERGENCE_LOOKBACK), or None without a store or symbol
+        """
+        if self.indicator_store is None or not symbol or df is None or len(df) < 50:
+            return None
+        history = self.indicator_store.get_or_compute(
+            symbol, df,
+            lambda d: combined_divergence_history(d, DIVERGENCE_LOOKBACK),
+            divergence_history_config(DIVERGENCE_LOOKBACK),
+        )
+        row = history.iloc[-1]
+        return DivergenceResult(DivergenceType(str(row['type'])), float(row['strength']), str(row['description']))
+
+    def calculate_upside_reversal_score(
+        self, df: pd.DataFrame, divergence: Optional[DivergenceResult] = None
+    ) -> tuple:
         """
         Computes 1-10 upside reversal score (potential bottom/bounce).
         
@@ -38,7 +70,7 @@ class ReversalCalculator:
         
         Returns: (score, breakdown_dict)
         """
-        result = calculate_upside_reversal_score_v2(df)
+        result = calculate_upside_reversal_score_v2(df, divergence)
 
         # Convert ReversalScore dataclass to legacy tuple format
         breakdown = {
@@ -54,7 +86,9 @@ class ReversalCalculator:
 
         return result.final_score, breakdown
     
-    def calculate_downside_reversal_score(self, df: pd.DataFrame) -> tuple:
+    def calculate_downside_reversal_score(
+        self, df: pd.DataFrame, divergence: Optional[DivergenceResult] = None
+    ) -> tuple:
         """
         Computes 1-10 downside reversal score (potential top/pullback).
         
@@ -66,7 +100,7 @@ class ReversalCalculator:
         
         Returns: (score, breakdown_dict)
         """
-        result = calculate_downside_reversal_score_v2(df)
+        result = calculate_downside_reversal_score_v2(df, divergence)
 
         # Convert ReversalScore dataclass to legacy tuple format
         breakdown = {
@@ -181,8 +215,9 @@ class ReversalCalculator:
         Returns complete reversal analysis for a ticker.
         Includes conviction levels for filtering actionable signals.
         """
-        upside_score, upside_breakdown = self.calculate_upside_reversal_score(df)
-        downside_score, downside_breakdown = self.calculate_downside_reversal_score(df)
+        divergence = self.stored_divergence(df, symbol)
+        upside_score, upside_breakdown = self.calculate_upside_reversal_score(df, divergence)
+        downside_score, downside_breakdown = self.calculate_downside_reversal_score(df, divergence)
         triggers = self.detect_reversal_triggers(df)
 
         # Get conviction levels from breakdowns
@@ -36,6 +36,10 @@ class ConvictionLevel(Enum):
     NONE = "NONE"       # Below thresholds
 
 
+# Swing-point divergence window (mid-term)
+DIVERGENCE_LOOKBACK = 20
+
+
 @dataclass
 class DivergenceResult:
     type: DivergenceType
@@ -537,10 +541,14 @@ def classify_conviction(
 # MAIN SCORING FUNCTIONS
 # =============================================================================
 
-def calculate_upside_reversal_score_v2(df: pd.DataFrame) -> ReversalScore:
+def calculate_upside_reversal_score_v2(
+    df: pd.DataFrame, divergence: Optional[DivergenceResult] = None
+) -> ReversalScore:
     """
     Calculate upside reversal score with v3 enhancements.
     (Function name kept for backward compatibility)
+
+    divergence: precomputed detect_combined_divergence(df, DIVERGENCE_LOOKBACK)
     """
     if df is None or len(df) < 50:
         return ReversalScore(
@@ -554,7 +562,8 @@ def calculate_upside_reversal_score_v2(df: pd.DataFrame) -> ReversalScore:
     prev = df.iloc[-2]
 
     # Divergence (with extended lookback for mid-term)
-    divergence = detect_combined_divergence(df, lookback=20)
+    if divergence is None:
+        divergence = detect_combined_divergence(df, lookback=DIVERGENCE_LOOKBACK)
 
     # Volume ratio
     volume_mult, volume_ratio = get_volume_multiplier(df)
@@ -606,10 +615,14 @@ def calculate_upside_reversal_score_v2(df: pd.DataFrame) -> ReversalScore:
     )
 
 
-def calculate_downside_reversal_score_v2(df: pd.DataFrame) -> ReversalScore:
+def calculate_downside_reversal_score_v2(
+    df: pd.DataFrame, divergence: Optional[DivergenceResult] = None
+) -> ReversalScore:
     """
     Calculate downside reversal score with v3 enhancements.
     (Function name kept for backward compatibility)
+
+    divergence: precomputed detect_combined_divergence(df, DIVERGENCE_LOOKBACK)
     """
     if df is None or len(df) < 50:
         return ReversalScore(
@@ -622,7 +635,8 @@ def calculate_downside_reversal_score_v2(df: pd.DataFrame) -> ReversalScore:
     current = df.iloc[-1]
     prev = df.iloc[-2]
 
-    divergence = detect_combined_divergence(df, lookback=20)
+    if divergence is None:
+        divergence = detect_combined_divergence(df, lookback=DIVERGENCE_LOOKBACK)
     volume_mult, volume_ratio = get_volume_multiplier(df)
     adx_mult, adx_value = get_adx_multiplier(current.get('ADX'))
 
@@ -32,6 +32,8 @@ from src import (
     OutputFormat,
 )
 from shared_core import archive_daily_indicators
+from shared_core.cache.indicator_store import IndicatorStore
+from src.fetcher import SHARED_INDICATOR_DIR
 
 
 # =============================================================================
@@ -136,41 +138,28 @@ def get_cached_tickers(cache_dir: Path) -> List[str]:
     Tries today first, then falls back to most recent date available.
     """
     from datetime import datetime
-    import re
+
+    from shared_core.utils.cache_tickers import get_cache_dates
+    from shared_core.utils.cache_tickers import get_cached_tickers as get_tickers_for_date
 
     if not cache_dir.exists():
         return []
 
     # Try today's files first
     today = os.environ.get('CACHE_DATE') or datetime.now().strftime('%Y-%m-%d')
-    tickers = []
-    for f in cache_dir.glob(f"*_{today}.json"):
-        ticker = f.stem.replace(f"_{today}", "")
-        if ticker:
-            tickers.append(ticker)
+    tickers = get_tickers_for_date(cache_dir, today)
 
     if tickers:
-        return sorted(set(tickers))
+        return tickers
 
     # Fallback: find most recent date in cache
-    date_pattern = re.compile(r'_(\d{4}-\d{2}-\d{2})\.json$')
-    dates = set()
-    for f in cache_dir.glob("*_????-??-??.json"):
-        match = date_pattern.search(f.name)
-        if match:
-            dates.add(match.group(1))
+    dates = get_cache_dates(cache_dir)
 
     if not dates:
         return []
 
     # Use most recent date
-    latest_date = max(dates)
-    for f in cache_dir.glob(f"*_{latest_date}.json"):
-        ticker = f.stem.replace(f"_{latest_date}", "")
-        if ticker:
-            tickers.append(ticker)
-
-    return sorted(set(tickers))
+    return get_tickers_for_date(cache_dir, dates[0])
 
 
 class WatchlistManager:
@@ -267,7 +256,7 @@ class OversoldScanner:
             api_keys: Optional list of API keys for rotation.
         """
         self.fetcher = TwelveDataFetcher(api_key, api_keys=api_keys)
-        self.calculator = TechnicalCalculator()
+        self.calculator = TechnicalCalculator(indicator_store=IndicatorStore(SHARED_INDICATOR_DIR))
         self.scorer = OversoldScorer()
         self.logger = logger or logging.getLogger(__name__)
     
@@ -300,7 +289,7 @@ class OversoldScanner:
                 continue
             
             # Calculate technical indicators
-            df = self.calculator.process_data(data_ts)
+            df = self.calculator.process_data(data_ts, symbol=ticker)
             if df is None or df.empty:
                 self.logger.warning(f"Could not process data for {ticker}")
                 continue
@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Tuple, Any
 
 import pandas as pd
 
+from shared_core.cache.indicator_store import IndicatorStore
 from shared_core.scoring.multi_horizon import MultiHorizonCalculator
 from .calculator import TechnicalCalculator
 from .true_value_models import TrueValueResult, Tier, assign_tier
@@ -28,9 +29,14 @@ DEDUP_PAIRS = {
 class TrueValueScorer:
     """Gate filter + 4-component weighted scoring engine."""
 
-    def __init__(self) -> None:
-        self.calculator = TechnicalCalculator()
-        self.mh_calculator = MultiHorizonCalculator()
+    def __init__(self, indicator_store: Optional[IndicatorStore] = None) -> None:
+        """
+        Args:
+            indicator_store: Reuse indicators and multi-horizon results other
+                pipelines (or an earlier run) already computed today.
+        """
+        self.calculator = TechnicalCalculator(indicator_store=indicator_store)
+        self.mh_calculator = MultiHorizonCalculator(indicator_store=indicator_store)
 
     def score_batch(
         self, raw_data: Dict[str, Any], tickers: List[str]
@@ -51,17 +57,17 @@ class TrueValueScorer:
             if not data_ts:
                 continue
 
-            df = self.calculator.process_data(data_ts)
+            df = self.calculator.process_data(data_ts, symbol=ticker)
             if df is None or df.empty or len(df) < 50:
                 continue
 
-            mh = self.mh_calculator.calculate_all(df)
+            mh = self.mh_calculator.calculate(df, ticker)
 
-            mt_rsi = mh.get("MT_RSI_14", 50.0)
-            lt_score = mh.get("LT_Score", 5.0)
-            sma = mh.get("LT_SMA50_vs_SMA200", "NEUTRAL")
-            obv = mh.get("LT_OBV_Trend_50d", "NEUTRAL")
-            lt_trend = mh.get("LT_Trend", "UNDEFINED")
+            mt_rsi = mh.mt_rsi
+            lt_score = mh.lt_score
+            sma = mh.lt_ma_cross
+            obv = mh.lt_obv_trend
+            lt_trend = mh.lt_trend
 
             passes, reason = self._passes_gate(mt_rsi, lt_score, sma, obv, lt_trend)
             if not passes:
@@ -69,14 +75,12 @@ class TrueValueScorer:
                 continue
 
             # Extract additional fields
-            lt_rsi = mh.get("LT_RSI_21", 50.0)
-            price_vs_sma200_str = mh.get("LT_Price_vs_SMA200", "+0.00%")
-            price_vs_sma200 = self._parse_pct(price_vs_sma200_str)
-            w52_str = mh.get("LT_52W_Position", "50%")
-            w52_position = self._parse_pct(w52_str)
-            divergence = mh.get("MT_Divergence", "NONE")
-            mt_reversal = mh.get("MT_Reversal_Score", 5.0)
-            mt_entry = mh.get("MT_Entry_Score", 5.0)
+            lt_rsi = mh.lt_rsi
+            price_vs_sma200 = mh.lt_price_vs_sma200
+            w52_position = mh.lt_52w_position
+            divergence = mh.mt_divergence
+            mt_reversal = mh.mt_reversal_score
+            mt_entry = mh.mt_entry_score
 
             # Score components (0-10 each)
             oversold = self._oversold_score(mt_rsi, lt_rsi, price_vs_sma200)
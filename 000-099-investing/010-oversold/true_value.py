@@ -21,7 +21,8 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from src.fetcher import TwelveDataFetcher
+from shared_core.cache.indicator_store import IndicatorStore
+from src.fetcher import SHARED_INDICATOR_DIR, TwelveDataFetcher
 from src.true_value_scorer import TrueValueScorer
 from src.true_value_notifier import TrueValueNotifier
 from src.true_value_models import TrueValueResult
@@ -120,7 +121,7 @@ def main() -> int:
     raw_data = fetcher.fetch_batch_time_series(tickers)
 
     # Score
-    scorer = TrueValueScorer()
+    scorer = TrueValueScorer(indicator_store=IndicatorStore(SHARED_INDICATOR_DIR))
     results = scorer.score_batch(raw_data, tickers)
 
     # Cap at --top
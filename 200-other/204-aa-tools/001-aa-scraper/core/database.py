@@ -1,9 +1,15 @@
 """
 SQLite database operations for AA Points Monitor.
 Handles all CRUD operations, staleness detection, and expiration filtering.
+
+One long-lived WAL-mode connection serves every call. Scrapers write a whole
+run through the batch methods (insert_hotel_deals, update_hotel_baselines,
+upsert_discoveries, upsert_yield_matrix_entries), which apply all rows in a
+single transaction with executemany upserts.
 """
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -18,26 +24,97 @@ logger = logging.getLogger(__name__)
 class Database:
     """SQLite database wrapper with connection pooling and helper methods."""
 
+    # Rows per SELECT when looking up existing keys for a batch
+    LOOKUP_CHUNK = 300
+
+    # Fields every deal passed to insert_hotel_deals must carry (url is optional)
+    HOTEL_DEAL_FIELDS = (
+        'hotel_name', 'city', 'state', 'check_in', 'check_out', 'nightly_rate',
+        'base_miles', 'bonus_miles', 'total_miles', 'total_cost', 'yield_ratio',
+        'deal_score',
+    )
+
     def __init__(self, db_path: Optional[Path] = None):
         """Initialize database connection."""
         settings = get_settings()
         self.db_path = db_path or settings.database_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._depth = 0
         self._init_schema()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection on first use."""
+        if self._conn is None:
+            # Transactions are managed explicitly in get_connection
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        return self._conn
+
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            conn.close()
+        """
+        Context manager yielding the shared connection inside a transaction.
+
+        The outermost block commits on success and rolls back on error.
+        Nested blocks (e.g. single-row helpers called inside a batch) run
+        in a savepoint of the enclosing transaction. Access is serialized
+        across threads.
+        """
+        with self._lock:
+            conn = self._connect()
+            savepoint = f"sp_{self._depth}" if self._depth else None
+            conn.execute(f"SAVEPOINT {savepoint}" if savepoint else "BEGIN")
+            self._depth += 1
+            try:
+                yield conn
+            except Exception as e:
+                if savepoint:
+                    conn.execute(f"ROLLBACK TO {savepoint}")
+                    conn.execute(f"RELEASE {savepoint}")
+                else:
+                    conn.execute("ROLLBACK")
+                    logger.error(f"Database error: {e}")
+                raise
+            else:
+                conn.execute(f"RELEASE {savepoint}" if savepoint else "COMMIT")
+            finally:
+                self._depth -= 1
+
+    transaction = get_connection
+
+    def close(self):
+        """Close the shared connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _fetch_existing(
+        self,
+        cursor: sqlite3.Cursor,
+        table: str,
+        columns: str,
+        key_columns: Tuple[str, ...],
+        keys: List[Tuple[Any, ...]],
+    ) -> Dict[Tuple[Any, ...], sqlite3.Row]:
+        """Look up existing rows for many composite keys, chunked."""
+        existing: Dict[Tuple[Any, ...], sqlite3.Row] = {}
+        key_list = ", ".join(key_columns)
+        row_value = "(" + ", ".join("?" * len(key_columns)) + ")"
+        for start in range(0, len(keys), self.LOOKUP_CHUNK):
+            chunk = keys[start:start + self.LOOKUP_CHUNK]
+            cursor.execute(
+                f"SELECT {key_list}, {columns} FROM {table} "
+                f"WHERE ({key_list}) IN (VALUES {', '.join([row_value] * len(chunk))})",
+                [value for key in chunk for value in key],
+            )
+            for row in cursor.fetchall():
+                existing[tuple(row[col] for col in key_columns)] = row
+        return existing
 
     def _init_schema(self):
         """Initialize database schema."""
@@ -430,6 +507,40 @@ class Database:
                   deal_score, url, scraped_at))
             return cursor.lastrowid
 
+    @classmethod
+    def missing_hotel_deal_fields(cls, deal: Dict[str, Any]) -> List[str]:
+        """HOTEL_DEAL_FIELDS a deal lacks or leaves empty (None)."""
+        return [field for field in cls.HOTEL_DEAL_FIELDS if deal.get(field) is None]
+
+    def insert_hotel_deals(self, deals: List[Dict[str, Any]], scraped_at: str) -> int:
+        """
+        Insert a scrape's hotel deals in one transaction.
+
+        A malformed deal fails the whole batch; filter with
+        missing_hotel_deal_fields first.
+
+        Args:
+            deals: Dicts with the HOTEL_DEAL_FIELDS (url optional)
+            scraped_at: Scrape timestamp applied to every deal
+
+        Returns:
+            Number of deals inserted
+        """
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO hotel_deals
+                (hotel_name, city, state, check_in, check_out, nightly_rate,
+                 base_miles, bonus_miles, total_miles, total_cost, yield_ratio,
+                 deal_score, url, scraped_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (d['hotel_name'], d['city'], d['state'], d['check_in'], d['check_out'],
+                 d['nightly_rate'], d['base_miles'], d['bonus_miles'], d['total_miles'],
+                 d['total_cost'], d['yield_ratio'], d['deal_score'], d.get('url'), scraped_at)
+                for d in deals
+            ])
+        return len(deals)
+
     def get_top_hotel_deals(
         self,
         city: Optional[str] = None,
@@ -860,139 +971,112 @@ class Database:
             top_premium: Best 4-5 star hotel dict
             top_budget: Best 1-3 star hotel dict (if exceptional)
         """
-        now = datetime.now().isoformat()
+        self.upsert_yield_matrix_entries([{
+            'city': city,
+            'day_of_week': day_of_week,
+            'duration': duration,
+            'advance_days': advance_days,
+            'stats': stats,
+            'top_premium': top_premium,
+            'top_budget': top_budget,
+        }])
+
+    def upsert_yield_matrix_entries(self, entries: List[Dict[str, Any]]):
+        """
+        Insert or update many yield matrix entries in one transaction.
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        Existing entries get the new stats, one more verification and an
+        updated yield stability: an EMA (70% old, 30% new) of 1 - drift,
+        where drift is the relative change in avg_yield. Stability is
+        left unchanged when either yield is missing or zero.
 
-            # Check if entry exists
-            cursor.execute("""
-                SELECT id, verification_count, avg_yield, yield_stability
-                FROM hotel_yield_matrix
-                WHERE city = ? AND day_of_week = ? AND duration = ? AND advance_days = ?
-            """, (city, day_of_week, duration, advance_days))
-
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update existing entry
-                old_yield = existing['avg_yield'] or 0
-                new_yield = stats.get('avg_yield', 0)
-                ver_count = existing['verification_count'] + 1
-
-                # Calculate stability (exponential moving average of 1 - drift)
-                if old_yield > 0 and new_yield > 0:
-                    drift = abs(new_yield - old_yield) / old_yield
-                    # Use stored stability or default to 1.0 for first verification
-                    old_stability = existing['yield_stability'] if existing['yield_stability'] else 1.0
-                    # EMA: 70% old stability, 30% new observation
-                    stability = 0.7 * old_stability + 0.3 * (1.0 - min(drift, 1.0))
-                else:
-                    stability = existing['yield_stability']  # Keep existing if can't calculate
+        Args:
+            entries: Dicts with the upsert_yield_matrix_entry arguments
+                (city, day_of_week, duration, advance_days, stats and
+                optional top_premium / top_budget)
+        """
+        now = datetime.now().isoformat()
+        rows = []
+        for entry in entries:
+            stats = entry['stats']
+            top_premium = entry.get('top_premium')
+            top_budget = entry.get('top_budget')
+            rows.append((
+                entry['city'], entry['day_of_week'], entry['duration'], entry['advance_days'],
+                stats.get('avg_yield'),
+                stats.get('max_yield'),
+                stats.get('min_yield'),
+                stats.get('median_yield'),
+                stats.get('deal_count', 0),
+                stats.get('avg_yield_5star'),
+                stats.get('avg_yield_4star'),
+                stats.get('avg_yield_3star'),
+                stats.get('avg_yield_2star'),
+                stats.get('avg_yield_1star'),
+                stats.get('count_5star', 0),
+                stats.get('count_4star', 0),
+                stats.get('count_3star', 0),
+                stats.get('count_2star', 0),
+                stats.get('count_1star', 0),
+                top_premium.get('hotel_name') if top_premium else None,
+                top_premium.get('yield_ratio') if top_premium else None,
+                top_premium.get('total_cost') if top_premium else None,
+                top_premium.get('total_miles') if top_premium else None,
+                top_premium.get('stars') if top_premium else None,
+                top_budget.get('hotel_name') if top_budget else None,
+                top_budget.get('yield_ratio') if top_budget else None,
+                top_budget.get('total_cost') if top_budget else None,
+                top_budget.get('total_miles') if top_budget else None,
+                top_budget.get('stars') if top_budget else None,
+                now, now
+            ))
 
-                cursor.execute("""
-                    UPDATE hotel_yield_matrix SET
-                        avg_yield = ?,
-                        max_yield = ?,
-                        min_yield = ?,
-                        median_yield = ?,
-                        deal_count = ?,
-                        avg_yield_5star = ?,
-                        avg_yield_4star = ?,
-                        avg_yield_3star = ?,
-                        avg_yield_2star = ?,
-                        avg_yield_1star = ?,
-                        count_5star = ?,
-                        count_4star = ?,
-                        count_3star = ?,
-                        count_2star = ?,
-                        count_1star = ?,
-                        top_premium_hotel = ?,
-                        top_premium_yield = ?,
-                        top_premium_cost = ?,
-                        top_premium_miles = ?,
-                        top_premium_stars = ?,
-                        top_budget_hotel = ?,
-                        top_budget_yield = ?,
-                        top_budget_cost = ?,
-                        top_budget_miles = ?,
-                        top_budget_stars = ?,
-                        last_verified_at = ?,
-                        verification_count = ?,
-                        yield_stability = ?
-                    WHERE id = ?
-                """, (
-                    stats.get('avg_yield'),
-                    stats.get('max_yield'),
-                    stats.get('min_yield'),
-                    stats.get('median_yield'),
-                    stats.get('deal_count', 0),
-                    stats.get('avg_yield_5star'),
-                    stats.get('avg_yield_4star'),
-                    stats.get('avg_yield_3star'),
-                    stats.get('avg_yield_2star'),
-                    stats.get('avg_yield_1star'),
-                    stats.get('count_5star', 0),
-                    stats.get('count_4star', 0),
-                    stats.get('count_3star', 0),
-                    stats.get('count_2star', 0),
-                    stats.get('count_1star', 0),
-                    top_premium.get('hotel_name') if top_premium else None,
-                    top_premium.get('yield_ratio') if top_premium else None,
-                    top_premium.get('total_cost') if top_premium else None,
-                    top_premium.get('total_miles') if top_premium else None,
-                    top_premium.get('stars') if top_premium else None,
-                    top_budget.get('hotel_name') if top_budget else None,
-                    top_budget.get('yield_ratio') if top_budget else None,
-                    top_budget.get('total_cost') if top_budget else None,
-                    top_budget.get('total_miles') if top_budget else None,
-                    top_budget.get('stars') if top_budget else None,
-                    now,
-                    ver_count,
-                    stability,
-                    existing['id']
-                ))
-            else:
-                # Insert new entry
-                cursor.execute("""
-                    INSERT INTO hotel_yield_matrix (
-                        city, day_of_week, duration, advance_days,
-                        avg_yield, max_yield, min_yield, median_yield, deal_count,
-                        avg_yield_5star, avg_yield_4star, avg_yield_3star, avg_yield_2star, avg_yield_1star,
-                        count_5star, count_4star, count_3star, count_2star, count_1star,
-                        top_premium_hotel, top_premium_yield, top_premium_cost, top_premium_miles, top_premium_stars,
-                        top_budget_hotel, top_budget_yield, top_budget_cost, top_budget_miles, top_budget_stars,
-                        discovered_at, last_verified_at, verification_count
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
-                """, (
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO hotel_yield_matrix (
                     city, day_of_week, duration, advance_days,
-                    stats.get('avg_yield'),
-                    stats.get('max_yield'),
-                    stats.get('min_yield'),
-                    stats.get('median_yield'),
-                    stats.get('deal_count', 0),
-                    stats.get('avg_yield_5star'),
-                    stats.get('avg_yield_4star'),
-                    stats.get('avg_yield_3star'),
-                    stats.get('avg_yield_2star'),
-                    stats.get('avg_yield_1star'),
-                    stats.get('count_5star', 0),
-                    stats.get('count_4star', 0),
-                    stats.get('count_3star', 0),
-                    stats.get('count_2star', 0),
-                    stats.get('count_1star', 0),
-                    top_premium.get('hotel_name') if top_premium else None,
-                    top_premium.get('yield_ratio') if top_premium else None,
-                    top_premium.get('total_cost') if top_premium else None,
-                    top_premium.get('total_miles') if top_premium else None,
-                    top_premium.get('stars') if top_premium else None,
-                    top_budget.get('hotel_name') if top_budget else None,
-                    top_budget.get('yield_ratio') if top_budget else None,
-                    top_budget.get('total_cost') if top_budget else None,
-                    top_budget.get('total_miles') if top_budget else None,
-                    top_budget.get('stars') if top_budget else None,
-                    now, now
-                ))
+                    avg_yield, max_yield, min_yield, median_yield, deal_count,
+                    avg_yield_5star, avg_yield_4star, avg_yield_3star, avg_yield_2star, avg_yield_1star,
+                    count_5star, count_4star, count_3star, count_2star, count_1star,
+                    top_premium_hotel, top_premium_yield, top_premium_cost, top_premium_miles, top_premium_stars,
+                    top_budget_hotel, top_budget_yield, top_budget_cost, top_budget_miles, top_budget_stars,
+                    discovered_at, last_verified_at, verification_count
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+                ON CONFLICT(city, day_of_week, duration, advance_days) DO UPDATE SET
+                    yield_stability = CASE
+                        WHEN COALESCE(avg_yield, 0) > 0 AND excluded.avg_yield > 0 THEN
+                            0.7 * COALESCE(NULLIF(yield_stability, 0), 1.0)
+                            + 0.3 * (1.0 - MIN(ABS(excluded.avg_yield - avg_yield) / avg_yield, 1.0))
+                        ELSE yield_stability
+                    END,
+                    avg_yield = excluded.avg_yield,
+                    max_yield = excluded.max_yield,
+                    min_yield = excluded.min_yield,
+                    median_yield = excluded.median_yield,
+                    deal_count = excluded.deal_count,
+                    avg_yield_5star = excluded.avg_yield_5star,
+                    avg_yield_4star = excluded.avg_yield_4star,
+                    avg_yield_3star = excluded.avg_yield_3star,
+                    avg_yield_2star = excluded.avg_yield_2star,
+                    avg_yield_1star = excluded.avg_yield_1star,
+                    count_5star = excluded.count_5star,
+                    count_4star = excluded.count_4star,
+                    count_3star = excluded.count_3star,
+                    count_2star = excluded.count_2star,
+                    count_1star = excluded.count_1star,
+                    top_premium_hotel = excluded.top_premium_hotel,
+                    top_premium_yield = excluded.top_premium_yield,
+                    top_premium_cost = excluded.top_premium_cost,
+                    top_premium_miles = excluded.top_premium_miles,
+                    top_premium_stars = excluded.top_premium_stars,
+                    top_budget_hotel = excluded.top_budget_hotel,
+                    top_budget_yield = excluded.top_budget_yield,
+                    top_budget_cost = excluded.top_budget_cost,
+                    top_budget_miles = excluded.top_budget_miles,
+                    top_budget_stars = excluded.top_budget_stars,
+                    last_verified_at = excluded.last_verified_at,
+                    verification_count = verification_count + 1
+            """, rows)
 
     def get_matrix_entry(
         self,
@@ -1350,62 +1434,109 @@ class Database:
             star_rating: Hotel star rating (1-5)
             yield_ratio: Current yield observation
         """
+        self.update_hotel_baselines([{
+            'hotel_name': hotel_name,
+            'city': city,
+            'day_of_week': day_of_week,
+            'star_rating': star_rating,
+            'yield_ratio': yield_ratio,
+        }])
+
+    @staticmethod
+    def _welford_step(baseline: Dict[str, Any], yield_ratio: float) -> Dict[str, Any]:
+        """Fold one yield observation into a baseline's running stats."""
+        n = baseline['observation_count'] + 1
+        old_avg = baseline['avg_yield']
+        old_stddev = baseline['stddev_yield'] or 0
+
+        # Welford's online algorithm
+        delta = yield_ratio - old_avg
+        new_avg = old_avg + delta / n
+
+        # For stddev, we track M2 (sum of squared differences)
+        # stddev = sqrt(M2 / n), so M2 = stddev^2 * (n-1)
+        if n > 2:
+            old_m2 = (old_stddev ** 2) * (n - 2) if old_stddev else 0
+            delta2 = yield_ratio - new_avg
+            new_m2 = old_m2 + delta * delta2
+            new_stddev = (new_m2 / (n - 1)) ** 0.5 if n > 1 else 0
+        else:
+            new_stddev = abs(yield_ratio - new_avg) if n == 2 else 0
+
+        return {
+            'star_rating': baseline['star_rating'],
+            'avg_yield': new_avg,
+            'stddev_yield': new_stddev,
+            'min_yield': min(baseline['min_yield'] or yield_ratio, yield_ratio),
+            'max_yield': max(baseline['max_yield'] or yield_ratio, yield_ratio),
+            'observation_count': n,
+        }
+
+    def update_hotel_baselines(self, observations: List[Dict[str, Any]]):
+        """
+        Fold many yield observations into hotel baselines in one transaction.
+
+        Existing baselines are read with one lookup per chunk of keys,
+        observations are applied in order (repeated hotels fold
+        sequentially, as with repeated update_hotel_baseline calls), and
+        the results are written with a single executemany upsert.
+
+        Args:
+            observations: Dicts with hotel_name, city, day_of_week,
+                star_rating and yield_ratio
+        """
+        if not observations:
+            return
+
         now = datetime.now().isoformat()
+        key_columns = ('hotel_name', 'city', 'day_of_week')
+        keys = list(dict.fromkeys(
+            (o['hotel_name'], o['city'], o['day_of_week']) for o in observations
+        ))
 
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            existing = self._fetch_existing(
+                cursor, 'hotel_yield_baselines',
+                'star_rating, avg_yield, stddev_yield, min_yield, max_yield, observation_count',
+                key_columns, keys,
+            )
+            baselines: Dict[Tuple[Any, ...], Dict[str, Any]] = {
+                key: dict(row) for key, row in existing.items()
+            }
 
-            # Check for existing baseline
-            cursor.execute("""
-                SELECT id, avg_yield, stddev_yield, min_yield, max_yield, observation_count
-                FROM hotel_yield_baselines
-                WHERE hotel_name = ? AND city = ? AND day_of_week = ?
-            """, (hotel_name, city, day_of_week))
-
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update using Welford's algorithm for running mean and variance
-                n = existing['observation_count'] + 1
-                old_avg = existing['avg_yield']
-                old_stddev = existing['stddev_yield'] or 0
-
-                # Welford's online algorithm
-                delta = yield_ratio - old_avg
-                new_avg = old_avg + delta / n
-
-                # For stddev, we track M2 (sum of squared differences)
-                # stddev = sqrt(M2 / n), so M2 = stddev^2 * (n-1)
-                if n > 2:
-                    old_m2 = (old_stddev ** 2) * (n - 2) if old_stddev else 0
-                    delta2 = yield_ratio - new_avg
-                    new_m2 = old_m2 + delta * delta2
-                    new_stddev = (new_m2 / (n - 1)) ** 0.5 if n > 1 else 0
+            for obs in observations:
+                key = (obs['hotel_name'], obs['city'], obs['day_of_week'])
+                yield_ratio = obs['yield_ratio']
+                if key in baselines:
+                    baselines[key] = self._welford_step(baselines[key], yield_ratio)
                 else:
-                    new_stddev = abs(yield_ratio - new_avg) if n == 2 else 0
-
-                new_min = min(existing['min_yield'] or yield_ratio, yield_ratio)
-                new_max = max(existing['max_yield'] or yield_ratio, yield_ratio)
-
-                cursor.execute("""
-                    UPDATE hotel_yield_baselines SET
-                        avg_yield = ?,
-                        stddev_yield = ?,
-                        min_yield = ?,
-                        max_yield = ?,
-                        observation_count = ?,
-                        last_updated = ?
-                    WHERE id = ?
-                """, (new_avg, new_stddev, new_min, new_max, n, now, existing['id']))
-            else:
-                # Insert new baseline
-                cursor.execute("""
-                    INSERT INTO hotel_yield_baselines
-                    (hotel_name, city, day_of_week, star_rating, avg_yield, stddev_yield,
-                     min_yield, max_yield, observation_count, last_updated)
-                    VALUES (?, ?, ?, ?, ?, 0, ?, ?, 1, ?)
-                """, (hotel_name, city, day_of_week, star_rating, yield_ratio,
-                      yield_ratio, yield_ratio, now))
+                    baselines[key] = {
+                        'star_rating': obs['star_rating'],
+                        'avg_yield': yield_ratio,
+                        'stddev_yield': 0,
+                        'min_yield': yield_ratio,
+                        'max_yield': yield_ratio,
+                        'observation_count': 1,
+                    }
+
+            cursor.executemany("""
+                INSERT INTO hotel_yield_baselines
+                (hotel_name, city, day_of_week, star_rating, avg_yield, stddev_yield,
+                 min_yield, max_yield, observation_count, last_updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(hotel_name, city, day_of_week) DO UPDATE SET
+                    avg_yield = excluded.avg_yield,
+                    stddev_yield = excluded.stddev_yield,
+                    min_yield = excluded.min_yield,
+                    max_yield = excluded.max_yield,
+                    observation_count = excluded.observation_count,
+                    last_updated = excluded.last_updated
+            """, [
+                (*key, b['star_rating'], b['avg_yield'], b['stddev_yield'],
+                 b['min_yield'], b['max_yield'], b['observation_count'], now)
+                for key, b in baselines.items()
+            ])
 
     def get_hotel_baseline(
         self,
@@ -1490,27 +1621,35 @@ class Database:
             deal_identifier: Unique identifier (merchant_name or hotel_city)
             yield_value: Current yield (optional, tracks best)
         """
+        self.upsert_discoveries([{
+            'deal_type': deal_type,
+            'deal_identifier': deal_identifier,
+            'yield_value': yield_value,
+        }])
+
+    def upsert_discoveries(self, discoveries: List[Dict[str, Any]]):
+        """
+        Record or update many deal discoveries in one transaction.
+
+        Args:
+            discoveries: Dicts with deal_type, deal_identifier and optional
+                yield_value (see upsert_discovery)
+        """
         now = datetime.now().isoformat()
 
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Try to update existing
-            cursor.execute("""
-                UPDATE deal_discoveries SET
-                    last_seen_at = ?,
+            conn.executemany("""
+                INSERT INTO deal_discoveries
+                (deal_type, deal_identifier, first_seen_at, last_seen_at, times_seen, best_yield_seen)
+                VALUES (?, ?, ?, ?, 1, ?)
+                ON CONFLICT(deal_type, deal_identifier) DO UPDATE SET
+                    last_seen_at = excluded.last_seen_at,
                     times_seen = times_seen + 1,
-                    best_yield_seen = MAX(COALESCE(best_yield_seen, 0), COALESCE(?, 0))
-                WHERE deal_type = ? AND deal_identifier = ?
-            """, (now, yield_value, deal_type, deal_identifier))
-
-            if cursor.rowcount == 0:
-                # Insert new discovery
-                cursor.execute("""
-                    INSERT INTO deal_discoveries
-                    (deal_type, deal_identifier, first_seen_at, last_seen_at, times_seen, best_yield_seen)
-                    VALUES (?, ?, ?, ?, 1, ?)
-                """, (deal_type, deal_identifier, now, now, yield_value))
+                    best_yield_seen = MAX(COALESCE(best_yield_seen, 0), COALESCE(excluded.best_yield_seen, 0))
+            """, [
+                (d['deal_type'], d['deal_identifier'], now, now, d.get('yield_value'))
+                for d in discoveries
+            ])
 
     def get_new_discoveries(
         self,
@@ -4,6 +4,7 @@ Cloud PostgreSQL backend with the same interface as SQLite database.py.
 """
 
 import logging
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from functools import wraps
@@ -55,6 +56,15 @@ class SupabaseDatabase:
         )
         logger.info("Supabase client initialized with schema: aa_scraper")
 
+    @contextmanager
+    def transaction(self):
+        """
+        Interface parity with the SQLite Database.
+
+        PostgREST commits each request on its own, so this groups nothing.
+        """
+        yield None
+
     # ==================== SimplyMiles Operations ====================
 
     @retry_on_error()
@@ -244,6 +254,32 @@ class SupabaseDatabase:
 
         return result.data[0]['id'] if result.data else None
 
+    @retry_on_error()
+    def insert_hotel_deals(self, deals: List[Dict[str, Any]], scraped_at: str) -> int:
+        """Insert a scrape's hotel deals in one request. Returns count inserted."""
+        if not deals:
+            return 0
+        self.client.table('hotel_deals').insert([
+            {
+                'hotel_name': d['hotel_name'],
+                'city': d['city'],
+                'state': d['state'],
+                'check_in': d['check_in'],
+                'check_out': d['check_out'],
+                'nightly_rate': d['nightly_rate'],
+                'base_miles': d['base_miles'],
+                'bonus_miles': d['bonus_miles'],
+                'total_miles': d['total_miles'],
+                'total_cost': d['total_cost'],
+                'yield_ratio': d['yield_ratio'],
+                'deal_score': d['deal_score'],
+                'url': d.get('url'),
+                'scraped_at': scraped_at
+            }
+            for d in deals
+        ]).execute()
+        return len(deals)
+
     @retry_on_error()
     def get_top_hotel_deals(
         self,
@@ -359,6 +395,11 @@ class SupabaseDatabase:
                 'last_updated': now
             }).execute()
 
+    def update_hotel_baselines(self, observations: List[Dict[str, Any]]):
+        """Apply update_hotel_baseline to each observation, in order."""
+        for obs in observations:
+            self.update_hotel_baseline(**obs)
+
     @retry_on_error()
     def get_hotel_baseline(
         self,
@@ -443,6 +484,11 @@ class SupabaseDatabase:
                 'best_yield_seen': yield_value
             }).execute()
 
+    def upsert_discoveries(self, discoveries: List[Dict[str, Any]]):
+        """Apply upsert_discovery to each discovery, in order."""
+        for d in discoveries:
+            self.upsert_discovery(d['deal_type'], d['deal_identifier'], d.get('yield_value'))
+
     @retry_on_error()
     def get_new_discoveries(self, days: int = 7) -> List[Dict[str, Any]]:
         """Get deals discovered in the last N days that are still active."""
@@ -883,6 +929,11 @@ class SupabaseDatabase:
 
             self.client.table('hotel_yield_matrix').insert(data).execute()
 
+    def upsert_yield_matrix_entries(self, entries: List[Dict[str, Any]]):
+        """Apply upsert_yield_matrix_entry to each entry, in order."""
+        for entry in entries:
+            self.upsert_yield_matrix_entry(**entry)
+
     @retry_on_error()
     def get_matrix_entry(
         self,
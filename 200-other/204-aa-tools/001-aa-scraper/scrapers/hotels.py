@@ -409,50 +409,44 @@ def run_scraper(test_mode: bool = False) -> Dict[str, Any]:
             db = get_database()
             scraped_at = datetime.now().isoformat()
 
-            # Clear old deals
-            db.clear_hotel_deals()
-
-            stored = 0
+            baselines = []
+            discoveries = []
+            deals = []
             for hotel in all_hotels:
-                try:
-                    db.insert_hotel_deal(
-                        hotel_name=hotel['hotel_name'],
-                        city=hotel['city'],
-                        state=hotel['state'],
-                        check_in=hotel['check_in'],
-                        check_out=hotel['check_out'],
-                        nightly_rate=hotel['nightly_rate'],
-                        base_miles=hotel['base_miles'],
-                        bonus_miles=hotel['bonus_miles'],
-                        total_miles=hotel['total_miles'],
-                        total_cost=hotel['total_cost'],
-                        yield_ratio=hotel['yield_ratio'],
-                        deal_score=hotel['deal_score'],
-                        url=hotel.get('url'),
-                        scraped_at=scraped_at
+                # Skip malformed deals here: one bad row would fail the batch insert
+                missing = db.missing_hotel_deal_fields(hotel)
+                if missing:
+                    logger.warning(
+                        f"Skipping hotel {hotel.get('hotel_name', '?')}: missing {', '.join(missing)}"
                     )
-
-                    # Update hotel yield baseline for deviation-based alerting
+                    continue
+                try:
+                    # Hotel yield baseline for deviation-based alerting
                     check_in_dt = datetime.fromisoformat(hotel['check_in'])
-                    db.update_hotel_baseline(
-                        hotel_name=hotel['hotel_name'],
-                        city=hotel['city'],
-                        day_of_week=check_in_dt.weekday(),
-                        star_rating=hotel.get('stars', 3),
-                        yield_ratio=hotel['yield_ratio']
-                    )
-
-                    # Record discovery for "New This Week" tracking
-                    deal_identifier = f"{hotel['hotel_name']}_{hotel['city']}"
-                    db.upsert_discovery(
-                        deal_type='hotel',
-                        deal_identifier=deal_identifier,
-                        yield_value=hotel['yield_ratio']
-                    )
-
-                    stored += 1
+                    baselines.append({
+                        'hotel_name': hotel['hotel_name'],
+                        'city': hotel['city'],
+                        'day_of_week': check_in_dt.weekday(),
+                        'star_rating': hotel.get('stars', 3),
+                        'yield_ratio': hotel['yield_ratio'],
+                    })
+
+                    # Discovery for "New This Week" tracking
+                    discoveries.append({
+                        'deal_type': 'hotel',
+                        'deal_identifier': f"{hotel['hotel_name']}_{hotel['city']}",
+                        'yield_value': hotel['yield_ratio'],
+                    })
+                    deals.append(hotel)
                 except Exception as e:
-                    logger.warning(f"Error inserting hotel: {e}")
+                    logger.warning(f"Error preparing hotel: {e}")
+
+            # Replace deals and fold in baselines/discoveries in one transaction
+            with db.transaction():
+                db.clear_hotel_deals()
+                stored = db.insert_hotel_deals(deals, scraped_at)
+                db.update_hotel_baselines(baselines)
+                db.upsert_discoveries(discoveries)
 
             # Record successful scrape
             db.record_scraper_run(
@@ -62,6 +62,9 @@ DAYS_OF_WEEK = [0, 1, 2, 3, 4, 5, 6]  # Mon-Sun
 DURATIONS = [1, 2, 3]  # 1, 2, 3 nights
 ADVANCE_DAYS = [7, 14, 21, 30, 45, 60, 90]  # Days ahead
 
+# Combinations explored between matrix/progress writes
+FLUSH_EVERY = 20
+
 
 def find_next_date_with_dow(target_dow: int, min_advance: int) -> datetime:
     """
@@ -209,18 +212,18 @@ def explore_combination(
     city_name: str,
     day_of_week: int,
     duration: int,
-    advance_days: int,
-    db: Any
-) -> Tuple[bool, int, Optional[str]]:
+    advance_days: int
+) -> Tuple[bool, int, Optional[str], Optional[Dict[str, Any]]]:
     """
-    Explore a single combination and save to matrix.
+    Explore a single combination.
 
     Returns:
-        Tuple of (success, hotels_found, error_message)
+        Tuple of (success, hotels_found, error_message, matrix_entry), where
+        matrix_entry is an upsert_yield_matrix_entries dict (None on error)
     """
     city = get_city_by_name(city_name)
     if not city:
-        return False, 0, f"Unknown city: {city_name}"
+        return False, 0, f"Unknown city: {city_name}", None
 
     # Calculate check-in/out dates
     check_in = find_next_date_with_dow(day_of_week, advance_days)
@@ -229,41 +232,44 @@ def explore_combination(
     try:
         hotels = search_hotels(client, city, check_in, check_out)
 
-        if not hotels:
-            # No results - still record as explored
-            stats = calculate_matrix_stats([])
-            db.upsert_yield_matrix_entry(
-                city=city_name,
-                day_of_week=day_of_week,
-                duration=duration,
-                advance_days=advance_days,
-                stats=stats,
-                top_premium=None,
-                top_budget=None
+        entry = {
+            'city': city_name,
+            'day_of_week': day_of_week,
+            'duration': duration,
+            'advance_days': advance_days,
+            'stats': calculate_matrix_stats(hotels),
+            'top_premium': None,
+            'top_budget': None,
+        }
+
+        # No results - still record as explored
+        if hotels:
+            entry['top_premium'], entry['top_budget'] = find_top_hotels(
+                hotels, city_name, city.is_local
             )
-            return True, 0, None
-
-        # Calculate stats
-        stats = calculate_matrix_stats(hotels)
-
-        # Find top hotels
-        top_premium, top_budget = find_top_hotels(hotels, city_name, city.is_local)
-
-        # Save to matrix
-        db.upsert_yield_matrix_entry(
-            city=city_name,
-            day_of_week=day_of_week,
-            duration=duration,
-            advance_days=advance_days,
-            stats=stats,
-            top_premium=top_premium,
-            top_budget=top_budget
-        )
 
-        return True, len(hotels), None
+        return True, len(hotels), None, entry
 
     except Exception as e:
-        return False, 0, str(e)
+        return False, 0, str(e), None
+
+
+def flush_discovery(db: Any, session_id: str, entries: List[Dict[str, Any]], attempts: List[Dict[str, Any]]):
+    """
+    Save buffered matrix entries and their progress records together.
+
+    One transaction keeps resume state consistent: a combination is only
+    marked explored once its matrix entry is written.
+    """
+    if not attempts:
+        return
+    with db.transaction():
+        if entries:
+            db.upsert_yield_matrix_entries(entries)
+        for attempt in attempts:
+            db.record_discovery_attempt(session_id=session_id, **attempt)
+    entries.clear()
+    attempts.clear()
 
 
 def run_discovery(
@@ -327,47 +333,56 @@ def run_discovery(
         'elapsed_seconds': 0,
     }
 
-    with httpx.Client(headers=HEADERS, follow_redirects=True) as client:
-        for i, (city_name, dow, duration, advance) in enumerate(remaining):
-            # Check time limit
-            elapsed = time() - start_time
-            if elapsed >= max_seconds:
-                logger.info(f"Time limit reached ({max_time_minutes} min)")
-                break
-
-            # Progress update every 20 combinations
-            if i > 0 and i % 20 == 0:
-                pct = (len(completed) + i) / total_combinations * 100
-                logger.info(f"Progress: {len(completed) + i}/{total_combinations} ({pct:.1f}%)")
-
-            # Explore this combination
-            dow_name = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'][dow]
-            logger.debug(f"Exploring: {city_name}, {dow_name}, {duration}n, {advance}d ahead")
-
-            random_delay()
-
-            success, hotels_count, error = explore_combination(
-                client, city_name, dow, duration, advance, db
-            )
-
-            # Record progress
-            db.record_discovery_attempt(
-                session_id=session_id,
-                city=city_name,
-                day_of_week=dow,
-                duration=duration,
-                advance_days=advance,
-                status='success' if success else 'error',
-                hotels_found=hotels_count,
-                error_message=error
-            )
-
-            results['explored_now'] += 1
-            results['hotels_found'] += hotels_count
+    pending_entries: List[Dict[str, Any]] = []
+    pending_attempts: List[Dict[str, Any]] = []
 
-            if not success:
-                results['errors'] += 1
-                logger.warning(f"Error: {city_name}/{dow}/{duration}/{advance}: {error}")
+    with httpx.Client(headers=HEADERS, follow_redirects=True) as client:
+        try:
+            for i, (city_name, dow, duration, advance) in enumerate(remaining):
+                # Check time limit
+                elapsed = time() - start_time
+                if elapsed >= max_seconds:
+                    logger.info(f"Time limit reached ({max_time_minutes} min)")
+                    break
+
+                # Progress update and save every FLUSH_EVERY combinations
+                if i > 0 and i % FLUSH_EVERY == 0:
+                    flush_discovery(db, session_id, pending_entries, pending_attempts)
+                    pct = (len(completed) + i) / total_combinations * 100
+                    logger.info(f"Progress: {len(completed) + i}/{total_combinations} ({pct:.1f}%)")
+
+                # Explore this combination
+                dow_name = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'][dow]
+                logger.debug(f"Exploring: {city_name}, {dow_name}, {duration}n, {advance}d ahead")
+
+                random_delay()
+
+                success, hotels_count, error, entry = explore_combination(
+                    client, city_name, dow, duration, advance
+                )
+
+                # Record progress (written with the matrix entry on flush)
+                if entry:
+                    pending_entries.append(entry)
+                pending_attempts.append({
+                    'city': city_name,
+                    'day_of_week': dow,
+                    'duration': duration,
+                    'advance_days': advance,
+                    'status': 'success' if success else 'error',
+                    'hotels_found': hotels_count,
+                    'error_message': error,
+                })
+
+                results['explored_now'] += 1
+                results['hotels_found'] += hotels_count
+
+                if not success:
+                    results['errors'] += 1
+                    logger.warning(f"Error: {city_name}/{dow}/{duration}/{advance}: {error}")
+        finally:
+            # Save the last partial batch, also when interrupted
+            flush_discovery(db, session_id, pending_entries, pending_attempts)
 
     results['elapsed_seconds'] = time() - start_time
 
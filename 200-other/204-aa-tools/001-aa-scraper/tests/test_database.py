@@ -20,8 +20,10 @@ def temp_db():
     yield db
 
     # Cleanup
-    if db_path.exists():
-        db_path.unlink()
+    db.close()
+    for path in (db_path, Path(f"{db_path}-wal"), Path(f"{db_path}-shm")):
+        if path.exists():
+            path.unlink()
 
 
 class TestDatabaseSchema:
@@ -236,6 +238,102 @@ class TestHotelOperations:
         assert vegas_deals[0]['city'] == "Las Vegas"
 
 
+class TestBatchOperations:
+    """Tests for set-based batch writes."""
+
+    @staticmethod
+    def _deal(name: str, city: str = "Austin"):
+        return {
+            'hotel_name': name, 'city': city, 'state': "TX",
+            'check_in': (datetime.now() + timedelta(days=7)).isoformat(),
+            'check_out': (datetime.now() + timedelta(days=8)).isoformat(),
+            'nightly_rate': 100.0, 'base_miles': 1000, 'bonus_miles': 0,
+            'total_miles': 1000, 'total_cost': 100.0, 'yield_ratio': 10.0,
+            'deal_score': 12.0,
+        }
+
+    def test_insert_hotel_deals(self, temp_db):
+        """Batch insert stores every deal."""
+        count = temp_db.insert_hotel_deals(
+            [self._deal("A"), self._deal("B")], datetime.now().isoformat()
+        )
+        assert count == 2
+        assert len(temp_db.get_top_hotel_deals(limit=10)) == 2
+
+    def test_missing_hotel_deal_fields(self, temp_db):
+        """Deals lacking a required field are reported before the batch insert."""
+        broken = {**self._deal("B"), 'state': None}
+        del broken['deal_score']
+
+        assert temp_db.missing_hotel_deal_fields(self._deal("A")) == []
+        assert temp_db.missing_hotel_deal_fields(broken) == ['state', 'deal_score']
+
+    def test_baselines_match_sequential_updates(self, temp_db):
+        """Batch baselines fold repeated hotels like one call per observation."""
+        observations = [
+            {'hotel_name': name, 'city': "Austin", 'day_of_week': 4,
+             'star_rating': 4, 'yield_ratio': y}
+            for name, y in [("A", 10.0), ("B", 8.0), ("A", 14.0), ("A", 9.0), ("B", 8.0)]
+        ]
+        temp_db.update_hotel_baselines(observations[:2])
+        temp_db.update_hotel_baselines(observations[2:])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            sequential = Database(db_path=Path(tmp) / "seq.db")
+            for obs in observations:
+                sequential.update_hotel_baseline(**obs)
+            for name in ("A", "B"):
+                batch = temp_db.get_hotel_baseline(name, "Austin", 4)
+                expected = sequential.get_hotel_baseline(name, "Austin", 4)
+                batch.pop('last_updated')
+                expected.pop('last_updated')
+                assert batch == expected
+            sequential.close()
+
+        baseline = temp_db.get_hotel_baseline("A", "Austin", 4)
+        assert baseline['observation_count'] == 3
+        assert baseline['min_yield'] == 9.0
+        assert baseline['max_yield'] == 14.0
+
+    def test_matrix_upsert_tracks_stability(self, temp_db):
+        """Re-verified matrix entries update the yield stability EMA."""
+        entry = {'city': "Austin", 'day_of_week': 4, 'duration': 1, 'advance_days': 7}
+        temp_db.upsert_yield_matrix_entries([{**entry, 'stats': {'avg_yield': 10.0}}])
+        temp_db.upsert_yield_matrix_entries([{**entry, 'stats': {'avg_yield': 12.0}}])
+
+        with temp_db.get_connection() as conn:
+            row = conn.execute("""
+                SELECT avg_yield, verification_count, yield_stability
+                FROM hotel_yield_matrix WHERE city = 'Austin'
+            """).fetchone()
+
+        assert row['avg_yield'] == 12.0
+        assert row['verification_count'] == 2
+        assert row['yield_stability'] == pytest.approx(0.7 + 0.3 * (1.0 - 0.2))
+
+    def test_upsert_discoveries(self, temp_db):
+        """Repeated discoveries count sightings and keep the best yield."""
+        temp_db.upsert_discoveries([
+            {'deal_type': 'hotel', 'deal_identifier': 'A_Austin', 'yield_value': 5.0},
+            {'deal_type': 'hotel', 'deal_identifier': 'A_Austin', 'yield_value': 9.0},
+            {'deal_type': 'hotel', 'deal_identifier': 'B_Austin'},
+        ])
+        found = {d['deal_identifier']: d for d in temp_db.get_new_discoveries()}
+
+        assert found['A_Austin']['times_seen'] == 2
+        assert found['A_Austin']['best_yield_seen'] == 9.0
+        assert found['B_Austin']['best_yield_seen'] is None
+
+    def test_transaction_rolls_back_all_writes(self, temp_db):
+        """A failure inside a transaction discards the whole batch."""
+        with pytest.raises(KeyError):
+            with temp_db.transaction():
+                temp_db.insert_hotel_deals([self._deal("A")], datetime.now().isoformat())
+                temp_db.insert_hotel_deals([{'hotel_name': "broken"}], datetime.now().isoformat())
+
+        assert temp_db.get_top_hotel_deals(limit=10) == []
+
+
 class TestAlertHistory:
     """Tests for alert history operations."""
 